@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from grant_agent import checkpoints as checkpoints_module
+from grant_agent.checkpoints import CheckpointRecord, CheckpointStore
+from grant_agent.models import RunState, VerificationResult, utc_now_iso
+
+
+def _grow_state(state: RunState, iteration: int, output_chars: int) -> dict[str, Any]:
+    state.completed_steps.append(f"Completed plan step {iteration} with verification evidence.")
+    state.decisions.append(f"Iteration {iteration}: kept the docs-first plan and tightened the acceptance checks.")
+    state.changed_files.append(f"src/module_{iteration % 40}.py")
+    state.next_actions = [f"Continue with step {iteration + 1}", "Re-run verification"]
+    state.notes.append(f"note {iteration}")
+    state.verification_results.append(
+        VerificationResult(
+            command="python -m unittest discover -s tests",
+            return_code=0,
+            stdout=("." * 70 + "\n") * max(1, output_chars // 71),
+            stderr="",
+            duration_ms=1200 + iteration,
+        )
+    )
+    return {"used_tokens": 1500 * iteration, "usage_ratio": round(min(iteration / 400, 1.0), 3), "status": "ok"}
+
+
+def _save_legacy(session_path: Path, session_id: str, iteration: int, state: RunState, context: dict) -> Path:
+    """The previous format: one indented full record per iteration."""
+    checkpoint_dir = session_path / "checkpoints"
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint_id = f"ckpt_{iteration:03d}"
+    record = CheckpointRecord(
+        checkpoint_id=checkpoint_id,
+        created_at=utc_now_iso(),
+        session_id=session_id,
+        iteration=iteration,
+        objective=state.objective,
+        context=context,
+        doc_sources=["README.md", "docs/plan.md"],
+        state=asdict(state),
+    )
+    path = checkpoint_dir / f"{checkpoint_id}.json"
+    path.write_text(json.dumps(asdict(record), indent=2), encoding="utf-8")
+    return path
+
+
+def _run_variant(
+    label: str,
+    base: Path,
+    *,
+    iterations: int,
+    output_chars: int,
+    full_every: int,
+    compress: bool | None,
+) -> dict[str, Any]:
+    session_path = base / label
+    store = None if compress is None else CheckpointStore(session_path, full_every=full_every, compress=compress)
+    state = RunState(objective="Benchmark checkpoint storage", plan_steps=["plan", "build", "verify"], acceptance_checks=["tests"])
+    paths: list[Path] = []
+    started = time.perf_counter()
+    for iteration in range(1, iterations + 1):
+        context = _grow_state(state, iteration, output_chars)
+        if store is None:
+            paths.append(_save_legacy(session_path, label, iteration, state, context))
+        else:
+            paths.append(
+                store.save(
+                    session_id=label,
+                    iteration=iteration,
+                    run_state=state,
+                    context=context,
+                    doc_sources=["README.md", "docs/plan.md"],
+                )
+            )
+    save_ms = (time.perf_counter() - started) * 1000
+
+    checkpoints_module._CHECKPOINT_RECORD_CACHE.clear()
+    started = time.perf_counter()
+    latest = CheckpointStore.latest(session_path)
+    latest_record = CheckpointStore.load(latest) if latest else {}
+    latest_ms = (time.perf_counter() - started) * 1000
+
+    checkpoints_module._CHECKPOINT_RECORD_CACHE.clear()
+    started = time.perf_counter()
+    middle_record = CheckpointStore.load(paths[len(paths) // 2])
+    middle_ms = (time.perf_counter() - started) * 1000
+
+    if latest_record.get("state") != asdict(state) or middle_record.get("iteration") != len(paths) // 2 + 1:
+        raise SystemExit(f"{label}: reconstructed checkpoint does not match the saved state")
+
+    total_bytes = sum(path.stat().st_size for path in (session_path / "checkpoints").iterdir() if path.is_file())
+    return {
+        "variant": label,
+        "files": len(list((session_path / "checkpoints").iterdir())),
+        "totalBytes": total_bytes,
+        "saveMsTotal": round(save_ms, 2),
+        "saveMsPerIteration": round(save_ms / iterations, 3),
+        "loadLatestMs": round(latest_ms, 3),
+        "loadMiddleMs": round(middle_ms, 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare checkpoint size and save/load time across formats.")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--output-chars", type=int, default=2000, help="Verification stdout captured per iteration.")
+    parser.add_argument("--full-every", type=int, default=checkpoints_module.CHECKPOINT_FULL_EVERY)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base = Path(temp_dir)
+        results = [
+            _run_variant(label, base, iterations=args.iterations, output_chars=args.output_chars, full_every=args.full_every, compress=compress)
+            for label, compress in (("legacy", None), ("delta", False), ("delta_zlib", True))
+        ]
+    legacy_bytes = results[0]["totalBytes"] or 1
+    for item in results:
+        item["sizeRatio"] = round(item["totalBytes"] / legacy_bytes, 4)
+    print(
+        json.dumps(
+            {
+                "iterations": args.iterations,
+                "outputChars": args.output_chars,
+                "fullEvery": args.full_every,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
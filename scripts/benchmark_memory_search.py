@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from grant_agent import memory as memory_module
+from grant_agent.memory import MemoryItem, MemoryStore, ingest_state_into_memory
+
+
+def _linear_search(items: list[MemoryItem], query: str, limit: int) -> list[MemoryItem]:
+    query_tokens = set(re.findall(r"[a-z0-9]+", query.lower()))
+
+    def score(item: MemoryItem) -> tuple[int, int]:
+        text = item.content + " " + " ".join(item.tags) + " " + item.objective
+        return len(query_tokens & set(re.findall(r"[a-z0-9]+", text.lower()))), len(item.tags)
+
+    ranked = sorted(items, key=score, reverse=True)
+    return [item for item in ranked if score(item)[0] > 0][:limit]
+
+
+def _write_corpus(path: Path, *, items: int, vocabulary: int, seed: int) -> None:
+    rng = random.Random(seed)
+    words = [f"term{index}" for index in range(vocabulary)]
+    payload = [
+        asdict(
+            MemoryItem(
+                id=f"mem_{index:08x}",
+                created_at=f"2026-10-{1 + index % 28:02d}T00:00:00+00:00",
+                source_session_id=f"session_{index % 500}",
+                objective=" ".join(rng.choices(words, k=8)),
+                content=" ".join(rng.choices(words, k=24)),
+                tags=rng.sample(["decision", "autonomy", "risk", "safety", "next_action", "resume"], 2),
+                kind="decision",
+            )
+        )
+        for index in range(items)
+    ]
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+_COLD_PROCESS_SNIPPET = """
+import re, sys, time
+sys.path.insert(0, sys.argv[1])
+started = time.perf_counter()
+from grant_agent.memory import MemoryStore
+store = MemoryStore(__import__("pathlib").Path(sys.argv[2]))
+if sys.argv[4] == "linear":
+    tokens = set(re.findall(r"[a-z0-9]+", sys.argv[3].lower()))
+    sorted(
+        store.items,
+        key=lambda item: len(
+            tokens & set(re.findall(r"[a-z0-9]+", (item.content + " " + " ".join(item.tags) + " " + item.objective).lower()))
+        ),
+        reverse=True,
+    )
+else:
+    store.search(sys.argv[3], limit=6)
+print(time.perf_counter() - started)
+"""
+
+
+def _cold_process_seconds(path: Path, query: str, mode: str) -> float:
+    """Open the store and run one search in a fresh interpreter, as the CLI does."""
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _COLD_PROCESS_SNIPPET, str(SRC), str(path), query, mode],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return round(float(completed.stdout.strip()), 3)
+
+
+def _ms(samples: list[float]) -> dict[str, float]:
+    return {
+        "medianMs": round(statistics.median(samples) * 1000, 3),
+        "maxMs": round(max(samples) * 1000, 3),
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    rng = random.Random(args.seed + 1)
+    queries = [" ".join(f"term{rng.randrange(args.vocabulary)}" for _ in range(4)) for _ in range(args.queries)]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "memory.json"
+        _write_corpus(path, items=args.items, vocabulary=args.vocabulary, seed=args.seed)
+
+        started = time.perf_counter()
+        store = MemoryStore(path)
+        load_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        store.search(queries[0], limit=6)
+        first_search_seconds = time.perf_counter() - started
+
+        indexed = []
+        for query in queries:
+            started = time.perf_counter()
+            store.search(query, limit=6)
+            indexed.append(time.perf_counter() - started)
+        linear = []
+        for query in queries[: args.linear_queries]:
+            started = time.perf_counter()
+            _linear_search(store.items, query, 6)
+            linear.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        ingest_state_into_memory(
+            store,
+            "session_benchmark",
+            {
+                "objective": "benchmark ingest",
+                "decisions": ["a", "b", "c"],
+                "risks": ["d", "e"],
+                "next_actions": ["f", "g"],
+            },
+        )
+        ingest_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        MemoryStore(path)
+        cached_open_seconds = time.perf_counter() - started
+        memory_module._MEMORY_CORPUS_CACHE.clear()
+        started = time.perf_counter()
+        MemoryStore(path).search(queries[0], limit=6)
+        cold_open_search_seconds = time.perf_counter() - started
+
+        index_path = path.with_name(path.name + memory_module.MEMORY_INDEX_SUFFIX)
+        cold_process_linear = _cold_process_seconds(path, queries[0], "linear")
+        index_path.unlink(missing_ok=True)
+        cold_process_build = _cold_process_seconds(path, queries[0], "indexed")
+        cold_process_persisted = _cold_process_seconds(path, queries[0], "indexed")
+
+    return {
+        "items": args.items,
+        "loadSeconds": round(load_seconds, 3),
+        "firstSearchWithIndexBuildSeconds": round(first_search_seconds, 3),
+        "indexedSearch": _ms(indexed),
+        "linearSearch": _ms(linear),
+        "ingestSevenItemsSeconds": round(ingest_seconds, 4),
+        "cachedOpenSeconds": round(cached_open_seconds, 4),
+        "coldOpenAndSearchSeconds": round(cold_open_search_seconds, 3),
+        "coldProcessLinearScanSeconds": cold_process_linear,
+        "coldProcessIndexBuildSeconds": cold_process_build,
+        "coldProcessPersistedIndexSeconds": cold_process_persisted,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark MemoryStore search against the linear scan.")
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--vocabulary", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--linear-queries", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
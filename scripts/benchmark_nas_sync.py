@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from grant_agent.mission_control import _sync_project_tree
+
+
+AGED_MTIME = 1_700_000_000
+
+
+def _build_tree(source: Path, *, files: int, files_per_dir: int, fanout: int) -> int:
+    """Create ``files`` small files spread over a ``fanout``-ary directory tree."""
+    directories = max(1, (files + files_per_dir - 1) // files_per_dir)
+    created = 0
+    for index in range(directories):
+        parts = []
+        value = index
+        while True:
+            parts.append(f"d{value % fanout:02d}")
+            value //= fanout
+            if value == 0:
+                break
+        folder = source.joinpath(*reversed(parts))
+        folder.mkdir(parents=True, exist_ok=True)
+        for file_index in range(min(files_per_dir, files - created)):
+            (folder / f"f{file_index:03d}.txt").write_text(f"{index}:{file_index}\n", encoding="utf-8")
+            created += 1
+    return directories
+
+
+def _age_tree(path: Path) -> None:
+    for current_root, dir_names, file_names in os.walk(path):
+        for name in file_names:
+            os.utime(Path(current_root) / name, (AGED_MTIME, AGED_MTIME))
+    for current_root, dir_names, _ in os.walk(path, topdown=False):
+        for name in dir_names:
+            os.utime(Path(current_root) / name, (AGED_MTIME, AGED_MTIME))
+    os.utime(path, (AGED_MTIME, AGED_MTIME))
+
+
+def _timed(label: str, source: Path, target: Path, manifest_dir: Path | None) -> dict[str, Any]:
+    started = time.perf_counter()
+    status = _sync_project_tree(
+        source,
+        target,
+        conflict_policy="keep_newer_and_log",
+        manifest_dir=manifest_dir,
+    )
+    return {
+        "label": label,
+        "seconds": round(time.perf_counter() - started, 3),
+        "filesCopied": status.get("filesCopied", 0),
+        "filesSkipped": status.get("filesSkipped", 0),
+        "syncManifest": status.get("syncManifest", {}),
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(dir=args.tmp_dir or None) as temp_dir:
+        base = Path(temp_dir)
+        source = base / "local"
+        source.mkdir()
+        directories = _build_tree(source, files=args.files, files_per_dir=args.files_per_dir, fanout=args.fanout)
+        _age_tree(source)
+        manifest_dir = base / "manifests"
+        legacy_target = base / "nas-legacy"
+        incremental_target = base / "nas-incremental"
+        runs = [
+            _timed("legacy_initial_copy", source, legacy_target, None),
+            _timed("legacy_repeat_no_changes", source, legacy_target, None),
+            _timed("manifest_initial_copy", source, incremental_target, manifest_dir),
+        ]
+        # Let the copies settle past the racy-timestamp window, as a real
+        # workspace would between saves.
+        _age_tree(incremental_target)
+        runs.append(_timed("manifest_verify_after_settle", source, incremental_target, manifest_dir))
+        _age_tree(incremental_target)
+        runs.append(_timed("manifest_verify_settled", source, incremental_target, manifest_dir))
+        runs.append(_timed("manifest_repeat_no_changes", source, incremental_target, manifest_dir))
+        edited = sorted(source.rglob("f000.txt"))[: args.edits]
+        for path in edited:
+            path.write_text("edited\n", encoding="utf-8")
+        runs.append(_timed(f"manifest_repeat_{len(edited)}_edits", source, incremental_target, manifest_dir))
+    return {
+        "files": args.files,
+        "directories": directories,
+        "filesPerDirectory": args.files_per_dir,
+        "runs": runs,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare full-walk and manifest-based project sync on a synthetic tree."
+    )
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--files-per-dir", type=int, default=50)
+    parser.add_argument("--fanout", type=int, default=16)
+    parser.add_argument("--edits", type=int, default=25)
+    parser.add_argument("--tmp-dir", default="", help="Place the trees here, e.g. on a NAS mount.")
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
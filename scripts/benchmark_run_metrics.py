@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from grant_agent import eval as eval_module
+from grant_agent.checkpoints import CheckpointStore
+from grant_agent.eval import RUN_METRICS_INDEX_FILENAME, summarize_runs, write_run_metrics
+from grant_agent.session_store import SessionStore
+
+
+def _legacy_summarize_runs(base_dir: Path) -> dict:
+    """The previous implementation: parse every state.json on each call."""
+    sessions = [path for path in base_dir.glob("session_*") if path.is_dir()]
+    sessions_with_handoff = 0
+    verification_failures = 0
+    verification_commands = 0
+    blocked_commands = 0
+    runs_with_doc_evidence = 0
+    runs_with_memory_writes = 0
+    runs_with_checkpoints = 0
+    usage_ratios: list[float] = []
+    for session in sessions:
+        if any(session.glob("handoff_packet_*.json")):
+            sessions_with_handoff += 1
+        state_path = session / "state.json"
+        if not state_path.exists():
+            continue
+        payload = json.loads(state_path.read_text(encoding="utf-8"))
+        if payload.get("doc_evidence"):
+            runs_with_doc_evidence += 1
+        if payload.get("memory_item_ids"):
+            runs_with_memory_writes += 1
+        if CheckpointStore.list(session):
+            runs_with_checkpoints += 1
+        usage_ratio = payload.get("context", {}).get("usage_ratio")
+        if isinstance(usage_ratio, (int, float)):
+            usage_ratios.append(float(usage_ratio))
+        for result in payload.get("verification_results", []):
+            verification_commands += 1
+            if result.get("status") == "blocked":
+                blocked_commands += 1
+            if result.get("return_code", 1) != 0:
+                verification_failures += 1
+    average_usage = sum(usage_ratios) / len(usage_ratios) if usage_ratios else 0.0
+    return {
+        "total_sessions": len(sessions),
+        "sessions_with_handoff": sessions_with_handoff,
+        "verification_failures": verification_failures,
+        "verification_commands": verification_commands,
+        "blocked_commands": blocked_commands,
+        "runs_with_doc_evidence": runs_with_doc_evidence,
+        "runs_with_memory_writes": runs_with_memory_writes,
+        "runs_with_checkpoints": runs_with_checkpoints,
+        "average_context_usage_ratio": round(average_usage, 3),
+    }
+
+
+def _synthetic_state(index: int, output_chars: int) -> dict[str, Any]:
+    return {
+        "objective": f"Synthetic run {index}",
+        "completed_steps": [f"step {step}" for step in range(index % 12)],
+        "doc_evidence": ["README.md"] if index % 3 == 0 else [],
+        "memory_item_ids": [f"mem_{index}"] if index % 5 == 0 else [],
+        "context": {"usage_ratio": round((index % 100) / 100, 2), "used_tokens": index * 37},
+        "verification_results": [
+            {
+                "command": f"python -m unittest tests.test_{check}",
+                "return_code": 0 if (index + check) % 7 else 1,
+                "status": "blocked" if (index + check) % 23 == 0 else "completed",
+                "stdout": "." * output_chars,
+                "stderr": "",
+            }
+            for check in range(index % 4)
+        ],
+    }
+
+
+def _populate(base: Path, sessions: int, output_chars: int) -> None:
+    store = SessionStore(base)
+    stamp = time.time() - 3600
+    for index in range(sessions):
+        session = base / f"session_{index:06d}"
+        session.mkdir(parents=True)
+        state = _synthetic_state(index, output_chars)
+        store.save_state(session, state)
+        if index % 4 == 0:
+            (session / "handoff_packet_001.json").write_text("{}", encoding="utf-8")
+        if index % 6 == 0:
+            (session / "checkpoints").mkdir()
+            (session / "checkpoints" / "ckpt_001.json").write_text("{}", encoding="utf-8")
+        # Settled sessions: outside the racy-mtime window the index trusts.
+        for path in [*session.rglob("*"), session]:
+            os.utime(path, (stamp, stamp))
+        write_run_metrics(session, state)
+        os.utime(session, (stamp, stamp))
+
+
+def _timed(label: str, func, base: Path, expected: dict | None) -> tuple[dict[str, Any], dict]:
+    started = time.perf_counter()
+    result = func(base)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if expected is not None and result != expected:
+        raise SystemExit(f"{label}: summary differs from the legacy scan\n{result}\n{expected}")
+    return {"variant": label, "ms": round(elapsed_ms, 2)}, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare full-scan and indexed run summaries over synthetic sessions.")
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--output-chars", type=int, default=400, help="Verification stdout stored per command.")
+    parser.add_argument("--touch", type=int, default=10, help="Sessions rewritten before the incremental summary.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base = Path(temp_dir)
+        started = time.perf_counter()
+        _populate(base, args.sessions, args.output_chars)
+        populate_ms = (time.perf_counter() - started) * 1000
+
+        results: list[dict[str, Any]] = []
+        timing, expected = _timed("legacy_full_scan", _legacy_summarize_runs, base, None)
+        results.append(timing)
+        results.append(_timed("indexed_cold", summarize_runs, base, expected)[0])
+        eval_module._RUN_METRICS_INDEX_CACHE.clear()
+        results.append(_timed("indexed_warm_new_process", summarize_runs, base, expected)[0])
+        results.append(_timed("indexed_warm_cached", summarize_runs, base, expected)[0])
+
+        store = SessionStore(base)
+        for index in range(0, args.sessions, max(1, args.sessions // max(1, args.touch)))[: args.touch]:
+            store.save_state(base / f"session_{index:06d}", _synthetic_state(index + 1, args.output_chars))
+        timing, expected = _timed("legacy_full_scan_after_touch", _legacy_summarize_runs, base, None)
+        results.append(timing)
+        results.append(_timed("indexed_after_touch", summarize_runs, base, expected)[0])
+        index_bytes = (base / RUN_METRICS_INDEX_FILENAME).stat().st_size
+
+    print(
+        json.dumps(
+            {
+                "sessions": args.sessions,
+                "outputChars": args.output_chars,
+                "touched": args.touch,
+                "populateMs": round(populate_ms, 2),
+                "indexBytes": index_bytes,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import secrets
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from grant_agent import web_backend
+from grant_agent.web_backend import SESSION_COOKIE_NAME, FluxioWebBackend, make_handler
+
+
+SUMMARY_BODY = json.dumps(
+    {
+        "command": "get_control_room_summary_command",
+        "payload": {"root": None, "summaryMode": "bootstrap"},
+    }
+).encode("utf-8")
+
+
+def _poll_summaries(
+    address: tuple[str, int],
+    cookie: str,
+    *,
+    keep_alive: bool,
+    deadline: float,
+    latencies: list[float],
+    counters: dict[str, int],
+    lock: threading.Lock,
+) -> None:
+    headers = {"Content-Type": "application/json", "Cookie": cookie}
+    if not keep_alive:
+        headers["Connection"] = "close"
+    connection: http.client.HTTPConnection | None = None
+    local: list[float] = []
+    connects = errors = 0
+    while time.perf_counter() < deadline:
+        if connection is None:
+            connection = http.client.HTTPConnection(*address, timeout=30)
+            connects += 1
+        started = time.perf_counter()
+        try:
+            connection.request("POST", "/api/backend", body=SUMMARY_BODY, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            if response.status != 200:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            connection = None
+            continue
+        local.append((time.perf_counter() - started) * 1000)
+        if not keep_alive or response.getheader("Connection", "").lower() == "close":
+            connection.close()
+            connection = None
+    if connection is not None:
+        connection.close()
+    with lock:
+        latencies.extend(local)
+        counters["connections"] += connects
+        counters["errors"] += errors
+
+
+def _run_mode(
+    address: tuple[str, int],
+    cookie: str,
+    *,
+    keep_alive: bool,
+    clients: int,
+    duration_seconds: float,
+) -> dict[str, Any]:
+    latencies: list[float] = []
+    counters = {"connections": 0, "errors": 0}
+    lock = threading.Lock()
+    started = time.perf_counter()
+    deadline = started + duration_seconds
+    threads = [
+        threading.Thread(
+            target=_poll_summaries,
+            args=(address, cookie),
+            kwargs={
+                "keep_alive": keep_alive,
+                "deadline": deadline,
+                "latencies": latencies,
+                "counters": counters,
+                "lock": lock,
+            },
+            daemon=True,
+        )
+        for _ in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    ordered = sorted(latencies)
+    return {
+        "mode": "keep-alive" if keep_alive else "close",
+        "requests": len(ordered),
+        "connections": counters["connections"],
+        "errors": counters["errors"],
+        "requestsPerSecond": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "p50Ms": round(statistics.median(ordered), 2) if ordered else None,
+        "p95Ms": round(ordered[int(len(ordered) * 0.95) - 1], 2) if len(ordered) >= 20 else None,
+        "maxMs": round(ordered[-1], 2) if ordered else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Poll the control-room summary from many concurrent clients against a local web backend."
+    )
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration-seconds", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=web_backend.WEB_WORKER_THREADS)
+    parser.add_argument("--root", default="", help="Workspace root to serve; defaults to an empty temp workspace.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(args.root).resolve() if args.root else Path(temp_dir)
+        backend = FluxioWebBackend(root, root)
+        token = secrets.token_urlsafe(32)
+        backend.sessions[token] = {"username": "benchmark", "displayName": "Benchmark", "role": "admin"}
+        cookie = f"{SESSION_COOKIE_NAME}={token}"
+        server = web_backend._HandshakeSafeThreadingHTTPServer(
+            ("127.0.0.1", 0),
+            make_handler(backend),
+            max_workers=args.workers,
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            address = server.server_address[:2]
+            _run_mode(address, cookie, keep_alive=True, clients=1, duration_seconds=0.5)
+            results = [
+                _run_mode(
+                    address,
+                    cookie,
+                    keep_alive=keep_alive,
+                    clients=args.clients,
+                    duration_seconds=args.duration_seconds,
+                )
+                for keep_alive in (False, True)
+            ]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    print(
+        json.dumps(
+            {
+                "clients": args.clients,
+                "durationSeconds": args.duration_seconds,
+                "workers": args.workers,
+                "keepAliveIdleSeconds": web_backend.WEB_KEEPALIVE_IDLE_SECONDS,
+                "keepAliveMaxRequests": web_backend.WEB_KEEPALIVE_MAX_REQUESTS,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
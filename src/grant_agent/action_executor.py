@@ -26,11 +26,13 @@ from .models import (
     utc_now_iso,
 )
 from .execution_truth import derive_execution_target
+from .git_probe import git_changed_files
 from .research import search_workspace
 from .runtimes import runtime_adapter_map
 from .runtimes.base import runtime_subprocess_env
 from .runtime_supervisor import DelegatedRuntimeSupervisor, _pid_alive
 from .safety import risk_level_for_command
+from .worktree_pool import CLEANUP_REFILL_LIMIT, worktree_pool_for
 
 PROFILE_EXECUTION_DEFAULTS = {
     "beginner": {
@@ -232,6 +234,19 @@ class HybridExecutionAdapter(ExecutionAdapter):
             ))
 
         worktree_path.parent.mkdir(parents=True, exist_ok=True)
+        pool = worktree_pool_for(workspace_root)
+        if pool.lease(worktree_path, branch_name):
+            return _with_execution_truth(ExecutionScope(
+                requested=requested,
+                strategy="git_worktree",
+                execution_root=str(worktree_path),
+                workspace_root=str(workspace_root),
+                branch_name=branch_name,
+                worktree_path=str(worktree_path),
+                isolated=True,
+                status="ready",
+                detail="Mission is isolated in a pre-warmed git worktree.",
+            ))
         add_attempts = [
             ["git", "worktree", "add", "-b", branch_name, str(worktree_path), "HEAD"],
             ["git", "worktree", "add", "--force", str(worktree_path), "HEAD"],
@@ -1046,6 +1061,17 @@ def cleanup_execution_scope(execution_scope: ExecutionScope | None) -> dict[str,
 
     details: list[str] = []
     if workspace_root and workspace_root.exists():
+        pool = worktree_pool_for(workspace_root)
+        if pool.recycle(worktree_path, execution_scope.branch_name or ""):
+            # The next launch is usually close behind; top the pool up while
+            # this mission is already done rather than on its launch path.
+            pool.refill(limit=CLEANUP_REFILL_LIMIT)
+            return {
+                "cleaned": not worktree_path.exists(),
+                "path": str(worktree_path),
+                "details": ["worktree_recycled_to_pool"],
+                "recycled": True,
+            }
         try:
             completed = subprocess.run(  # noqa: S603
                 ["git", "worktree", "remove", "--force", str(worktree_path)],
@@ -1099,6 +1125,9 @@ def cleanup_execution_scope(execution_scope: ExecutionScope | None) -> dict[str,
             except StopIteration:
                 worktree_parent.rmdir()
 
+    if workspace_root and workspace_root.exists() and pool.refill(limit=CLEANUP_REFILL_LIMIT):
+        details.append("worktree_pool_refilled")
+
     return {
         "cleaned": not worktree_path.exists(),
         "path": str(worktree_path),
@@ -1126,23 +1155,7 @@ def _with_execution_truth(scope: ExecutionScope) -> ExecutionScope:
 def _git_changed_files(root: Path) -> list[str]:
     if not _is_git_workspace(root) and not (root / ".git").exists():
         return []
-    try:
-        completed = subprocess.run(  # noqa: S603
-            ["git", "status", "--short"],
-            cwd=str(root),
-            capture_output=True,
-            text=True,
-            timeout=10,
-            check=False,
-        )
-    except OSError:
-        return []
-    changed: list[str] = []
-    for line in completed.stdout.splitlines():
-        if not line.strip():
-            continue
-        changed.append(line[3:].strip())
-    return changed
+    return git_changed_files(root)
 
 
 def _policy_decision(proposal: ActionProposal, policy: ExecutionPolicy) -> str:
@@ -1,11 +1,29 @@
 from __future__ import annotations
 
+import copy
 import json
+import marshal
+import os
+import threading
+import zlib
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any
 
 from .models import RunState, utc_now_iso
 
+CHECKPOINT_FORMAT = "fluxio.checkpoint.v2"
+CHECKPOINT_MANIFEST_FORMAT = "fluxio.checkpoint_manifest.v1"
+CHECKPOINT_MANIFEST_NAME = "manifest.json"
+CHECKPOINT_FULL_EVERY = max(int(os.environ.get("FLUXIO_CHECKPOINT_FULL_EVERY", "10")), 1)
+CHECKPOINT_COMPRESSION_LEVEL = 6
+CHECKPOINT_RECORD_CACHE_LIMIT = 64
+CHECKPOINT_SUFFIXES = (".json", ".json.zlib")
+
+_CHECKPOINT_RECORD_CACHE: OrderedDict[str, tuple[tuple[int, int], bytes]] = OrderedDict()
+_CHECKPOINT_RECORD_CACHE_LOCK = threading.Lock()
+
 
 @dataclass
 class CheckpointRecord:
@@ -19,11 +37,145 @@ class CheckpointRecord:
     state: dict
 
 
+def _compression_default() -> bool:
+    raw = str(os.environ.get("FLUXIO_CHECKPOINT_COMPRESS", "")).strip().lower()
+    return raw not in {"0", "false", "no", "off", "disabled"}
+
+
+def _structural_delta(old: Any, new: Any) -> dict | None:
+    """Smallest nested patch turning ``old`` into ``new``; ``None`` when equal.
+
+    Dicts patch changed keys (``d``) and list removed ones (``r``); lists keep
+    their common prefix (``l``) and append the rest (``a``), which is how run
+    state grows between iterations; anything else is replaced (``=``).
+    """
+    if type(old) is type(new) and old == new:
+        return None
+    if isinstance(old, dict) and isinstance(new, dict):
+        changed: dict[str, Any] = {}
+        for key, value in new.items():
+            if key not in old:
+                changed[key] = {"=": value}
+                continue
+            nested = _structural_delta(old[key], value)
+            if nested is not None:
+                changed[key] = nested
+        removed = [key for key in old if key not in new]
+        delta: dict[str, Any] = {}
+        if changed:
+            delta["d"] = changed
+        if removed:
+            delta["r"] = removed
+        return delta or None
+    if isinstance(old, list) and isinstance(new, list):
+        prefix = 0
+        limit = min(len(old), len(new))
+        while prefix < limit and type(old[prefix]) is type(new[prefix]) and old[prefix] == new[prefix]:
+            prefix += 1
+        if prefix:
+            return {"l": prefix, "a": new[prefix:]}
+    return {"=": new}
+
+
+def _apply_delta(base: Any, delta: dict) -> Any:
+    if "=" in delta:
+        return delta["="]
+    if "l" in delta:
+        return list(base[: delta["l"]]) + list(delta.get("a") or [])
+    result = dict(base) if isinstance(base, dict) else {}
+    for key in delta.get("r") or []:
+        result.pop(key, None)
+    for key, nested in (delta.get("d") or {}).items():
+        result[key] = _apply_delta(result.get(key), nested)
+    return result
+
+
+def _encode_payload(payload: dict, *, compress: bool) -> bytes:
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(raw, CHECKPOINT_COMPRESSION_LEVEL) if compress else raw
+
+
+def _decode_payload(raw: bytes) -> dict:
+    stripped = raw.lstrip()
+    if not stripped.startswith(b"{"):
+        raw = zlib.decompress(raw)
+    payload = json.loads(raw.decode("utf-8"))
+    return payload if isinstance(payload, dict) else {}
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_manifest(checkpoint_dir: Path) -> dict | None:
+    try:
+        payload = json.loads((checkpoint_dir / CHECKPOINT_MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict) or not isinstance(payload.get("checkpoints"), list):
+        return None
+    return payload
+
+
+def _cached_record(path: Path) -> tuple[tuple[int, int] | None, dict | None]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None, None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = str(path)
+    with _CHECKPOINT_RECORD_CACHE_LOCK:
+        cached = _CHECKPOINT_RECORD_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            _CHECKPOINT_RECORD_CACHE.move_to_end(key)
+            return signature, marshal.loads(cached[1])
+    return signature, None
+
+
+def _remember_record(path: Path, signature: tuple[int, int] | None, record: dict) -> None:
+    if signature is None:
+        return
+    try:
+        blob = marshal.dumps(record)
+    except ValueError:
+        return
+    with _CHECKPOINT_RECORD_CACHE_LOCK:
+        _CHECKPOINT_RECORD_CACHE[str(path)] = (signature, blob)
+        _CHECKPOINT_RECORD_CACHE.move_to_end(str(path))
+        while len(_CHECKPOINT_RECORD_CACHE) > CHECKPOINT_RECORD_CACHE_LIMIT:
+            _CHECKPOINT_RECORD_CACHE.popitem(last=False)
+
+
 class CheckpointStore:
-    def __init__(self, session_path: Path) -> None:
+    """Per-iteration checkpoints stored as full snapshots plus structural deltas.
+
+    Every ``full_every``-th checkpoint (``FLUXIO_CHECKPOINT_FULL_EVERY``) is a
+    full record; the ones in between store only a patch against the previous
+    checkpoint, optionally zlib-compressed (``FLUXIO_CHECKPOINT_COMPRESS``).
+    ``manifest.json`` records save order, so ``latest`` and ``list`` no longer
+    glob the directory and sort by mtime. Checkpoints written before the
+    manifest existed still list and load as plain JSON records.
+    """
+
+    def __init__(
+        self,
+        session_path: Path,
+        *,
+        full_every: int | None = None,
+        compress: bool | None = None,
+    ) -> None:
         self.session_path = session_path
         self.checkpoint_dir = session_path / "checkpoints"
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self.full_every = max(1, int(full_every or CHECKPOINT_FULL_EVERY))
+        self.compress = _compression_default() if compress is None else compress
+        self._previous: tuple[str, dict, int] | None = None
 
     def save(
         self,
@@ -34,36 +186,171 @@ class CheckpointStore:
         doc_sources: list[str],
     ) -> Path:
         checkpoint_id = f"ckpt_{iteration:03d}"
-        record = CheckpointRecord(
-            checkpoint_id=checkpoint_id,
-            created_at=utc_now_iso(),
-            session_id=session_id,
-            iteration=iteration,
-            objective=run_state.objective,
-            context=context,
-            doc_sources=doc_sources,
-            state=asdict(run_state),
+        # ``asdict`` already deep-copies the run state; copying the record
+        # again would double the cost of every save.
+        record = dict(
+            vars(
+                CheckpointRecord(
+                    checkpoint_id=checkpoint_id,
+                    created_at=utc_now_iso(),
+                    session_id=session_id,
+                    iteration=iteration,
+                    objective=run_state.objective,
+                    context=copy.deepcopy(context),
+                    doc_sources=list(doc_sources),
+                    state=asdict(run_state),
+                )
+            )
+        )
+        manifest = _read_manifest(self.checkpoint_dir) or self._legacy_manifest()
+        entries = [entry for entry in manifest["checkpoints"] if isinstance(entry, dict)]
+        overwriting = any(entry.get("checkpoint_id") == checkpoint_id for entry in entries)
+        previous = None if overwriting else self._previous_checkpoint(manifest, entries)
+
+        file_name = f"{checkpoint_id}{CHECKPOINT_SUFFIXES[1] if self.compress else CHECKPOINT_SUFFIXES[0]}"
+        if previous is None or previous[2] + 1 >= self.full_every:
+            payload: dict[str, Any] = {"format": CHECKPOINT_FORMAT, "kind": "full", "record": record}
+            depth = 0
+        else:
+            payload = {
+                "format": CHECKPOINT_FORMAT,
+                "kind": "delta",
+                "parent": previous[0],
+                "parent_created_at": previous[1].get("created_at"),
+                "delta": _structural_delta(previous[1], record) or {},
+            }
+            depth = previous[2] + 1
+        data = _encode_payload(payload, compress=self.compress)
+        path = self.checkpoint_dir / file_name
+        _write_atomic(path, data)
+        for suffix in CHECKPOINT_SUFFIXES:
+            stale = self.checkpoint_dir / f"{checkpoint_id}{suffix}"
+            if stale != path:
+                stale.unlink(missing_ok=True)
+
+        entries = [entry for entry in entries if entry.get("checkpoint_id") != checkpoint_id]
+        entries.append(
+            {
+                "checkpoint_id": checkpoint_id,
+                "iteration": iteration,
+                "file": file_name,
+                "kind": payload["kind"],
+                "depth": depth,
+                "created_at": record["created_at"],
+                "bytes": len(data),
+            }
         )
-        path = self.checkpoint_dir / f"{checkpoint_id}.json"
-        path.write_text(json.dumps(asdict(record), indent=2), encoding="utf-8")
+        manifest.update({"format": CHECKPOINT_MANIFEST_FORMAT, "latest": file_name, "checkpoints": entries})
+        _write_atomic(
+            self.checkpoint_dir / CHECKPOINT_MANIFEST_NAME,
+            json.dumps(manifest, indent=2).encode("utf-8"),
+        )
+        self._previous = (file_name, record, depth)
         return path
 
+    def _legacy_manifest(self) -> dict:
+        """Manifest seeded from checkpoints written before manifests existed."""
+        legacy = list(reversed(CheckpointStore.list(self.session_path)))
+        return {
+            "format": CHECKPOINT_MANIFEST_FORMAT,
+            "latest": legacy[-1].name if legacy else None,
+            "checkpoints": [
+                {
+                    "checkpoint_id": path.name.split(".", 1)[0],
+                    "file": path.name,
+                    "kind": "legacy",
+                    "depth": 0,
+                }
+                for path in legacy
+            ],
+        }
+
+    def _previous_checkpoint(self, manifest: dict, entries: list[dict]) -> tuple[str, dict, int] | None:
+        latest = manifest.get("latest")
+        if self._previous is not None and self._previous[0] == latest:
+            return self._previous
+        entry = next((item for item in reversed(entries) if item.get("file") == latest), None)
+        if entry is None:
+            return None
+        try:
+            record = CheckpointStore.load(self.checkpoint_dir / str(latest))
+        except (OSError, ValueError, zlib.error):
+            return None
+        return str(latest), record, int(entry.get("depth") or 0)
+
     @staticmethod
     def list(session_path: Path) -> list[Path]:
         checkpoint_dir = session_path / "checkpoints"
         if not checkpoint_dir.exists():
             return []
+        manifest = _read_manifest(checkpoint_dir)
+        if manifest is not None:
+            paths = [
+                checkpoint_dir / str(entry.get("file"))
+                for entry in reversed(manifest["checkpoints"])
+                if isinstance(entry, dict) and entry.get("file")
+            ]
+            return [path for path in paths if path.is_file()]
         return sorted(
-            [path for path in checkpoint_dir.glob("ckpt_*.json") if path.is_file()],
+            [
+                path
+                for suffix in CHECKPOINT_SUFFIXES
+                for path in checkpoint_dir.glob(f"ckpt_*{suffix}")
+                if path.is_file()
+            ],
             key=lambda item: item.stat().st_mtime,
             reverse=True,
         )
 
     @staticmethod
     def load(checkpoint_path: Path) -> dict:
-        return json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        """Full checkpoint record, replaying deltas back to the nearest snapshot."""
+        chain: list[tuple[Path, tuple[int, int] | None, dict]] = []
+        path = checkpoint_path
+        record: dict | None = None
+        while True:
+            signature, record = _cached_record(path)
+            if record is not None:
+                break
+            payload = _decode_payload(path.read_bytes())
+            if payload.get("format") != CHECKPOINT_FORMAT:
+                record = payload
+                _remember_record(path, signature, record)
+                break
+            if payload.get("kind") == "full":
+                record = payload.get("record") if isinstance(payload.get("record"), dict) else {}
+                _remember_record(path, signature, record)
+                break
+            chain.append((path, signature, payload))
+            path = path.parent / str(payload.get("parent") or "")
+        for path, signature, payload in reversed(chain):
+            if record.get("created_at") != payload.get("parent_created_at"):
+                raise ValueError(f"Checkpoint {path.name} no longer matches its parent {payload.get('parent')}.")
+            record = _apply_delta(record, payload.get("delta") or {})
+            _remember_record(path, signature, record)
+        return record
+
+    @staticmethod
+    def load_iteration(session_path: Path, iteration: int) -> dict | None:
+        checkpoint_dir = session_path / "checkpoints"
+        manifest = _read_manifest(checkpoint_dir)
+        if manifest is not None:
+            for entry in reversed(manifest["checkpoints"]):
+                if isinstance(entry, dict) and entry.get("iteration") == iteration:
+                    return CheckpointStore.load(checkpoint_dir / str(entry.get("file")))
+            return None
+        for suffix in CHECKPOINT_SUFFIXES:
+            path = checkpoint_dir / f"ckpt_{iteration:03d}{suffix}"
+            if path.is_file():
+                return CheckpointStore.load(path)
+        return None
 
     @staticmethod
     def latest(session_path: Path) -> Path | None:
+        manifest = _read_manifest(session_path / "checkpoints")
+        if manifest is not None and manifest.get("latest"):
+            path = session_path / "checkpoints" / str(manifest["latest"])
+            if path.is_file():
+                return path
         checkpoints = CheckpointStore.list(session_path)
         return checkpoints[0] if checkpoints else None
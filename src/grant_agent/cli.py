@@ -74,6 +74,7 @@ from .mission_control import (
     _discover_related_delegated_runtime_sessions,
     _runtime_lane_rows_for_mission,
 )
+from .mission_event_index import MissionEventIndex
 from .mission_watchdog import (
     SCOPE_SAFE,
     build_watchdog_supervisor_state,
@@ -3340,15 +3341,7 @@ def _mission_async_dispatches(root: Path, mission_id: str) -> list[dict]:
         return []
     dispatches: list[dict] = []
     seen: set[int] = set()
-    for line in events_path.read_text(encoding="utf-8", errors="ignore").splitlines():
-        if not line.strip():
-            continue
-        try:
-            event = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if event.get("mission_id") != mission_id:
-            continue
+    for event in reversed(MissionEventIndex(events_path).mission_events(mission_id)):
         if event.get("kind") not in {
             "mission.resume_dispatched",
             "mission.auto_resume_dispatched",
@@ -6663,9 +6656,9 @@ def cmd_workspace_action(args: argparse.Namespace) -> int:
     return 0 if payload.get("ok") or payload.get("record", {}).get("gate", {}).get("status") == "pending" else 2
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command == "bootstrap":
         bootstrap_project(Path(args.root).resolve())
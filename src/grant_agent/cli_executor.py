@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+IN_PROCESS_ENV = "FLUXIO_WEB_CLI_IN_PROCESS"
+WORKERS_ENV = "FLUXIO_WEB_CLI_WORKERS"
+DEFAULT_WORKERS = 4
+# Commands that only read or rewrite control-room state. Anything that drives a
+# runtime, runs workspace actions or may block for minutes keeps the
+# subprocess path so a crash or hang cannot take the web backend down with it.
+IN_PROCESS_COMMANDS = frozenset(
+    {
+        "control-room",
+        "control-room-export",
+        "mission-proof-digest",
+        "skill-repair-apply",
+        "workspace-save",
+        "workspace-sync-conflict-resolve",
+        "workspace-sync-conflict-resolve-batch",
+        "mission-lane-control",
+        "mission-follow-up",
+    }
+)
+# Overrides that only steer child processes: ``runs_loaded_package`` already
+# guarantees the in-process path imports the same ``grant_agent``, and the
+# OpenClaw agent mode is read by runtime launches, which never run in process.
+SUBPROCESS_ONLY_ENV = frozenset({"PYTHONPATH", "SYNTELOS_OPENCLAW_AGENT_MODE"})
+# Overrides that in-process commands read through ``command_env``.
+CONTEXT_LOCAL_ENV = frozenset({"FLUXIO_CONTROL_ROOM_FAST"})
+PACKAGE_DIR = Path(__file__).resolve().parent
+_COMMAND_ENV: ContextVar[dict[str, str] | None] = ContextVar("fluxio_cli_command_env", default=None)
+
+
+def in_process_cli_enabled() -> bool:
+    return os.environ.get(IN_PROCESS_ENV, "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _configured_workers() -> int:
+    try:
+        return max(1, int(os.environ.get(WORKERS_ENV, "") or DEFAULT_WORKERS))
+    except ValueError:
+        return DEFAULT_WORKERS
+
+
+def runs_loaded_package(root: Path) -> bool:
+    """True when ``root`` would import the same ``grant_agent`` as this process.
+
+    The subprocess path prepends ``<root>/src`` to ``PYTHONPATH``; a root that
+    ships its own checkout must keep doing that instead of running our code.
+    """
+    candidate = root / "src" / "grant_agent"
+    if not candidate.exists():
+        return True
+    try:
+        return candidate.resolve() == PACKAGE_DIR
+    except OSError:
+        return False
+
+
+class _ThreadRoutedStream(io.TextIOBase):
+    """``sys.stdout``/``sys.stderr`` stand-in that captures per worker thread.
+
+    ``contextlib.redirect_stdout`` swaps the process-wide stream, so two
+    commands running at once would interleave their JSON. Threads that
+    registered a buffer write into it; every other thread falls through to
+    the stream that was installed before us.
+    """
+
+    def __init__(self, fallback) -> None:
+        super().__init__()
+        self.fallback = fallback
+        self._buffers: dict[int, io.StringIO] = {}
+
+    def register(self, buffer: io.StringIO) -> None:
+        self._buffers[threading.get_ident()] = buffer
+
+    def unregister(self) -> None:
+        self._buffers.pop(threading.get_ident(), None)
+
+    def _target(self):
+        return self._buffers.get(threading.get_ident(), self.fallback)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        target = self._target()
+        if target is not None:
+            target.flush()
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return str(getattr(self.fallback, "encoding", None) or "utf-8")
+
+    def isatty(self) -> bool:
+        target = self._target()
+        return bool(target is not None and target is self.fallback and target.isatty())
+
+    def fileno(self) -> int:
+        return self.fallback.fileno()
+
+
+class _StreamRouter:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._active = 0
+        self._stdout: _ThreadRoutedStream | None = None
+        self._stderr: _ThreadRoutedStream | None = None
+
+    def _install_locked(self) -> None:
+        if not isinstance(sys.stdout, _ThreadRoutedStream):
+            self._stdout = _ThreadRoutedStream(sys.stdout)
+            sys.stdout = self._stdout
+        else:
+            self._stdout = sys.stdout
+        if not isinstance(sys.stderr, _ThreadRoutedStream):
+            self._stderr = _ThreadRoutedStream(sys.stderr)
+            sys.stderr = self._stderr
+        else:
+            self._stderr = sys.stderr
+
+    def _uninstall_locked(self) -> None:
+        if sys.stdout is self._stdout and self._stdout is not None:
+            sys.stdout = self._stdout.fallback
+        if sys.stderr is self._stderr and self._stderr is not None:
+            sys.stderr = self._stderr.fallback
+        self._stdout = None
+        self._stderr = None
+
+    @contextmanager
+    def capture(self, stdout: io.StringIO, stderr: io.StringIO) -> Iterator[None]:
+        with self._lock:
+            if not self._active:
+                self._install_locked()
+            self._active += 1
+            routed_stdout, routed_stderr = self._stdout, self._stderr
+        assert routed_stdout is not None and routed_stderr is not None
+        routed_stdout.register(stdout)
+        routed_stderr.register(stderr)
+        try:
+            yield
+        finally:
+            routed_stdout.unregister()
+            routed_stderr.unregister()
+            with self._lock:
+                self._active -= 1
+                if not self._active:
+                    self._uninstall_locked()
+
+
+def command_env(name: str, default: str | None = None) -> str | None:
+    """``os.environ.get`` that also sees the overrides of an in-process CLI command.
+
+    In-process commands never touch the shared ``os.environ``; keys listed in
+    ``CONTEXT_LOCAL_ENV`` reach them through this context-local layer instead.
+    """
+    overrides = _COMMAND_ENV.get()
+    if overrides and name in overrides:
+        return overrides[name]
+    return os.environ.get(name, default)
+
+
+def _default_entrypoint(argv: list[str]) -> int:
+    from . import cli
+
+    return int(cli.main(argv) or 0)
+
+
+class CliExecutor:
+    """Run ``grant_agent.cli`` commands on a bounded in-process worker pool.
+
+    Results come back as ``subprocess.CompletedProcess`` so callers parse the
+    in-process and subprocess paths identically. A timed-out command cannot be
+    interrupted; its worker keeps running and its output is discarded. Callers
+    check ``accepts`` first: a command whose environment differs from this
+    process, or that would have to queue behind busy (possibly hung) workers,
+    belongs on the subprocess path.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        entrypoint: Callable[[list[str]], int] | None = None,
+    ) -> None:
+        self.max_workers = max_workers or _configured_workers()
+        self._entrypoint = entrypoint or _default_entrypoint
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+        self._streams = _StreamRouter()
+        self._in_flight = 0
+        self._stats_lock = threading.Lock()
+        self._stats: dict[str, dict[str, Any]] = {}
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="fluxio-cli",
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def env_conflicts(self, extra_env: dict[str, str] | None) -> list[str]:
+        """Override keys an in-process run could only honour by mutating ``os.environ``."""
+        return sorted(
+            key
+            for key, value in (extra_env or {}).items()
+            if key not in SUBPROCESS_ONLY_ENV and key not in CONTEXT_LOCAL_ENV and os.environ.get(key) != value
+        )
+
+    def has_capacity(self) -> bool:
+        with self._stats_lock:
+            return self._in_flight < self.max_workers
+
+    def accepts(self, extra_env: dict[str, str] | None = None) -> bool:
+        return not self.env_conflicts(extra_env) and self.has_capacity()
+
+    def _invoke(self, argv: list[str], extra_env: dict[str, str]) -> subprocess.CompletedProcess:
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        returncode = 0
+        token = _COMMAND_ENV.set({key: value for key, value in extra_env.items() if key in CONTEXT_LOCAL_ENV})
+        try:
+            with self._streams.capture(stdout, stderr):
+                try:
+                    returncode = self._entrypoint(argv)
+                except SystemExit as exc:
+                    code = exc.code
+                    if code is None:
+                        returncode = 0
+                    elif isinstance(code, int):
+                        returncode = code
+                    else:
+                        stderr.write(f"{code}\n")
+                        returncode = 1
+                except Exception:  # noqa: BLE001 - mirror an interpreter crash
+                    stderr.write(traceback.format_exc())
+                    returncode = 1
+        finally:
+            _COMMAND_ENV.reset(token)
+            with self._stats_lock:
+                self._in_flight -= 1
+        return subprocess.CompletedProcess(argv, returncode, stdout.getvalue(), stderr.getvalue())
+
+    def run(
+        self,
+        argv: list[str],
+        *,
+        timeout: float,
+        extra_env: dict[str, str] | None = None,
+    ) -> subprocess.CompletedProcess:
+        conflicts = self.env_conflicts(extra_env)
+        if conflicts:
+            raise ValueError(f"In-process CLI cannot apply environment overrides: {', '.join(conflicts)}")
+        with self._stats_lock:
+            self._in_flight += 1
+        try:
+            future = self._executor().submit(self._invoke, list(argv), dict(extra_env or {}))
+        except BaseException:
+            with self._stats_lock:
+                self._in_flight -= 1
+            raise
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError as exc:
+            if future.cancel():
+                with self._stats_lock:
+                    self._in_flight -= 1
+            raise subprocess.TimeoutExpired(argv, timeout) from exc
+
+    def record(self, command: str, *, mode: str, duration_ms: float, ok: bool) -> None:
+        with self._stats_lock:
+            stats = self._stats.setdefault(
+                command,
+                {
+                    "count": 0,
+                    "failures": 0,
+                    "inProcess": 0,
+                    "subprocess": 0,
+                    "totalMs": 0.0,
+                    "maxMs": 0.0,
+                    "lastMs": 0.0,
+                    "lastMode": mode,
+                },
+            )
+            stats["count"] += 1
+            stats["failures"] += 0 if ok else 1
+            stats["inProcess" if mode == "in-process" else "subprocess"] += 1
+            stats["totalMs"] += duration_ms
+            stats["maxMs"] = max(stats["maxMs"], duration_ms)
+            stats["lastMs"] = duration_ms
+            stats["lastMode"] = mode
+
+    def latency_stats(self) -> dict[str, dict[str, Any]]:
+        with self._stats_lock:
+            return {
+                command: {
+                    **stats,
+                    "totalMs": round(stats["totalMs"], 3),
+                    "maxMs": round(stats["maxMs"], 3),
+                    "lastMs": round(stats["lastMs"], 3),
+                    "avgMs": round(stats["totalMs"] / stats["count"], 3) if stats["count"] else 0.0,
+                }
+                for command, stats in sorted(self._stats.items())
+            }
+
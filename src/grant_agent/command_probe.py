@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+COMMAND_PROBE_WORKERS_ENV = "FLUXIO_COMMAND_PROBE_WORKERS"
+COMMAND_PROBE_DEFAULT_WORKERS = 8
+COMMAND_PROBE_CACHE_TTL_SECONDS = max(
+    float(os.environ.get("FLUXIO_COMMAND_PROBE_CACHE_TTL_SECONDS", "300")),
+    5.0,
+)
+
+_T = TypeVar("_T")
+_ProbeKey = tuple[str, ...]
+_BinarySignature = tuple[str, int, int]
+
+_COMMAND_PROBE_LOCK = threading.Lock()
+_COMMAND_PROBE_CACHE: dict[_ProbeKey, tuple[_BinarySignature, float, Any]] = {}
+_COMMAND_PROBE_INFLIGHT: dict[_ProbeKey, Future] = {}
+
+
+def _binary_signature(command: str) -> _BinarySignature | None:
+    try:
+        stat = os.stat(command)
+    except (OSError, ValueError):
+        return None
+    return command, stat.st_mtime_ns, stat.st_size
+
+
+def probe_command(args: list[str], **kwargs: Any) -> Any:
+    """``subprocess.run(args, **kwargs)`` shared by every caller probing the same command.
+
+    Meant for read-only probes such as ``--version`` or ``wsl bash -lc`` lookups
+    whose answer is a property of the binary, not of the caller's cwd or env:
+    the key is the argument vector alone, so onboarding and runtime detection
+    asking the same question share one subprocess. A probe already running in
+    another thread is awaited rather than started twice. Completed results are
+    kept while ``args[0]`` keeps its mtime and size, bounded by
+    ``COMMAND_PROBE_CACHE_TTL_SECONDS`` for wrappers like ``wsl`` whose target
+    can change underneath an unchanged binary. Commands that cannot be stat'ed
+    are never cached, and exceptions (timeouts, missing binaries) propagate to
+    every waiter without being cached.
+    """
+    key = tuple(str(arg) for arg in args)
+    signature = _binary_signature(key[0]) if key else None
+    now = time.monotonic()
+    with _COMMAND_PROBE_LOCK:
+        cached = _COMMAND_PROBE_CACHE.get(key)
+        if (
+            signature is not None
+            and cached is not None
+            and cached[0] == signature
+            and now - cached[1] < COMMAND_PROBE_CACHE_TTL_SECONDS
+        ):
+            return cached[2]
+        waiting = _COMMAND_PROBE_INFLIGHT.get(key)
+        if waiting is None:
+            owner: Future = Future()
+            _COMMAND_PROBE_INFLIGHT[key] = owner
+    if waiting is not None:
+        return waiting.result()
+    try:
+        completed = subprocess.run(list(args), **kwargs)  # noqa: S603
+    except BaseException as exc:
+        with _COMMAND_PROBE_LOCK:
+            _COMMAND_PROBE_INFLIGHT.pop(key, None)
+        owner.set_exception(exc)
+        raise
+    with _COMMAND_PROBE_LOCK:
+        _COMMAND_PROBE_INFLIGHT.pop(key, None)
+        if signature is not None:
+            _COMMAND_PROBE_CACHE[key] = (signature, time.monotonic(), completed)
+    owner.set_result(completed)
+    return completed
+
+
+def gather_probes(calls: dict[str, Callable[[], _T]]) -> dict[str, _T]:
+    """Run independent probe callables concurrently and return results by name.
+
+    Each call keeps the timeout of the subprocess it wraps, so the whole batch
+    takes as long as its slowest probe rather than the sum of all of them.
+    """
+    if not calls:
+        return {}
+    try:
+        workers = int(os.environ.get(COMMAND_PROBE_WORKERS_ENV, COMMAND_PROBE_DEFAULT_WORKERS))
+    except ValueError:
+        workers = COMMAND_PROBE_DEFAULT_WORKERS
+    workers = max(1, min(workers, len(calls)))
+    if workers == 1:
+        return {name: call() for name, call in calls.items()}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fluxio-command-probe") as pool:
+        futures = {name: pool.submit(call) for name, call in calls.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def invalidate_command_probe_cache() -> None:
+    with _COMMAND_PROBE_LOCK:
+        _COMMAND_PROBE_CACHE.clear()
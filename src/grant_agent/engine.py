@@ -618,6 +618,7 @@ class AutonomousEngine:
                             for r in verification_results
                             if r.return_code != 0
                         ],
+                        "cached": [r.command for r in verification_results if r.cached],
                     },
                 ),
             )
@@ -1,11 +1,169 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
+import threading
+import time
 from pathlib import Path
 
+from .checkpoints import CheckpointStore
+
+RUN_METRICS_FILENAME = "run_metrics.json"
+RUN_METRICS_INDEX_FILENAME = "run_metrics_index.json"
+RUN_METRICS_VERSION = 1
+# Files touched this recently can change again without moving their mtime,
+# so sessions with such files are re-read on every summary until they settle.
+RUN_METRICS_RACY_NS = 2_000_000_000
+
+_RUN_METRICS_INDEX_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
+_RUN_METRICS_INDEX_LOCK = threading.Lock()
+
+
+def run_metrics_from_state(state: dict) -> dict:
+    """Per-session contribution of a persisted ``state.json`` payload to ``summarize_runs``."""
+    verification_commands = 0
+    blocked_commands = 0
+    verification_failures = 0
+    for result in state.get("verification_results", []):
+        verification_commands += 1
+        if result.get("status") == "blocked":
+            blocked_commands += 1
+        if result.get("return_code", 1) != 0:
+            verification_failures += 1
+    context = state.get("context", {})
+    usage_ratio = context.get("usage_ratio")
+    return {
+        "doc_evidence": bool(state.get("doc_evidence")),
+        "memory_writes": bool(state.get("memory_item_ids")),
+        "usage_ratio": float(usage_ratio) if isinstance(usage_ratio, (int, float)) else None,
+        "verification_commands": verification_commands,
+        "blocked_commands": blocked_commands,
+        "verification_failures": verification_failures,
+    }
+
+
+def write_run_metrics(session_path: Path, state: dict) -> None:
+    """Record the session's metrics next to the ``state.json`` they were derived from."""
+    try:
+        state_stat = (session_path / "state.json").stat()
+    except OSError:
+        return
+    payload = {
+        "version": RUN_METRICS_VERSION,
+        "state_signature": [state_stat.st_mtime_ns, state_stat.st_size],
+        "metrics": run_metrics_from_state(state),
+    }
+    _write_json_atomic(session_path / RUN_METRICS_FILENAME, payload)
+
+
+def _write_json_atomic(path: Path, payload: dict) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _mtime_and_size(path: str) -> tuple[int, int]:
+    try:
+        path_stat = os.stat(path)
+    except OSError:
+        return -1, -1
+    return path_stat.st_mtime_ns, path_stat.st_size
+
+
+def _session_signature(session: str, dir_mtime_ns: int) -> list[int]:
+    # Plain string paths: building Path objects dominated warm summaries.
+    state_mtime_ns, state_size = _mtime_and_size(os.path.join(session, "state.json"))
+    checkpoints_mtime_ns, _ = _mtime_and_size(os.path.join(session, "checkpoints"))
+    return [dir_mtime_ns, state_mtime_ns, state_size, checkpoints_mtime_ns]
+
+
+def _scan_session(session: Path, signature: list[int]) -> dict:
+    entry: dict = {
+        "signature": signature,
+        "handoff": any(session.glob("handoff_packet_*.json")),
+        "has_state": signature[1] >= 0,
+    }
+    if not entry["has_state"]:
+        return entry
+    metrics = None
+    try:
+        recorded = json.loads((session / RUN_METRICS_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        recorded = None
+    if (
+        isinstance(recorded, dict)
+        and recorded.get("version") == RUN_METRICS_VERSION
+        and recorded.get("state_signature") == signature[1:3]
+    ):
+        metrics = recorded.get("metrics")
+    if not isinstance(metrics, dict):
+        metrics = run_metrics_from_state(json.loads((session / "state.json").read_text(encoding="utf-8")))
+    entry["metrics"] = metrics
+    entry["checkpoints"] = signature[3] >= 0 and bool(CheckpointStore.list(session))
+    return entry
+
+
+def _load_index(index_path: Path) -> dict:
+    try:
+        index_stat = index_path.stat()
+    except OSError:
+        return {}
+    signature = (index_stat.st_mtime_ns, index_stat.st_size)
+    key = str(index_path)
+    with _RUN_METRICS_INDEX_LOCK:
+        cached = _RUN_METRICS_INDEX_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    try:
+        payload = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    sessions = payload.get("sessions") if isinstance(payload, dict) else None
+    if not isinstance(sessions, dict) or payload.get("version") != RUN_METRICS_VERSION:
+        return {}
+    with _RUN_METRICS_INDEX_LOCK:
+        _RUN_METRICS_INDEX_CACHE[key] = (signature, sessions)
+    return sessions
+
+
+def _save_index(index_path: Path, sessions: dict) -> None:
+    _write_json_atomic(index_path, {"version": RUN_METRICS_VERSION, "sessions": sessions})
+    try:
+        index_stat = index_path.stat()
+    except OSError:
+        return
+    with _RUN_METRICS_INDEX_LOCK:
+        _RUN_METRICS_INDEX_CACHE[str(index_path)] = ((index_stat.st_mtime_ns, index_stat.st_size), sessions)
+
 
 def summarize_runs(base_dir: Path) -> dict:
-    sessions = [p for p in base_dir.glob("session_*") if p.is_dir()]
+    """Aggregate run metrics over every ``session_*`` directory in ``base_dir``.
+
+    Per-session contributions are kept in ``run_metrics_index.json`` keyed on
+    the mtimes of the session directory, its ``state.json`` and its
+    ``checkpoints`` folder, so a repeat summary only re-reads sessions that
+    changed. Changed sessions prefer the ``run_metrics.json`` record written
+    with their state over parsing ``state.json``.
+    """
+    # Same directory order as ``base_dir.glob("session_*")``.
+    sessions: list[tuple[str, str, int]] = []
+    try:
+        with os.scandir(base_dir) as entries:
+            for dir_entry in entries:
+                if not dir_entry.name.startswith("session_"):
+                    continue
+                try:
+                    path_stat = dir_entry.stat()
+                except OSError:
+                    continue
+                if stat.S_ISDIR(path_stat.st_mode):
+                    sessions.append((dir_entry.name, dir_entry.path, path_stat.st_mtime_ns))
+    except OSError:
+        pass
     if not sessions:
         return {
             "total_sessions": 0,
@@ -19,6 +177,21 @@ def summarize_runs(base_dir: Path) -> dict:
             "average_context_usage_ratio": 0.0,
         }
 
+    index_path = base_dir / RUN_METRICS_INDEX_FILENAME
+    indexed = _load_index(index_path)
+    racy_after_ns = time.time_ns() - RUN_METRICS_RACY_NS
+    entries: dict[str, dict] = {}
+    changed = False
+    for name, session, dir_mtime_ns in sessions:
+        signature = _session_signature(session, dir_mtime_ns)
+        entry = indexed.get(name)
+        if not isinstance(entry, dict) or entry.get("signature") != signature or max(signature) > racy_after_ns:
+            entry = _scan_session(Path(session), signature)
+            changed = True
+        entries[name] = entry
+    if changed or len(entries) != len(indexed):
+        _save_index(index_path, entries)
+
     sessions_with_handoff = 0
     verification_failures = 0
     verification_commands = 0
@@ -28,31 +201,24 @@ def summarize_runs(base_dir: Path) -> dict:
     runs_with_checkpoints = 0
     usage_ratios: list[float] = []
 
-    for session in sessions:
-        if list(session.glob("handoff_packet_*.json")):
+    for name, _, _ in sessions:
+        entry = entries[name]
+        if entry.get("handoff"):
             sessions_with_handoff += 1
-
-        state_path = session / "state.json"
-        if not state_path.exists():
+        if not entry.get("has_state"):
             continue
-        payload = json.loads(state_path.read_text(encoding="utf-8"))
-        if payload.get("doc_evidence"):
+        metrics = entry.get("metrics") or {}
+        if metrics.get("doc_evidence"):
             runs_with_doc_evidence += 1
-        if payload.get("memory_item_ids"):
+        if metrics.get("memory_writes"):
             runs_with_memory_writes += 1
-        if (session / "checkpoints").exists() and list((session / "checkpoints").glob("ckpt_*.json")):
+        if entry.get("checkpoints"):
             runs_with_checkpoints += 1
-        context = payload.get("context", {})
-        usage_ratio = context.get("usage_ratio")
-        if isinstance(usage_ratio, (int, float)):
-            usage_ratios.append(float(usage_ratio))
-
-        for result in payload.get("verification_results", []):
-            verification_commands += 1
-            if result.get("status") == "blocked":
-                blocked_commands += 1
-            if result.get("return_code", 1) != 0:
-                verification_failures += 1
+        if metrics.get("usage_ratio") is not None:
+            usage_ratios.append(float(metrics["usage_ratio"]))
+        verification_commands += int(metrics.get("verification_commands") or 0)
+        blocked_commands += int(metrics.get("blocked_commands") or 0)
+        verification_failures += int(metrics.get("verification_failures") or 0)
 
     average_usage = sum(usage_ratios) / len(usage_ratios) if usage_ratios else 0.0
     return {
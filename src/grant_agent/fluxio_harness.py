@@ -22,6 +22,7 @@ from .doc_ingestion import ingest_docs
 from .engine import AutonomousEngine
 from .handoff import create_handoff_packet, save_handoff_packet
 from .mission_control import hermes_auth_store_candidates
+from .mission_store import load_mission_payloads
 from .models import (
     ActionExecutionRecord,
     ActionProposal,
@@ -606,12 +607,8 @@ def build_route_outcome_trends(root: Path, limit: int = AUTONOMY_HISTORY_LIMIT)
         ):
             scanned += 1
 
-    missions_path = root / ".agent_control" / "missions.json"
     mission_scanned = 0
-    try:
-        missions_payload = json.loads(missions_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
-        missions_payload = []
+    missions_payload = load_mission_payloads(root / ".agent_control")
     if isinstance(missions_payload, list):
         mission_rows = [
             item for item in missions_payload
@@ -3115,6 +3112,9 @@ class FluxioHarness:
         failed = [item.command for item in results if item.return_code != 0 or item.status != "executed"]
         if failed:
             return f"Verification failed: {', '.join(failed[:2])}"
+        cached = sum(1 for item in results if item.cached)
+        if cached:
+            return f"Verification passed for {len(results)} command(s) ({cached} unchanged since their last pass)."
         return f"Verification passed for {len(results)} command(s)."
 
     @staticmethod
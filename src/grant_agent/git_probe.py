@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import copy
+import re
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+# Working-tree edits touch neither .git/index nor HEAD, so a cached status is
+# also bounded by age.
+GIT_STATUS_CACHE_TTL_SECONDS = 30.0
+GIT_STATUS_TIMEOUT_SECONDS = 8
+_GIT_STATUS_CACHE_LOCK = threading.Lock()
+_GIT_STATUS_CACHE: dict[str, tuple[tuple, float, dict]] = {}
+_REMOTE_SECTION_PATTERN = re.compile(r'^\s*\[\s*remote\s+"((?:[^"\\]|\\.)*)"\s*\]')
+_SECTION_PATTERN = re.compile(r"^\s*\[")
+_CONFIG_VALUE_PATTERN = re.compile(r"^\s*(url|pushurl)\s*=\s*(.*?)\s*$", re.IGNORECASE)
+
+
+def empty_git_status() -> dict:
+    return {
+        "repoDetected": False,
+        "gitDir": "",
+        "branch": "",
+        "trackingBranch": "",
+        "ahead": 0,
+        "behind": 0,
+        "dirty": False,
+        "stagedCount": 0,
+        "unstagedCount": 0,
+        "untrackedCount": 0,
+        "changedFiles": [],
+        "remotes": [],
+        "processCount": 0,
+    }
+
+
+def locate_git_dir(workspace_root: Path) -> tuple[Path, Path] | None:
+    """Return ``(git_dir, common_dir)`` for the repo containing ``workspace_root``.
+
+    Follows ``.git`` pointer files used by worktrees and submodules. The
+    common dir holds the shared ``config``; for a plain checkout both are the
+    same directory.
+    """
+    try:
+        candidate = workspace_root.resolve()
+    except OSError:
+        return None
+    for folder in (candidate, *candidate.parents):
+        git_path = folder / ".git"
+        try:
+            if git_path.is_dir():
+                return git_path, git_path
+            if not git_path.is_file():
+                continue
+            pointer = git_path.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        if not pointer.startswith("gitdir:"):
+            return None
+        git_dir = Path(pointer.removeprefix("gitdir:").strip())
+        if not git_dir.is_absolute():
+            git_dir = (folder / git_dir).resolve()
+        common_dir = git_dir
+        try:
+            common_pointer = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+        except OSError:
+            common_pointer = ""
+        if common_pointer:
+            common_dir = Path(common_pointer)
+            if not common_dir.is_absolute():
+                common_dir = (git_dir / common_dir).resolve()
+        return git_dir, common_dir
+    return None
+
+
+def git_state_key(workspace_root: Path) -> tuple | None:
+    """Cheap stat-only fingerprint of the index, HEAD and remote config."""
+    located = locate_git_dir(workspace_root)
+    if located is None:
+        return None
+    git_dir, common_dir = located
+    key: list[object] = [str(git_dir)]
+    for path in (git_dir / "index", git_dir / "HEAD", common_dir / "config"):
+        try:
+            stat = path.stat()
+        except OSError:
+            key.append((path.name, 0, 0))
+        else:
+            key.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+
+def read_git_remotes(config_path: Path) -> list[dict]:
+    """Parse remotes from a git config file without spawning ``git remote -v``.
+
+    Mirrors the push side of ``git remote -v``: ``pushurl`` entries win over
+    ``url``. ``include``/``insteadOf`` indirections are not followed.
+    """
+    try:
+        lines = config_path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return []
+    remotes: dict[str, dict[str, list[str]]] = {}
+    current = ""
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+        section = _REMOTE_SECTION_PATTERN.match(line)
+        if section:
+            current = section.group(1).replace('\\"', '"').replace("\\\\", "\\")
+            remotes.setdefault(current, {"url": [], "pushurl": []})
+            continue
+        if _SECTION_PATTERN.match(line):
+            current = ""
+            continue
+        if not current:
+            continue
+        value = _CONFIG_VALUE_PATTERN.match(line)
+        if value:
+            raw = value.group(2)
+            if len(raw) >= 2 and raw[0] == raw[-1] == '"':
+                raw = raw[1:-1]
+            remotes[current][value.group(1).lower()].append(raw)
+    result = []
+    seen = set()
+    for name, urls in remotes.items():
+        for url in urls["pushurl"] or urls["url"]:
+            if (name, url) in seen:
+                continue
+            seen.add((name, url))
+            result.append({"name": name, "url": url})
+    return result
+
+
+def parse_porcelain_v2(output: str) -> dict:
+    """Parse ``git status --porcelain=v2 --branch -z`` into status counts."""
+    status = {
+        "branch": "",
+        "trackingBranch": "",
+        "ahead": 0,
+        "behind": 0,
+        "stagedCount": 0,
+        "unstagedCount": 0,
+        "untrackedCount": 0,
+        "changedFiles": [],
+    }
+    entries = output.split("\0")
+    index = 0
+    while index < len(entries):
+        entry = entries[index]
+        index += 1
+        if not entry:
+            continue
+        if entry.startswith("# "):
+            header, _, value = entry[2:].partition(" ")
+            if header == "branch.head":
+                status["branch"] = "HEAD (no branch)" if value == "(detached)" else value
+            elif header == "branch.upstream":
+                status["trackingBranch"] = value
+            elif header == "branch.ab":
+                for part in value.split():
+                    if part.startswith("+") and part[1:].isdigit():
+                        status["ahead"] = int(part[1:])
+                    elif part.startswith("-") and part[1:].isdigit():
+                        status["behind"] = int(part[1:])
+            continue
+        kind = entry[:1]
+        if kind == "?":
+            path_text = entry[2:]
+            status["untrackedCount"] += 1
+        elif kind in {"1", "2", "u"}:
+            field_count = {"1": 9, "2": 10, "u": 11}[kind]
+            fields = entry.split(" ", field_count - 1)
+            if len(fields) < field_count:
+                continue
+            code = fields[1]
+            path_text = fields[-1]
+            if kind == "2":
+                # The rename source follows as its own NUL-terminated field.
+                index += 1
+            if code[:1] != ".":
+                status["stagedCount"] += 1
+            if code[1:2] != ".":
+                status["unstagedCount"] += 1
+        else:
+            continue
+        if path_text and path_text not in status["changedFiles"]:
+            status["changedFiles"].append(path_text)
+    return status
+
+
+def _probe_git_status(workspace_root: Path) -> dict:
+    status = empty_git_status()
+    if not workspace_root.exists():
+        return status
+    located = locate_git_dir(workspace_root)
+    if located is None:
+        return status
+    git_dir, common_dir = located
+    status["processCount"] = 1
+    try:
+        completed = subprocess.run(  # noqa: S603
+            # --no-optional-locks keeps status from rewriting the index, which
+            # would also churn the cache key.
+            ["git", "--no-optional-locks", "status", "--porcelain=v2", "--branch", "-z"],
+            cwd=str(workspace_root),
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=GIT_STATUS_TIMEOUT_SECONDS,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return status
+    if completed.returncode != 0:
+        return status
+    status.update(parse_porcelain_v2(completed.stdout or ""))
+    status["repoDetected"] = True
+    status["gitDir"] = str(git_dir)
+    status["dirty"] = bool(status["stagedCount"] or status["unstagedCount"] or status["untrackedCount"])
+    status["remotes"] = read_git_remotes(common_dir / "config")
+    return status
+
+
+def read_git_status(
+    workspace_root: Path,
+    *,
+    max_age: float = GIT_STATUS_CACHE_TTL_SECONDS,
+) -> tuple[dict, str]:
+    """Return the repo status for ``workspace_root`` and how it was served.
+
+    The second value is ``hit``, ``miss`` or ``uncached``. Entries are keyed on
+    the index/HEAD/config stat fingerprint and reused for at most
+    ``max_age`` seconds; ``max_age=0`` always re-probes but still refreshes the
+    shared entry. Callers get their own copy.
+    """
+    state_key = git_state_key(workspace_root)
+    if state_key is None:
+        return _probe_git_status(workspace_root), "uncached"
+    cache_key = str(workspace_root.resolve())
+    now = time.monotonic()
+    if max_age > 0:
+        with _GIT_STATUS_CACHE_LOCK:
+            cached = _GIT_STATUS_CACHE.get(cache_key)
+        if cached and cached[0] == state_key and now - cached[1] <= max_age:
+            hit = copy.deepcopy(cached[2])
+            hit["processCount"] = 0
+            return hit, "hit"
+    status = _probe_git_status(workspace_root)
+    with _GIT_STATUS_CACHE_LOCK:
+        _GIT_STATUS_CACHE[cache_key] = (state_key, now, copy.deepcopy(status))
+    return status, "miss"
+
+
+def git_changed_files(workspace_root: Path) -> list[str]:
+    """Freshly probed changed paths, relative to the repository root."""
+    status, _ = read_git_status(workspace_root, max_age=0)
+    return list(status["changedFiles"])
+
+
+def invalidate_git_status(workspace_root: Path | None = None) -> None:
+    with _GIT_STATUS_CACHE_LOCK:
+        if workspace_root is None:
+            _GIT_STATUS_CACHE.clear()
+            return
+        _GIT_STATUS_CACHE.pop(str(workspace_root.resolve()), None)
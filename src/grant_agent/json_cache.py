@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import marshal
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+
+class JsonFileCache:
+    """LRU of parsed JSON files, validated by each file's mtime and size.
+
+    Payloads are held as ``marshal`` blobs: the blob length is the byte cost
+    charged against ``max_bytes``, and every hit unmarshals a private copy, so
+    callers may mutate what they get back without corrupting the cache.
+    Unmarshalling is also cheaper than re-parsing the JSON text.
+    """
+
+    def __init__(self, *, max_bytes: int, max_items: int) -> None:
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[int, int, bytes]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, path: Path, default: Any) -> Any:
+        try:
+            stat = path.stat()
+        except OSError:
+            return default
+        if stat.st_size <= 0:
+            return default
+        cache_key = str(path.resolve())
+        with self._lock:
+            cached = self._entries.get(cache_key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                blob = cached[2]
+            else:
+                self.misses += 1
+                blob = None
+        if blob is not None:
+            return marshal.loads(blob)
+        try:
+            raw = path.read_text(encoding="utf-8").strip()
+        except OSError:
+            return default
+        if not raw:
+            return default
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError:
+            return default
+        if isinstance(payload, (list, dict)):
+            self._store(cache_key, stat.st_mtime_ns, stat.st_size, marshal.dumps(payload))
+        return payload
+
+    def _store(self, cache_key: str, mtime_ns: int, size: int, blob: bytes) -> None:
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self._bytes -= len(previous[2])
+            if len(blob) > self.max_bytes:
+                return
+            self._entries[cache_key] = (mtime_ns, size, blob)
+            self._bytes += len(blob)
+            while self._entries and (len(self._entries) > self.max_items or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted[2])
+                self.evictions += 1
+
+    def invalidate(self, path: Path) -> None:
+        try:
+            cache_key = str(path.resolve())
+        except OSError:
+            cache_key = str(path)
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self._bytes -= len(previous[2])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxEntries": self.max_items,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -1,18 +1,38 @@
 from __future__ import annotations
 
+import heapq
 import json
+import marshal
+import math
+import os
 import re
+import threading
 import uuid
+from collections import Counter
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from .models import utc_now_iso
 
+MEMORY_LOG_SCHEMA = "fluxio.memory_log.v1"
+MEMORY_LOG_SUFFIX = ".log.jsonl"
+MEMORY_LOG_COMPACT_THRESHOLD = 512
+MEMORY_INDEX_SUFFIX = ".index.marshal"
+MEMORY_INDEX_VERSION = 1
+BM25_K1 = 1.2
+BM25_B = 0.75
+_MEMORY_CORPUS_CACHE_LOCK = threading.Lock()
+_MEMORY_CORPUS_CACHE: dict[str, tuple[tuple, "_MemoryCorpus"]] = {}
+
 
 def _tokens(text: str) -> set[str]:
     return set(re.findall(r"[a-z0-9]+", text.lower()))
 
 
+def _token_counts(text: str) -> Counter[str]:
+    return Counter(re.findall(r"[a-z0-9]+", text.lower()))
+
+
 @dataclass
 class MemoryItem:
     id: str
@@ -24,34 +44,277 @@ class MemoryItem:
     kind: str
 
 
+def _item_from_raw(raw: dict) -> MemoryItem:
+    return MemoryItem(
+        id=raw["id"],
+        created_at=raw["created_at"],
+        source_session_id=raw["source_session_id"],
+        objective=raw["objective"],
+        content=raw["content"],
+        tags=raw.get("tags", []),
+        kind=raw.get("kind", "note"),
+    )
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _log_header_matches(line: str, snapshot_signature: tuple[int, int] | None) -> bool:
+    try:
+        header = json.loads(line)
+    except ValueError:
+        return False
+    if not isinstance(header, dict) or header.get("schema") != MEMORY_LOG_SCHEMA:
+        return False
+    return tuple(header.get("base") or ()) == tuple(snapshot_signature or (0, 0))
+
+
+class _MemoryIndex:
+    """Token -> {item position: term frequency} postings over one item list."""
+
+    def __init__(self) -> None:
+        self.postings: dict[str, dict[int, int]] = {}
+        self.lengths: list[int] = []
+        self.total_length = 0
+
+    @classmethod
+    def load(cls, path: Path, base: tuple[int, int], count: int, last_id: str) -> "_MemoryIndex | None":
+        """Read postings persisted for the first ``count`` items of the snapshot ``base``."""
+        try:
+            payload = marshal.loads(path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != MEMORY_INDEX_VERSION
+            or tuple(payload.get("base") or ()) != base
+            or payload.get("count") != count
+            or payload.get("last_id") != last_id
+        ):
+            return None
+        postings, lengths = payload.get("postings"), payload.get("lengths")
+        if not isinstance(postings, dict) or not isinstance(lengths, list) or len(lengths) != count:
+            return None
+        index = cls()
+        index.postings = postings
+        index.lengths = lengths
+        index.total_length = int(payload.get("total_length") or 0)
+        return index
+
+    def persist(self, path: Path, base: tuple[int, int], last_id: str) -> None:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        payload = {
+            "version": MEMORY_INDEX_VERSION,
+            "base": list(base),
+            "count": len(self.lengths),
+            "last_id": last_id,
+            "postings": self.postings,
+            "lengths": self.lengths,
+            "total_length": self.total_length,
+        }
+        try:
+            tmp_path.write_bytes(marshal.dumps(payload))
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def add(self, item: MemoryItem) -> None:
+        position = len(self.lengths)
+        counts = _token_counts(item.content + " " + " ".join(item.tags) + " " + item.objective)
+        for token, count in counts.items():
+            self.postings.setdefault(token, {})[position] = count
+        length = sum(counts.values())
+        self.lengths.append(length)
+        self.total_length += length
+
+    def score(self, query_tokens: set[str]) -> dict[int, list[float]]:
+        """Return ``{position: [matched query tokens, bm25]}`` for every matching item."""
+        count = len(self.lengths)
+        average_length = (self.total_length / count) if count else 1.0
+        scores: dict[int, list[float]] = {}
+        for token in query_tokens:
+            posting = self.postings.get(token)
+            if not posting:
+                continue
+            frequency = len(posting)
+            idf = math.log(1.0 + (count - frequency + 0.5) / (frequency + 0.5))
+            for position, term_frequency in posting.items():
+                norm = BM25_K1 * (1.0 - BM25_B + BM25_B * self.lengths[position] / (average_length or 1.0))
+                gain = idf * term_frequency * (BM25_K1 + 1.0) / (term_frequency + norm)
+                entry = scores.get(position)
+                if entry is None:
+                    scores[position] = [1, gain]
+                else:
+                    entry[0] += 1
+                    entry[1] += gain
+        return scores
+
+
+class _MemoryCorpus:
+    """Items of one memory file plus their lazily built index.
+
+    Shared by every ``MemoryStore`` on the same path in this process while the
+    snapshot and log files are unchanged on disk. Postings for the snapshot's
+    items are persisted next to it, keyed on the snapshot's size and mtime, so
+    a fresh process only indexes the log tail instead of every item.
+    """
+
+    def __init__(
+        self,
+        items: list[MemoryItem],
+        log_entries: int,
+        *,
+        index_path: Path | None = None,
+        snapshot_signature: tuple[int, int] | None = None,
+    ) -> None:
+        self.items = items
+        self.log_entries = log_entries
+        self.index_path = index_path
+        self.snapshot_signature = snapshot_signature
+        self.lock = threading.RLock()
+        self._index: _MemoryIndex | None = None
+
+    def _snapshot_index(self) -> _MemoryIndex:
+        snapshot_count = len(self.items) - self.log_entries
+        if self.index_path is None or self.snapshot_signature is None or snapshot_count <= 0:
+            return _MemoryIndex()
+        last_id = self.items[snapshot_count - 1].id
+        index = _MemoryIndex.load(self.index_path, self.snapshot_signature, snapshot_count, last_id)
+        if index is not None:
+            return index
+        index = _MemoryIndex()
+        for item in self.items[:snapshot_count]:
+            index.add(item)
+        index.persist(self.index_path, self.snapshot_signature, last_id)
+        return index
+
+    def index(self) -> _MemoryIndex:
+        with self.lock:
+            if self._index is None or len(self._index.lengths) > len(self.items):
+                self._index = self._snapshot_index()
+            for item in self.items[len(self._index.lengths):]:
+                self._index.add(item)
+            return self._index
+
+    def invalidate_index(self) -> None:
+        with self.lock:
+            self._index = None
+
+
 class MemoryStore:
+    """JSON memory snapshot plus an append-only insert log.
+
+    ``add`` appends one line to ``<path>.log.jsonl`` instead of rewriting the
+    snapshot. The log header records the snapshot's size and mtime, so a log
+    left behind by a replaced or deleted snapshot is ignored. After
+    ``MEMORY_LOG_COMPACT_THRESHOLD`` inserts the log is folded back into the
+    snapshot. ``search`` ranks through an inverted index, persisted for the
+    snapshot in ``<path>.index.marshal``: items matching more distinct query
+    tokens come first, then BM25, then tag count.
+    """
+
     def __init__(self, path: Path) -> None:
         self.path = path
-        self.items = self._load(path)
+        self.log_path = path.with_name(path.name + MEMORY_LOG_SUFFIX)
+        self.index_path = path.with_name(path.name + MEMORY_INDEX_SUFFIX)
+        self._corpus = self._load_corpus()
+        self.items = self._corpus.items
+
+    def _signature(self) -> tuple:
+        return (_file_signature(self.path), _file_signature(self.log_path))
+
+    def _load_corpus(self) -> _MemoryCorpus:
+        cache_key = str(self.path.resolve())
+        signature = self._signature()
+        with _MEMORY_CORPUS_CACHE_LOCK:
+            cached = _MEMORY_CORPUS_CACHE.get(cache_key)
+        if cached and cached[0] == signature:
+            return cached[1]
+        snapshot_signature = _file_signature(self.path)
+        items = self._load(self.path)
+        log_items = self._load_log(self.log_path, snapshot_signature)
+        corpus = _MemoryCorpus(
+            items + log_items,
+            len(log_items),
+            index_path=self.index_path,
+            snapshot_signature=snapshot_signature,
+        )
+        with _MEMORY_CORPUS_CACHE_LOCK:
+            _MEMORY_CORPUS_CACHE[cache_key] = (signature, corpus)
+        return corpus
+
+    def _remember_signature(self) -> None:
+        with _MEMORY_CORPUS_CACHE_LOCK:
+            _MEMORY_CORPUS_CACHE[str(self.path.resolve())] = (self._signature(), self._corpus)
 
     @staticmethod
     def _load(path: Path) -> list[MemoryItem]:
         if not path.exists():
             return []
         payload = json.loads(path.read_text(encoding="utf-8"))
+        return [_item_from_raw(raw) for raw in payload]
+
+    @staticmethod
+    def _load_log(log_path: Path, snapshot_signature: tuple[int, int] | None) -> list[MemoryItem]:
+        try:
+            lines = log_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return []
+        if not lines:
+            return []
+        if not _log_header_matches(lines[0], snapshot_signature):
+            return []
         items: list[MemoryItem] = []
-        for raw in payload:
-            items.append(
-                MemoryItem(
-                    id=raw["id"],
-                    created_at=raw["created_at"],
-                    source_session_id=raw["source_session_id"],
-                    objective=raw["objective"],
-                    content=raw["content"],
-                    tags=raw.get("tags", []),
-                    kind=raw.get("kind", "note"),
-                )
-            )
+        for line in lines[1:]:
+            try:
+                items.append(_item_from_raw(json.loads(line)))
+            except (ValueError, KeyError, TypeError):
+                # A torn final line from an interrupted append.
+                continue
         return items
 
     def save(self) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps([asdict(item) for item in self.items], indent=2), encoding="utf-8")
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(json.dumps([asdict(item) for item in self.items], indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        try:
+            self.log_path.unlink()
+        except FileNotFoundError:
+            pass
+        with self._corpus.lock:
+            self._corpus.log_entries = 0
+            self._corpus.snapshot_signature = _file_signature(self.path)
+            # Callers may have edited ``items`` in place before saving.
+            self._corpus.invalidate_index()
+        self._remember_signature()
+
+    def _append_log(self, item: MemoryItem) -> None:
+        if not self.path.exists():
+            # Give the log a snapshot to anchor to, so deleting the snapshot
+            # later also retires the log.
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("[]", encoding="utf-8")
+        snapshot_signature = _file_signature(self.path)
+        try:
+            with self.log_path.open("r", encoding="utf-8") as handle:
+                current_header = handle.readline()
+        except OSError:
+            current_header = ""
+        lines = []
+        mode = "a"
+        if not _log_header_matches(current_header, snapshot_signature):
+            # Missing, or left over from a snapshot that was replaced.
+            mode = "w"
+            lines.append(json.dumps({"schema": MEMORY_LOG_SCHEMA, "base": list(snapshot_signature or (0, 0))}))
+        lines.append(json.dumps(asdict(item)))
+        with self.log_path.open(mode, encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
 
     def add(self, source_session_id: str, objective: str, content: str, tags: list[str], kind: str) -> MemoryItem:
         item = MemoryItem(
@@ -63,28 +326,34 @@ class MemoryStore:
             tags=tags,
             kind=kind,
         )
-        self.items.append(item)
-        self.save()
+        with self._corpus.lock:
+            self.items.append(item)
+            self._corpus.log_entries += 1
+            if self._corpus.log_entries >= MEMORY_LOG_COMPACT_THRESHOLD:
+                self.save()
+            else:
+                self._append_log(item)
+                self._remember_signature()
         return item
 
     def recent(self, limit: int = 10) -> list[MemoryItem]:
-        return sorted(self.items, key=lambda item: item.created_at, reverse=True)[:limit]
+        # Same order as sorted(..., reverse=True)[:limit], ties included.
+        return heapq.nlargest(limit, self.items, key=lambda item: item.created_at)
 
     def search(self, query: str, limit: int = 8) -> list[MemoryItem]:
         query_tokens = _tokens(query)
         if not query_tokens:
             return self.recent(limit=limit)
-
-        def score(item: MemoryItem) -> tuple[int, int]:
-            text_tokens = _tokens(item.content + " " + " ".join(item.tags) + " " + item.objective)
-            overlap = len(query_tokens & text_tokens)
-            return overlap, len(item.tags)
-
-        ranked = sorted(self.items, key=score, reverse=True)
-        positive = [item for item in ranked if score(item)[0] > 0]
-        if positive:
-            return positive[:limit]
-        return self.recent(limit=limit)
+        with self._corpus.lock:
+            scores = self._corpus.index().score(query_tokens)
+            if not scores:
+                return self.recent(limit=limit)
+            ranked = heapq.nsmallest(
+                limit,
+                scores.items(),
+                key=lambda entry: (-entry[1][0], -entry[1][1], -len(self.items[entry[0]].tags), entry[0]),
+            )
+            return [self.items[position] for position, _ in ranked]
 
 
 def ingest_state_into_memory(memory: MemoryStore, session_id: str, state: dict) -> list[str]:
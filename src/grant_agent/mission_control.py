@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import marshal
 import os
 import re
 import shlex
@@ -11,10 +12,12 @@ import threading
 import time
 import uuid
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from errno import EBUSY, ETXTBSY
 from dataclasses import asdict, fields, is_dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable
 from urllib.parse import quote, urlencode
 
 from .models import (
@@ -35,6 +38,7 @@ from .models import (
     utc_now_iso,
 )
 from .app_capability_standard import build_connected_apps_snapshot, load_mock_manifests
+from .cli_executor import command_env
 from .delivery_receipt import (
     load_delivery_receipts,
     ntfy_status,
@@ -48,6 +52,8 @@ from .demo_runner import (
     normalize_red_team_pressure,
 )
 from .execution_truth import derive_execution_target
+from .git_probe import GIT_STATUS_CACHE_TTL_SECONDS, read_git_status
+from .json_cache import JsonFileCache
 from .launch_recommendation import build_launch_runtime_recommendation
 from .onboarding import (
     build_guidance_snapshot,
@@ -55,6 +61,8 @@ from .onboarding import (
     invalidate_onboarding_status_cache,
     load_telegram_destination,
 )
+from .mission_event_index import MissionEventIndex
+from .mission_store import ShardedMissionStore, load_mission_payloads, sharded_mission_store_requested
 from .mission_watchdog import (
     build_mission_watchdog_report,
     build_planned_scope_artifacts,
@@ -64,8 +72,20 @@ from .mission_watchdog import (
 from .profiles import ProfileRegistry
 from .runtimes import detect_runtime_statuses, invalidate_runtime_status_cache
 from .runtime_supervisor import DelegatedRuntimeSupervisor
-from .skill_library import SkillLibrary, load_codex_home_skill_rows
+from .skill_library import (
+    SKILL_FEEDBACK_HISTORY_LIMIT,
+    SKILL_REPAIR_RECEIPT_HISTORY_LIMIT,
+    SkillLibrary,
+    load_codex_home_skill_rows,
+    load_skill_ledger_rows,
+)
 from .skills import SkillRegistry
+from .snapshot_memo import (
+    active_snapshot_memo,
+    clear_snapshot_memo,
+    snapshot_memoized,
+    with_snapshot_memo,
+)
 from .verification import detect_default_verification_commands
 
 TERMINAL_MISSION_STATUSES = {"completed", "failed", "stopped"}
@@ -89,13 +109,23 @@ CONTROL_ROOM_VISIBLE_SUMMARY_MISSION_LIMIT = 12
 CONTROL_ROOM_VISIBLE_PROJECT_PROGRESS_LIMIT = 3
 CONTROL_ROOM_VISIBLE_LAUNCH_SHORTCUT_LIMIT = 3
 CONTROL_ROOM_BOOTSTRAP_MISSION_LIMIT = 8
-CONTROL_ROOM_JSON_CACHE_MAX_BYTES = 8_000_000
-CONTROL_ROOM_JSON_CACHE_MAX_ITEMS = 16
-_CONTROL_ROOM_JSON_CACHE_LOCK = threading.Lock()
-_CONTROL_ROOM_JSON_CACHE: dict[str, tuple[int, int, list | dict]] = {}
+CONTROL_ROOM_JSON_CACHE_MAX_BYTES = 32_000_000
+CONTROL_ROOM_JSON_CACHE_MAX_ITEMS = 64
+CONTROL_ROOM_EVENT_TAIL_MEMO_LINES = 80
+_CONTROL_ROOM_JSON_CACHE = JsonFileCache(
+    max_bytes=CONTROL_ROOM_JSON_CACHE_MAX_BYTES,
+    max_items=CONTROL_ROOM_JSON_CACHE_MAX_ITEMS,
+)
+MISSION_OBJECT_CACHE_MAX_ENTRIES = 4096
+_MISSION_OBJECT_CACHE_LOCK = threading.Lock()
+_MISSION_OBJECT_CACHE: dict[str, tuple[int, int, list[bytes]]] = {}
+_DATACLASS_FIELD_NAMES: dict[type, frozenset[str]] = {}
 PROVIDER_AUTH_PRESENCE_CACHE_TTL_SECONDS = 30
 _PROVIDER_AUTH_PRESENCE_CACHE_LOCK = threading.Lock()
 _PROVIDER_AUTH_PRESENCE_CACHE: tuple[float, tuple[tuple[str, str], ...], dict[str, bool]] | None = None
+WORKSPACE_PROBE_WORKERS_ENV = "FLUXIO_WORKSPACE_PROBE_WORKERS"
+WORKSPACE_PROBE_DEFAULT_WORKERS = 6
+WORKSPACE_GIT_CACHE_TTL_SECONDS = GIT_STATUS_CACHE_TTL_SECONDS
 ANSI_ESCAPE_PATTERN = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
 
 
@@ -1294,6 +1324,11 @@ SYNC_COPY_RETRY_ATTEMPTS = 3
 SYNC_COPY_RETRY_BASE_DELAY_SECONDS = 0.08
 SYNC_LOCKED_FILE_SAMPLE_LIMIT = 8
 SYNC_CONFLICT_SAMPLE_LIMIT = 8
+SYNC_MANIFEST_SCHEMA = "fluxio.sync_manifest.v1"
+SYNC_MANIFEST_DIRNAME = "sync_manifests"
+SYNC_MANIFEST_FULL_SCAN_ENV = "FLUXIO_SYNC_FULL_SCAN_SECONDS"
+SYNC_MANIFEST_DEFAULT_FULL_SCAN_SECONDS = 600.0
+SYNC_MANIFEST_RACY_WINDOW_NS = 2_000_000_000
 RELEASE_PATH_PATTERN = re.compile(
     r"^(?P<prefix>.+[\\/]releases[\\/])(?P<release>[^\\/]+)(?P<suffix>(?:[\\/].*)?)$"
 )
@@ -1446,11 +1481,129 @@ PROVIDER_AUTH_ALIASES = {
 }
 
 
-def _dataclass_from_mapping(cls, payload: object):
+def _dataclass_field_names(cls) -> frozenset[str]:
+    allowed = _DATACLASS_FIELD_NAMES.get(cls)
+    if allowed is None:
+        allowed = frozenset(item.name for item in fields(cls))
+        _DATACLASS_FIELD_NAMES[cls] = allowed
+    return allowed
+
+
+def _dataclass_kwargs(cls, payload: object) -> dict:
     if not isinstance(payload, dict):
-        payload = {}
-    allowed = {item.name for item in fields(cls)}
-    return cls(**{key: value for key, value in payload.items() if key in allowed})
+        return {}
+    allowed = _dataclass_field_names(cls)
+    return {key: value for key, value in payload.items() if key in allowed}
+
+
+def _dataclass_from_mapping(cls, payload: object):
+    return cls(**_dataclass_kwargs(cls, payload))
+
+
+_MISSION_NESTED_DATACLASSES = {
+    "run_budget": MissionRunBudget,
+    "verification_policy": MissionVerificationPolicy,
+    "escalation_policy": ApprovalEscalation,
+    "state": MissionStateSnapshot,
+    "proof": MissionProof,
+    "execution_scope": ExecutionScope,
+    "execution_policy": ExecutionPolicy,
+    "code_execution": MissionCodeExecutionConfig,
+}
+
+
+def _mission_kwargs(item: dict) -> dict:
+    """Normalize a raw mission dict into plain ``Mission`` constructor arguments."""
+    planned_file_scope = [
+        str(value).strip()
+        for value in item.get("planned_file_scope", [])
+        if str(value or "").strip()
+    ]
+    if not planned_file_scope:
+        planned_file_scope = infer_planned_file_scope(
+            item.get("objective", ""),
+            item.get("success_checks", []),
+        )
+    nested = {
+        name: _dataclass_kwargs(cls, item.get(name, {}))
+        for name, cls in _MISSION_NESTED_DATACLASSES.items()
+    }
+    if "execution_policy" not in item:
+        nested["execution_policy"] = {"profile_name": item.get("selected_profile", "builder")}
+    return {
+        "mission_id": item["mission_id"],
+        "workspace_id": item["workspace_id"],
+        "runtime_id": item["runtime_id"],
+        "objective": item["objective"],
+        "success_checks": item.get("success_checks", []),
+        "created_at": item.get("created_at", utc_now_iso()),
+        "updated_at": item.get("updated_at", utc_now_iso()),
+        "title": item.get("title", ""),
+        "harness_id": item.get("harness_id", "fluxio_hybrid"),
+        "selected_profile": item.get("selected_profile", "builder"),
+        "route_configs": item.get("route_configs", []),
+        "routing_decisions": item.get("routing_decisions", []),
+        "effective_route_contract": item.get("effective_route_contract", {}),
+        "current_plan_revision_id": item.get("current_plan_revision_id"),
+        "plan_revisions": item.get("plan_revisions", []),
+        "derived_tasks": item.get("derived_tasks", []),
+        "improvement_queue": item.get("improvement_queue", []),
+        "planned_file_scope": planned_file_scope,
+        "skill_usage": item.get("skill_usage", []),
+        "learned_skill_events": item.get("learned_skill_events", []),
+        "action_history": item.get("action_history", []),
+        "delegated_runtime_sessions": [
+            _dataclass_kwargs(DelegatedRuntimeSession, row)
+            for row in item.get("delegated_runtime_sessions", [])
+        ],
+        "tutorial_context": item.get("tutorial_context", {}),
+        "planner_loop_status": item.get("planner_loop_status", "idle"),
+        **nested,
+    }
+
+
+def _mission_from_kwargs(kwargs: dict) -> Mission:
+    for name, cls in _MISSION_NESTED_DATACLASSES.items():
+        kwargs[name] = cls(**kwargs[name])
+    kwargs["delegated_runtime_sessions"] = [
+        DelegatedRuntimeSession(**row) for row in kwargs["delegated_runtime_sessions"]
+    ]
+    return Mission(**kwargs)
+
+
+def _cached_mission_blobs(path: Path, load: Callable[[], list[dict]]) -> list[bytes]:
+    """Marshalled constructor arguments for the missions stored in ``path``.
+
+    Keyed on the file's mtime and size and shared by every store in the
+    process. Each mission is rebuilt from its blob, so callers get private
+    objects they can mutate; only the normalization is cached.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return []
+    cache_key = str(path)
+    with _MISSION_OBJECT_CACHE_LOCK:
+        cached = _MISSION_OBJECT_CACHE.get(cache_key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    blobs = [marshal.dumps(_mission_kwargs(item)) for item in load()]
+    with _MISSION_OBJECT_CACHE_LOCK:
+        if len(_MISSION_OBJECT_CACHE) >= MISSION_OBJECT_CACHE_MAX_ENTRIES:
+            _MISSION_OBJECT_CACHE.clear()
+        _MISSION_OBJECT_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, blobs)
+    return blobs
+
+
+def _invalidate_mission_object_cache(path: Path) -> None:
+    with _MISSION_OBJECT_CACHE_LOCK:
+        _MISSION_OBJECT_CACHE.pop(str(path), None)
+    clear_snapshot_memo()
+
+
+def _snapshot_memo_stats() -> dict:
+    memo = active_snapshot_memo()
+    return memo.stats() if memo is not None else {}
 
 
 def _mission_runtime_persistence_signature(mission: Mission) -> str:
@@ -1490,29 +1643,7 @@ def _mission_queue_persistence_signature(missions: list[Mission]) -> str:
 
 
 def _latest_runtime_cycles_by_mission(events_path: Path) -> dict[str, dict]:
-    if not events_path.exists():
-        return {}
-    latest: dict[str, dict] = {}
-    try:
-        handle = events_path.open("r", encoding="utf-8", errors="ignore")
-    except OSError:
-        return {}
-    with handle:
-        for line in handle:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                event = json.loads(stripped)
-            except json.JSONDecodeError:
-                continue
-            if event.get("kind") != "mission.runtime_cycle":
-                continue
-            mission_id = str(event.get("mission_id") or event.get("missionId") or "").strip()
-            if not mission_id:
-                continue
-            latest[mission_id] = event
-    return latest
+    return MissionEventIndex(events_path).latest_runtime_cycles()
 
 
 def _reconcile_mission_from_runtime_cycle(
@@ -2029,7 +2160,9 @@ class ControlRoomStore:
         self.control_dir.mkdir(parents=True, exist_ok=True)
         self.workspaces_path = self.control_dir / "workspaces.json"
         self.missions_path = self.control_dir / "missions.json"
+        self.mission_shards = ShardedMissionStore(self.control_dir)
         self.events_path = self.control_dir / "mission_events.jsonl"
+        self.event_index = MissionEventIndex(self.events_path)
         self.lane_control_receipts_path = self.control_dir / "lane_control_receipts.jsonl"
         self.workspace_actions_path = self.control_dir / "workspace_actions.json"
         self.autonomous_workflows_path = self.control_dir / "autonomous_workflows.json"
@@ -2050,9 +2183,14 @@ class ControlRoomStore:
     def _invalidate_snapshot_caches(self) -> None:
         invalidate_onboarding_status_cache(self.root)
         invalidate_runtime_status_cache(self.root)
+        clear_snapshot_memo()
 
     def load_workspaces(self) -> list[WorkspaceProfile]:
-        payload = self._load_json(self.workspaces_path, [])
+        payload = snapshot_memoized(
+            ("workspaces", str(self.workspaces_path)),
+            lambda: self._load_json(self.workspaces_path, []),
+            copy_on_read=True,
+        )
         workspaces: list[WorkspaceProfile] = []
         for item in payload:
             if not isinstance(item, dict):
@@ -2076,91 +2214,61 @@ class ControlRoomStore:
             [asdict(item) for item in workspaces],
         )
 
-    def load_missions(self) -> list[Mission]:
+    def _missions_sharded(self) -> bool:
+        if self.mission_shards.exists():
+            return True
+        if sharded_mission_store_requested():
+            self.migrate_missions_to_shards()
+            return True
+        return False
+
+    def migrate_missions_to_shards(self) -> int:
+        migrated = self.mission_shards.migrate_from_legacy()
+        self._invalidate_json_cache(self.missions_path)
+        self._invalidate_snapshot_caches()
+        return migrated
+
+    def _load_mission_payloads(self) -> list[dict]:
+        if self._missions_sharded():
+            return self.mission_shards.load_all()
         payload = self._load_json(self.missions_path, [])
-        missions: list[Mission] = []
-        for item in payload:
-            run_budget = _dataclass_from_mapping(MissionRunBudget, item.get("run_budget", {}))
-            verification_policy = _dataclass_from_mapping(
-                MissionVerificationPolicy,
-                item.get("verification_policy", {}),
-            )
-            escalation_policy = _dataclass_from_mapping(
-                ApprovalEscalation,
-                item.get("escalation_policy", {}),
-            )
-            state = _dataclass_from_mapping(MissionStateSnapshot, item.get("state", {}))
-            proof = _dataclass_from_mapping(MissionProof, item.get("proof", {}))
-            planned_file_scope = [
-                str(value).strip()
-                for value in item.get("planned_file_scope", [])
-                if str(value or "").strip()
-            ]
-            if not planned_file_scope:
-                planned_file_scope = infer_planned_file_scope(
-                    item.get("objective", ""),
-                    item.get("success_checks", []),
-                )
-            execution_scope = _dataclass_from_mapping(
-                ExecutionScope,
-                item.get("execution_scope", {}),
-            )
-            execution_policy = _dataclass_from_mapping(
-                ExecutionPolicy,
-                item.get("execution_policy", {"profile_name": item.get("selected_profile", "builder")}),
-            )
-            code_execution = _dataclass_from_mapping(
-                MissionCodeExecutionConfig,
-                item.get("code_execution", {}),
-            )
-            delegated_runtime_sessions = [
-                _dataclass_from_mapping(DelegatedRuntimeSession, row)
-                for row in item.get("delegated_runtime_sessions", [])
-            ]
-            missions.append(
-                Mission(
-                    mission_id=item["mission_id"],
-                    workspace_id=item["workspace_id"],
-                    runtime_id=item["runtime_id"],
-                    objective=item["objective"],
-                    success_checks=item.get("success_checks", []),
-                    created_at=item.get("created_at", utc_now_iso()),
-                    updated_at=item.get("updated_at", utc_now_iso()),
-                    title=item.get("title", ""),
-                    run_budget=run_budget,
-                    verification_policy=verification_policy,
-                    escalation_policy=escalation_policy,
-                    harness_id=item.get("harness_id", "fluxio_hybrid"),
-                    selected_profile=item.get("selected_profile", "builder"),
-                    execution_scope=execution_scope,
-                    execution_policy=execution_policy,
-                    code_execution=code_execution,
-                    route_configs=item.get("route_configs", []),
-                    routing_decisions=item.get("routing_decisions", []),
-                    effective_route_contract=item.get("effective_route_contract", {}),
-                    current_plan_revision_id=item.get("current_plan_revision_id"),
-                    plan_revisions=item.get("plan_revisions", []),
-                    derived_tasks=item.get("derived_tasks", []),
-                    improvement_queue=item.get("improvement_queue", []),
-                    planned_file_scope=planned_file_scope,
-                    skill_usage=item.get("skill_usage", []),
-                    learned_skill_events=item.get("learned_skill_events", []),
-                    action_history=item.get("action_history", []),
-                    delegated_runtime_sessions=delegated_runtime_sessions,
-                    tutorial_context=item.get("tutorial_context", {}),
-                    planner_loop_status=item.get("planner_loop_status", "idle"),
-                    state=state,
-                    proof=proof,
-                )
-            )
-        return missions
+        return [item for item in payload if isinstance(item, dict)] if isinstance(payload, list) else []
+
+    def _load_mission_blobs(self) -> list[bytes]:
+        if not self._missions_sharded():
+            return _cached_mission_blobs(self.missions_path, self._load_mission_payloads)
+        blobs: list[bytes] = []
+        for row in self.mission_shards.load_index():
+            blobs.extend(self._load_shard_mission_blobs(str(row["mission_id"])))
+        return blobs
+
+    def _load_shard_mission_blobs(self, mission_id: str) -> list[bytes]:
+        def load() -> list[dict]:
+            payload = self.mission_shards.load_one(mission_id)
+            return [payload] if payload is not None else []
+
+        return _cached_mission_blobs(self.mission_shards.shard_path(mission_id), load)
+
+    def load_missions(self) -> list[Mission]:
+        blobs = snapshot_memoized(("missions", str(self.control_dir)), self._load_mission_blobs)
+        return [_mission_from_kwargs(marshal.loads(blob)) for blob in blobs]
+
+    @staticmethod
+    def _mission_from_payload(item: dict) -> Mission:
+        return _mission_from_kwargs(_mission_kwargs(item))
 
     def save_missions(self, missions: list[Mission]) -> None:
         self._invalidate_snapshot_caches()
+        if self._missions_sharded():
+            self.mission_shards.write_all([asdict(item) for item in missions])
+            for item in missions:
+                _invalidate_mission_object_cache(self.mission_shards.shard_path(item.mission_id))
+            return
         self._write_json_if_changed(
             self.missions_path,
             [asdict(item) for item in missions],
         )
+        _invalidate_mission_object_cache(self.missions_path)
 
     def load_autonomous_workflows(self) -> list[dict]:
         payload = self._load_json(self.autonomous_workflows_path, [])
@@ -2395,23 +2503,7 @@ class ControlRoomStore:
         return _build_autonomous_workflow_records_snapshot(next_workflows)
 
     def _mission_event_count(self, mission_id: str) -> int:
-        if not self.events_path.exists():
-            return 0
-        count = 0
-        try:
-            with self.events_path.open("r", encoding="utf-8") as handle:
-                for line in handle:
-                    if not line.strip():
-                        continue
-                    try:
-                        payload = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    if str(payload.get("mission_id") or payload.get("missionId") or "") == mission_id:
-                        count += 1
-        except OSError:
-            return 0
-        return count
+        return self.event_index.mission_event_count(mission_id)
 
     def upsert_workspace(
         self,
@@ -2456,6 +2548,7 @@ class ControlRoomStore:
                 nas_root=workspace_root,
                 sync_direction=clean_sync_direction,
                 conflict_policy=clean_sync_conflict_policy,
+                manifest_dir=self.control_dir / SYNC_MANIFEST_DIRNAME,
             )
             # If no local root is provided, keep the existing one-way behavior from
             # the selected root path to NAS for backwards compatibility.
@@ -2469,6 +2562,7 @@ class ControlRoomStore:
                     Path(root_path).expanduser().resolve(),
                     workspace_root,
                     conflict_policy=clean_sync_conflict_policy,
+                    manifest_dir=self.control_dir / SYNC_MANIFEST_DIRNAME,
                 )
         now = utc_now_iso()
         normalized_route_overrides = normalize_route_overrides(
@@ -2736,9 +2830,15 @@ class ControlRoomStore:
         return mission
 
     def update_mission(self, mission: Mission) -> Mission:
-        missions = self.load_missions()
         updated = mission
         updated.updated_at = utc_now_iso()
+        if self._missions_sharded():
+            self._invalidate_snapshot_caches()
+            self.mission_shards.write_one(asdict(updated))
+            _invalidate_mission_object_cache(self.mission_shards.shard_path(updated.mission_id))
+            self.record_autonomous_workflow(updated)
+            return updated
+        missions = self.load_missions()
         for index, item in enumerate(missions):
             if item.mission_id == mission.mission_id:
                 missions[index] = updated
@@ -2757,6 +2857,10 @@ class ControlRoomStore:
         return None
 
     def get_mission(self, mission_id: str) -> Mission | None:
+        if self._missions_sharded():
+            for blob in self._load_shard_mission_blobs(mission_id):
+                return _mission_from_kwargs(marshal.loads(blob))
+            return self._mission_from_autonomous_workflow_record(mission_id)
         for item in self.load_missions():
             if item.mission_id == mission_id:
                 return item
@@ -2774,8 +2878,16 @@ class ControlRoomStore:
 
     def append_event(self, event: MissionEvent) -> None:
         self._rotate_events_if_needed()
-        with self.events_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(asdict(event), ensure_ascii=True) + "\n")
+        payload = asdict(event)
+        line = (json.dumps(payload, ensure_ascii=True) + "\n").encode("ascii")
+        with self.events_path.open("ab") as handle:
+            handle.write(line)
+            offset = handle.tell() - len(line)
+        self.event_index.record_append(payload, offset, len(line))
+        clear_snapshot_memo()
+
+    def mission_events(self, mission_id: str, limit: int = 40) -> list[dict]:
+        return self.event_index.mission_events(mission_id, limit=limit)
 
     def append_lane_control_receipt(self, receipt: dict) -> None:
         if not isinstance(receipt, dict):
@@ -2830,7 +2942,22 @@ class ControlRoomStore:
     def recent_events(self, limit: int = 40) -> list[dict]:
         if not self.events_path.exists():
             return []
-        lines = _read_text_tail_lines(self.events_path, limit=max(0, int(limit)))
+        limit = max(0, int(limit))
+        memo = active_snapshot_memo()
+        if memo is None:
+            lines = _read_text_tail_lines(self.events_path, limit=limit)
+        else:
+            # One tail read serves every smaller limit in the same snapshot.
+            memo_key = ("recent_events", str(self.events_path))
+            read_limit = max(limit, CONTROL_ROOM_EVENT_TAIL_MEMO_LINES)
+            cached = memo.peek(memo_key)
+            if cached is not None and cached[0] < limit:
+                memo.discard(memo_key)
+            _read_limit, tail = memo.get(
+                memo_key,
+                lambda: (read_limit, _read_text_tail_lines(self.events_path, limit=read_limit)),
+            )
+            lines = tail[-limit:] if limit else []
         events: list[dict] = []
         for line in reversed(lines):
             try:
@@ -2874,6 +3001,7 @@ class ControlRoomStore:
                 handle.writelines(tail)
         except OSError:
             self.events_path.touch(exist_ok=True)
+        self.event_index.rebuild()
 
     def load_workspace_actions(self) -> dict[str, list[dict]]:
         payload = self._load_json(self.workspace_actions_path, {})
@@ -2903,14 +3031,19 @@ class ControlRoomStore:
         )
         return record
 
+    @with_snapshot_memo
     def build_snapshot(self) -> dict:
         workspaces = self.load_workspaces()
         missions = self.load_missions()
-        if os.environ.get("FLUXIO_CONTROL_ROOM_FAST") == "1":
+        if command_env("FLUXIO_CONTROL_ROOM_FAST") == "1":
             return self._build_fast_snapshot(workspaces, missions)
         workspace_action_history = self.load_workspace_actions()
         setup_history = workspace_action_history.get("__setup__", [])
-        runtime_statuses = detect_runtime_statuses(self.root)
+        runtime_statuses = snapshot_memoized(
+            ("runtime_statuses", str(self.root)),
+            lambda: detect_runtime_statuses(self.root),
+            copy_on_read=True,
+        )
         runtime_lookup = {item.runtime_id: asdict(item) for item in runtime_statuses}
         profiles = ProfileRegistry(self.root / "config" / "profiles.json")
         skill_library = SkillLibrary(
@@ -2930,21 +3063,15 @@ class ControlRoomStore:
 
         workspace_cards = []
         recommended_skill_pack_objects = []
-        for workspace in workspaces:
+        probe_started = time.perf_counter()
+        workspace_probes = _probe_workspaces(workspaces, profiles)
+        workspace_probe_duration_ms = round((time.perf_counter() - probe_started) * 1000, 2)
+        for workspace, probe in zip(workspaces, workspace_probes):
             runtime_id = workspace.default_runtime
-            profile = profiles.resolve(workspace.user_profile, Path(workspace.root_path))
-            profile_parameters = _profile_parameter_snapshot(
-                workspace.user_profile,
-                profile,
-            )
-            git_snapshot = _inspect_workspace_git(
-                Path(workspace.root_path),
-                commit_message_style=workspace.commit_message_style,
-            )
-            validation_actions = _build_validation_actions(Path(workspace.root_path))
-            verification_commands = detect_default_verification_commands(
-                Path(workspace.root_path)
-            )
+            profile_parameters = probe["profileParameters"]
+            git_snapshot = probe["gitSnapshot"]
+            validation_actions = probe["validationActions"]
+            verification_commands = probe["verificationCommands"]
             skill_recommendations = [
                 asdict(item)
                 for item in recommend_skills(
@@ -3313,8 +3440,19 @@ class ControlRoomStore:
             "missionWatchdog": mission_watchdog,
             "redTeamEscalation": red_team_escalation,
             "systemAuditDigest": system_audit_digest,
+            "performance": {
+                "source": "control_room_snapshot",
+                "workspaceProbe": {
+                    "durationMs": workspace_probe_duration_ms,
+                    "workers": _workspace_probe_workers(len(workspaces)),
+                    "workspaces": [probe["timing"] for probe in workspace_probes],
+                },
+                "jsonCache": _CONTROL_ROOM_JSON_CACHE.stats(),
+                "snapshotMemo": _snapshot_memo_stats(),
+            },
         }
 
+    @with_snapshot_memo
     def build_summary_snapshot(self) -> dict:
         started = time.perf_counter()
         section_started = started
@@ -3690,6 +3828,8 @@ class ControlRoomStore:
             "durationMs": round((time.perf_counter() - started) * 1000, 2),
             "missionLimit": len(mission_payload),
             "activityLimit": len(activity),
+            "jsonCache": _CONTROL_ROOM_JSON_CACHE.stats(),
+            "snapshotMemo": _snapshot_memo_stats(),
             "sectionDurations": section_durations,
             "slowestSections": sorted(
                 section_durations,
@@ -4145,8 +4285,11 @@ class ControlRoomStore:
         control_dir = self.root / ".agent_control"
         learned_raw = _load_json_file(control_dir / "learned_skills.json")
         installed_raw = _load_json_file(control_dir / "user_installed_skills.json")
-        feedback_raw = _load_json_file(control_dir / "skill_feedback.json")
-        repair_receipts_raw = _load_json_file(control_dir / "skill_repair_receipts.json")
+        feedback_raw = load_skill_ledger_rows(control_dir / "skill_feedback.json", SKILL_FEEDBACK_HISTORY_LIMIT)
+        repair_receipts_raw = load_skill_ledger_rows(
+            control_dir / "skill_repair_receipts.json",
+            SKILL_REPAIR_RECEIPT_HISTORY_LIMIT,
+        )
         learned_rows = learned_raw if isinstance(learned_raw, list) else []
         installed_rows = installed_raw if isinstance(installed_raw, list) else []
         existing_installed_ids = {
@@ -4979,6 +5122,7 @@ class ControlRoomStore:
             },
         }
 
+    @with_snapshot_memo
     def build_bootstrap_summary_snapshot(self) -> dict:
         started = time.perf_counter()
         workspaces = self.load_workspaces()
@@ -6409,6 +6553,7 @@ class ControlRoomStore:
             "summary": "Copy this URL or command to reopen the mission launcher with project defaults.",
         }
 
+    @with_snapshot_memo
     def build_mission_detail_snapshot(self, mission_id: str, *, event_limit: int = 80) -> dict:
         started = time.perf_counter()
         section_started = started
@@ -6438,19 +6583,11 @@ class ControlRoomStore:
         for item in all_missions:
             workspace_missions.setdefault(item.workspace_id, []).append(item)
         mark_section("base_store_load")
-        raw_mission_events = [
-            event
-            for event in self.recent_events(limit=max(event_limit * 8, 600))
-            if str(event.get("mission_id") or event.get("missionId") or "") == mission.mission_id
-        ]
-        latest_runtime_cycle = next(
-            (
-                event
-                for event in raw_mission_events
-                if str(event.get("kind") or event.get("event") or "") == "mission.runtime_cycle"
-            ),
-            None,
+        raw_mission_events = self.mission_events(
+            mission.mission_id,
+            limit=max(event_limit * 8, 600),
         )
+        latest_runtime_cycle = self.event_index.latest_runtime_cycle(mission.mission_id)
         if _reconcile_mission_from_runtime_cycle(
             mission,
             latest_runtime_cycle,
@@ -6620,6 +6757,7 @@ class ControlRoomStore:
             "performance": {
                 "source": "control_room_mission_detail",
                 "durationMs": round((time.perf_counter() - started) * 1000, 2),
+                "snapshotMemo": _snapshot_memo_stats(),
                 "sectionDurations": section_durations,
                 "slowestSections": sorted(
                     section_durations,
@@ -8817,44 +8955,13 @@ class ControlRoomStore:
 
     @staticmethod
     def _load_json(path: Path, default: list | dict) -> list | dict:
-        try:
-            stat = path.stat()
-        except OSError:
-            return default
-        if stat.st_size <= 0:
-            return default
-        cache_key = str(path.resolve())
-        if stat.st_size <= CONTROL_ROOM_JSON_CACHE_MAX_BYTES:
-            with _CONTROL_ROOM_JSON_CACHE_LOCK:
-                cached = _CONTROL_ROOM_JSON_CACHE.get(cache_key)
-                if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
-                    return cached[2]
-        try:
-            raw = path.read_text(encoding="utf-8").strip()
-        except OSError:
-            return default
-        if not raw:
-            return default
-        try:
-            payload = json.loads(raw)
-        except json.JSONDecodeError:
-            return default
-        if isinstance(payload, (list, dict)) and stat.st_size <= CONTROL_ROOM_JSON_CACHE_MAX_BYTES:
-            with _CONTROL_ROOM_JSON_CACHE_LOCK:
-                _CONTROL_ROOM_JSON_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, payload)
-                if len(_CONTROL_ROOM_JSON_CACHE) > CONTROL_ROOM_JSON_CACHE_MAX_ITEMS:
-                    oldest_key = next(iter(_CONTROL_ROOM_JSON_CACHE))
-                    _CONTROL_ROOM_JSON_CACHE.pop(oldest_key, None)
-        return payload
+        # Each call gets its own copy; callers may mutate the result freely.
+        return _CONTROL_ROOM_JSON_CACHE.load(path, default)
 
     @staticmethod
     def _invalidate_json_cache(path: Path) -> None:
-        try:
-            cache_key = str(path.resolve())
-        except OSError:
-            cache_key = str(path)
-        with _CONTROL_ROOM_JSON_CACHE_LOCK:
-            _CONTROL_ROOM_JSON_CACHE.pop(cache_key, None)
+        _CONTROL_ROOM_JSON_CACHE.invalidate(path)
+        clear_snapshot_memo()
 
     @staticmethod
     def _split_release_path(raw_path: str) -> tuple[str, str, str] | None:
@@ -9347,6 +9454,14 @@ def _deferred_bootstrap_provider_truth(provider_truth: dict, *, source: str) ->
 
 
 def _provider_auth_presence_from_env() -> dict[str, bool]:
+    return snapshot_memoized(
+        ("provider_auth_presence",),
+        _scan_provider_auth_presence,
+        copy_on_read=True,
+    )
+
+
+def _scan_provider_auth_presence() -> dict[str, bool]:
     global _PROVIDER_AUTH_PRESENCE_CACHE
     cache_key = _provider_auth_presence_cache_key()
     now = time.monotonic()
@@ -9598,6 +9713,7 @@ def _sync_local_and_nas_projects(
     nas_root: Path,
     sync_direction: str,
     conflict_policy: str,
+    manifest_dir: Path | None = None,
 ) -> dict[str, object]:
     if local_root is None:
         return {}
@@ -9628,6 +9744,7 @@ def _sync_local_and_nas_projects(
                 conflict_policy,
                 direction="local_to_nas",
             ),
+            manifest_dir=manifest_dir,
         )
         passes.append({"direction": "local_to_nas", **status})
 
@@ -9642,6 +9759,7 @@ def _sync_local_and_nas_projects(
                     conflict_policy,
                     direction="nas_to_local",
                 ),
+                manifest_dir=manifest_dir,
             )
             passes.append({"direction": "nas_to_local", **status})
 
@@ -9746,7 +9864,13 @@ def _sync_conflict_policy_for_direction(conflict_policy: str, *, direction: str)
     return normalized
 
 
-def _sync_project_tree(source: Path, target: Path, *, conflict_policy: str) -> dict[str, object]:
+def _sync_project_tree(
+    source: Path,
+    target: Path,
+    *,
+    conflict_policy: str,
+    manifest_dir: Path | None = None,
+) -> dict[str, object]:
     if not source.exists() or not source.is_dir():
         return {
             "synced": False,
@@ -9774,83 +9898,52 @@ def _sync_project_tree(source: Path, target: Path, *, conflict_policy: str) -> d
     manual_review_required = False
     locked_samples: list[str] = []
     conflict_samples: list[dict[str, object]] = []
-    for current_root, dir_names, file_names in os.walk(source):
-        dir_names[:] = [name for name in dir_names if name not in SYNC_EXCLUDED_DIRS]
-        relative_root = Path(current_root).relative_to(source)
-        target_root = target / relative_root
-        target_root.mkdir(parents=True, exist_ok=True)
-        for file_name in file_names:
-            if file_name in SYNC_EXCLUDED_FILES:
-                skipped += 1
-                continue
-            source_file = Path(current_root) / file_name
-            target_file = target_root / file_name
-            if target_file.exists():
-                conflict_sample: dict[str, object] | None = None
-                if _sync_files_conflict(source_file, target_file):
-                    conflicts_detected += 1
-                    conflict_sample = _sync_conflict_sample(
-                        source_file=source_file,
-                        target_file=target_file,
-                        source_root=source,
-                        conflict_policy=conflict_policy,
-                    )
-                    if len(conflict_samples) < SYNC_CONFLICT_SAMPLE_LIMIT:
-                        conflict_samples.append(conflict_sample)
-                if conflict_policy == "local_wins":
-                    target_file.parent.mkdir(parents=True, exist_ok=True)
-                    copy_result = _copy_project_file_with_retry(source_file, target_file)
-                    if copy_result == "copied":
-                        copied += 1
-                        continue
-                    skipped += 1
-                    if copy_result == "locked":
-                        locked_skipped += 1
-                        if len(locked_samples) < SYNC_LOCKED_FILE_SAMPLE_LIMIT:
-                            locked_samples.append(str(source_file))
-                        continue
-                    if copy_result == "missing":
-                        missing_skipped += 1
-                        continue
-                elif conflict_policy == "nas_wins":
-                    skipped += 1
-                    continue
-                elif conflict_policy == "manual_review":
-                    manual_review_required = bool(conflict_sample)
-                    skipped += 1
-                    continue
-                try:
-                    target_mtime = target_file.stat().st_mtime
-                    source_mtime = source_file.stat().st_mtime
-                except FileNotFoundError:
-                    skipped += 1
-                    missing_skipped += 1
-                    continue
-                except OSError as exc:
-                    if _is_locked_copy_error(exc):
-                        skipped += 1
-                        locked_skipped += 1
-                        if len(locked_samples) < SYNC_LOCKED_FILE_SAMPLE_LIMIT:
-                            locked_samples.append(str(source_file))
-                        continue
-                    raise
-                if target_mtime >= source_mtime:
+
+    def sync_file(source_file: Path, target_file: Path) -> None:
+        nonlocal copied, skipped, locked_skipped, missing_skipped, conflicts_detected, manual_review_required
+        outcome, conflict_sample = _sync_project_file(
+            source_file,
+            target_file,
+            source_root=source,
+            conflict_policy=conflict_policy,
+        )
+        if conflict_sample is not None:
+            conflicts_detected += 1
+            if len(conflict_samples) < SYNC_CONFLICT_SAMPLE_LIMIT:
+                conflict_samples.append(conflict_sample)
+            if conflict_policy == "manual_review":
+                manual_review_required = True
+        if outcome == "copied":
+            copied += 1
+            return
+        skipped += 1
+        if outcome == "locked":
+            locked_skipped += 1
+            if len(locked_samples) < SYNC_LOCKED_FILE_SAMPLE_LIMIT:
+                locked_samples.append(str(source_file))
+        elif outcome == "missing":
+            missing_skipped += 1
+
+    manifest_stats: dict[str, object] = {}
+    if manifest_dir is None:
+        for current_root, dir_names, file_names in os.walk(source):
+            dir_names[:] = [name for name in dir_names if name not in SYNC_EXCLUDED_DIRS]
+            relative_root = Path(current_root).relative_to(source)
+            target_root = target / relative_root
+            target_root.mkdir(parents=True, exist_ok=True)
+            for file_name in file_names:
+                if file_name in SYNC_EXCLUDED_FILES:
                     skipped += 1
                     continue
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-            copy_result = _copy_project_file_with_retry(source_file, target_file)
-            if copy_result == "copied":
-                copied += 1
-                continue
-            skipped += 1
-            if copy_result == "locked":
-                locked_skipped += 1
-                if len(locked_samples) < SYNC_LOCKED_FILE_SAMPLE_LIMIT:
-                    locked_samples.append(str(source_file))
-                continue
-            if copy_result == "missing":
-                missing_skipped += 1
-                continue
+                sync_file(Path(current_root) / file_name, target_root / file_name)
+    else:
+        manifest_stats = _sync_project_tree_incremental(
+            source,
+            target,
+            manifest_path=_sync_manifest_path(manifest_dir, source, target),
+            sync_file=sync_file,
+        )
+        skipped += int(manifest_stats.get("filesUnchanged", 0)) + int(manifest_stats.get("filesExcluded", 0))
     payload = {
         "synced": True,
         "reason": "copied",
@@ -9859,6 +9952,8 @@ def _sync_project_tree(source: Path, target: Path, *, conflict_policy: str) -> d
         "filesCopied": copied,
         "filesSkipped": skipped,
     }
+    if manifest_stats:
+        payload["syncManifest"] = manifest_stats
     payload["syncReceipt"] = _build_sync_pass_receipt(
         source=source,
         target=target,
@@ -9884,6 +9979,254 @@ def _sync_project_tree(source: Path, target: Path, *, conflict_policy: str) -> d
     return payload
 
 
+def _sync_project_file(
+    source_file: Path,
+    target_file: Path,
+    *,
+    source_root: Path,
+    conflict_policy: str,
+) -> tuple[str, dict[str, object] | None]:
+    """Apply ``conflict_policy`` to one file pair.
+
+    Returns ``copied``, ``skipped``, ``locked`` or ``missing`` plus the
+    conflict sample when both sides existed and differed.
+    """
+    conflict_sample: dict[str, object] | None = None
+    if target_file.exists():
+        if _sync_files_conflict(source_file, target_file):
+            conflict_sample = _sync_conflict_sample(
+                source_file=source_file,
+                target_file=target_file,
+                source_root=source_root,
+                conflict_policy=conflict_policy,
+            )
+        if conflict_policy == "local_wins":
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+            return _copy_project_file_with_retry(source_file, target_file), conflict_sample
+        if conflict_policy in {"nas_wins", "manual_review"}:
+            return "skipped", conflict_sample
+        try:
+            target_mtime = target_file.stat().st_mtime
+            source_mtime = source_file.stat().st_mtime
+        except FileNotFoundError:
+            return "missing", conflict_sample
+        except OSError as exc:
+            if _is_locked_copy_error(exc):
+                return "locked", conflict_sample
+            raise
+        if target_mtime >= source_mtime:
+            return "skipped", conflict_sample
+    target_file.parent.mkdir(parents=True, exist_ok=True)
+    return _copy_project_file_with_retry(source_file, target_file), conflict_sample
+
+
+def _sync_manifest_path(manifest_dir: Path, source: Path, target: Path) -> Path:
+    pair = f"{source.resolve()}\n{target.resolve()}"
+    digest = hashlib.blake2b(pair.encode("utf-8"), digest_size=10).hexdigest()
+    return manifest_dir / f"sync_{digest}.json"
+
+
+def _load_sync_manifest(manifest_path: Path, source: Path, target: Path) -> dict | None:
+    try:
+        payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("schema") != SYNC_MANIFEST_SCHEMA
+        or payload.get("source") != str(source.resolve())
+        or payload.get("target") != str(target.resolve())
+        or not isinstance(payload.get("dirs"), dict)
+    ):
+        return None
+    return payload
+
+
+def _sync_full_scan_interval_ns() -> int:
+    try:
+        seconds = float(os.environ.get(SYNC_MANIFEST_FULL_SCAN_ENV, "") or SYNC_MANIFEST_DEFAULT_FULL_SCAN_SECONDS)
+    except ValueError:
+        seconds = SYNC_MANIFEST_DEFAULT_FULL_SCAN_SECONDS
+    return int(max(0.0, seconds) * 1_000_000_000)
+
+
+def _stat_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _sync_pair_settled(source_sig: tuple[int, int] | None, target_sig: tuple[int, int] | None) -> bool:
+    if source_sig is None or target_sig is None:
+        return False
+    # Same tolerance as _sync_files_conflict (copy2 may round sub-microsecond mtimes).
+    return source_sig[0] == target_sig[0] and abs(source_sig[1] - target_sig[1]) <= 1000
+
+
+def _sync_project_tree_incremental(
+    source: Path,
+    target: Path,
+    *,
+    manifest_path: Path,
+    sync_file: Callable[[Path, Path], None],
+) -> dict[str, object]:
+    """Walk ``source`` against the manifest of the previous pass.
+
+    The manifest records, per directory, both sides' mtimes, child directories
+    and every file pair that ended the pass identical ("settled"). A settled
+    pair whose stats are unchanged is skipped without running the conflict
+    policy. When a directory's mtime is unchanged on both sides its entries
+    are unchanged too, so it is not listed and its target files are not
+    stat'ed; each source file still costs one ``stat`` because in-place edits
+    do not touch the directory mtime. Target-only edits in such directories are
+    caught by the reverse pass of a bidirectional sync or by the periodic full
+    verification (``FLUXIO_SYNC_FULL_SCAN_SECONDS``). Pairs that stay in
+    conflict are never recorded, so every pass re-evaluates and re-reports them.
+    """
+    manifest = _load_sync_manifest(manifest_path, source, target)
+    started_ns = time.time_ns()
+    previous_dirs: dict = manifest["dirs"] if manifest else {}
+    previous_scan_ns = int(manifest.get("scannedAtNs", 0)) if manifest else 0
+    full_scan_ns = int(manifest.get("fullScanAtNs", 0)) if manifest else 0
+    full_scan = manifest is None or started_ns - full_scan_ns >= _sync_full_scan_interval_ns()
+    # Anything modified this close to the previous scan may have changed again
+    # within the same timestamp tick.
+    settled_before_ns = previous_scan_ns - SYNC_MANIFEST_RACY_WINDOW_NS
+    next_dirs: dict[str, dict] = {}
+    dirs_pruned = 0
+    dirs_scanned = 0
+    files_unchanged = 0
+    files_excluded = 0
+    files_checked = 0
+    pending = [""]
+    while pending:
+        relative = pending.pop()
+        source_dir = source / relative if relative else source
+        target_dir = target / relative if relative else target
+        previous = previous_dirs.get(relative) if isinstance(previous_dirs.get(relative), dict) else None
+        source_dir_sig = _stat_signature(source_dir)
+        if source_dir_sig is None:
+            continue
+        target_dir_sig = _stat_signature(target_dir)
+        previous_files = previous.get("files", {}) if previous is not None else {}
+        listing_unchanged = (
+            not full_scan
+            and previous is not None
+            and previous.get("complete")
+            and target_dir_sig is not None
+            and previous.get("sourceMtimeNs") == source_dir_sig[1]
+            and previous.get("targetMtimeNs") == target_dir_sig[1]
+            and max(source_dir_sig[1], target_dir_sig[1]) < settled_before_ns
+        )
+        if listing_unchanged:
+            dirs_pruned += 1
+            child_dirs = [str(name) for name in previous.get("dirs", [])]
+            excluded = int(previous.get("excluded", 0) or 0)
+            file_names = sorted(previous_files)
+        else:
+            dirs_scanned += 1
+            if target_dir_sig is None:
+                target_dir.mkdir(parents=True, exist_ok=True)
+            child_dirs = []
+            file_names = []
+            excluded = 0
+            try:
+                with os.scandir(source_dir) as iterator:
+                    entries = sorted(iterator, key=lambda item: item.name)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Matches os.walk(followlinks=False): linked directories are not descended.
+                    if entry.name not in SYNC_EXCLUDED_DIRS and not entry.is_symlink():
+                        child_dirs.append(entry.name)
+                elif entry.name in SYNC_EXCLUDED_FILES:
+                    excluded += 1
+                else:
+                    file_names.append(entry.name)
+        settled_files: dict[str, list[int]] = {}
+        complete = True
+        for name in file_names:
+            source_file = source_dir / name
+            target_file = target_dir / name
+            source_sig = _stat_signature(source_file)
+            if listing_unchanged and source_sig is None:
+                # Deleted in place of an unchanged listing; rescan next time.
+                complete = False
+                continue
+            recorded = previous_files.get(name)
+            if (
+                source_sig is not None
+                and isinstance(recorded, list)
+                and len(recorded) == 3
+                and source_sig == (recorded[0], recorded[1])
+                and source_sig[1] < settled_before_ns
+                and (listing_unchanged or _stat_signature(target_file) == (recorded[0], recorded[2]))
+            ):
+                files_unchanged += 1
+                settled_files[name] = recorded
+                continue
+            files_checked += 1
+            sync_file(source_file, target_file)
+            source_sig = _stat_signature(source_file)
+            target_sig = _stat_signature(target_file)
+            if _sync_pair_settled(source_sig, target_sig):
+                settled_files[name] = [source_sig[0], source_sig[1], target_sig[1]]
+            else:
+                complete = False
+        for name in child_dirs:
+            (target_dir / name).mkdir(exist_ok=True)
+        # Re-stat after copying so this pass's own writes do not look like new changes.
+        target_dir_sig = _stat_signature(target_dir)
+        next_dirs[relative] = {
+            "sourceMtimeNs": source_dir_sig[1],
+            "targetMtimeNs": target_dir_sig[1] if target_dir_sig else 0,
+            "complete": complete,
+            "dirs": child_dirs,
+            "excluded": excluded,
+            "files": settled_files,
+        }
+        files_excluded += excluded
+        pending.extend(f"{relative}/{name}" if relative else name for name in reversed(child_dirs))
+    _atomic_write_sync_manifest(
+        manifest_path,
+        {
+            "schema": SYNC_MANIFEST_SCHEMA,
+            "source": str(source.resolve()),
+            "target": str(target.resolve()),
+            "scannedAtNs": time.time_ns(),
+            "fullScanAtNs": time.time_ns() if full_scan else full_scan_ns,
+            "dirs": next_dirs,
+        },
+    )
+    return {
+        "manifestPath": str(manifest_path),
+        "fullScan": full_scan,
+        "dirsScanned": dirs_scanned,
+        "dirsPruned": dirs_pruned,
+        "filesChecked": files_checked,
+        "filesUnchanged": files_unchanged,
+        "filesExcluded": files_excluded,
+    }
+
+
+def _atomic_write_sync_manifest(manifest_path: Path, payload: dict) -> None:
+    try:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, manifest_path)
+    except OSError:
+        # A missing manifest only costs the next pass a full scan.
+        return
+
+
 def _sync_files_conflict(source_file: Path, target_file: Path) -> bool:
     try:
         source_stat = source_file.stat()
@@ -11364,9 +11707,78 @@ def _current_runtime_lane_for_mission(
     return f"{mission.runtime_id} primary lane {mission.state.status.replace('_', ' ')}"
 
 
+def _workspace_probe_workers(workspace_count: int) -> int:
+    try:
+        configured = int(os.environ.get(WORKSPACE_PROBE_WORKERS_ENV, "") or WORKSPACE_PROBE_DEFAULT_WORKERS)
+    except ValueError:
+        configured = WORKSPACE_PROBE_DEFAULT_WORKERS
+    return max(1, min(configured, workspace_count))
+
+
+def _probe_workspace(workspace: WorkspaceProfile, profiles: ProfileRegistry) -> dict:
+    started = time.perf_counter()
+    workspace_root = Path(workspace.root_path)
+    profile = profiles.resolve(workspace.user_profile, workspace_root)
+    git_snapshot, git_cache = _cached_workspace_git_snapshot(
+        workspace_root,
+        commit_message_style=workspace.commit_message_style,
+    )
+    git_ms = round((time.perf_counter() - started) * 1000, 2)
+    probe = {
+        "profileParameters": _profile_parameter_snapshot(workspace.user_profile, profile),
+        "gitSnapshot": git_snapshot,
+        "validationActions": _build_validation_actions(workspace_root),
+        "verificationCommands": detect_default_verification_commands(workspace_root),
+    }
+    probe["timing"] = {
+        "workspaceId": workspace.workspace_id,
+        "durationMs": round((time.perf_counter() - started) * 1000, 2),
+        "gitDurationMs": git_ms,
+        "gitCache": git_cache,
+    }
+    return probe
+
+
+def _probe_workspaces(workspaces: list[WorkspaceProfile], profiles: ProfileRegistry) -> list[dict]:
+    """Run the per-workspace git/validation/profile probes on a bounded pool.
+
+    Results keep ``workspaces`` order. Slow NAS mounts then cost the slowest
+    workspace rather than the sum of all of them.
+    """
+    if not workspaces:
+        return []
+    workers = _workspace_probe_workers(len(workspaces))
+    if workers == 1:
+        return [_probe_workspace(workspace, profiles) for workspace in workspaces]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fluxio-workspace-probe") as pool:
+        return list(pool.map(lambda workspace: _probe_workspace(workspace, profiles), workspaces))
+
+
+def _cached_workspace_git_snapshot(
+    workspace_root: Path,
+    commit_message_style: str = "scoped",
+) -> tuple[dict, str]:
+    """``_inspect_workspace_git`` served from the shared git status cache.
+
+    Returns the snapshot and ``hit``/``miss``/``uncached``. Workspaces whose
+    git dir cannot be located are probed every time.
+    """
+    status, cache_state = read_git_status(workspace_root, max_age=WORKSPACE_GIT_CACHE_TTL_SECONDS)
+    return _workspace_git_snapshot(workspace_root, status, commit_message_style), cache_state
+
+
 def _inspect_workspace_git(
     workspace_root: Path,
     commit_message_style: str = "scoped",
+) -> dict:
+    status, _ = read_git_status(workspace_root, max_age=0)
+    return _workspace_git_snapshot(workspace_root, status, commit_message_style)
+
+
+def _workspace_git_snapshot(
+    workspace_root: Path,
+    status: dict,
+    commit_message_style: str = "scoped",
 ) -> dict:
     snapshot = {
         "repoDetected": False,
@@ -11393,51 +11805,25 @@ def _inspect_workspace_git(
     if not workspace_root.exists():
         snapshot["detail"] = "Workspace path does not exist."
         return snapshot
-
-    git_probe = _run_git_command(workspace_root, ["rev-parse", "--is-inside-work-tree"])
-    if git_probe["return_code"] != 0 or git_probe["stdout"].strip() != "true":
+    if not status.get("repoDetected"):
         snapshot["detail"] = "No Git repository detected for this workspace."
         return snapshot
 
     snapshot["repoDetected"] = True
-    status_output = _run_git_command(workspace_root, ["status", "--porcelain=1", "--branch"])
-    lines = [line for line in status_output["stdout"].splitlines() if line.strip()]
-    if lines and lines[0].startswith("## "):
-        snapshot.update(_parse_branch_status(lines[0][3:]))
-        lines = lines[1:]
-
-    for line in lines:
-        code = line[:2]
-        path_text = _parse_git_status_path(line)
-        if path_text and path_text not in snapshot["changedFiles"]:
-            snapshot["changedFiles"].append(path_text)
-        if code.startswith("??"):
-            snapshot["untrackedCount"] += 1
-            continue
-        if code[:1] not in {" ", "?"}:
-            snapshot["stagedCount"] += 1
-        if code[1:2] not in {" ", "?"}:
-            snapshot["unstagedCount"] += 1
-    snapshot["dirty"] = (
-        snapshot["stagedCount"] > 0
-        or snapshot["unstagedCount"] > 0
-        or snapshot["untrackedCount"] > 0
-    )
-
-    remotes = []
-    remotes_output = _run_git_command(workspace_root, ["remote", "-v"])
-    seen = set()
-    for line in remotes_output["stdout"].splitlines():
-        parts = line.split()
-        if len(parts) < 3:
-            continue
-        name, url, kind = parts[0], parts[1], parts[2].strip("()")
-        key = (name, url)
-        if kind != "push" or key in seen:
-            continue
-        seen.add(key)
-        remotes.append({"name": name, "url": url})
-    snapshot["remotes"] = remotes
+    for key in (
+        "branch",
+        "trackingBranch",
+        "ahead",
+        "behind",
+        "dirty",
+        "stagedCount",
+        "unstagedCount",
+        "untrackedCount",
+        "changedFiles",
+        "remotes",
+    ):
+        snapshot[key] = status[key]
+    remotes = snapshot["remotes"]
     snapshot["deployTarget"] = _infer_deploy_target(workspace_root, remotes)
     snapshot["detail"] = (
         f"{snapshot['branch'] or 'Detached HEAD'} · "
@@ -11451,58 +11837,6 @@ def _inspect_workspace_git(
     return snapshot
 
 
-def _run_git_command(workspace_root: Path, args: list[str]) -> dict:
-    try:
-        completed = subprocess.run(  # noqa: S603
-            ["git", *args],
-            cwd=str(workspace_root),
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=8,
-            check=False,
-        )
-    except OSError:
-        return {"return_code": 1, "stdout": "", "stderr": "git unavailable"}
-    return {
-        "return_code": completed.returncode,
-        "stdout": completed.stdout or "",
-        "stderr": completed.stderr or "",
-    }
-
-
-def _parse_branch_status(branch_line: str) -> dict:
-    branch = branch_line
-    tracking = ""
-    ahead = 0
-    behind = 0
-    if "..." in branch_line:
-        branch, rest = branch_line.split("...", 1)
-        tracking = rest.split(" [", 1)[0].strip()
-    match = re.search(r"\[(.*?)\]$", branch_line)
-    if match:
-        parts = [item.strip() for item in match.group(1).split(",")]
-        for part in parts:
-            if part.startswith("ahead "):
-                ahead = int(part.split(" ", 1)[1])
-            elif part.startswith("behind "):
-                behind = int(part.split(" ", 1)[1])
-    return {
-        "branch": branch.strip(),
-        "trackingBranch": tracking,
-        "ahead": ahead,
-        "behind": behind,
-    }
-
-
-def _parse_git_status_path(line: str) -> str:
-    payload = line[3:].strip()
-    if " -> " in payload:
-        payload = payload.split(" -> ", 1)[1].strip()
-    return payload
-
-
 def _normalize_commit_subject_token(value: str) -> str:
     cleaned = re.sub(r"[_\-]+", " ", value)
     cleaned = re.sub(r"[^A-Za-z0-9 ]+", " ", cleaned)
@@ -12601,6 +12935,20 @@ def _percent(numerator: int, denominator: int) -> int:
 
 
 def _load_json_file(path: Path) -> dict | list | None:
+    if active_snapshot_memo() is None:
+        return _read_json_file(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return snapshot_memoized(
+        ("control_file", str(path), stat.st_mtime_ns, stat.st_size),
+        lambda: _read_json_file(path),
+        copy_on_read=True,
+    )
+
+
+def _read_json_file(path: Path) -> dict | list | None:
     if not path.exists():
         return None
     try:
@@ -13429,7 +13777,7 @@ def _mission_events_record_delegated_active(root: Path) -> bool:
 
 
 def _build_proving_cycle_readiness(root: Path) -> dict:
-    payload = _load_json_file(root / ".agent_control" / "missions.json")
+    payload = load_mission_payloads(root / ".agent_control")
     missions = payload if isinstance(payload, list) else []
     runtime_session_paths = sorted(
         (root / ".agent_control" / "runtime_sessions").glob("delegate_*.json"),
@@ -18617,7 +18965,7 @@ def _release_mission_items(payload: object) -> list[tuple[str, dict]]:
 
 def _build_mission_watchdog_release_gate(root: Path) -> dict:
     control_dir = root / ".agent_control"
-    missions_payload = _load_json_file(control_dir / "missions.json")
+    missions_payload = load_mission_payloads(control_dir)
     missions = _release_mission_items(missions_payload)
     active_missions = []
     for _, mission in missions:
@@ -19203,7 +19551,7 @@ def _build_route_trust_coverage_snapshot(root: Path, *, sessions: list[Path]) ->
         _route_trust_row(coverage, _route_trust_task_type(payload))["routeSamples"] += 1
 
     mission_status_by_id: dict[str, str] = {}
-    missions_payload = _load_json_file(root / ".agent_control" / "missions.json")
+    missions_payload = load_mission_payloads(root / ".agent_control")
     if isinstance(missions_payload, list):
         for mission in missions_payload:
             if not isinstance(mission, dict):
@@ -19358,6 +19706,14 @@ def _route_trust_payload_for_mission(mission: Mission) -> dict:
 
 
 def _build_route_outcome_trends_for_trust(root: Path) -> dict:
+    return snapshot_memoized(
+        ("route_outcome_trends", str(root)),
+        lambda: _scan_route_outcome_trends_for_trust(root),
+        copy_on_read=True,
+    )
+
+
+def _scan_route_outcome_trends_for_trust(root: Path) -> dict:
     try:
         from .fluxio_harness import build_route_outcome_trends
     except Exception:
@@ -19611,6 +19967,14 @@ def _build_harness_parity_matrix() -> list[dict]:
 
 
 def build_harness_lab_snapshot(root: Path) -> dict:
+    return snapshot_memoized(
+        ("harness_lab", str(root)),
+        lambda: _scan_harness_lab_snapshot(root),
+        copy_on_read=True,
+    )
+
+
+def _scan_harness_lab_snapshot(root: Path) -> dict:
     runs_root = root / ".agent_runs"
     sessions = sorted(
         [path for path in runs_root.glob("session_*") if path.is_dir()],
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+
+MISSION_EVENT_INDEX_SCHEMA = "fluxio.mission_event_index.v1"
+RUNTIME_CYCLE_EVENT_KIND = "mission.runtime_cycle"
+_MISSION_EVENT_INDEX_STATES: dict[str, "_IndexState"] = {}
+_MISSION_EVENT_INDEX_LOCK = threading.Lock()
+
+
+def _event_mission_id(event: object) -> str:
+    if not isinstance(event, dict):
+        return ""
+    return str(event.get("mission_id") or event.get("missionId") or "").strip()
+
+
+def _event_kind(event: object) -> str:
+    if not isinstance(event, dict):
+        return ""
+    return str(event.get("kind") or event.get("event") or "")
+
+
+class _IndexState:
+    def __init__(self, events_ino: int, index_ino: int) -> None:
+        self.events_ino = events_ino
+        self.index_ino = index_ino
+        self.index_position = 0
+        self.covered_bytes = 0
+        self.offsets: dict[str, list[int]] = {}
+        self.lengths: dict[int, int] = {}
+        self.runtime_cycles: dict[str, int] = {}
+
+    def add(self, mission_id: str, offset: int, length: int, runtime_cycle: bool) -> None:
+        if not mission_id or offset in self.lengths:
+            return
+        self.lengths[offset] = length
+        rows = self.offsets.setdefault(mission_id, [])
+        if rows and rows[-1] > offset:
+            bisect.insort(rows, offset)
+        else:
+            rows.append(offset)
+        if runtime_cycle and offset >= self.runtime_cycles.get(mission_id, -1):
+            self.runtime_cycles[mission_id] = offset
+        self.covered_bytes = max(self.covered_bytes, offset + length)
+
+
+class MissionEventIndex:
+    """Append-maintained sidecar index for ``mission_events.jsonl``.
+
+    Each indexed event is one compact JSONL row (mission id, byte offset,
+    length, runtime-cycle flag) so per-mission pages, counts and the latest
+    ``mission.runtime_cycle`` are seeks instead of full decodes of the log.
+    The sidecar is rebuilt when the event log is replaced by a rotation and
+    caught up from its covered offset when other writers appended lines.
+    """
+
+    def __init__(self, events_path: Path) -> None:
+        self.events_path = events_path
+        self.index_path = events_path.with_name(f"{events_path.stem}.index.jsonl")
+
+    @staticmethod
+    def _row(mission_id: str, offset: int, length: int, runtime_cycle: bool) -> str:
+        row: dict[str, object] = {"m": mission_id, "o": offset, "n": length}
+        if runtime_cycle:
+            row["c"] = 1
+        return json.dumps(row, separators=(",", ":"), ensure_ascii=True) + "\n"
+
+    def _header(self, events_ino: int) -> str:
+        return json.dumps(
+            {"schema": MISSION_EVENT_INDEX_SCHEMA, "eventsIno": events_ino},
+            separators=(",", ":"),
+        ) + "\n"
+
+    def record_append(self, event: dict, offset: int, length: int) -> None:
+        mission_id = _event_mission_id(event)
+        if not mission_id or not self.index_path.exists():
+            return
+        try:
+            with self.index_path.open("ab") as handle:
+                handle.write(
+                    self._row(
+                        mission_id,
+                        offset,
+                        length,
+                        _event_kind(event) == RUNTIME_CYCLE_EVENT_KIND,
+                    ).encode("ascii")
+                )
+        except OSError:
+            return
+
+    def _scan_events(self, state: _IndexState, start: int) -> list[str]:
+        rows: list[str] = []
+        try:
+            handle = self.events_path.open("rb")
+        except OSError:
+            return rows
+        with handle:
+            handle.seek(start)
+            offset = start
+            for raw_line in handle:
+                if not raw_line.endswith(b"\n"):
+                    break
+                length = len(raw_line)
+                if raw_line.strip():
+                    try:
+                        event = json.loads(raw_line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        event = None
+                    mission_id = _event_mission_id(event)
+                    if mission_id:
+                        runtime_cycle = _event_kind(event) == RUNTIME_CYCLE_EVENT_KIND
+                        state.add(mission_id, offset, length, runtime_cycle)
+                        rows.append(self._row(mission_id, offset, length, runtime_cycle))
+                offset += length
+        state.covered_bytes = max(state.covered_bytes, offset)
+        return rows
+
+    def rebuild(self) -> None:
+        with _MISSION_EVENT_INDEX_LOCK:
+            self._rebuild_locked()
+
+    def _rebuild_locked(self) -> _IndexState | None:
+        cache_key = str(self.index_path)
+        try:
+            events_ino = self.events_path.stat().st_ino
+        except OSError:
+            _MISSION_EVENT_INDEX_STATES.pop(cache_key, None)
+            try:
+                self.index_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return None
+        state = _IndexState(events_ino, 0)
+        rows = self._scan_events(state, 0)
+        serialized = self._header(events_ino) + "".join(rows)
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(serialized.encode("ascii"))
+            os.replace(tmp_path, self.index_path)
+            index_stat = self.index_path.stat()
+        except OSError:
+            _MISSION_EVENT_INDEX_STATES.pop(cache_key, None)
+            return state
+        state.index_ino = index_stat.st_ino
+        state.index_position = len(serialized)
+        _MISSION_EVENT_INDEX_STATES[cache_key] = state
+        return state
+
+    def _read_index_rows(self, state: _IndexState) -> bool:
+        try:
+            with self.index_path.open("rb") as handle:
+                handle.seek(state.index_position)
+                for raw_line in handle:
+                    if not raw_line.endswith(b"\n"):
+                        break
+                    state.index_position += len(raw_line)
+                    try:
+                        row = json.loads(raw_line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+                    if not isinstance(row, dict):
+                        continue
+                    if "schema" in row:
+                        if row.get("eventsIno") != state.events_ino:
+                            return False
+                        continue
+                    try:
+                        offset = int(row.get("o"))
+                        length = int(row.get("n"))
+                    except (TypeError, ValueError):
+                        continue
+                    state.add(str(row.get("m") or ""), offset, length, bool(row.get("c")))
+        except OSError:
+            return False
+        return True
+
+    def _state(self) -> _IndexState | None:
+        cache_key = str(self.index_path)
+        with _MISSION_EVENT_INDEX_LOCK:
+            try:
+                events_stat = self.events_path.stat()
+            except OSError:
+                _MISSION_EVENT_INDEX_STATES.pop(cache_key, None)
+                return None
+            try:
+                index_stat = self.index_path.stat()
+            except OSError:
+                return self._rebuild_locked()
+            state = _MISSION_EVENT_INDEX_STATES.get(cache_key)
+            if (
+                state is None
+                or state.events_ino != events_stat.st_ino
+                or state.index_ino != index_stat.st_ino
+                or state.index_position > index_stat.st_size
+            ):
+                state = _IndexState(events_stat.st_ino, index_stat.st_ino)
+            if not self._read_index_rows(state) or state.covered_bytes > events_stat.st_size:
+                return self._rebuild_locked()
+            _MISSION_EVENT_INDEX_STATES[cache_key] = state
+            if events_stat.st_size > state.covered_bytes:
+                rows = self._scan_events(state, state.covered_bytes)
+                if rows:
+                    try:
+                        with self.index_path.open("ab") as handle:
+                            handle.write("".join(rows).encode("ascii"))
+                    except OSError:
+                        pass
+            return state
+
+    def _read_events_at(self, offsets: list[int], lengths: dict[int, int]) -> list[dict] | None:
+        events: list[dict] = []
+        try:
+            handle = self.events_path.open("rb")
+        except OSError:
+            return []
+        with handle:
+            for offset in offsets:
+                handle.seek(offset)
+                raw_line = handle.read(lengths.get(offset, 0))
+                try:
+                    event = json.loads(raw_line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    return None
+                if not isinstance(event, dict):
+                    return None
+                events.append(event)
+        return events
+
+    def _load_events(self, mission_id: str, select) -> list[dict]:
+        for _attempt in range(2):
+            state = self._state()
+            if state is None:
+                return []
+            with _MISSION_EVENT_INDEX_LOCK:
+                offsets = select(state)
+                lengths = {offset: state.lengths.get(offset, 0) for offset in offsets}
+            events = self._read_events_at(offsets, lengths)
+            if events is not None and all(_event_mission_id(event) == mission_id for event in events):
+                return events
+            self.rebuild()
+        return []
+
+    def mission_event_count(self, mission_id: str) -> int:
+        state = self._state()
+        if state is None:
+            return 0
+        with _MISSION_EVENT_INDEX_LOCK:
+            return len(state.offsets.get(str(mission_id), []))
+
+    def mission_events(self, mission_id: str, *, limit: int | None = None) -> list[dict]:
+        """Return the mission's events newest first, like ``recent_events``."""
+        mission_id = str(mission_id or "").strip()
+
+        def select(state: _IndexState) -> list[int]:
+            offsets = state.offsets.get(mission_id, [])
+            if limit is not None:
+                offsets = offsets[-max(0, int(limit)) :] if limit > 0 else []
+            return list(reversed(offsets))
+
+        return self._load_events(mission_id, select)
+
+    def latest_runtime_cycle(self, mission_id: str) -> dict | None:
+        mission_id = str(mission_id or "").strip()
+
+        def select(state: _IndexState) -> list[int]:
+            offset = state.runtime_cycles.get(mission_id)
+            return [] if offset is None else [offset]
+
+        events = self._load_events(mission_id, select)
+        return events[0] if events else None
+
+    def latest_runtime_cycles(self) -> dict[str, dict]:
+        for _attempt in range(2):
+            state = self._state()
+            if state is None:
+                return {}
+            with _MISSION_EVENT_INDEX_LOCK:
+                pairs = sorted(state.runtime_cycles.items(), key=lambda item: item[1])
+                lengths = {offset: state.lengths.get(offset, 0) for _, offset in pairs}
+            events = self._read_events_at([offset for _, offset in pairs], lengths)
+            if events is not None and all(
+                _event_mission_id(event) == mission_id for (mission_id, _), event in zip(pairs, events)
+            ):
+                return {mission_id: event for (mission_id, _), event in zip(pairs, events)}
+            self.rebuild()
+        return {}
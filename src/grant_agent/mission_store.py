@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import json
+import marshal
+import os
+import re
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+MISSION_STORE_ENV = "FLUXIO_MISSION_STORE"
+MISSION_SHARD_DIRNAME = "missions"
+MISSION_INDEX_FILENAME = "index.json"
+LEGACY_MISSIONS_FILENAME = "missions.json"
+MISSION_INDEX_SCHEMA = "fluxio.mission_index.v1"
+_SHARD_NAME_PATTERN = re.compile(r"[^A-Za-z0-9_.-]+")
+# Shards are cached as marshal blobs so every reader gets a private copy.
+_MISSION_SHARD_CACHE: dict[str, tuple[int, int, bytes]] = {}
+_MISSION_SHARD_CACHE_LOCK = threading.Lock()
+
+
+def mission_index_row(payload: dict) -> dict:
+    state = payload.get("state") if isinstance(payload.get("state"), dict) else {}
+    try:
+        queue_position = int(state.get("queue_position") or 0)
+    except (TypeError, ValueError):
+        queue_position = 0
+    return {
+        "mission_id": str(payload.get("mission_id") or ""),
+        "workspace_id": str(payload.get("workspace_id") or ""),
+        "status": str(state.get("status") or ""),
+        "queue_position": queue_position,
+        "updated_at": str(payload.get("updated_at") or ""),
+    }
+
+
+def _atomic_write_text(path: Path, serialized: str) -> bool:
+    if path.exists():
+        try:
+            if path.read_text(encoding="utf-8") == serialized:
+                return False
+        except OSError:
+            pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    tmp_path.write_text(serialized, encoding="utf-8")
+    os.replace(tmp_path, path)
+    return True
+
+
+class ShardedMissionStore:
+    """One JSON file per mission plus a compact ordered index.
+
+    The index is the commit point: a shard only becomes visible once its row
+    is written to ``index.json``, so single-mission updates cost one shard
+    write and one small index rewrite instead of re-serializing every mission.
+    Every shard change bumps the index ``generation`` as well, so watchers of
+    ``index.json`` see edits that leave the mission's index row unchanged.
+    """
+
+    def __init__(self, control_dir: Path) -> None:
+        self.control_dir = control_dir
+        self.shard_dir = control_dir / MISSION_SHARD_DIRNAME
+        self.index_path = self.shard_dir / MISSION_INDEX_FILENAME
+        self.legacy_path = control_dir / LEGACY_MISSIONS_FILENAME
+
+    def exists(self) -> bool:
+        return self.index_path.exists()
+
+    def shard_path(self, mission_id: str) -> Path:
+        slug = _SHARD_NAME_PATTERN.sub("_", str(mission_id or "").strip()) or "mission"
+        return self.shard_dir / f"{slug}.json"
+
+    def _read_index(self) -> tuple[list[dict], int]:
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return [], 0
+        rows = payload.get("missions", []) if isinstance(payload, dict) else payload
+        try:
+            generation = int(payload.get("generation") or 0) if isinstance(payload, dict) else 0
+        except (TypeError, ValueError):
+            generation = 0
+        if not isinstance(rows, list):
+            return [], generation
+        return [row for row in rows if isinstance(row, dict) and row.get("mission_id")], generation
+
+    def load_index(self) -> list[dict]:
+        return self._read_index()[0]
+
+    def save_index(self, rows: list[dict], generation: int = 0) -> None:
+        serialized = json.dumps(
+            {"schema": MISSION_INDEX_SCHEMA, "generation": generation, "missions": rows},
+            separators=(",", ":"),
+        )
+        _atomic_write_text(self.index_path, serialized)
+
+    def load_one(self, mission_id: str) -> dict | None:
+        path = self.shard_path(mission_id)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        cache_key = str(path)
+        with _MISSION_SHARD_CACHE_LOCK:
+            cached = _MISSION_SHARD_CACHE.get(cache_key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return marshal.loads(cached[2])
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        with _MISSION_SHARD_CACHE_LOCK:
+            _MISSION_SHARD_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, marshal.dumps(payload))
+        return payload
+
+    def load_all(self) -> list[dict]:
+        payloads: list[dict] = []
+        for row in self.load_index():
+            payload = self.load_one(str(row["mission_id"]))
+            if payload is not None:
+                payloads.append(payload)
+        return payloads
+
+    def _write_shard(self, payload: dict) -> bool:
+        path = self.shard_path(str(payload.get("mission_id") or ""))
+        if not _atomic_write_text(path, json.dumps(payload, indent=2)):
+            return False
+        with _MISSION_SHARD_CACHE_LOCK:
+            _MISSION_SHARD_CACHE.pop(str(path), None)
+        return True
+
+    def _remove_shard(self, mission_id: str) -> None:
+        path = self.shard_path(mission_id)
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        with _MISSION_SHARD_CACHE_LOCK:
+            _MISSION_SHARD_CACHE.pop(str(path), None)
+
+    def write_one(self, payload: dict) -> None:
+        mission_id = str(payload.get("mission_id") or "")
+        if not mission_id:
+            return
+        shard_changed = self._write_shard(payload)
+        rows, generation = self._read_index()
+        next_row = mission_index_row(payload)
+        for index, row in enumerate(rows):
+            if row.get("mission_id") == mission_id:
+                if row == next_row and not shard_changed:
+                    return
+                rows[index] = next_row
+                break
+        else:
+            rows.append(next_row)
+        self.save_index(rows, generation + 1)
+
+    def write_all(self, payloads: list[dict]) -> None:
+        previous_rows, generation = self._read_index()
+        previous_ids = {str(row.get("mission_id")) for row in previous_rows}
+        rows: list[dict] = []
+        shards_changed = False
+        for payload in payloads:
+            if not str(payload.get("mission_id") or ""):
+                continue
+            shards_changed = self._write_shard(payload) or shards_changed
+            rows.append(mission_index_row(payload))
+        self.save_index(rows, generation + 1 if shards_changed else generation)
+        for mission_id in previous_ids - {row["mission_id"] for row in rows}:
+            self._remove_shard(mission_id)
+
+    def migrate_from_legacy(self) -> int:
+        """Split ``missions.json`` into shards and park the legacy file in backups."""
+        if not self.legacy_path.exists():
+            if not self.exists():
+                self.save_index([])
+            return 0
+        try:
+            payload = json.loads(self.legacy_path.read_text(encoding="utf-8") or "[]")
+        except (OSError, json.JSONDecodeError):
+            return 0
+        payloads = [item for item in payload if isinstance(item, dict)] if isinstance(payload, list) else []
+        self.write_all(payloads)
+        backups_dir = self.control_dir / "backups"
+        backups_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        try:
+            self.legacy_path.replace(backups_dir / f"missions-premigration-{stamp}.json")
+        except OSError:
+            pass
+        return len(payloads)
+
+
+def sharded_mission_store_requested() -> bool:
+    return os.environ.get(MISSION_STORE_ENV, "").strip().lower() == "sharded"
+
+
+def load_mission_payloads(control_dir: Path) -> list[dict]:
+    """Read raw mission dicts from whichever layout the control dir uses."""
+    shards = ShardedMissionStore(control_dir)
+    if shards.exists():
+        return shards.load_all()
+    try:
+        payload = json.loads(shards.legacy_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return []
+    if not isinstance(payload, list):
+        return []
+    return [item for item in payload if isinstance(item, dict)]
+
+
+def load_mission_payload(control_dir: Path, mission_id: str) -> dict | None:
+    """Read one raw mission dict, touching a single shard when sharded."""
+    shards = ShardedMissionStore(control_dir)
+    if shards.exists():
+        return shards.load_one(mission_id)
+    for payload in load_mission_payloads(control_dir):
+        if str(payload.get("mission_id") or "") == mission_id:
+            return payload
+    return None
+
+
+def save_mission_payloads(control_dir: Path, payloads: list[dict]) -> None:
+    shards = ShardedMissionStore(control_dir)
+    if shards.exists():
+        shards.write_all(payloads)
+        return
+    control_dir.mkdir(parents=True, exist_ok=True)
+    shards.legacy_path.write_text(json.dumps(payloads, indent=2), encoding="utf-8")
+
+
+def mission_store_watch_paths(control_dir: Path) -> list[Path]:
+    shards = ShardedMissionStore(control_dir)
+    return [shards.legacy_path, shards.index_path]
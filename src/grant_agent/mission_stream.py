@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import parse_qsl, urlencode
+
+from .mission_store import load_mission_payload
+
+MISSION_STREAM_SCHEMA = "fluxio.mission_stream.v1"
+MISSION_EVENTS_CURSOR_KEY = "mission"
+STREAM_POLL_ENV = "FLUXIO_MISSION_STREAM_POLL_SECONDS"
+STREAM_MAX_ENV = "FLUXIO_MISSION_STREAM_MAX_SECONDS"
+DEFAULT_POLL_SECONDS = 0.5
+DEFAULT_HEARTBEAT_SECONDS = 15.0
+DEFAULT_MAX_SECONDS = 900.0
+SESSION_REFRESH_SECONDS = 2.0
+RECONNECT_RETRY_MS = 2000
+STREAM_TERMINAL_STATUSES = {"completed", "failed", "stopped", "archived"}
+
+
+def _env_seconds(name: str, default: float) -> float:
+    try:
+        return max(0.05, float(os.environ.get(name, "") or default))
+    except ValueError:
+        return default
+
+
+def parse_stream_cursor(raw: str) -> dict[str, int]:
+    """Decode a ``Last-Event-ID`` cursor into per-file byte offsets."""
+    offsets: dict[str, int] = {}
+    for key, value in parse_qsl(str(raw or "").strip(), keep_blank_values=False):
+        try:
+            offsets[key] = max(0, int(value))
+        except ValueError:
+            continue
+    return offsets
+
+
+def format_stream_cursor(offsets: dict[str, int]) -> str:
+    return urlencode(sorted(offsets.items()))
+
+
+def format_sse(event: str, data: object, *, event_id: str = "") -> bytes:
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    serialized = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    lines.extend(f"data: {line}" for line in serialized.splitlines() or [""])
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+def _read_appended_lines(path: Path, offset: int) -> tuple[list[tuple[int, dict]], int]:
+    """Return complete JSON lines after ``offset`` with each line's end offset.
+
+    A file shorter than the cursor was rotated or compacted; its retained
+    lines were already sent, so the cursor skips to the current end. A
+    trailing partial line is left for the next poll.
+    """
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return [], offset
+    if size <= offset:
+        return [], size
+        return [], offset
+    rows: list[tuple[int, dict]] = []
+    try:
+        with path.open("rb") as handle:
+            handle.seek(offset)
+            for raw_line in handle:
+                if not raw_line.endswith(b"\n"):
+                    break
+                offset += len(raw_line)
+                if not raw_line.strip():
+                    continue
+                try:
+                    payload = json.loads(raw_line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                if isinstance(payload, dict):
+                    rows.append((offset, payload))
+    except OSError:
+        pass
+    return rows, offset
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+class MissionEventTail:
+    """Follow one mission across ``mission_events.jsonl`` and its delegated sessions.
+
+    The cursor is a query string of byte offsets keyed by ``mission`` and each
+    delegated id, so a reconnect with ``Last-Event-ID`` resumes exactly where
+    the previous stream stopped. Sessions missing from a resumed cursor were
+    launched afterwards and are replayed from their first line.
+    """
+
+    def __init__(self, root: Path, mission_id: str, cursor: str = "") -> None:
+        self.control_dir = root / ".agent_control"
+        self.mission_id = mission_id
+        self.events_path = self.control_dir / "mission_events.jsonl"
+        self.offsets = parse_stream_cursor(cursor)
+        self.resumed = bool(self.offsets)
+        self.session_paths: dict[str, Path] = {}
+        self.status = ""
+        self.found = False
+
+    def cursor(self) -> str:
+        return format_stream_cursor(self.offsets)
+
+    @property
+    def terminal(self) -> bool:
+        return self.status in STREAM_TERMINAL_STATUSES
+
+    def refresh_mission(self) -> None:
+        mission = load_mission_payload(self.control_dir, self.mission_id)
+        if mission is None:
+            return
+        self.found = True
+        state = mission.get("state") if isinstance(mission.get("state"), dict) else {}
+        self.status = str(state.get("status") or mission.get("status") or "").strip().lower()
+        sessions = state.get("delegated_runtime_sessions")
+        if not isinstance(sessions, list):
+            sessions = mission.get("delegated_runtime_sessions", [])
+        for session in sessions if isinstance(sessions, list) else []:
+            if not isinstance(session, dict):
+                continue
+            delegated_id = str(session.get("delegated_id") or "").strip()
+            if not delegated_id or delegated_id == MISSION_EVENTS_CURSOR_KEY:
+                continue
+            events_path = str(session.get("events_path") or "").strip()
+            self.session_paths[delegated_id] = (
+                Path(events_path) if events_path else self.control_dir / f"{delegated_id}.events.jsonl"
+            )
+
+    def start(self) -> None:
+        self.refresh_mission()
+        if self.resumed:
+            return
+        self.offsets[MISSION_EVENTS_CURSOR_KEY] = _file_size(self.events_path)
+        for delegated_id, path in self.session_paths.items():
+            self.offsets[delegated_id] = _file_size(path)
+
+    def poll(self) -> list[tuple[str, dict[str, Any]]]:
+        """Return ``(cursor, payload)`` pairs for events appended since the last poll."""
+        emitted: list[tuple[str, dict[str, Any]]] = []
+        rows, end = _read_appended_lines(self.events_path, self.offsets.get(MISSION_EVENTS_CURSOR_KEY, 0))
+        for line_end, event in rows:
+            self.offsets[MISSION_EVENTS_CURSOR_KEY] = line_end
+            if str(event.get("mission_id") or event.get("missionId") or "").strip() != self.mission_id:
+                continue
+            emitted.append(
+                (self.cursor(), {"source": "mission", "missionId": self.mission_id, "event": event})
+            )
+        self.offsets[MISSION_EVENTS_CURSOR_KEY] = end
+        for delegated_id, path in sorted(self.session_paths.items()):
+            rows, end = _read_appended_lines(path, self.offsets.get(delegated_id, 0))
+            for line_end, event in rows:
+                self.offsets[delegated_id] = line_end
+                emitted.append(
+                    (
+                        self.cursor(),
+                        {
+                            "source": "delegated_session",
+                            "missionId": self.mission_id,
+                            "delegatedId": delegated_id,
+                            "event": event,
+                        },
+                    )
+                )
+            self.offsets[delegated_id] = end
+        return emitted
+
+
+def stream_mission_events(
+    write: Callable[[bytes], None],
+    tail: MissionEventTail,
+    *,
+    poll_seconds: float | None = None,
+    heartbeat_seconds: float = DEFAULT_HEARTBEAT_SECONDS,
+    max_seconds: float | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> str:
+    """Push a mission's events through ``write`` until it ends or the budget runs out.
+
+    Returns why the stream stopped: ``terminal``, ``missing`` or ``expired``.
+    Write errors from a disconnected client propagate to the caller.
+    """
+    poll_seconds = poll_seconds if poll_seconds is not None else _env_seconds(STREAM_POLL_ENV, DEFAULT_POLL_SECONDS)
+    max_seconds = max_seconds if max_seconds is not None else _env_seconds(STREAM_MAX_ENV, DEFAULT_MAX_SECONDS)
+    tail.start()
+    write(f"retry: {RECONNECT_RETRY_MS}\n\n".encode("ascii"))
+    if not tail.found:
+        write(format_sse("end", {"missionId": tail.mission_id, "reason": "missing"}))
+        return "missing"
+    write(
+        format_sse(
+            "ready",
+            {
+                "schema": MISSION_STREAM_SCHEMA,
+                "missionId": tail.mission_id,
+                "status": tail.status,
+                "resumed": tail.resumed,
+            },
+            event_id=tail.cursor(),
+        )
+    )
+    started = clock()
+    last_write = started
+    last_refresh = started
+    while True:
+        now = clock()
+        if now - last_refresh >= SESSION_REFRESH_SECONDS:
+            tail.refresh_mission()
+            last_refresh = now
+        events = tail.poll()
+        for cursor, payload in events:
+            write(format_sse("mission_event", payload, event_id=cursor))
+        if events:
+            last_write = now
+            if any(payload["source"] == "mission" for _, payload in events):
+                tail.refresh_mission()
+                last_refresh = now
+        if tail.terminal:
+            for cursor, payload in tail.poll():
+                write(format_sse("mission_event", payload, event_id=cursor))
+            write(
+                format_sse(
+                    "end",
+                    {"missionId": tail.mission_id, "reason": "terminal", "status": tail.status},
+                    event_id=tail.cursor(),
+                )
+            )
+            return "terminal"
+        if now - started >= max_seconds:
+            return "expired"
+        if now - last_write >= heartbeat_seconds:
+            write(b": keep-alive\n\n")
+            last_write = now
+        sleep(poll_seconds)
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 import uuid
 
+from .mission_event_index import MissionEventIndex
 from .models import Mission, WorkspaceProfile, utc_now_iso
 
 TERMINAL_STATUSES = {"completed", "failed", "stopped", "archived"}
@@ -245,29 +246,7 @@ def _age_minutes(value: object, now: datetime) -> int | None:
 
 
 def _latest_runtime_cycles_by_mission(root: Path) -> dict[str, dict]:
-    path = root / ".agent_control" / "mission_events.jsonl"
-    if not path.exists():
-        return {}
-    latest: dict[str, dict] = {}
-    try:
-        handle = path.open("r", encoding="utf-8", errors="ignore")
-    except OSError:
-        return {}
-    with handle:
-        for line in handle:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                event = json.loads(stripped)
-            except json.JSONDecodeError:
-                continue
-            if event.get("kind") != "mission.runtime_cycle":
-                continue
-            mission_id = str(event.get("mission_id") or event.get("missionId") or "").strip()
-            if mission_id:
-                latest[mission_id] = event
-    return latest
+    return MissionEventIndex(root / ".agent_control" / "mission_events.jsonl").latest_runtime_cycles()
 
 
 def _route_roles(mission: Mission) -> set[str]:
@@ -37,6 +37,7 @@ class VerificationResult:
     duration_ms: int
     status: str = "executed"
     risk_level: str = "low"
+    cached: bool = False
 
 
 @dataclass
@@ -10,6 +10,8 @@ import subprocess
 import time
 from pathlib import Path
 
+from .command_probe import gather_probes, invalidate_command_probe_cache, probe_command
+from .mission_store import load_mission_payloads
 from .models import GuidanceCard, ImprovementQueueItem, OnboardingProgress, TutorialStep
 from .profiles import ProfileRegistry
 from .runtime_updates import (
@@ -65,7 +67,7 @@ def _python_module_version(module_name: str, version_attr: str = "__version__")
         f"print(getattr(module, {version_attr!r}, 'installed'))"
     )
     try:
-        completed = subprocess.run(  # noqa: S603
+        completed = probe_command(
             [python_command, "-c", script],
             capture_output=True,
             text=True,
@@ -370,7 +372,7 @@ def _command_version(
     if lookup_path:
         env["PATH"] = lookup_path
     try:
-        completed = subprocess.run(  # noqa: S603
+        completed = probe_command(
             args,
             capture_output=True,
             text=True,
@@ -421,7 +423,7 @@ def _command_version_from_wsl(command_name: str, version_args: list[str] | None
     escaped_command = shlex.quote(command_name)
     lookup = f"command -v {escaped_command} >/dev/null 2>&1 && {escaped_command} {args}"
     try:
-        completed = subprocess.run(  # noqa: S603
+        completed = probe_command(
             [wsl, "bash", "-lc", lookup],
             capture_output=True,
             text=True,
@@ -473,7 +475,7 @@ def detect_wsl_status() -> dict:
         }
 
     try:
-        completed = subprocess.run(  # noqa: S603
+        completed = probe_command(
             [wsl, "--status"],
             capture_output=True,
             timeout=10,
@@ -543,20 +545,26 @@ def detect_onboarding_status(root: Path, *, force: bool = False) -> dict:
         if isinstance(persisted, dict):
             _ONBOARDING_CACHE[cache_key] = (now, copy.deepcopy(persisted))
             return copy.deepcopy(persisted)
+    else:
+        invalidate_command_probe_cache()
 
     readme_exists = (root / "README.md").exists()
-    wsl = detect_wsl_status()
     setup_history = _load_setup_history(root)
     launched_mission_count = _launched_mission_count(root)
     phone_ready = _phone_destination_count(root) > 0
-    checks = {
-        "node": _command_version("node", root=root),
-        "python": _command_version("python", root=root),
-        "uv": _command_version("uv", ["--version"], root=root),
-        "opencv": _python_module_version("cv2"),
-        "openclaw": _command_version("openclaw", root=root),
-        "hermes": _command_version("hermes", root=root),
-    }
+    probes = gather_probes(
+        {
+            "wsl": detect_wsl_status,
+            "node": lambda: _command_version("node", root=root),
+            "python": lambda: _command_version("python", root=root),
+            "uv": lambda: _command_version("uv", ["--version"], root=root),
+            "opencv": lambda: _python_module_version("cv2"),
+            "openclaw": lambda: _command_version("openclaw", root=root),
+            "hermes": lambda: _command_version("hermes", root=root),
+        }
+    )
+    wsl = probes.pop("wsl")
+    checks = probes
     if checks["openclaw"].get("version"):
         checks["openclaw"]["version"] = normalize_openclaw_version(checks["openclaw"]["version"])
     if checks["hermes"].get("version"):
@@ -2030,11 +2038,11 @@ def _workspace_count(root: Path) -> int:
 
 
 def _mission_count(root: Path) -> int:
-    return len(_load_control_list(root, "missions.json"))
+    return len(load_mission_payloads(root / ".agent_control"))
 
 
 def _launched_mission_count(root: Path) -> int:
-    missions = _load_control_list(root, "missions.json")
+    missions = load_mission_payloads(root / ".agent_control")
     return sum(
         1
         for mission in missions
@@ -2046,7 +2054,7 @@ def _launched_mission_count(root: Path) -> int:
 
 def _phone_destination_count(root: Path) -> int:
     configured_destination = load_telegram_destination(root)
-    missions = _load_control_list(root, "missions.json")
+    missions = load_mission_payloads(root / ".agent_control")
     mission_destinations = sum(
         1
         for mission in missions
@@ -1,11 +1,42 @@
 from __future__ import annotations
 
+import marshal
+import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
 
-EXCLUDED_DIRS = {".git", ".agent_runs", ".agent_runs_test", "__pycache__", ".venv", "venv"}
+EXCLUDED_DIRS = {
+    ".git",
+    ".hg",
+    ".svn",
+    ".agent_control",
+    ".agent_runs",
+    ".agent_runs_test",
+    "__pycache__",
+    ".venv",
+    "venv",
+    "node_modules",
+    ".pytest_cache",
+    ".mypy_cache",
+}
+SEARCH_INDEX_RELATIVE_PATH = Path(".agent_control") / "cache" / "search_index.marshal"
+SEARCH_INDEX_VERSION = 1
+SEARCH_MAX_FILE_BYTES = max(int(os.environ.get("FLUXIO_SEARCH_MAX_FILE_BYTES", str(2 * 1024 * 1024))), 1024)
+SEARCH_BINARY_SNIFF_BYTES = 8192
+# Files written this recently can change again without moving their mtime,
+# so they are re-indexed on every search until they settle.
+SEARCH_INDEX_RACY_NS = 2_000_000_000
+# Queries whose per-line meaning differs from a whole-file search, so a file
+# cannot be rejected by searching its full text once.
+_LINE_ANCHORED_TOKENS = ("\\A", "\\Z", "(?!", "(?<!")
+
+_SEARCH_INDEX_CACHE: dict[str, "_TrigramIndex"] = {}
+_SEARCH_INDEX_CACHE_LOCK = threading.Lock()
 
 
 @dataclass
@@ -15,6 +46,345 @@ class SearchMatch:
     snippet: str
 
 
+def _env_flag(name: str, default: bool) -> bool:
+    raw = str(os.environ.get(name, "")).strip().lower()
+    if not raw:
+        return default
+    return raw not in {"0", "false", "no", "off", "disabled"}
+
+
+def _search_workers() -> int:
+    try:
+        configured = int(os.environ.get("FLUXIO_SEARCH_WORKERS", "") or 0)
+    except ValueError:
+        configured = 0
+    return max(1, configured or min(8, os.cpu_count() or 1))
+
+
+def _glob_matcher(include_glob: str) -> re.Pattern[str]:
+    """Translate a ``Path.glob`` pattern into a regex over POSIX relative paths."""
+    pattern = include_glob.replace("\\", "/").lstrip("/") or "**/*"
+    parts: list[str] = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            close = pattern.find("]", index + 2)
+            if close == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[index + 1 : close]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+                index = close
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return re.compile("".join(parts) + r"\Z")
+
+
+def _glob_base(include_glob: str) -> str:
+    """Leading directory of ``include_glob`` that contains no wildcards."""
+    prefix: list[str] = []
+    for part in include_glob.replace("\\", "/").strip("/").split("/")[:-1]:
+        if any(char in part for char in "*?["):
+            break
+        prefix.append(part)
+    return "/".join(prefix)
+
+
+def _candidate_files(root: Path, include_glob: str) -> list[str]:
+    """Sorted POSIX paths under ``root`` matching ``include_glob``, minus excluded dirs."""
+    matcher = _glob_matcher(include_glob)
+    base = _glob_base(include_glob)
+    if any(part in EXCLUDED_DIRS for part in base.split("/")):
+        return []
+    start = root / base if base else root
+    files: list[str] = []
+    for current, dirnames, filenames in os.walk(start):
+        dirnames[:] = [name for name in dirnames if name not in EXCLUDED_DIRS]
+        relative_dir = Path(current).relative_to(root).as_posix()
+        prefix = "" if relative_dir == "." else f"{relative_dir}/"
+        for name in filenames:
+            relative = prefix + name
+            if matcher.match(relative):
+                files.append(relative)
+    files.sort()
+    return files
+
+
+def _read_searchable_text(path: Path) -> str | None:
+    """Decoded file text, or ``None`` for binaries, oversized files and read errors."""
+    try:
+        if path.stat().st_size > SEARCH_MAX_FILE_BYTES:
+            return None
+        raw = path.read_bytes()
+    except OSError:
+        return None
+    if b"\0" in raw[:SEARCH_BINARY_SNIFF_BYTES]:
+        return None
+    return raw.decode("utf-8", errors="ignore")
+
+
+def _trigram_blob(text: str) -> str:
+    folded = text.casefold()
+    trigrams = {folded[index : index + 3] for index in range(len(folded) - 2)}
+    return "\n" + "\n".join(sorted(item for item in trigrams if "\n" not in item)) + "\n"
+
+
+_ESCAPE_OPERAND_LENGTHS = {"x": 2, "u": 4, "U": 8}
+
+
+def _required_literals(query: str, flags: int) -> list[str]:
+    """Literal runs every match of ``query`` must contain, for trigram narrowing.
+
+    Deliberately conservative: alternation or verbose mode disables narrowing
+    entirely, and anything inside a group, a character class or before an
+    optional quantifier is left out, so a file lacking one of these runs can
+    never hold a match.
+    """
+    if flags & re.VERBOSE or "|" in query:
+        return []
+    literals: list[str] = []
+    current: list[str] = []
+
+    def flush() -> None:
+        if len(current) >= 3:
+            literals.append("".join(current))
+        current.clear()
+
+    index = 0
+    depth = 0
+    while index < len(query):
+        char = query[index]
+        if char == "\\":
+            escaped = query[index + 1 : index + 2]
+            if depth == 0 and escaped and not escaped.isalnum():
+                current.append(escaped)
+                index += 2
+                continue
+            flush()
+            index += 2
+            # Skip the escape's operands so they are never read as literal text.
+            if escaped in _ESCAPE_OPERAND_LENGTHS:
+                index += _ESCAPE_OPERAND_LENGTHS[escaped]
+            elif escaped == "N" and query[index : index + 1] == "{":
+                close = query.find("}", index)
+                index = close + 1 if close != -1 else len(query)
+            elif escaped.isdigit():
+                # Octal escapes and backreferences take at most two more digits.
+                for _ in range(2):
+                    if query[index : index + 1].isdigit():
+                        index += 1
+            continue
+        if char == "[":
+            flush()
+            index += 1
+            if query[index : index + 1] == "^":
+                index += 1
+            if query[index : index + 1] == "]":
+                index += 1
+            while index < len(query) and query[index] != "]":
+                index += 2 if query[index] == "\\" else 1
+            index += 1
+            continue
+        if char in "*?{":
+            if current:
+                current.pop()
+            flush()
+            if char == "{":
+                close = query.find("}", index)
+                index = close if close != -1 else index
+            index += 1
+            continue
+        if char == "+":
+            flush()
+        elif char == "(":
+            flush()
+            depth += 1
+        elif char == ")":
+            depth = max(0, depth - 1)
+        elif char in ".^$":
+            flush()
+        elif depth == 0:
+            current.append(char)
+        index += 1
+    flush()
+    return literals
+
+
+def _query_trigrams(literals: list[str]) -> list[str]:
+    trigrams: set[str] = set()
+    for literal in literals:
+        folded = literal.casefold()
+        trigrams.update(folded[index : index + 3] for index in range(len(folded) - 2))
+    return sorted(trigrams)
+
+
+class _TrigramIndex:
+    """Per-file trigram sets for one workspace, persisted under ``.agent_control/cache``.
+
+    Entries are keyed on the file's mtime and size, so a search re-reads only
+    files that changed since the index was last saved. Binaries and oversized
+    files are recorded with no trigrams and never match.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.path = root / SEARCH_INDEX_RELATIVE_PATH
+        self.lock = threading.Lock()
+        self.files: dict[str, tuple[int, int, str | None]] = {}
+        self.loaded_signature: tuple[int, int] | None = None
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            stat = self.path.stat()
+            payload = marshal.loads(self.path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == SEARCH_INDEX_VERSION:
+            files = payload.get("files")
+            if isinstance(files, dict):
+                self.files = files
+                self.loaded_signature = (stat.st_mtime_ns, stat.st_size)
+
+    def refresh(self, relative_paths: list[str], scope: str) -> None:
+        """Bring entries for ``relative_paths`` up to date and drop vanished files under ``scope``."""
+        stale: list[tuple[str, int, int]] = []
+        racy_after_ns = time.time_ns() - SEARCH_INDEX_RACY_NS
+        for relative in relative_paths:
+            try:
+                stat = (self.root / relative).stat()
+            except OSError:
+                continue
+            known = self.files.get(relative)
+            if (
+                known is None
+                or known[0] != stat.st_mtime_ns
+                or known[1] != stat.st_size
+                or stat.st_mtime_ns > racy_after_ns
+            ):
+                stale.append((relative, stat.st_mtime_ns, stat.st_size))
+        scope_prefix = f"{scope}/" if scope else ""
+        present = set(relative_paths)
+        vanished = [
+            relative
+            for relative in self.files
+            if relative.startswith(scope_prefix) and relative not in present and not (self.root / relative).is_file()
+        ]
+        if not stale and not vanished:
+            return
+
+        def build(item: tuple[str, int, int]) -> tuple[str, tuple[int, int, str | None]]:
+            relative, mtime_ns, size = item
+            text = _read_searchable_text(self.root / relative)
+            return relative, (mtime_ns, size, _trigram_blob(text) if text is not None else None)
+
+        with ThreadPoolExecutor(max_workers=_search_workers(), thread_name_prefix="fluxio-search-index") as pool:
+            self.files.update(pool.map(build, stale))
+        for relative in vanished:
+            self.files.pop(relative, None)
+        self._save()
+
+    def _save(self) -> None:
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(marshal.dumps({"version": SEARCH_INDEX_VERSION, "files": self.files}))
+            os.replace(tmp_path, self.path)
+            stat = self.path.stat()
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+        self.loaded_signature = (stat.st_mtime_ns, stat.st_size)
+
+    def narrow(self, relative_paths: list[str], trigrams: list[str]) -> list[str]:
+        needles = [f"\n{trigram}\n" for trigram in trigrams]
+        narrowed: list[str] = []
+        for relative in relative_paths:
+            entry = self.files.get(relative)
+            if entry is None:
+                narrowed.append(relative)
+                continue
+            blob = entry[2]
+            if blob is not None and all(needle in blob for needle in needles):
+                narrowed.append(relative)
+        return narrowed
+
+
+def _workspace_index(root: Path) -> _TrigramIndex:
+    key = str(root)
+    with _SEARCH_INDEX_CACHE_LOCK:
+        index = _SEARCH_INDEX_CACHE.get(key)
+        if index is not None:
+            try:
+                stat = index.path.stat()
+                signature: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                signature = None
+            if signature == index.loaded_signature:
+                return index
+        index = _TrigramIndex(root)
+        _SEARCH_INDEX_CACHE[key] = index
+        return index
+
+
+def invalidate_search_index_cache() -> None:
+    with _SEARCH_INDEX_CACHE_LOCK:
+        _SEARCH_INDEX_CACHE.clear()
+
+
+def _scan_files(
+    root: Path,
+    relative_paths: list[str],
+    pattern: re.Pattern[str],
+    file_filter: re.Pattern[str] | None,
+    max_results: int,
+) -> list[SearchMatch]:
+    """Matches in path order, scanning files on a thread pool in bounded batches.
+
+    Batches are consumed in order, so the scan stops submitting work as soon
+    as ``max_results`` matches have been collected.
+    """
+
+    def scan(relative: str) -> list[SearchMatch]:
+        text = _read_searchable_text(root / relative)
+        if text is None or (file_filter is not None and not file_filter.search(text)):
+            return []
+        matches: list[SearchMatch] = []
+        for index, line in enumerate(text.splitlines(), start=1):
+            if pattern.search(line):
+                matches.append(SearchMatch(path=str(Path(relative)), line=index, snippet=line.strip()))
+                if len(matches) >= max_results:
+                    break
+        return matches
+
+    results: list[SearchMatch] = []
+    workers = _search_workers()
+    batch_size = workers * 4
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fluxio-search") as pool:
+        for offset in range(0, len(relative_paths), batch_size):
+            for matches in pool.map(scan, relative_paths[offset : offset + batch_size]):
+                results.extend(matches)
+                if len(results) >= max_results:
+                    return results[:max_results]
+    return results
+
+
 def search_workspace(
     root: Path,
     query: str,
@@ -22,24 +392,31 @@ def search_workspace(
     max_results: int = 25,
     case_sensitive: bool = False,
 ) -> list[dict]:
+    """Regex search over workspace text files, one result per matching line.
+
+    Binaries, files above ``SEARCH_MAX_FILE_BYTES`` and ``EXCLUDED_DIRS`` are
+    skipped. When the query has a literal run of three or more characters,
+    a persistent trigram index (``FLUXIO_SEARCH_INDEX``, on by default) picks
+    the candidate files before any of them are read; otherwise every file
+    matching ``include_glob`` is scanned in parallel. Results come back in
+    path order and stop at ``max_results``.
+    """
     flags = 0 if case_sensitive else re.IGNORECASE
     pattern = re.compile(query, flags=flags)
+    root = root.resolve()
+    if max_results <= 0:
+        return []
 
-    results: list[SearchMatch] = []
-    for path in root.glob(include_glob):
-        if not path.is_file():
-            continue
-        if any(part in EXCLUDED_DIRS for part in path.parts):
-            continue
-        try:
-            lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-        except OSError:
-            continue
+    candidates = _candidate_files(root, include_glob)
+    trigrams = _query_trigrams(_required_literals(query, pattern.flags))
+    if trigrams and candidates and _env_flag("FLUXIO_SEARCH_INDEX", True):
+        index = _workspace_index(root)
+        with index.lock:
+            index.refresh(candidates, _glob_base(include_glob))
+            candidates = index.narrow(candidates, trigrams)
 
-        for index, line in enumerate(lines, start=1):
-            if pattern.search(line):
-                relative = str(path.relative_to(root))
-                results.append(SearchMatch(path=relative, line=index, snippet=line.strip()))
-                if len(results) >= max_results:
-                    return [asdict(item) for item in results]
-    return [asdict(item) for item in results]
+    file_filter = None
+    if query and not any(token in query for token in _LINE_ANCHORED_TOKENS):
+        file_filter = re.compile(query, flags=flags | re.MULTILINE)
+
+    return [asdict(item) for item in _scan_files(root, candidates, pattern, file_filter, max_results)]
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import argparse
 import ctypes
+import ctypes.util
 import json
 import os
 import re
+import select
 import shlex
 import signal
+import struct
 import subprocess
 import sys
 import threading
@@ -17,11 +20,11 @@ from pathlib import Path
 from typing import Any
 
 try:
-    from .subprocess_utils import background_creationflags
+    from .subprocess_utils import background_creationflags, hidden_windows_subprocess_kwargs
     from .runtimes.base import _apply_runtime_home_env
 except ImportError:  # pragma: no cover - direct script fallback
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-    from grant_agent.subprocess_utils import background_creationflags
+    from grant_agent.subprocess_utils import background_creationflags, hidden_windows_subprocess_kwargs
     from grant_agent.runtimes.base import _apply_runtime_home_env
 
 STRUCTURED_EVENT_PREFIX = "FLUXIO_EVENT:"
@@ -45,6 +48,13 @@ SNAPSHOT_EXCLUDED_DIRS = {
 }
 SNAPSHOT_MAX_FILES = max(int(os.environ.get("FLUXIO_DELEGATED_SNAPSHOT_MAX_FILES", "8000")), 100)
 CHANGED_FILE_LIMIT = max(int(os.environ.get("FLUXIO_DELEGATED_CHANGED_FILE_LIMIT", "240")), 20)
+CHANGE_TRACKING_MODES = ("git", "inotify", "walk")
+CHANGE_TRACKING_GIT_TIMEOUT_SECONDS = 30
+STATE_FLUSH_INTERVAL_SECONDS = max(
+    float(os.environ.get("FLUXIO_DELEGATED_STATE_FLUSH_SECONDS", "0.5")),
+    0.0,
+)
+LATEST_EVENT_LIMIT = 5
 
 
 def _load_state(path: Path) -> dict:
@@ -60,68 +70,127 @@ def _write_state(path: Path, updates: dict) -> dict:
     return payload
 
 
-def _append_event(session_path: Path, *, kind: str, message: str, status: str = "", data: dict | None = None) -> dict:
-    payload = _load_state(session_path)
-    events_path = Path(payload.get("events_path", session_path.with_suffix(".events.jsonl"))).resolve()
-    events_path.parent.mkdir(parents=True, exist_ok=True)
-    event_timestamp = _utc_now()
-    event = {
-        "event_id": f"evt_{uuid.uuid4().hex[:10]}",
-        "delegated_id": payload.get("delegated_id", ""),
-        "runtime_id": payload.get("runtime_id", ""),
-        "kind": kind,
-        "message": message,
-        "status": status or payload.get("status", ""),
-        "created_at": event_timestamp,
-        "data": data or {},
-    }
-    with events_path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(event, ensure_ascii=True) + "\n")
-    latest_events, event_count = _read_events(events_path, max_events=5)
-    updates = {
-        "updated_at": event_timestamp,
-        "last_event": message,
-        "last_event_kind": kind,
-        "latest_events": latest_events,
-        "event_cursor": event_count,
-    }
-    current_status = str(event["status"] or "")
-    if current_status in {"launching", "running", "waiting_for_approval"}:
-        updates["heartbeat_at"] = event_timestamp
-        updates["heartbeat_status"] = "healthy"
-        updates["heartbeat_interval_seconds"] = max(
-            int(round(HEARTBEAT_INTERVAL_SECONDS)),
-            1,
-        )
-    elif current_status in {"completed", "failed", "stopped"}:
-        updates["heartbeat_status"] = "inactive"
-    _write_state(
-        session_path,
-        updates,
-    )
-    return event
+class _SessionRecorder:
+    """Event cursor and debounced state writer for one delegated run.
 
+    Output lines become a single append to the events file; the latest
+    events and the event count live in memory, and the session state file is
+    rewritten at most once per flush interval unless the status changes or
+    an approval/terminal event forces an immediate flush.
+    """
 
-def _read_events(path: Path, max_events: int = 0) -> tuple[list[dict], int]:
-    if not path.exists():
-        return [], 0
-    event_count = 0
-    if max_events > 0:
-        rows: deque[dict] = deque(maxlen=max_events)
-    else:
-        rows = deque()
-    with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        for raw_line in handle:
+    def __init__(self, session_path: Path, *, flush_interval: float | None = None) -> None:
+        self.session_path = session_path
+        payload = _load_state(session_path)
+        self.events_path = Path(payload.get("events_path", session_path.with_suffix(".events.jsonl"))).resolve()
+        self.events_path.parent.mkdir(parents=True, exist_ok=True)
+        self.delegated_id = str(payload.get("delegated_id", ""))
+        self.runtime_id = str(payload.get("runtime_id", ""))
+        self.status = str(payload.get("status", ""))
+        self.flush_interval = STATE_FLUSH_INTERVAL_SECONDS if flush_interval is None else max(flush_interval, 0.0)
+        self.latest_events: deque[dict] = deque(maxlen=LATEST_EVENT_LIMIT)
+        self.event_count = 0
+        self.position = 0
+        self.state_writes = 0
+        self._pending: dict = {}
+        self._last_flush = 0.0
+        self._timer: threading.Timer | None = None
+        self._lock = threading.RLock()
+        self._writer = self.events_path.open("ab")
+        self._reader = self.events_path.open("rb")
+        self._catch_up()
+
+    def _catch_up(self) -> None:
+        self._reader.seek(self.position)
+        for raw_line in self._reader:
+            if not raw_line.endswith(b"\n"):
+                break
+            self.position += len(raw_line)
             line = raw_line.strip()
             if not line:
                 continue
             try:
                 event = json.loads(line)
-            except json.JSONDecodeError:
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 continue
-            event_count += 1
-            rows.append(event)
-    return list(rows), event_count
+            self.event_count += 1
+            self.latest_events.append(event)
+
+    def append_event(self, *, kind: str, message: str, status: str = "", data: dict | None = None) -> dict:
+        with self._lock:
+            event_timestamp = _utc_now()
+            event = {
+                "event_id": f"evt_{uuid.uuid4().hex[:10]}",
+                "delegated_id": self.delegated_id,
+                "runtime_id": self.runtime_id,
+                "kind": kind,
+                "message": message,
+                "status": status or self.status,
+                "created_at": event_timestamp,
+                "data": data or {},
+            }
+            self._writer.write((json.dumps(event, ensure_ascii=True) + "\n").encode("ascii"))
+            self._writer.flush()
+            self._catch_up()
+            updates = {
+                "updated_at": event_timestamp,
+                "last_event": message,
+                "last_event_kind": kind,
+                "latest_events": list(self.latest_events),
+                "event_cursor": self.event_count,
+            }
+            current_status = str(event["status"] or "")
+            if current_status in {"launching", "running", "waiting_for_approval"}:
+                updates["heartbeat_at"] = event_timestamp
+                updates["heartbeat_status"] = "healthy"
+                updates["heartbeat_interval_seconds"] = max(
+                    int(round(HEARTBEAT_INTERVAL_SECONDS)),
+                    1,
+                )
+            elif current_status in {"completed", "failed", "stopped"}:
+                updates["heartbeat_status"] = "inactive"
+            force = kind.startswith("approval.") or current_status in {"completed", "failed", "stopped"}
+            self.update_state(updates, force=force)
+            return event
+
+    def update_state(self, updates: dict, *, force: bool = False) -> None:
+        with self._lock:
+            self._pending.update(updates)
+            next_status = str(updates.get("status") or "")
+            if next_status and next_status != self.status:
+                self.status = next_status
+                force = True
+            elapsed = time.monotonic() - self._last_flush
+            if force or elapsed >= self.flush_interval:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval - elapsed, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> dict:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return {}
+            payload = _write_state(self.session_path, self._pending)
+            self._pending = {}
+            self._last_flush = time.monotonic()
+            self.state_writes += 1
+            return payload
+
+    def load_state(self) -> dict:
+        with self._lock:
+            self.flush()
+            return _load_state(self.session_path)
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._writer.close()
+            self._reader.close()
 
 
 def _read_json_with_retries(path: Path, retries: int = 8, delay: float = 0.02) -> dict:
@@ -394,8 +463,9 @@ def _parse_structured_event(line: str) -> dict[str, Any] | None:
     return None
 
 
-def _wait_for_approval(session_path: Path, child: subprocess.Popen, request: dict) -> str:
-    payload = _load_state(session_path)
+def _wait_for_approval(recorder: _SessionRecorder, child: subprocess.Popen, request: dict) -> str:
+    session_path = recorder.session_path
+    payload = recorder.load_state()
     decision_path = Path(payload.get("decision_path", session_path.with_suffix(".approval.json"))).resolve()
     decision_path.parent.mkdir(parents=True, exist_ok=True)
     while True:
@@ -412,17 +482,16 @@ def _wait_for_approval(session_path: Path, child: subprocess.Popen, request: dic
             history = list(payload.get("approval_history", []))
             history.append(request)
             if status == "approved":
-                _write_state(
-                    session_path,
+                recorder.update_state(
                     {
                         "status": "running",
                         "detail": "Delegated runtime resumed after approval.",
                         "pending_approval": {},
                         "approval_history": history,
                     },
+                    force=True,
                 )
-                _append_event(
-                    session_path,
+                recorder.append_event(
                     kind="approval.resolved",
                     message="Delegated approval approved by operator.",
                     status="running",
@@ -430,17 +499,16 @@ def _wait_for_approval(session_path: Path, child: subprocess.Popen, request: dic
                 )
                 return "approved"
             _terminate_child(child)
-            _write_state(
-                session_path,
+            recorder.update_state(
                 {
                     "status": "failed",
                     "detail": "Delegated runtime was rejected by operator.",
                     "pending_approval": request,
                     "approval_history": history,
                 },
+                force=True,
             )
-            _append_event(
-                session_path,
+            recorder.append_event(
                 kind="approval.rejected",
                 message="Delegated approval rejected by operator.",
                 status="failed",
@@ -463,24 +531,30 @@ def _heartbeat_message(status: str) -> str:
 
 
 def _heartbeat_loop(
-    session_path: Path,
+    recorder: _SessionRecorder,
     child: subprocess.Popen,
     stop_event: threading.Event,
+    change_tracker: _WalkChangeTracker | _GitChangeTracker | _InotifyChangeTracker | None = None,
 ) -> None:
+    reported_changes: list[str] | None = None
     while not stop_event.wait(HEARTBEAT_INTERVAL_SECONDS):
         if child.poll() is not None:
             return
-        payload = _load_state(session_path)
+        payload = recorder.load_state()
         status = str(payload.get("status", "running"))
         if status in {"completed", "failed", "stopped"}:
             return
-        _append_event(
-            session_path,
+        recorder.append_event(
             kind="session.heartbeat",
             message=_heartbeat_message(status),
             status=status,
             data={"phase": status},
         )
+        if change_tracker is not None and change_tracker.incremental:
+            changed_files = change_tracker.changed_files()
+            if changed_files != reported_changes:
+                reported_changes = changed_files
+                recorder.update_state({"changed_files": changed_files})
 
 
 def run(session_path: Path, cwd: Path, command: str) -> int:
@@ -491,184 +565,179 @@ def run(session_path: Path, cwd: Path, command: str) -> int:
     log_path.parent.mkdir(parents=True, exist_ok=True)
     events_path = Path(payload.get("events_path", session_path.with_suffix(".events.jsonl"))).resolve()
     decision_path = Path(payload.get("decision_path", session_path.with_suffix(".approval.json"))).resolve()
-    before_snapshot = _workspace_snapshot(cwd)
-
-    _write_state(
-        session_path,
-        {
-            "status": "launching",
-            "supervisor_pid": os.getpid(),
-            "updated_at": _utc_now(),
-            "detail": "Launching delegated runtime process.",
-            "events_path": str(events_path),
-            "decision_path": str(decision_path),
-            "heartbeat_at": _utc_now(),
-            "heartbeat_status": "healthy",
-            "heartbeat_interval_seconds": max(
-                int(round(HEARTBEAT_INTERVAL_SECONDS)),
-                1,
-            ),
-        },
-    )
-    _append_event(
-        session_path,
-        kind="session.launching",
-        message="Launching delegated runtime process.",
-        status="launching",
-    )
-
-    with log_path.open("a", encoding="utf-8") as handle:
-        popen_command = _popen_command(command)
-        child = subprocess.Popen(  # noqa: S603
-            popen_command,
-            shell=False,
-            cwd=str(cwd),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            bufsize=1,
-            creationflags=_creationflags(),
-            env=_runtime_env(session_path, cwd),
-        )
-
-        _write_state(
-            session_path,
+    change_tracker = _start_change_tracker(cwd)
+    recorder = _SessionRecorder(session_path)
+    try:
+        recorder.update_state(
             {
-                "status": "running",
-                "pid": child.pid,
+                "status": "launching",
+                "supervisor_pid": os.getpid(),
                 "updated_at": _utc_now(),
-                "detail": "Delegated runtime process is running.",
+                "detail": "Launching delegated runtime process.",
+                "events_path": str(events_path),
+                "decision_path": str(decision_path),
+                "change_tracking": change_tracker.mode,
+                "heartbeat_at": _utc_now(),
+                "heartbeat_status": "healthy",
+                "heartbeat_interval_seconds": max(
+                    int(round(HEARTBEAT_INTERVAL_SECONDS)),
+                    1,
+                ),
             },
         )
-        _append_event(
-            session_path,
-            kind="session.running",
-            message="Delegated runtime process is running.",
-            status="running",
-        )
-        heartbeat_stop = threading.Event()
-        heartbeat_thread = threading.Thread(
-            target=_heartbeat_loop,
-            args=(session_path, child, heartbeat_stop),
-            daemon=True,
+        recorder.append_event(
+            kind="session.launching",
+            message="Launching delegated runtime process.",
+            status="launching",
         )
-        heartbeat_thread.start()
 
-        if child.stdout is not None:
-            for raw_line in iter(child.stdout.readline, ""):
-                if not raw_line:
-                    if child.poll() is not None:
-                        break
-                    continue
-                handle.write(raw_line)
-                handle.flush()
-                line = raw_line.strip()
-                if not line:
-                    continue
-                structured = _parse_structured_event(line)
-                if structured is None:
-                    _append_event(
-                        session_path,
-                        kind="runtime.output",
-                        message=line,
-                        status="running",
-                    )
-                    continue
+        with log_path.open("a", encoding="utf-8") as handle:
+            popen_command = _popen_command(command)
+            child = subprocess.Popen(  # noqa: S603
+                popen_command,
+                shell=False,
+                cwd=str(cwd),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+                creationflags=_creationflags(),
+                env=_runtime_env(session_path, cwd),
+            )
 
-                kind = str(structured.get("kind", "runtime.event"))
-                message = str(structured.get("message", line))
-                runtime_status = str(structured.get("status", "running"))
-                event_data = dict(structured.get("data", {}))
-                if kind == "approval.request":
-                    request = {
-                        "request_id": str(structured.get("request_id", f"approval_{uuid.uuid4().hex[:8]}")),
-                        "delegated_id": payload.get("delegated_id", ""),
-                        "runtime_id": payload.get("runtime_id", ""),
-                        "prompt": message,
-                        "risk_level": str(structured.get("risk_level", event_data.get("risk_level", "medium"))),
-                        "status": "pending",
-                        "created_at": _utc_now(),
-                        "resolved_at": None,
-                        "resolved_by": "",
-                        "metadata": event_data,
-                    }
-                    _write_state(
-                        session_path,
+            recorder.update_state(
+                {
+                    "status": "running",
+                    "pid": child.pid,
+                    "updated_at": _utc_now(),
+                    "detail": "Delegated runtime process is running.",
+                },
+            )
+            recorder.append_event(
+                kind="session.running",
+                message="Delegated runtime process is running.",
+                status="running",
+            )
+            heartbeat_stop = threading.Event()
+            heartbeat_thread = threading.Thread(
+                target=_heartbeat_loop,
+                args=(recorder, child, heartbeat_stop, change_tracker),
+                daemon=True,
+            )
+            heartbeat_thread.start()
+
+            if child.stdout is not None:
+                for raw_line in iter(child.stdout.readline, ""):
+                    if not raw_line:
+                        if child.poll() is not None:
+                            break
+                        continue
+                    handle.write(raw_line)
+                    handle.flush()
+                    line = raw_line.strip()
+                    if not line:
+                        continue
+                    structured = _parse_structured_event(line)
+                    if structured is None:
+                        recorder.append_event(
+                            kind="runtime.output",
+                            message=line,
+                            status="running",
+                        )
+                        continue
+
+                    kind = str(structured.get("kind", "runtime.event"))
+                    message = str(structured.get("message", line))
+                    runtime_status = str(structured.get("status", "running"))
+                    event_data = dict(structured.get("data", {}))
+                    if kind == "approval.request":
+                        request = {
+                            "request_id": str(structured.get("request_id", f"approval_{uuid.uuid4().hex[:8]}")),
+                            "delegated_id": payload.get("delegated_id", ""),
+                            "runtime_id": payload.get("runtime_id", ""),
+                            "prompt": message,
+                            "risk_level": str(structured.get("risk_level", event_data.get("risk_level", "medium"))),
+                            "status": "pending",
+                            "created_at": _utc_now(),
+                            "resolved_at": None,
+                            "resolved_by": "",
+                            "metadata": event_data,
+                        }
+                        recorder.update_state(
+                            {
+                                "status": "waiting_for_approval",
+                                "detail": "Delegated runtime is waiting for approval.",
+                                "pending_approval": request,
+                            },
+                        )
+                        recorder.append_event(
+                            kind="approval.request",
+                            message=message,
+                            status="waiting_for_approval",
+                            data=event_data,
+                        )
+                        decision = _wait_for_approval(recorder, child, request)
+                        if decision == "rejected":
+                            break
+                        continue
+
+                    recorder.update_state(
                         {
-                            "status": "waiting_for_approval",
-                            "detail": "Delegated runtime is waiting for approval.",
-                            "pending_approval": request,
+                            "status": runtime_status or "running",
+                            "detail": message,
                         },
                     )
-                    _append_event(
-                        session_path,
-                        kind="approval.request",
+                    recorder.append_event(
+                        kind=kind,
                         message=message,
-                        status="waiting_for_approval",
+                        status=runtime_status or "running",
                         data=event_data,
                     )
-                    decision = _wait_for_approval(session_path, child, request)
-                    if decision == "rejected":
-                        break
-                    continue
 
-                _write_state(
-                    session_path,
-                    {
-                        "status": runtime_status or "running",
-                        "detail": message,
-                    },
-                )
-                _append_event(
-                    session_path,
-                    kind=kind,
-                    message=message,
-                    status=runtime_status or "running",
-                    data=event_data,
-                )
-
-    heartbeat_stop.set()
-    heartbeat_thread.join(timeout=1)
-    return_code = child.wait()
-    summary = _tail_summary(log_path)
-    existing = _load_state(session_path)
-    changed_files = _changed_files_since(before_snapshot, _workspace_snapshot(cwd))
-    try:
-        decision_path.unlink(missing_ok=True)
-    except OSError:
-        pass
-    if existing.get("status") == "failed" and existing.get("pending_approval", {}).get("status") == "rejected":
-        final_status = "failed"
-    elif existing.get("status") == "stopped":
-        final_status = "stopped"
-    else:
-        final_status = "completed" if return_code == 0 else "failed"
-    _write_state(
-        session_path,
-        {
-            "status": final_status,
-            "exit_code": return_code,
-            "updated_at": _utc_now(),
-            "detail": (
-                "Delegated runtime process completed."
-                if final_status == "completed"
-                else "Delegated runtime process failed."
-            ),
-            "last_event": summary or "runtime_finished",
-            "changed_files": changed_files,
-            "heartbeat_status": "inactive",
-        },
-    )
-    _append_event(
-        session_path,
-        kind="session.completed" if final_status == "completed" else "session.failed",
-        message=summary or ("Delegated runtime completed." if final_status == "completed" else "Delegated runtime failed."),
-        status=final_status,
-        data={"exit_code": return_code, "changed_files": changed_files},
-    )
-    return return_code
+        heartbeat_stop.set()
+        heartbeat_thread.join(timeout=1)
+        return_code = child.wait()
+        summary = _tail_summary(log_path)
+        existing = recorder.load_state()
+        changed_files = change_tracker.changed_files()
+        try:
+            decision_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        if existing.get("status") == "failed" and existing.get("pending_approval", {}).get("status") == "rejected":
+            final_status = "failed"
+        elif existing.get("status") == "stopped":
+            final_status = "stopped"
+        else:
+            final_status = "completed" if return_code == 0 else "failed"
+        recorder.update_state(
+            {
+                "status": final_status,
+                "exit_code": return_code,
+                "updated_at": _utc_now(),
+                "detail": (
+                    "Delegated runtime process completed."
+                    if final_status == "completed"
+                    else "Delegated runtime process failed."
+                ),
+                "last_event": summary or "runtime_finished",
+                "changed_files": changed_files,
+                "changed_files_truncated": change_tracker.truncated,
+                "heartbeat_status": "inactive",
+            },
+        )
+        recorder.append_event(
+            kind="session.completed" if final_status == "completed" else "session.failed",
+            message=summary or ("Delegated runtime completed." if final_status == "completed" else "Delegated runtime failed."),
+            status=final_status,
+            data={"exit_code": return_code, "changed_files": changed_files},
+        )
+        return return_code
+    finally:
+        change_tracker.close()
+        recorder.close()
 
 
 def _popen_command(command: str) -> list[str]:
@@ -742,6 +811,280 @@ def _changed_files_since(
     return sorted(dict.fromkeys(changed))[:CHANGED_FILE_LIMIT]
 
 
+def _tracked_relative_path(parts: tuple[str, ...] | list[str]) -> str | None:
+    if not parts or any(part in SNAPSHOT_EXCLUDED_DIRS for part in parts[:-1]):
+        return None
+    return "/".join(parts)
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class _WalkChangeTracker:
+    """Before/after ``os.walk`` comparison; capped at ``SNAPSHOT_MAX_FILES``."""
+
+    mode = "walk"
+    incremental = False
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.before = _workspace_snapshot(root)
+        self.truncated = len(self.before) >= SNAPSHOT_MAX_FILES
+
+    def changed_files(self) -> list[str]:
+        after = _workspace_snapshot(self.root)
+        self.truncated = self.truncated or len(after) >= SNAPSHOT_MAX_FILES
+        return _changed_files_since(self.before, after)
+
+    def close(self) -> None:
+        return None
+
+
+class _GitChangeTracker:
+    """Changed paths from ``git diff``/``git ls-files`` against the launch commit.
+
+    Paths that were already dirty at launch are reported only if the run
+    touched them again (their size or mtime moved) or restored them.
+    """
+
+    mode = "git"
+    incremental = True
+    truncated = False
+
+    def __init__(self, root: Path, base_commit: str) -> None:
+        self.root = root
+        self.base_commit = base_commit
+        self.initial = {path: _file_signature(root / path) for path in self._dirty_paths() or ()}
+        self._last: list[str] = []
+
+    @classmethod
+    def start(cls, root: Path) -> _GitChangeTracker | None:
+        if _git_output(root, "rev-parse", "--is-inside-work-tree") != "true":
+            return None
+        base_commit = _git_output(root, "rev-parse", "--verify", "-q", "HEAD^{commit}")
+        if not base_commit:
+            return None
+        # An ignored scope inside a parent repo would hide every new file.
+        if _git_output(root, "check-ignore", "-q", ".") is not None:
+            return None
+        return cls(root, base_commit)
+
+    def _dirty_paths(self) -> set[str] | None:
+        tracked = _git_output(
+            self.root,
+            "diff",
+            "--name-only",
+            "-z",
+            "--relative",
+            "--no-renames",
+            self.base_commit,
+            "--",
+        )
+        untracked = _git_output(self.root, "ls-files", "--others", "--exclude-standard", "-z")
+        if tracked is None or untracked is None:
+            return None
+        paths: set[str] = set()
+        for raw in (*tracked.split("\0"), *untracked.split("\0")):
+            relative = _tracked_relative_path(raw.split("/")) if raw else None
+            if relative:
+                paths.add(relative)
+        return paths
+
+    def changed_files(self) -> list[str]:
+        current = self._dirty_paths()
+        if current is None:
+            return self._last
+        changed = [
+            path
+            for path in current
+            if path not in self.initial or _file_signature(self.root / path) != self.initial[path]
+        ]
+        changed.extend(path for path in self.initial if path not in current)
+        self._last = sorted(dict.fromkeys(changed))[:CHANGED_FILE_LIMIT]
+        return self._last
+
+    def close(self) -> None:
+        return None
+
+
+def _git_output(root: Path, *args: str) -> str | None:
+    """Stripped stdout of a successful ``git`` call in ``root``, else ``None``."""
+    try:
+        completed = subprocess.run(  # noqa: S603
+            ["git", *args],
+            cwd=str(root),
+            capture_output=True,
+            timeout=CHANGE_TRACKING_GIT_TIMEOUT_SECONDS,
+            check=False,
+            **hidden_windows_subprocess_kwargs(),
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if completed.returncode != 0:
+        return None
+    return completed.stdout.decode("utf-8", errors="surrogateescape").strip("\n")
+
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_INOTIFY_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class _InotifyChangeTracker:
+    """Linux inotify watches on every scope directory, read on a background thread.
+
+    No file count cap: only directories are watched. Files created and
+    removed again during the run are not reported. If the kernel event queue
+    overflows the result is marked ``truncated``.
+    """
+
+    mode = "inotify"
+    incremental = True
+
+    def __init__(self, root: Path, libc: ctypes.CDLL, fd: int) -> None:
+        self.root = root
+        self.truncated = False
+        self._libc = libc
+        self._fd = fd
+        self._watches: dict[int, tuple[str, ...]] = {}
+        self._touched: set[str] = set()
+        self._created: set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._read_loop, daemon=True)
+
+    @classmethod
+    def start(cls, root: Path) -> _InotifyChangeTracker | None:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        tracker = cls(root, libc, fd)
+        if not tracker._watch_tree(()):
+            os.close(fd)
+            return None
+        tracker._thread.start()
+        return tracker
+
+    def _watch_tree(self, parts: tuple[str, ...], *, record_files: bool = False) -> bool:
+        for current_root, dirnames, filenames in os.walk(self.root.joinpath(*parts)):
+            dirnames[:] = [name for name in dirnames if name not in SNAPSHOT_EXCLUDED_DIRS]
+            current_parts = Path(current_root).relative_to(self.root).parts
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(current_root), _INOTIFY_WATCH_MASK)
+            if wd < 0:
+                # ENOSPC past fs.inotify.max_user_watches: let the caller fall back.
+                return False
+            self._watches[wd] = current_parts
+            if record_files:
+                for filename in filenames:
+                    self._record((*current_parts, filename), created=True)
+        return True
+
+    def _record(self, parts: tuple[str, ...], *, created: bool) -> None:
+        relative = _tracked_relative_path(parts)
+        if relative is None:
+            return
+        with self._lock:
+            if created and relative not in self._touched:
+                self._created.add(relative)
+            self._touched.add(relative)
+
+    def _read_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ready, _, _ = select.select([self._fd], [], [], 0.2)
+                if not ready:
+                    continue
+                buffer = os.read(self._fd, 64 * 1024)
+            except (OSError, ValueError):
+                return
+            self._handle_events(buffer)
+
+    def _handle_events(self, buffer: bytes) -> None:
+        offset = 0
+        while offset + _INOTIFY_EVENT.size <= len(buffer):
+            wd, mask, _cookie, length = _INOTIFY_EVENT.unpack_from(buffer, offset)
+            raw_name = buffer[offset + _INOTIFY_EVENT.size : offset + _INOTIFY_EVENT.size + length]
+            offset += _INOTIFY_EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                self.truncated = True
+                continue
+            if mask & _IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            directory = self._watches.get(wd)
+            name = os.fsdecode(raw_name.rstrip(b"\0"))
+            if directory is None or not name:
+                continue
+            parts = (*directory, name)
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO) and name not in SNAPSHOT_EXCLUDED_DIRS:
+                    # Files written before the new watch lands would be missed otherwise.
+                    if not self._watch_tree(parts, record_files=True):
+                        self.truncated = True
+                continue
+            self._record(parts, created=bool(mask & (_IN_CREATE | _IN_MOVED_TO)))
+
+    def changed_files(self) -> list[str]:
+        with self._lock:
+            touched = sorted(self._touched)
+            created = set(self._created)
+        changed = [
+            path
+            for path in touched
+            if path not in created or (self.root / path).exists()
+        ]
+        return changed[:CHANGED_FILE_LIMIT]
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=1)
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+
+
+def _start_change_tracker(root: Path) -> _WalkChangeTracker | _GitChangeTracker | _InotifyChangeTracker:
+    """Pick the cheapest tracker for ``root``.
+
+    ``FLUXIO_DELEGATED_CHANGE_TRACKING`` may pin ``git``, ``inotify`` or
+    ``walk``; ``auto`` (the default) tries them in that order.
+    """
+    requested = str(os.environ.get("FLUXIO_DELEGATED_CHANGE_TRACKING", "auto")).strip().lower()
+    modes = (requested,) if requested in CHANGE_TRACKING_MODES else CHANGE_TRACKING_MODES
+    if root.exists():
+        if "git" in modes:
+            tracker = _GitChangeTracker.start(root)
+            if tracker is not None:
+                return tracker
+        if "inotify" in modes:
+            tracker = _InotifyChangeTracker.start(root)
+            if tracker is not None:
+                return tracker
+    return _WalkChangeTracker(root)
+
+
 def _terminate_child(child: subprocess.Popen) -> None:
     if child.poll() is not None:
         return
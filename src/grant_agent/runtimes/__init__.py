@@ -6,6 +6,7 @@ import os
 from pathlib import Path
 import time
 
+from ..command_probe import gather_probes, invalidate_command_probe_cache
 from ..models import RuntimeCapability, RuntimeInstallStatus
 from ..snapshot_cache import (
     invalidate_persistent_snapshot_cache,
@@ -100,8 +101,15 @@ def detect_runtime_statuses(
         if persisted is not None:
             _RUNTIME_STATUS_CACHE[cache_key] = (now, deepcopy(persisted))
             return deepcopy(persisted)
+    else:
+        invalidate_command_probe_cache()
 
-    payload = [adapter.doctor(root) for adapter in runtime_adapters()]
+    # Each doctor() blocks on its own --version/WSL probes; run them side by side.
+    adapters = runtime_adapters()
+    doctored = gather_probes(
+        {adapter.runtime_id: (lambda adapter=adapter: adapter.doctor(root)) for adapter in adapters}
+    )
+    payload = [doctored[adapter.runtime_id] for adapter in adapters]
     save_persistent_snapshot_cache(
         root,
         "runtime_statuses",
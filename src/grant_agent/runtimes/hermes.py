@@ -3,10 +3,10 @@ from __future__ import annotations
 import os
 import shlex
 import shutil
-import subprocess
 from pathlib import Path
 
 from ..models import Mission, RuntimeCapability, RuntimeInstallStatus, WorkspaceProfile
+from ..command_probe import probe_command
 from ..subprocess_utils import hidden_windows_subprocess_kwargs
 from ..runtime_updates import compare_version_tokens, latest_hermes_release, normalize_hermes_version
 from .base import (
@@ -98,7 +98,7 @@ class HermesRuntimeAdapter(AgentRuntimeAdapter):
         issues: list[str] = []
         if command:
             try:
-                completed = subprocess.run(  # noqa: S603
+                completed = probe_command(
                     [command, "--version"],
                     cwd=str(workspace_root),
                     capture_output=True,
@@ -370,7 +370,7 @@ class HermesRuntimeAdapter(AgentRuntimeAdapter):
         if not wsl:
             return False
         try:
-            completed = subprocess.run(  # noqa: S603
+            completed = probe_command(
                 [wsl, "bash", "-lc", "command -v hermes >/dev/null 2>&1"],
                 capture_output=True,
                 text=True,
@@ -391,7 +391,7 @@ class HermesRuntimeAdapter(AgentRuntimeAdapter):
         if not wsl:
             return None
         try:
-            completed = subprocess.run(  # noqa: S603
+            completed = probe_command(
                 [
                     wsl,
                     "bash",
@@ -3,12 +3,12 @@ from __future__ import annotations
 import hashlib
 import json
 import os
-import subprocess
 import re
 import shutil
 from pathlib import Path
 
 from ..models import Mission, RuntimeCapability, RuntimeInstallStatus, WorkspaceProfile
+from ..command_probe import probe_command
 from ..subprocess_utils import hidden_windows_subprocess_kwargs
 from ..runtime_updates import (
     compare_version_tokens,
@@ -136,7 +136,7 @@ class OpenClawRuntimeAdapter(AgentRuntimeAdapter):
         issues: list[str] = []
         if command and not version:
             try:
-                completed = subprocess.run(  # noqa: S603
+                completed = probe_command(
                     [command, "--version"],
                     cwd=str(workspace_root),
                     capture_output=True,
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import re
-import subprocess
 import sys
 from pathlib import Path
 
 from ..models import Mission, RuntimeCapability, RuntimeInstallStatus, WorkspaceProfile
+from ..command_probe import probe_command
 from ..subprocess_utils import hidden_windows_subprocess_kwargs
 from .base import (
     AgentRuntimeAdapter,
@@ -61,7 +61,7 @@ class OpenCodeRuntimeAdapter(AgentRuntimeAdapter):
         issues: list[str] = []
         if command:
             try:
-                completed = subprocess.run(  # noqa: S603
+                completed = probe_command(
                     [command, "--version"],
                     cwd=str(workspace_root),
                     capture_output=True,
@@ -4,6 +4,7 @@ import json
 import uuid
 from pathlib import Path
 
+from .eval import write_run_metrics
 from .models import TimelineEvent, to_dict, utc_now_iso
 
 
@@ -34,6 +35,7 @@ class SessionStore:
     def save_state(self, session_path: Path, state: dict) -> None:
         state_path = session_path / "state.json"
         state_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        write_run_metrics(session_path, state)
 
     @staticmethod
     def read_state(session_path: Path) -> dict:
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import copy
+import heapq
 import json
+import os
 import re
+import threading
 import uuid
 from dataclasses import asdict
 from pathlib import Path
+from typing import Callable
 
+from .mission_store import load_mission_payloads
 from .models import (
     LearnedSkill,
     SkillPack,
@@ -15,6 +21,11 @@ from .models import (
     utc_now_iso,
 )
 from .skills import Skill, SkillRegistry
+from .snapshot_cache import (
+    invalidate_persistent_snapshot_cache,
+    load_persistent_snapshot_cache,
+    save_persistent_snapshot_cache,
+)
 
 
 DEFAULT_SKILL_HARNESS_COMPATIBILITY = [
@@ -24,12 +35,111 @@ DEFAULT_SKILL_HARNESS_COMPATIBILITY = [
     "hermes",
     "legacy_autonomous_engine",
 ]
+SKILL_TOKEN_CACHE_LIMIT = 8192
+SKILL_LEDGER_SCHEMA = "fluxio.skill_ledger.v1"
+SKILL_LEDGER_SUFFIX = ".log.jsonl"
+SKILL_LEDGER_COMPACT_THRESHOLD = 256
+SKILL_USAGE_SUMMARY_SCHEMA = "fluxio.skill_usage_summary.v1"
+SKILL_FEEDBACK_HISTORY_LIMIT = 500
+SKILL_REPAIR_RECEIPT_HISTORY_LIMIT = 100
+CODEX_SKILL_CACHE_NAME = "codex_home_skills"
+CODEX_SKILL_CACHE_SCHEMA = "fluxio.codex_home_skill_cache.v1"
+_CODEX_SKILL_ROW_CACHE_LOCK = threading.Lock()
+_CODEX_SKILL_ROW_CACHE: dict[str, tuple[list[int], dict]] = {}
 
 
 def _tokenize(text: str) -> set[str]:
     return set(re.findall(r"[a-z0-9]+", text.lower()))
 
 
+def _ledger_log_path(snapshot_path: Path) -> Path:
+    return snapshot_path.with_name(snapshot_path.stem + SKILL_LEDGER_SUFFIX)
+
+
+def _file_signature(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _read_ledger_tail(snapshot_path: Path) -> list[dict]:
+    """Rows appended after ``snapshot_path`` was last written.
+
+    The log header pins the snapshot's size and mtime, so a log orphaned by a
+    snapshot rewritten elsewhere is ignored rather than replayed twice.
+    """
+    try:
+        lines = _ledger_log_path(snapshot_path).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+    if not lines:
+        return []
+    try:
+        header = json.loads(lines[0])
+    except json.JSONDecodeError:
+        return []
+    if (
+        not isinstance(header, dict)
+        or header.get("schema") != SKILL_LEDGER_SCHEMA
+        or header.get("base") != _file_signature(snapshot_path)
+    ):
+        return []
+    rows: list[dict] = []
+    for line in lines[1:]:
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            # A torn final line from an interrupted append.
+            continue
+        if isinstance(row, dict):
+            rows.append(row)
+    return rows
+
+
+def _append_ledger_rows(snapshot_path: Path, rows: list[dict]) -> None:
+    log_path = _ledger_log_path(snapshot_path)
+    base = _file_signature(snapshot_path)
+    try:
+        with log_path.open("r", encoding="utf-8") as handle:
+            header = json.loads(handle.readline() or "null")
+    except (OSError, json.JSONDecodeError):
+        header = None
+    lines = [json.dumps(row) for row in rows]
+    mode = "a"
+    if not isinstance(header, dict) or header.get("schema") != SKILL_LEDGER_SCHEMA or header.get("base") != base:
+        mode = "w"
+        lines.insert(0, json.dumps({"schema": SKILL_LEDGER_SCHEMA, "base": base}))
+    with log_path.open(mode, encoding="utf-8") as handle:
+        handle.write("\n".join(lines) + "\n")
+
+
+def _write_ledger_snapshot(snapshot_path: Path, payload: list | dict) -> None:
+    tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(tmp_path, snapshot_path)
+    try:
+        _ledger_log_path(snapshot_path).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def load_skill_ledger_rows(snapshot_path: Path, limit: int = 0) -> list:
+    """Snapshot rows of a skill ledger followed by its uncompacted appends.
+
+    ``limit`` keeps only the newest rows, matching what compaction retains.
+    """
+    try:
+        payload = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return []
+    if not isinstance(payload, list):
+        return []
+    rows = payload + _read_ledger_tail(snapshot_path)
+    return rows[-limit:] if limit > 0 else rows
+
+
 def _safe_skill_id(value: str) -> str:
     cleaned = re.sub(r"[^a-zA-Z0-9_.-]+", "-", value.strip()).strip(".-")
     return cleaned[:96] or "skill"
@@ -61,60 +171,134 @@ def _skill_description_from_markdown(text: str) -> str:
     return ""
 
 
+def _codex_home_skill_row(skill_dir: Path, skill_path: Path, text: str) -> dict:
+    name = _skill_frontmatter_value(text, "name") or skill_dir.name
+    description = _skill_description_from_markdown(text)
+    return {
+        "skillId": skill_dir.name,
+        "label": name.replace("-", " ").title() if name == skill_dir.name else name,
+        "description": description,
+        "promptHint": description,
+        "instructions": text,
+        "originType": "user_authored",
+        "editableStatus": "active",
+        "testStatus": "untested",
+        "promotionState": "reviewed",
+        "source": {
+            "kind": "codex_home_skill",
+            "label": "Local Codex skill",
+            "path": str(skill_path),
+        },
+        "usableByHarnesses": list(DEFAULT_SKILL_HARNESS_COMPATIBILITY),
+        "compatibleHarnesses": list(DEFAULT_SKILL_HARNESS_COMPATIBILITY),
+        "harnessCompatibility": {
+            "schema": "fluxio.skill_harness_compatibility.v1",
+            "source": "local-skill-md",
+            "originType": "user_authored",
+            "usableByHarnesses": list(DEFAULT_SKILL_HARNESS_COMPATIBILITY),
+            "crossHarness": True,
+            "adapterRequired": False,
+            "notes": "Local SKILL.md instructions are loaded as shared runtime context for Fluxio, Codex, OpenClaw, Hermes, and the legacy autonomous engine.",
+        },
+        "runtimeHints": {
+            "compatibleHarnesses": list(DEFAULT_SKILL_HARNESS_COMPATIBILITY),
+            "skillFile": str(skill_path),
+            "loadMode": "local-skill-md",
+            "skillContract": "SKILL.md instructions are passed as runtime context, not assumed as a Codex-only feature.",
+        },
+        "tags": ["user-authored", "codex-skill", "multi-harness"],
+    }
+
+
+def _load_persisted_codex_skill_rows(control_dir: Path, skills_root: Path) -> dict[str, dict]:
+    payload = load_persistent_snapshot_cache(control_dir.parent, CODEX_SKILL_CACHE_NAME, 0)
+    if (
+        not isinstance(payload, dict)
+        or payload.get("schema") != CODEX_SKILL_CACHE_SCHEMA
+        or payload.get("skillsRoot") != str(skills_root)
+        or not isinstance(payload.get("entries"), dict)
+    ):
+        return {}
+    return payload["entries"]
+
+
+def invalidate_codex_home_skill_cache(skill_path: Path | None = None, control_dir: Path | None = None) -> None:
+    """Drop cached SKILL.md rows, e.g. after the Skills page saved an edit.
+
+    With ``control_dir`` the rows persisted under its ``cache`` folder go too;
+    a same-size save inside the filesystem's mtime granularity would
+    otherwise match the old signature after a restart.
+    """
+    keys = {str(skill_path), str(skill_path.resolve())} if skill_path is not None else set()
+    with _CODEX_SKILL_ROW_CACHE_LOCK:
+        if skill_path is None:
+            _CODEX_SKILL_ROW_CACHE.clear()
+        else:
+            for key in keys:
+                _CODEX_SKILL_ROW_CACHE.pop(key, None)
+    if control_dir is None:
+        return
+    if skill_path is None:
+        invalidate_persistent_snapshot_cache(control_dir.parent, CODEX_SKILL_CACHE_NAME)
+        return
+    payload = load_persistent_snapshot_cache(control_dir.parent, CODEX_SKILL_CACHE_NAME, 0)
+    entries = payload.get("entries") if isinstance(payload, dict) else None
+    if isinstance(entries, dict) and keys & set(entries):
+        for key in keys:
+            entries.pop(key, None)
+        save_persistent_snapshot_cache(control_dir.parent, CODEX_SKILL_CACHE_NAME, payload)
+
+
 def load_codex_home_skill_rows(control_dir: Path | None = None) -> list[dict]:
+    """Rows for every ``~/.codex/skills/*/SKILL.md``.
+
+    Parsed rows are cached per file in this process and, when ``control_dir``
+    is given, in ``.agent_control/cache`` for cold starts. Both are keyed by
+    the file's size and mtime, so only new or edited skills are re-read.
+    """
     if control_dir is not None and not (control_dir / "workspaces.json").exists():
         return []
     skills_root = Path.home() / ".codex" / "skills"
     if not skills_root.exists():
         return []
+    persisted: dict[str, dict] | None = None
+    entries: dict[str, dict] = {}
+    dirty = False
     rows: list[dict] = []
     for skill_dir in sorted(path for path in skills_root.iterdir() if path.is_dir()):
         if skill_dir.name.startswith("."):
             continue
         skill_path = skill_dir / "SKILL.md"
-        if not skill_path.exists():
-            continue
-        try:
-            text = skill_path.read_text(encoding="utf-8")
-        except OSError:
+        signature = _file_signature(skill_path)
+        if signature is None:
             continue
-        name = _skill_frontmatter_value(text, "name") or skill_dir.name
-        description = _skill_description_from_markdown(text)
-        rows.append(
-            {
-                "skillId": skill_dir.name,
-                "label": name.replace("-", " ").title() if name == skill_dir.name else name,
-                "description": description,
-                "promptHint": description,
-                "instructions": text,
-                "originType": "user_authored",
-                "editableStatus": "active",
-                "testStatus": "untested",
-                "promotionState": "reviewed",
-                "source": {
-                    "kind": "codex_home_skill",
-                    "label": "Local Codex skill",
-                    "path": str(skill_path),
-                },
-                "usableByHarnesses": list(DEFAULT_SKILL_HARNESS_COMPATIBILITY),
-                "compatibleHarnesses": list(DEFAULT_SKILL_HARNESS_COMPATIBILITY),
-                "harnessCompatibility": {
-                    "schema": "fluxio.skill_harness_compatibility.v1",
-                    "source": "local-skill-md",
-                    "originType": "user_authored",
-                    "usableByHarnesses": list(DEFAULT_SKILL_HARNESS_COMPATIBILITY),
-                    "crossHarness": True,
-                    "adapterRequired": False,
-                    "notes": "Local SKILL.md instructions are loaded as shared runtime context for Fluxio, Codex, OpenClaw, Hermes, and the legacy autonomous engine.",
-                },
-                "runtimeHints": {
-                    "compatibleHarnesses": list(DEFAULT_SKILL_HARNESS_COMPATIBILITY),
-                    "skillFile": str(skill_path),
-                    "loadMode": "local-skill-md",
-                    "skillContract": "SKILL.md instructions are passed as runtime context, not assumed as a Codex-only feature.",
-                },
-                "tags": ["user-authored", "codex-skill", "multi-harness"],
-            }
+        key = str(skill_path)
+        with _CODEX_SKILL_ROW_CACHE_LOCK:
+            cached = _CODEX_SKILL_ROW_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            row = cached[1]
+        else:
+            if persisted is None:
+                persisted = _load_persisted_codex_skill_rows(control_dir, skills_root) if control_dir else {}
+            entry = persisted.get(key)
+            if isinstance(entry, dict) and entry.get("signature") == signature and isinstance(entry.get("row"), dict):
+                row = entry["row"]
+            else:
+                try:
+                    text = skill_path.read_text(encoding="utf-8")
+                except OSError:
+                    continue
+                row = _codex_home_skill_row(skill_dir, skill_path, text)
+                dirty = True
+            with _CODEX_SKILL_ROW_CACHE_LOCK:
+                _CODEX_SKILL_ROW_CACHE[key] = (signature, row)
+        entries[key] = {"signature": signature, "row": row}
+        rows.append(copy.deepcopy(row))
+    if control_dir is not None and persisted is not None and (dirty or set(persisted) != set(entries)):
+        save_persistent_snapshot_cache(
+            control_dir.parent,
+            CODEX_SKILL_CACHE_NAME,
+            {"schema": CODEX_SKILL_CACHE_SCHEMA, "skillsRoot": str(skills_root), "entries": entries},
         )
     return rows
 
@@ -127,7 +311,9 @@ class SkillLibrary:
         self.control_dir.mkdir(parents=True, exist_ok=True)
         self.learned_path = self.control_dir / "learned_skills.json"
         self.user_installed_path = self.control_dir / "user_installed_skills.json"
+        # Legacy full-history usage list; read once to seed the summary below.
         self.usage_path = self.control_dir / "skill_usage.json"
+        self.usage_summary_path = self.control_dir / "skill_usage_summary.json"
         self.feedback_path = self.control_dir / "skill_feedback.json"
         self.repair_receipts_path = self.control_dir / "skill_repair_receipts.json"
         self.learned_skills = self._load_learned_skills()
@@ -142,10 +328,25 @@ class SkillLibrary:
             if skill_id and skill_id not in existing_ids:
                 self.user_installed_skills.append(item)
                 existing_ids.add(skill_id)
-        self.usage_records = self._load_usage_records()
-        self.feedback_records = self._load_skill_rows(self.feedback_path)
-        self.repair_receipts = self._load_skill_rows(self.repair_receipts_path)
+        # usage_records holds only records appended since the summary was last
+        # compacted; older usage survives as per-skill counters.
+        self._usage_totals, self.usage_records = self._load_usage_ledger()
+        self.feedback_records = self._load_ledger_rows(self.feedback_path, SKILL_FEEDBACK_HISTORY_LIMIT)
+        self.repair_receipts = self._load_ledger_rows(self.repair_receipts_path, SKILL_REPAIR_RECEIPT_HISTORY_LIMIT)
+        self._ledger_tail_counts = {
+            path: len(_read_ledger_tail(path))
+            for path in (self.usage_summary_path, self.feedback_path, self.repair_receipts_path)
+        }
         self._operator_value_samples_by_alias: dict[str, list[dict]] | None = None
+        # Aggregates over usage_records / feedback_records, extended as records
+        # are appended and rebuilt if either list is replaced or truncated.
+        self._usage_index: dict[str, dict[str, str | int | None]] = {}
+        self._usage_index_source: list[SkillUsageRecord] | None = None
+        self._usage_indexed = 0
+        self._feedback_index: dict[str, list[tuple[int, dict]]] = {}
+        self._feedback_index_source: list[dict] | None = None
+        self._feedback_indexed = 0
+        self._token_cache: dict[str, set[str]] = {}
 
     def _load_skill_rows(self, path: Path) -> list[dict]:
         if not path.exists():
@@ -159,9 +360,22 @@ class SkillLibrary:
             return []
         return payload if isinstance(payload, list) else []
 
-    def _load_usage_records(self) -> list[SkillUsageRecord]:
-        payload = self._load_skill_rows(self.usage_path)
-        return [SkillUsageRecord(**item) for item in payload]
+    def _load_ledger_rows(self, path: Path, limit: int) -> list[dict]:
+        rows = self._load_skill_rows(path) + _read_ledger_tail(path)
+        return rows[-limit:]
+
+    def _load_usage_ledger(self) -> tuple[dict[str, dict[str, str | int | None]], list[SkillUsageRecord]]:
+        try:
+            summary = json.loads(self.usage_summary_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            summary = None
+        if not isinstance(summary, dict) or summary.get("schema") != SKILL_USAGE_SUMMARY_SCHEMA:
+            payload = self._load_skill_rows(self.usage_path)
+            return {}, [SkillUsageRecord(**item) for item in payload]
+        skills = summary.get("skills") if isinstance(summary.get("skills"), dict) else {}
+        totals = {str(skill_id): dict(counters) for skill_id, counters in skills.items() if isinstance(counters, dict)}
+        tail = [SkillUsageRecord(**item) for item in _read_ledger_tail(self.usage_summary_path)]
+        return totals, tail
 
     def _load_learned_skills(self) -> list[LearnedSkill]:
         payload = self._load_skill_rows(self.learned_path)
@@ -195,22 +409,37 @@ class SkillLibrary:
             encoding="utf-8",
         )
 
-    def _save_usage_records(self) -> None:
-        self.usage_path.write_text(
-            json.dumps([asdict(item) for item in self.usage_records], indent=2),
-            encoding="utf-8",
-        )
+    def _append_ledger(self, path: Path, rows: list[dict], snapshot: Callable[[], list | dict]) -> None:
+        """Append ``rows`` to the ledger of ``path``, compacting into ``snapshot()`` when due."""
+        tail_count = self._ledger_tail_counts.get(path, 0) + len(rows)
+        if not path.exists() or tail_count >= SKILL_LEDGER_COMPACT_THRESHOLD:
+            _write_ledger_snapshot(path, snapshot())
+            self._ledger_tail_counts[path] = 0
+            return
+        _append_ledger_rows(path, rows)
+        self._ledger_tail_counts[path] = tail_count
 
-    def _save_feedback_records(self) -> None:
-        self.feedback_path.write_text(
-            json.dumps(self.feedback_records, indent=2),
-            encoding="utf-8",
+    def _usage_summary_snapshot(self) -> dict:
+        totals = {skill_id: dict(counters) for skill_id, counters in self._usage_by_skill().items()}
+        self._usage_totals = totals
+        self.usage_records = []
+        return {"schema": SKILL_USAGE_SUMMARY_SCHEMA, "updatedAt": utc_now_iso(), "skills": totals}
+
+    def _append_usage_records(self, records: list[SkillUsageRecord]) -> None:
+        self._append_ledger(self.usage_summary_path, [asdict(item) for item in records], self._usage_summary_snapshot)
+
+    def _append_feedback_records(self, records: list[dict]) -> None:
+        self._append_ledger(
+            self.feedback_path,
+            records,
+            lambda: self.feedback_records[-SKILL_FEEDBACK_HISTORY_LIMIT:],
         )
 
-    def _save_repair_receipts(self) -> None:
-        self.repair_receipts_path.write_text(
-            json.dumps(self.repair_receipts[-100:], indent=2),
-            encoding="utf-8",
+    def _append_repair_receipt(self, receipt: dict) -> None:
+        self._append_ledger(
+            self.repair_receipts_path,
+            [receipt],
+            lambda: self.repair_receipts[-SKILL_REPAIR_RECEIPT_HISTORY_LIMIT:],
         )
 
     def curated_packs(self) -> list[SkillPack]:
@@ -238,17 +467,61 @@ class SkillLibrary:
     def learned_skill_rows(self) -> list[dict]:
         return [asdict(item) for item in self.learned_skills]
 
+    def _tokens(self, text: str) -> set[str]:
+        tokens = self._token_cache.get(text)
+        if tokens is None:
+            if len(self._token_cache) >= SKILL_TOKEN_CACHE_LIMIT:
+                self._token_cache.clear()
+            tokens = _tokenize(text)
+            self._token_cache[text] = tokens
+        return tokens
+
+    def _usage_by_skill(self) -> dict[str, dict[str, str | int | None]]:
+        records = self.usage_records
+        if records is not self._usage_index_source or len(records) < self._usage_indexed:
+            self._usage_index = {skill_id: dict(counters) for skill_id, counters in self._usage_totals.items()}
+            self._usage_index_source = records
+            self._usage_indexed = 0
+        for item in records[self._usage_indexed:]:
+            summary = self._usage_index.setdefault(
+                item.skill_id,
+                {"usageCount": 0, "helpedCount": 0, "lastUsedAt": None, "lastHelpedAt": None},
+            )
+            summary["usageCount"] = int(summary["usageCount"] or 0) + 1
+            if summary["lastUsedAt"] is None or item.created_at > str(summary["lastUsedAt"]):
+                summary["lastUsedAt"] = item.created_at
+            if item.helped:
+                summary["helpedCount"] = int(summary["helpedCount"] or 0) + 1
+                if summary["lastHelpedAt"] is None or item.created_at > str(summary["lastHelpedAt"]):
+                    summary["lastHelpedAt"] = item.created_at
+        self._usage_indexed = len(records)
+        return self._usage_index
+
     def _usage_summary(self, skill_id: str) -> dict[str, str | int | None]:
-        records = [item for item in self.usage_records if item.skill_id == skill_id]
-        helped = [item for item in records if item.helped]
-        last_used_at = max((item.created_at for item in records), default=None)
-        last_helped_at = max((item.created_at for item in helped), default=None)
-        return {
-            "usageCount": len(records),
-            "helpedCount": len(helped),
-            "lastUsedAt": last_used_at,
-            "lastHelpedAt": last_helped_at,
-        }
+        summary = self._usage_by_skill().get(skill_id)
+        if summary is None:
+            return {"usageCount": 0, "helpedCount": 0, "lastUsedAt": None, "lastHelpedAt": None}
+        return dict(summary)
+
+    def _feedback_by_skill(self) -> dict[str, list[tuple[int, dict]]]:
+        records = self.feedback_records
+        if records is not self._feedback_index_source or len(records) < self._feedback_indexed:
+            self._feedback_index = {}
+            self._feedback_index_source = records
+            self._feedback_indexed = 0
+        for position in range(self._feedback_indexed, len(records)):
+            item = records[position]
+            key = str(item.get("skillId") or item.get("skill_id") or "")
+            self._feedback_index.setdefault(key, []).append((position, item))
+        self._feedback_indexed = len(records)
+        return self._feedback_index
+
+    def _feedback_records_for(self, aliases: set[str]) -> list[dict]:
+        index = self._feedback_by_skill()
+        matches = [entry for alias in aliases for entry in index.get(alias, [])]
+        if len(aliases) > 1:
+            matches.sort(key=lambda entry: entry[0])
+        return [item for _, item in matches]
 
     def _feedback_aliases(self, row: dict, skill_id: str) -> set[str]:
         aliases = {str(skill_id or "").strip()}
@@ -268,13 +541,7 @@ class SkillLibrary:
     def _operator_value_index(self) -> dict[str, list[dict]]:
         if self._operator_value_samples_by_alias is not None:
             return self._operator_value_samples_by_alias
-        missions_path = self.control_dir / "missions.json"
-        try:
-            missions = json.loads(missions_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            missions = []
-        if not isinstance(missions, list):
-            missions = []
+        missions = load_mission_payloads(self.control_dir)
         samples_by_alias: dict[str, list[dict]] = {}
         for mission in missions:
             if not isinstance(mission, dict):
@@ -388,11 +655,7 @@ class SkillLibrary:
     def _feedback_summary(self, row: dict, skill_id: str) -> dict:
         aliases = self._feedback_aliases(row, skill_id)
         operator_value = self._operator_value_summary(aliases)
-        records = [
-            item
-            for item in self.feedback_records
-            if str(item.get("skillId") or item.get("skill_id") or "") in aliases
-        ]
+        records = self._feedback_records_for(aliases)
         if not records:
             if int(operator_value.get("sampleCount", 0) or 0) > 0:
                 state = str(operator_value.get("state") or "review")
@@ -1174,11 +1437,12 @@ class SkillLibrary:
         )
         created_at = utc_now_iso()
         records: list[dict] = []
+        learned_changed = False
         for skill in skills:
             skill_id = str(skill.get("skillId") or skill.get("skill_id") or skill.get("label") or "skill")
             prior = [
                 item
-                for item in self.feedback_records
+                for _, item in self._feedback_by_skill().get(skill_id, [])
                 if str(item.get("skillId") or "") == skill_id
             ]
             prior_loss = (
@@ -1224,9 +1488,12 @@ class SkillLibrary:
                         f"{created_at}: slice feedback {next_action} loss={system_loss}"
                     )
                     learned.updated_at = created_at
-        self.feedback_records = self.feedback_records[-500:]
-        self._save_feedback_records()
-        self._save_learned_skills()
+                    learned_changed = True
+        if len(self.feedback_records) > SKILL_FEEDBACK_HISTORY_LIMIT:
+            self.feedback_records = self.feedback_records[-SKILL_FEEDBACK_HISTORY_LIMIT:]
+        self._append_feedback_records(records)
+        if learned_changed:
+            self._save_learned_skills()
         return records
 
     def apply_repair_proposal(
@@ -1267,7 +1534,7 @@ class SkillLibrary:
                 "nextAction": "Record a high-gap slice so a repair proposal exists before applying it.",
             }
             self.repair_receipts.append(receipt)
-            self._save_repair_receipts()
+            self._append_repair_receipt(receipt)
             return receipt
         if learned is None:
             receipt = {
@@ -1281,7 +1548,7 @@ class SkillLibrary:
                 "nextAction": "Convert or promote this skill into an editable learned skill before applying repair patches.",
             }
             self.repair_receipts.append(receipt)
-            self._save_repair_receipts()
+            self._append_repair_receipt(receipt)
             return receipt
 
         repair_patch = proposal.get("repairPatch", {}) if isinstance(proposal.get("repairPatch"), dict) else {}
@@ -1313,7 +1580,7 @@ class SkillLibrary:
             "nextAction": "Run one clean validation slice before preferring this repaired skill again.",
         }
         self.repair_receipts.append(receipt)
-        self._save_repair_receipts()
+        self._append_repair_receipt(receipt)
         return receipt
 
     def retrieve(
@@ -1329,14 +1596,12 @@ class SkillLibrary:
         query_tokens = _tokenize(task_brief)
 
         def learned_score(item: LearnedSkill) -> tuple[int, float, int]:
-            text_tokens = _tokenize(
+            text_tokens = self._tokens(
                 " ".join([item.label, item.description, item.prompt_hint, " ".join(item.tags)])
             )
             return len(query_tokens & text_tokens), item.confidence, item.usage_count
 
-        ranked_learned = sorted(
-            learned_candidates, key=learned_score, reverse=True
-        )[:candidate_count]
+        ranked_learned = heapq.nlargest(candidate_count, learned_candidates, key=learned_score)
         merged: list[dict] = []
         for index, skill in enumerate(curated):
             row = {
@@ -1377,7 +1642,7 @@ class SkillLibrary:
             merged.append(row)
 
         def retrieval_priority(item: dict) -> tuple[float, float, int]:
-            text_tokens = _tokenize(
+            text_tokens = self._tokens(
                 " ".join(
                     [
                         str(item.get("skillId") or ""),
@@ -1403,10 +1668,10 @@ class SkillLibrary:
             for item in merged
             if not bool(item.get("systemLossHold", {}).get("held"))
         ]
-        ranked = sorted(eligible, key=retrieval_priority, reverse=True)
+        ranked = heapq.nlargest(top_k, eligible, key=retrieval_priority)
         for item in ranked:
             item.pop("_baseRank", None)
-        return ranked[:top_k]
+        return ranked
 
     def record_usage(
         self,
@@ -1426,13 +1691,16 @@ class SkillLibrary:
             source_kind=source_kind,
         )
         self.usage_records.append(record)
-        self._save_usage_records()
+        self._append_usage_records([record])
+        learned_changed = False
         for learned in self.learned_skills:
             if learned.skill_id == skill_id:
                 learned.usage_count += 1
                 learned.last_used_at = record.created_at
                 learned.updated_at = record.created_at
-        self._save_learned_skills()
+                learned_changed = True
+        if learned_changed:
+            self._save_learned_skills()
         return record
 
     def suggest_promotions(
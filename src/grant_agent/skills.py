@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import json
 import re
 from dataclasses import dataclass
@@ -27,6 +28,13 @@ class SkillRegistry:
     def __init__(self, path: Path) -> None:
         self.path = path
         self.skills = self._load(path)
+        self._skill_tokens: list[set[str]] = []
+
+    def _tokens_for_skills(self) -> list[set[str]]:
+        # ``skills`` is a plain list; re-index if a caller swapped or grew it.
+        if len(self._skill_tokens) != len(self.skills):
+            self._skill_tokens = [_tokenize(skill.name + " " + skill.description) for skill in self.skills]
+        return self._skill_tokens
 
     @staticmethod
     def _load(path: Path) -> list[Skill]:
@@ -54,14 +62,15 @@ class SkillRegistry:
         if not self.skills:
             return []
         query_tokens = _tokenize(task_brief)
-
-        def score(skill: Skill) -> tuple[int, int]:
-            text_tokens = _tokenize(skill.name + " " + skill.description)
-            overlap = len(query_tokens & text_tokens)
-            return overlap, -len(skill.name)
-
-        ranked = sorted(self.skills, key=score, reverse=True)
-        positive = [skill for skill in ranked[:top_k] if score(skill)[0] > 0]
+        skill_tokens = self._tokens_for_skills()
+        overlaps = [len(query_tokens & tokens) for tokens in skill_tokens]
+        # Highest overlap first, then shorter names, then load order.
+        ranked = heapq.nsmallest(
+            top_k,
+            range(len(self.skills)),
+            key=lambda index: (-overlaps[index], len(self.skills[index].name), index),
+        )
+        positive = [self.skills[index] for index in ranked if overlaps[index] > 0]
         if positive:
             return positive
-        return ranked[:top_k]
+        return [self.skills[index] for index in ranked]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import contextvars
+import copy
+import functools
+import marshal
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterator
+
+
+class SnapshotMemo:
+    """Values computed at most once while one snapshot is being built.
+
+    Entries live only as long as the ``snapshot_memo_scope`` that created the
+    memo, so there is no TTL or file validation to get wrong: anything a
+    builder reads or derives is reused by every other builder in the same
+    pass and dropped when the pass ends. Store writes call ``clear`` so a
+    builder never sees its own stale view after saving.
+
+    With ``copy_on_read`` the value is kept as a ``marshal`` blob (or deep
+    copied when it is not marshallable) and every caller gets a private copy.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[Hashable, tuple[bool, Any]] = {}
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+
+    def get(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        *,
+        copy_on_read: bool = False,
+    ) -> Any:
+        label = str(key[0] if isinstance(key, tuple) and key else key)
+        cached = self._values.get(key)
+        if cached is not None:
+            self.hits[label] = self.hits.get(label, 0) + 1
+            return _read(cached)
+        self.misses[label] = self.misses.get(label, 0) + 1
+        value = compute()
+        if not copy_on_read:
+            self._values[key] = (False, value)
+            return value
+        try:
+            self._values[key] = (True, marshal.dumps(value))
+        except ValueError:
+            self._values[key] = (True, copy.deepcopy(value))
+            return value
+        return value
+
+    def peek(self, key: Hashable) -> Any:
+        cached = self._values.get(key)
+        return _read(cached) if cached is not None else None
+
+    def discard(self, key: Hashable) -> None:
+        self._values.pop(key, None)
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "entries": len(self._values),
+            "hits": sum(self.hits.values()),
+            "misses": sum(self.misses.values()),
+            "hitsByKey": dict(sorted(self.hits.items())),
+            "missesByKey": dict(sorted(self.misses.items())),
+        }
+
+
+def _read(cached: tuple[bool, Any]) -> Any:
+    copied, value = cached
+    if not copied:
+        return value
+    if isinstance(value, bytes):
+        return marshal.loads(value)
+    return copy.deepcopy(value)
+
+
+_ACTIVE_SNAPSHOT_MEMO: contextvars.ContextVar[SnapshotMemo | None] = contextvars.ContextVar(
+    "fluxio_snapshot_memo",
+    default=None,
+)
+
+
+def active_snapshot_memo() -> SnapshotMemo | None:
+    return _ACTIVE_SNAPSHOT_MEMO.get()
+
+
+@contextmanager
+def snapshot_memo_scope() -> Iterator[SnapshotMemo]:
+    """Open a memo for the current snapshot; nested scopes share the outer one."""
+    existing = _ACTIVE_SNAPSHOT_MEMO.get()
+    if existing is not None:
+        yield existing
+        return
+    memo = SnapshotMemo()
+    token = _ACTIVE_SNAPSHOT_MEMO.set(memo)
+    try:
+        yield memo
+    finally:
+        _ACTIVE_SNAPSHOT_MEMO.reset(token)
+
+
+def with_snapshot_memo(builder: Callable[..., Any]) -> Callable[..., Any]:
+    """Run ``builder`` inside a ``snapshot_memo_scope``."""
+
+    @functools.wraps(builder)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with snapshot_memo_scope():
+            return builder(*args, **kwargs)
+
+    return wrapper
+
+
+def snapshot_memoized(
+    key: Hashable,
+    compute: Callable[[], Any],
+    *,
+    copy_on_read: bool = False,
+) -> Any:
+    """``compute()`` once per active snapshot scope; a plain call outside one."""
+    memo = _ACTIVE_SNAPSHOT_MEMO.get()
+    if memo is None:
+        return compute()
+    return memo.get(key, compute, copy_on_read=copy_on_read)
+
+
+def clear_snapshot_memo() -> None:
+    memo = _ACTIVE_SNAPSHOT_MEMO.get()
+    if memo is not None:
+        memo.clear()
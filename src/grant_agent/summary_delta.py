@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import uuid
+from typing import Any
+
+SUMMARY_DELTA_SCHEMA = "fluxio.control_room.summary_delta.v1"
+SUMMARY_VERSION_HISTORY = 16
+# Keyed row collections inside the summary: (dotted path, row id field).
+SUMMARY_DELTA_COLLECTIONS = (
+    ("missions", "mission_id"),
+    ("workspaces", "workspace_id"),
+    ("missionWatchdog.issues", "issueId"),
+)
+# Rewritten on every build; they never bump the version and are sent in the
+# delta envelope rather than as patch operations.
+SUMMARY_VOLATILE_KEYS = frozenset({"generatedAt", "performance", "summaryCache", "summaryVersion"})
+
+
+def _digest(value: object) -> str:
+    serialized = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(serialized.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def _split_path(path: str) -> tuple[str, ...]:
+    return tuple(path.split("."))
+
+
+def _get_path(payload: dict[str, Any], parts: tuple[str, ...]) -> Any:
+    current: Any = payload
+    for part in parts:
+        if not isinstance(current, dict):
+            return None
+        current = current.get(part)
+    return current
+
+
+def _keyed_rows(rows: object, key_field: str) -> list[tuple[str, dict[str, Any]]] | None:
+    if not isinstance(rows, list):
+        return None
+    keyed: list[tuple[str, dict[str, Any]]] = []
+    seen: set[str] = set()
+    for row in rows:
+        key = str(row.get(key_field) or "") if isinstance(row, dict) else ""
+        if not key or key in seen:
+            return None
+        seen.add(key)
+        keyed.append((key, row))
+    return keyed
+
+
+class _SummaryFingerprint:
+    """Per-row and per-section digests of one summary, without its values."""
+
+    def __init__(self, summary: dict[str, Any]) -> None:
+        self.sections: dict[str, str] = {}
+        self.rows: dict[str, dict[str, str]] = {}
+        self.orders: dict[str, list[str]] = {}
+        keyed_parents: dict[str, dict[str, Any]] = {}
+        for path, key_field in SUMMARY_DELTA_COLLECTIONS:
+            parts = _split_path(path)
+            keyed = _keyed_rows(_get_path(summary, parts), key_field)
+            if keyed is None:
+                continue
+            self.rows[path] = {key: _digest(row) for key, row in keyed}
+            self.orders[path] = [key for key, _ in keyed]
+            if len(parts) > 1:
+                keyed_parents.setdefault(parts[0], {})[".".join(parts[1:])] = None
+        for key, value in summary.items():
+            if key in SUMMARY_VOLATILE_KEYS:
+                continue
+            if key in self.rows:
+                continue
+            if key in keyed_parents and isinstance(value, dict):
+                value = {
+                    child_key: child
+                    for child_key, child in value.items()
+                    if child_key not in keyed_parents[key]
+                }
+            self.sections[key] = _digest(value)
+        self.version_digest = _digest([self.sections, self.rows, self.orders])
+
+
+class SummaryVersionLog:
+    """Bounded history of control-room summary versions for one root.
+
+    Only digests are retained, so the log stays small no matter how large the
+    summary is. ``delta`` compares a client's cursor against the current
+    summary and returns patch operations for the rows and sections that
+    changed. A cursor that aged out of the history, or was issued by another
+    backend process, gets the full summary instead.
+    """
+
+    def __init__(self, history: int = SUMMARY_VERSION_HISTORY) -> None:
+        self.history = history
+        self.epoch = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self._version = 0
+        self._entries: dict[int, _SummaryFingerprint] = {}
+
+    def _cursor(self, version: int) -> str:
+        return f"{self.epoch}:{version}"
+
+    def _parse_cursor(self, cursor: str) -> int | None:
+        epoch, _, raw_version = str(cursor or "").strip().partition(":")
+        if epoch != self.epoch:
+            return None
+        try:
+            return int(raw_version)
+        except ValueError:
+            return None
+
+    def record(self, summary: dict[str, Any]) -> tuple[str, _SummaryFingerprint]:
+        fingerprint = _SummaryFingerprint(summary)
+        with self._lock:
+            latest = self._entries.get(self._version)
+            if latest is None or latest.version_digest != fingerprint.version_digest:
+                self._version += 1
+                self._entries[self._version] = fingerprint
+                for stale in [version for version in self._entries if version <= self._version - self.history]:
+                    self._entries.pop(stale, None)
+            else:
+                fingerprint = latest
+            return self._cursor(self._version), fingerprint
+
+    def delta(self, summary: dict[str, Any], since: str) -> dict[str, Any]:
+        """Record ``summary`` and describe it relative to ``since``.
+
+        Returns the full summary (with ``summaryVersion``) when the cursor is
+        unknown, otherwise a delta envelope.
+        """
+        cursor, current = self.record(summary)
+        base_version = self._parse_cursor(since)
+        with self._lock:
+            base = self._entries.get(base_version) if base_version is not None else None
+        if base is None:
+            full = dict(summary)
+            full["summaryVersion"] = cursor
+            return full
+        ops: list[dict[str, Any]] = []
+        replaced: set[str] = set()
+        for key, digest in current.sections.items():
+            if base.sections.get(key) != digest:
+                replaced.add(key)
+                ops.append({"op": "replace" if key in base.sections else "add", "path": f"/{key}", "value": summary[key]})
+        for key in [*base.sections, *base.rows]:
+            if "." not in key and key not in summary:
+                ops.append({"op": "remove", "path": f"/{key}"})
+        for path, key_field in SUMMARY_DELTA_COLLECTIONS:
+            rows = current.rows.get(path)
+            parts = _split_path(path)
+            # A replaced parent section already carries its nested rows.
+            if rows is None or (len(parts) > 1 and parts[0] in replaced):
+                continue
+            base_rows = base.rows.get(path)
+            if base_rows is None:
+                ops.append({"op": "replace", "path": "/" + "/".join(parts), "value": _get_path(summary, parts)})
+                continue
+            values = dict(_keyed_rows(_get_path(summary, parts), key_field) or [])
+            for key, digest in rows.items():
+                if base_rows.get(key) != digest:
+                    ops.append({"op": "upsert", "collection": path, "key": key, "value": values[key]})
+            for key in base_rows:
+                if key not in rows:
+                    ops.append({"op": "remove", "collection": path, "key": key})
+            patched_order = [key for key in base.orders.get(path, []) if key in rows]
+            patched_order.extend(key for key in current.orders[path] if key not in base_rows)
+            if patched_order != current.orders[path]:
+                ops.append({"op": "order", "collection": path, "keys": current.orders[path]})
+        return {
+            "schema": SUMMARY_DELTA_SCHEMA,
+            "mode": "delta",
+            "baseVersion": since,
+            "summaryVersion": cursor,
+            "unchanged": not ops,
+            "generatedAt": summary.get("generatedAt"),
+            "summaryCache": summary.get("summaryCache"),
+            "ops": ops,
+        }
@@ -16,6 +16,7 @@ from .mission_control import (
 )
 from .delivery_receipt import ntfy_status, web_push_status
 from .demo_runner import build_red_team_escalation_audit, build_red_team_escalation_trend, normalize_red_team_pressure
+from .mission_store import load_mission_payloads
 from .onboarding import detect_onboarding_status, invalidate_onboarding_status_cache
 
 
@@ -4958,7 +4959,7 @@ def _apply_strict_score_caps(
 def _single_project_progress(name: str, project_root: Path) -> dict[str, Any]:
     control = project_root / ".agent_control"
     workspaces = _load_json(control / "workspaces.json", [])
-    missions_payload = _load_json(control / "missions.json", {})
+    missions_payload = load_mission_payloads(control)
     missions = _mission_items(missions_payload)
     runtime_counts: dict[str, int] = {}
     status_counts: dict[str, int] = {}
@@ -1,26 +1,378 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import queue
+import shlex
 import shutil
 import subprocess
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterator
 
-from .models import VerificationResult
+from .models import VerificationResult, utc_now_iso
 from .safety import risk_level_for_command
+from .subprocess_utils import hidden_windows_subprocess_kwargs
+
+VERIFICATION_MODES = ("auto", "parallel", "serial")
+VERIFICATION_CACHE_RELATIVE_PATH = Path(".agent_control") / "verification_cache.json"
+VERIFICATION_CACHE_MAX_FILES = max(int(os.environ.get("FLUXIO_VERIFICATION_CACHE_MAX_FILES", "20000")), 100)
+VERIFICATION_CACHE_OUTPUT_CHARS = 4000
+VERIFICATION_CACHE_GIT_TIMEOUT_SECONDS = 30
+# Files touched this recently may change again within the same mtime tick,
+# so their content is re-hashed instead of trusting the stat signature.
+VERIFICATION_CACHE_RACY_NS = 2_000_000_000
+VERIFICATION_INPUT_EXCLUDED_DIRS = {
+    ".git",
+    ".hg",
+    ".svn",
+    ".agent_control",
+    ".agent_runs",
+    ".venv",
+    "venv",
+    "node_modules",
+    "__pycache__",
+    ".pytest_cache",
+    "target",
+}
+# Files outside the tracked inputs whose stat signature still decides whether
+# a command would behave the same: lockfiles and env files that may be
+# git-ignored, and the markers package managers and venvs rewrite on install.
+VERIFICATION_DEPENDENCY_STATE_PATHS = (
+    ".env",
+    ".env.local",
+    ".python-version",
+    ".nvmrc",
+    ".tool-versions",
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "bun.lockb",
+    "Cargo.lock",
+    "poetry.lock",
+    "uv.lock",
+    "Pipfile.lock",
+    "requirements.txt",
+    "go.sum",
+    "Gemfile.lock",
+    "node_modules/.package-lock.json",
+    "node_modules/.modules.yaml",
+    "node_modules/.yarn-state.yml",
+    ".venv/pyvenv.cfg",
+    "venv/pyvenv.cfg",
+)
+VERIFICATION_SITE_PACKAGES_GLOBS = (
+    ".venv/lib/python*/site-packages",
+    "venv/lib/python*/site-packages",
+    ".venv/Lib/site-packages",
+    "venv/Lib/site-packages",
+)
+# Tools that share lockfiles, build directories or daemons within a
+# workspace; commands mapped to the same lane keep their relative order.
+COMMAND_TOOL_LANES = {
+    "npm": "node",
+    "npx": "node",
+    "pnpm": "node",
+    "yarn": "node",
+    "bun": "node",
+    "cargo": "cargo",
+    "make": "make",
+    "mvn": "mvn",
+    "gradle": "gradle",
+    "gradlew": "gradle",
+}
+_SHELL_SEPARATORS = {"&&", ";"}
+
+
+def _command_lane(command: str, index: int) -> str:
+    tool = Path(_command_tool(command)).name.lower()
+    for suffix in (".cmd", ".exe", ".bat"):
+        tool = tool.removesuffix(suffix)
+    return COMMAND_TOOL_LANES.get(tool, f"#{index}")
+
+
+def _command_tool(command: str) -> str:
+    """First program ``command`` runs, past env assignments and ``cd <dir> &&`` prefixes."""
+    try:
+        tokens = shlex.split(command, posix=os.name != "nt")
+    except ValueError:
+        tokens = command.split()
+    position = 0
+    while position < len(tokens):
+        token = tokens[position].strip("\"'")
+        if token in _SHELL_SEPARATORS or ("=" in token and not token.startswith(("-", "/", "."))):
+            position += 1
+        elif token == "cd":
+            position += 2
+        else:
+            return token
+    return ""
+
+
+def _verification_workers(configured: int | None, lanes: int) -> int:
+    budget = configured
+    if budget is None:
+        try:
+            budget = int(os.environ.get("FLUXIO_VERIFICATION_WORKERS", "") or (os.cpu_count() or 1))
+        except ValueError:
+            budget = os.cpu_count() or 1
+    return max(1, min(budget, lanes))
+
+
+def _tracked_input_paths(workdir: Path) -> list[str] | None:
+    """Workspace files a verification command may read, relative to ``workdir``.
+
+    Git worktrees use tracked plus untracked-but-not-ignored files so build
+    outputs stay out of the fingerprint; other folders fall back to a walk.
+    ``None`` means the workspace is too large (or unreadable) to fingerprint.
+    """
+    paths: list[str] = []
+    try:
+        completed = subprocess.run(  # noqa: S603
+            ["git", "ls-files", "-co", "--exclude-standard", "-z"],
+            cwd=str(workdir),
+            capture_output=True,
+            timeout=VERIFICATION_CACHE_GIT_TIMEOUT_SECONDS,
+            check=False,
+            **hidden_windows_subprocess_kwargs(),
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if completed.returncode == 0 and completed.stdout:
+        # An empty listing means the folder is git-ignored by an enclosing
+        # repo, which says nothing about its contents; walk it instead.
+        for raw in completed.stdout.decode("utf-8", errors="surrogateescape").split("\0"):
+            if raw and not VERIFICATION_INPUT_EXCLUDED_DIRS.intersection(raw.split("/")[:-1]):
+                paths.append(raw)
+                if len(paths) > VERIFICATION_CACHE_MAX_FILES:
+                    return None
+        return paths
+    try:
+        for current, dirnames, filenames in os.walk(workdir):
+            dirnames[:] = sorted(name for name in dirnames if name not in VERIFICATION_INPUT_EXCLUDED_DIRS)
+            relative_dir = Path(current).relative_to(workdir)
+            for name in filenames:
+                paths.append((relative_dir / name).as_posix())
+                if len(paths) > VERIFICATION_CACHE_MAX_FILES:
+                    return None
+    except OSError:
+        return None
+    return paths
+
+
+def _stat_signature(path: Path) -> str:
+    try:
+        stat = path.stat()
+    except OSError:
+        return "-"
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _VerificationCache:
+    """Last passing result per command, keyed on a fingerprint of its inputs.
+
+    The fingerprint is a content hash over every tracked workspace file, the
+    whole process environment, this interpreter, the stat signatures of
+    ``VERIFICATION_DEPENDENCY_STATE_PATHS`` and venv ``site-packages``, and
+    the resolved executable of the command's tool. Per-file hashes are reused
+    while a file keeps its mtime and size, so an unchanged workspace is
+    fingerprinted with stat calls alone.
+
+    It cannot see anything else a command reads: packages installed outside
+    the workspace (global or ``--user`` site-packages, ``~/.cargo``), ignored
+    files other than the listed ones, tools a command invokes indirectly,
+    network services, or the clock. That is why the cache is opt-in.
+    """
+
+    def __init__(self, workdir: Path) -> None:
+        self.workdir = workdir
+        self.path = workdir / VERIFICATION_CACHE_RELATIVE_PATH
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            payload = {}
+        payload = payload if isinstance(payload, dict) else {}
+        files = payload.get("files")
+        commands = payload.get("commands")
+        self.files: dict[str, list] = files if isinstance(files, dict) else {}
+        self.commands: dict[str, dict] = commands if isinstance(commands, dict) else {}
+        self.dirty = False
+
+    def input_digest(self) -> str | None:
+        paths = _tracked_input_paths(self.workdir)
+        if paths is None:
+            return None
+        now_ns = time.time_ns()
+        digest = hashlib.sha256()
+        for key, value in sorted(os.environ.items()):
+            digest.update(f"{key}={value}\0".encode("utf-8", errors="surrogateescape"))
+        digest.update(f"{sys.executable}\0{sys.version}\0".encode("utf-8", errors="surrogateescape"))
+        state_paths = [self.workdir / relative for relative in VERIFICATION_DEPENDENCY_STATE_PATHS]
+        for pattern in VERIFICATION_SITE_PACKAGES_GLOBS:
+            state_paths.extend(sorted(self.workdir.glob(pattern)))
+        for path in state_paths:
+            digest.update(f"{path.relative_to(self.workdir).as_posix()}\0{_stat_signature(path)}\0".encode(
+                "utf-8", errors="surrogateescape"
+            ))
+        files: dict[str, list] = {}
+        for relative in sorted(paths):
+            encoded = relative.encode("utf-8", errors="surrogateescape")
+            path = self.workdir / relative
+            try:
+                stat = path.stat()
+                known = self.files.get(relative)
+                if (
+                    isinstance(known, list)
+                    and len(known) == 3
+                    and known[:2] == [stat.st_mtime_ns, stat.st_size]
+                    and now_ns - stat.st_mtime_ns > VERIFICATION_CACHE_RACY_NS
+                ):
+                    content_hash = str(known[2])
+                else:
+                    content_hash = _file_sha256(path)
+            except OSError:
+                digest.update(encoded + b"\0-\0")
+                continue
+            files[relative] = [stat.st_mtime_ns, stat.st_size, content_hash]
+            digest.update(encoded + b"\0" + content_hash.encode("ascii") + b"\0")
+        if files != self.files:
+            self.files = files
+            self.dirty = True
+        return digest.hexdigest()
+
+    @staticmethod
+    def command_inputs(command: str, inputs: str | None) -> str | None:
+        """Extend the workspace fingerprint with the executable ``command`` resolves to."""
+        if not inputs:
+            return None
+        tool = _command_tool(command)
+        resolved = shutil.which(tool) if tool else None
+        signature = ""
+        if resolved:
+            real_path = os.path.realpath(resolved)
+            signature = f"{real_path}\0{_stat_signature(Path(real_path))}"
+        return hashlib.sha256(f"{inputs}\0{tool}\0{signature}".encode("utf-8", errors="surrogateescape")).hexdigest()
+
+    def lookup(self, command: str, inputs: str | None) -> VerificationResult | None:
+        entry = self.commands.get(command)
+        if not inputs or not isinstance(entry, dict) or entry.get("inputs") != inputs:
+            return None
+        return VerificationResult(
+            command=command,
+            return_code=0,
+            stdout=str(entry.get("stdout") or ""),
+            stderr=str(entry.get("stderr") or ""),
+            duration_ms=0,
+            status="executed",
+            risk_level=str(entry.get("riskLevel") or "low"),
+            cached=True,
+        )
+
+    def record(self, result: VerificationResult, inputs: str | None) -> None:
+        if result.return_code == 0 and result.status == "executed" and inputs:
+            self.commands[result.command] = {
+                "inputs": inputs,
+                "stdout": result.stdout[-VERIFICATION_CACHE_OUTPUT_CHARS:],
+                "stderr": result.stderr[-VERIFICATION_CACHE_OUTPUT_CHARS:],
+                "durationMs": result.duration_ms,
+                "riskLevel": result.risk_level,
+                "recordedAt": utc_now_iso(),
+            }
+        elif self.commands.pop(result.command, None) is None:
+            return
+        self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty or not (self.commands or self.path.exists()):
+            return
+        payload = {"version": 1, "files": self.files, "commands": self.commands}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+        self.dirty = False
 
 
 class VerificationRunner:
-    def __init__(self, default_timeout_seconds: int = 120) -> None:
+    """Run verification commands for a workspace.
+
+    ``parallel`` mode runs commands side by side on at most ``max_workers``
+    threads (``FLUXIO_VERIFICATION_WORKERS``, default one per CPU); commands
+    for the same package manager or build tool stay in order within one lane.
+    ``serial`` runs them one after another. ``auto`` (the default, or
+    ``FLUXIO_VERIFICATION_MODE``) is parallel only when every command is one
+    of ``detect_default_verification_commands``, which are independent by
+    construction; caller-supplied lists may depend on their order, e.g. an
+    install before a test, so they run serially. The pass cache is off unless
+    ``use_cache`` or ``FLUXIO_VERIFICATION_CACHE=1`` turns it on; then a
+    command whose last run passed against the same input fingerprint (see
+    ``_VerificationCache`` for what it covers) is reported from
+    ``.agent_control/verification_cache.json`` with ``cached=True``.
+    """
+
+    def __init__(
+        self,
+        default_timeout_seconds: int = 120,
+        *,
+        mode: str | None = None,
+        max_workers: int | None = None,
+        use_cache: bool | None = None,
+    ) -> None:
         self.default_timeout_seconds = default_timeout_seconds
+        resolved_mode = str(mode or os.environ.get("FLUXIO_VERIFICATION_MODE") or "auto").strip().lower()
+        self.mode = resolved_mode if resolved_mode in VERIFICATION_MODES else "auto"
+        self.max_workers = max_workers
+        if use_cache is None:
+            use_cache = str(os.environ.get("FLUXIO_VERIFICATION_CACHE", "")).strip().lower() in {
+                "1",
+                "true",
+                "yes",
+                "on",
+                "enabled",
+            }
+        self.use_cache = use_cache
 
-    def run(self, commands: list[str], workdir: Path) -> list[VerificationResult]:
-        results: list[VerificationResult] = []
-        for command in commands:
-            risk_level = risk_level_for_command(command)
-            if risk_level == "high":
-                results.append(
-                    VerificationResult(
+    def run(
+        self,
+        commands: list[str],
+        workdir: Path,
+        on_result: Callable[[VerificationResult], None] | None = None,
+    ) -> list[VerificationResult]:
+        results: list[VerificationResult | None] = [None] * len(commands)
+        for index, result in self.iter_results(commands, workdir):
+            results[index] = result
+            if on_result is not None:
+                on_result(result)
+        return [result for result in results if result is not None]
+
+    def iter_results(self, commands: list[str], workdir: Path) -> Iterator[tuple[int, VerificationResult]]:
+        """Yield ``(index, result)`` pairs as each command finishes."""
+        cache: _VerificationCache | None = None
+        inputs: str | None = None
+        command_inputs: dict[int, str | None] = {}
+        pending: list[tuple[int, str]] = []
+        try:
+            for index, command in enumerate(commands):
+                risk_level = risk_level_for_command(command)
+                if risk_level == "high":
+                    yield index, VerificationResult(
                         command=command,
                         return_code=126,
                         stdout="",
@@ -29,51 +381,102 @@ class VerificationRunner:
                         status="blocked",
                         risk_level=risk_level,
                     )
-                )
-                continue
+                    continue
+                if self.use_cache and cache is None:
+                    cache = _VerificationCache(workdir)
+                    inputs = cache.input_digest()
+                if cache is not None:
+                    command_inputs[index] = cache.command_inputs(command, inputs)
+                cached = cache.lookup(command, command_inputs.get(index)) if cache is not None else None
+                if cached is not None:
+                    yield index, cached
+                    continue
+                pending.append((index, command))
 
-            start = time.monotonic()
-            try:
-                completed = subprocess.run(  # noqa: S603
-                    command,
-                    shell=True,
-                    cwd=str(workdir),
-                    capture_output=True,
-                    text=True,
-                    timeout=self.default_timeout_seconds,
-                    check=False,
-                )
-            except subprocess.TimeoutExpired as exc:
-                duration_ms = int((time.monotonic() - start) * 1000)
-                stdout = exc.stdout.decode(errors="replace") if isinstance(exc.stdout, bytes) else str(exc.stdout or "")
-                stderr = exc.stderr.decode(errors="replace") if isinstance(exc.stderr, bytes) else str(exc.stderr or "")
-                timeout_note = f"Command timed out after {self.default_timeout_seconds} seconds."
-                results.append(
-                    VerificationResult(
-                        command=command,
-                        return_code=124,
-                        stdout=stdout.strip(),
-                        stderr=(f"{stderr.strip()}\n{timeout_note}".strip()),
-                        duration_ms=duration_ms,
-                        status="timeout",
-                        risk_level=risk_level,
-                    )
-                )
-                continue
+            for index, result in self._execute_pending(pending, workdir):
+                if cache is not None:
+                    cache.record(result, command_inputs.get(index))
+                yield index, result
+        finally:
+            if cache is not None:
+                cache.save()
+
+    def _execute_pending(
+        self,
+        pending: list[tuple[int, str]],
+        workdir: Path,
+    ) -> Iterator[tuple[int, VerificationResult]]:
+        lanes: dict[str, list[tuple[int, str]]] = {}
+        for index, command in pending:
+            lanes.setdefault(_command_lane(command, index), []).append((index, command))
+        parallel = self.mode == "parallel" or (
+            self.mode == "auto"
+            and len(lanes) > 1
+            and {command for _, command in pending} <= set(detect_default_verification_commands(workdir))
+        )
+        workers = _verification_workers(self.max_workers, len(lanes)) if parallel else 1
+        if workers == 1:
+            for index, command in pending:
+                yield index, self._execute(command, workdir)
+            return
 
+        finished: queue.SimpleQueue = queue.SimpleQueue()
+
+        def run_lane(lane: list[tuple[int, str]]) -> None:
+            for index, command in lane:
+                try:
+                    finished.put((index, self._execute(command, workdir), None))
+                except BaseException as exc:  # noqa: BLE001 - re-raised on the caller's thread
+                    finished.put((index, None, exc))
+                    return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fluxio-verify") as pool:
+            for lane in lanes.values():
+                pool.submit(run_lane, lane)
+            for _ in range(len(pending)):
+                index, result, error = finished.get()
+                if error is not None:
+                    raise error
+                yield index, result
+
+    def _execute(self, command: str, workdir: Path) -> VerificationResult:
+        risk_level = risk_level_for_command(command)
+        start = time.monotonic()
+        try:
+            completed = subprocess.run(  # noqa: S603
+                command,
+                shell=True,
+                cwd=str(workdir),
+                capture_output=True,
+                text=True,
+                timeout=self.default_timeout_seconds,
+                check=False,
+            )
+        except subprocess.TimeoutExpired as exc:
             duration_ms = int((time.monotonic() - start) * 1000)
-            results.append(
-                VerificationResult(
-                    command=command,
-                    return_code=completed.returncode,
-                    stdout=completed.stdout.strip(),
-                    stderr=completed.stderr.strip(),
-                    duration_ms=duration_ms,
-                    status="executed",
-                    risk_level=risk_level,
-                )
+            stdout = exc.stdout.decode(errors="replace") if isinstance(exc.stdout, bytes) else str(exc.stdout or "")
+            stderr = exc.stderr.decode(errors="replace") if isinstance(exc.stderr, bytes) else str(exc.stderr or "")
+            timeout_note = f"Command timed out after {self.default_timeout_seconds} seconds."
+            return VerificationResult(
+                command=command,
+                return_code=124,
+                stdout=stdout.strip(),
+                stderr=(f"{stderr.strip()}\n{timeout_note}".strip()),
+                duration_ms=duration_ms,
+                status="timeout",
+                risk_level=risk_level,
             )
-        return results
+
+        duration_ms = int((time.monotonic() - start) * 1000)
+        return VerificationResult(
+            command=command,
+            return_code=completed.returncode,
+            stdout=completed.stdout.strip(),
+            stderr=completed.stderr.strip(),
+            duration_ms=duration_ms,
+            status="executed",
+            risk_level=risk_level,
+        )
 
 
 def detect_default_verification_commands(workdir: Path) -> list[str]:
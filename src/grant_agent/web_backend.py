@@ -8,6 +8,7 @@ import hmac
 import html
 import json
 import os
+import queue
 import re
 import secrets
 import shlex
@@ -24,6 +25,7 @@ import traceback
 import webbrowser
 import zlib
 from dataclasses import asdict
+from email.utils import formatdate, parsedate_to_datetime
 from datetime import datetime, timezone
 from http import cookies
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
@@ -33,6 +35,12 @@ from urllib.error import HTTPError, URLError
 from urllib.parse import parse_qs, unquote, urlencode, urlparse
 from urllib.request import Request, urlopen
 
+from .cli_executor import (
+    IN_PROCESS_COMMANDS,
+    CliExecutor,
+    in_process_cli_enabled,
+    runs_loaded_package,
+)
 from .delivery_receipt import (
     generate_web_push_vapid_config,
     load_delivery_receipts,
@@ -55,14 +63,16 @@ from .mission_control import (
     normalize_agent_turn_mode,
 )
 from .models import MissionEvent, utc_now_iso
+from .mission_stream import MissionEventTail, stream_mission_events
 from .mission_watchdog import ensure_watchdog_supervisor_loop
 from .port_safety import tcp_port_accepts_connection
 from .real_agent_proof import build_real_agent_proof_status, run_real_agent_proof
 from .runtimes.base import runtime_subprocess_env, runtime_which
 from .runtimes.hermes import _runtime_which as _hermes_runtime_which
-from .skill_library import SkillLibrary
+from .skill_library import SkillLibrary, invalidate_codex_home_skill_cache
 from .skills import SkillRegistry
 from .subprocess_utils import hidden_windows_subprocess_kwargs
+from .summary_delta import SummaryVersionLog
 
 
 ANTI_DRIFT_BLOCKED_KINDS = {
@@ -115,6 +125,17 @@ CONVERSATION_STATE_MAX_SESSIONS = 80
 CONVERSATION_STATE_MAX_TURNS_PER_SESSION = 160
 CONVERSATION_STATE_MAX_TEXT_CHARS = 12000
 MISSION_DETAIL_CACHE_MAX_ITEMS = 12
+GZIP_MIN_BODY_BYTES = 1024
+GZIP_COMPRESSION_LEVEL = 6
+GZIP_CONTENT_TYPE_PREFIXES = ("text/", "application/json", "application/manifest+json", "image/svg+xml")
+# Route proof, push and provider presence are folded into read responses but
+# are not covered by the control-file signature, so read ETags also roll over
+# on this window.
+BACKEND_READ_ETAG_WINDOW_SECONDS = 60
+BACKEND_READ_ETAG_COMMANDS = {
+    "get_control_room_summary_command",
+    "get_control_room_mission_detail_command",
+}
 MISSION_DETAIL_PREWARM_DELAY_SECONDS = _env_float(
     "FLUXIO_MISSION_DETAIL_PREWARM_DELAY_SECONDS",
     0.05,
@@ -211,10 +232,25 @@ def _sanitize_artifact_id(value: str) -> str:
     return cleaned[:90] or f"guard-{secrets.token_hex(6)}"
 
 
+WEB_WORKER_THREADS = _env_int("FLUXIO_WEB_WORKERS", 64, minimum=1)
+WEB_KEEPALIVE_IDLE_SECONDS = _env_int("FLUXIO_WEB_KEEPALIVE_IDLE_SECONDS", 5, minimum=1)
+WEB_KEEPALIVE_MAX_REQUESTS = _env_int("FLUXIO_WEB_KEEPALIVE_MAX_REQUESTS", 100, minimum=1)
+WEB_MAX_STREAMS = _env_int("FLUXIO_WEB_MAX_STREAMS", 32, minimum=1)
+
+
 class _HandshakeSafeThreadingHTTPServer(ThreadingHTTPServer):
-    """Keep plain TCP probes from blocking the TLS accept loop."""
+    """Keep plain TCP probes from blocking the TLS accept loop.
+
+    Connections are served by at most ``max_workers`` daemon threads instead
+    of one thread per connection; accepted sockets beyond that wait in a queue
+    until a worker frees up. While anything is waiting, responses stop
+    offering keep-alive so idle persistent connections hand their worker back.
+    Long-lived streaming responses call ``begin_stream``: their thread leaves
+    the pool (a replacement is started if work is queued) and exits when the
+    stream ends, so open event streams are capped by ``max_streams`` instead
+    of starving ordinary requests.
+    """
 
-    daemon_threads = True
     request_queue_size = 64
 
     def __init__(
@@ -223,8 +259,17 @@ class _HandshakeSafeThreadingHTTPServer(ThreadingHTTPServer):
         request_handler_class: type[BaseHTTPRequestHandler],
         *,
         ssl_context: ssl.SSLContext | None = None,
+        max_workers: int | None = None,
+        max_streams: int | None = None,
     ) -> None:
         self.ssl_context = ssl_context
+        self.max_workers = max(1, int(max_workers or WEB_WORKER_THREADS))
+        self.max_streams = max(1, int(max_streams or WEB_MAX_STREAMS))
+        self._connection_queue: queue.SimpleQueue[tuple[Any, Any] | None] = queue.SimpleQueue()
+        self._workers: list[threading.Thread] = []
+        self._workers_lock = threading.Lock()
+        self._open_connections = 0
+        self._open_streams = 0
         super().__init__(server_address, request_handler_class)
 
     def get_request(self) -> tuple[Any, Any]:
@@ -243,6 +288,103 @@ class _HandshakeSafeThreadingHTTPServer(ThreadingHTTPServer):
             raise
         tls_socket.settimeout(TLS_HANDSHAKE_TIMEOUT_SECONDS)
         return tls_socket, client_address
+
+    def _spawn_worker_locked(self) -> None:
+        if len(self._workers) < self.max_workers and self._open_connections > len(self._workers):
+            worker = threading.Thread(
+                target=self._serve_connections,
+                name=f"fluxio-web-{len(self._workers) + 1}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self._workers_lock:
+            self._open_connections += 1
+            self._spawn_worker_locked()
+        self._connection_queue.put((request, client_address))
+
+    def _serve_connections(self) -> None:
+        current = threading.current_thread()
+        while True:
+            item = self._connection_queue.get()
+            if item is None:
+                return
+            try:
+                self.process_request_thread(*item)
+            finally:
+                with self._workers_lock:
+                    streamed = current not in self._workers
+                    if streamed:
+                        self._open_streams -= 1
+                    else:
+                        self._open_connections -= 1
+            if streamed:
+                return
+
+    def begin_stream(self) -> bool:
+        """Take the calling worker out of the pool for a long-lived response.
+
+        Returns False when ``max_streams`` streams are already open; the
+        caller should refuse the stream rather than hold a pool worker.
+        """
+        current = threading.current_thread()
+        with self._workers_lock:
+            if current not in self._workers:
+                return True
+            if self._open_streams >= self.max_streams:
+                return False
+            self._workers.remove(current)
+            self._open_connections -= 1
+            self._open_streams += 1
+            self._spawn_worker_locked()
+        return True
+
+    def keep_alive_available(self) -> bool:
+        with self._workers_lock:
+            return self._open_connections <= self.max_workers
+
+    def server_close(self) -> None:
+        super().server_close()
+        with self._workers_lock:
+            workers = len(self._workers)
+        for _ in range(workers):
+            self._connection_queue.put(None)
+
+
+class _KeepAliveRequestHandler(BaseHTTPRequestHandler):
+    """Serve several requests per connection with an idle timeout and a cap.
+
+    The accept-time socket timeout still bounds the TLS handshake and each
+    request's I/O; only the wait for a follow-up request uses the shorter
+    ``WEB_KEEPALIVE_IDLE_SECONDS``.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        self.requests_handled = 0
+        self._io_timeout = self.connection.gettimeout()
+
+    def handle(self) -> None:
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection:
+            self.connection.settimeout(WEB_KEEPALIVE_IDLE_SECONDS)
+            self.handle_one_request()
+
+    def parse_request(self) -> bool:
+        self.connection.settimeout(self._io_timeout)
+        self.requests_handled += 1
+        self.request_body_read = False
+        return super().parse_request()
+
+    def keep_alive_remaining(self) -> int:
+        if not getattr(self.server, "keep_alive_available", lambda: True)():
+            return 0
+        return max(0, WEB_KEEPALIVE_MAX_REQUESTS - self.requests_handled)
 PROVIDER_ENV = {
     "openai": ("OPENAI_API_KEY",),
     "openai-codex": ("OPENAI_API_KEY", "FLUXIO_OPENAI_CODEX_OAUTH_PRESENT"),
@@ -348,18 +490,47 @@ def _send_cors_headers(handler: BaseHTTPRequestHandler) -> None:
         handler.send_header("Access-Control-Allow-Origin", origin)
         handler.send_header("Vary", "Origin")
     handler.send_header("Access-Control-Allow-Credentials", "true")
-    handler.send_header("Access-Control-Allow-Headers", "content-type, authorization")
+    handler.send_header("Access-Control-Allow-Headers", "content-type, authorization, if-none-match")
+    handler.send_header("Access-Control-Expose-Headers", "ETag")
     handler.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
 
 
+def _keep_alive_remaining(handler: BaseHTTPRequestHandler) -> int:
+    """Requests this connection may still serve after the current response.
+
+    Zero unless the handler supports keep-alive, the client did not ask to
+    close, and the request body was fully consumed so the next request starts
+    on a clean boundary.
+    """
+    remaining = getattr(handler, "keep_alive_remaining", None)
+    if remaining is None or getattr(handler, "close_connection", True):
+        return 0
+    if _request_header(handler, "Transfer-Encoding"):
+        return 0
+    try:
+        body_length = int(_request_header(handler, "Content-Length") or 0)
+    except ValueError:
+        return 0
+    if body_length > 0 and not getattr(handler, "request_body_read", False):
+        return 0
+    return remaining()
+
+
 def _apply_security_headers(
     handler: BaseHTTPRequestHandler,
     *,
     cache_control: str = "no-store",
     frame_options: str = "DENY",
+    keep_alive: bool = True,
 ) -> None:
-    handler.close_connection = True
-    handler.send_header("Connection", "close")
+    remaining = _keep_alive_remaining(handler) if keep_alive else 0
+    if remaining > 0:
+        handler.close_connection = False
+        handler.send_header("Connection", "keep-alive")
+        handler.send_header("Keep-Alive", f"timeout={WEB_KEEPALIVE_IDLE_SECONDS}, max={remaining}")
+    else:
+        handler.close_connection = True
+        handler.send_header("Connection", "close")
     handler.send_header("X-Content-Type-Options", "nosniff")
     handler.send_header("X-Frame-Options", frame_options)
     handler.send_header("Referrer-Policy", "no-referrer")
@@ -372,12 +543,128 @@ def _write_response_body(handler: BaseHTTPRequestHandler, body: bytes, *, chunk_
         handler.wfile.flush()
 
 
-def _json_response(handler: BaseHTTPRequestHandler, status: int, payload: object) -> None:
-    body = json.dumps(payload, indent=2).encode("utf-8")
+def _request_header(handler: BaseHTTPRequestHandler, name: str) -> str:
+    headers = getattr(handler, "headers", None)
+    return str(headers.get(name) or "").strip() if headers is not None else ""
+
+
+def _accepts_gzip(handler: BaseHTTPRequestHandler) -> bool:
+    for item in _request_header(handler, "Accept-Encoding").split(","):
+        coding, _, params = item.strip().partition(";")
+        if coding.strip().lower() not in {"gzip", "*"}:
+            continue
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def _gzip_bytes(body: bytes) -> bytes:
+    compressor = zlib.compressobj(GZIP_COMPRESSION_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress(body) + compressor.flush()
+
+
+def _negotiate_body(
+    handler: BaseHTTPRequestHandler,
+    body: bytes,
+    content_type: str,
+) -> tuple[bytes, str]:
+    if (
+        len(body) < GZIP_MIN_BODY_BYTES
+        or not content_type.startswith(GZIP_CONTENT_TYPE_PREFIXES)
+        or not _accepts_gzip(handler)
+    ):
+        return body, ""
+    return _gzip_bytes(body), "gzip"
+
+
+def _representation_etag(etag: str, encoding: str) -> str:
+    # Strong validators must differ per content-coding.
+    return f'{etag[:-1]}-{encoding}"' if encoding and etag else etag
+
+
+def _etag_matches(handler: BaseHTTPRequestHandler, etag: str) -> bool:
+    header = _request_header(handler, "If-None-Match")
+    if not header or not etag:
+        return False
+    if header == "*":
+        return True
+    candidates = {item.strip().removeprefix("W/") for item in header.split(",")}
+    return bool(candidates & {etag, _representation_etag(etag, "gzip")})
+
+
+def _not_modified_since(handler: BaseHTTPRequestHandler, mtime: float) -> bool:
+    if _request_header(handler, "If-None-Match"):
+        return False
+    header = _request_header(handler, "If-Modified-Since")
+    if not header:
+        return False
+    try:
+        return int(mtime) <= parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError, OverflowError):
+        return False
+
+
+def _not_modified_response(
+    handler: BaseHTTPRequestHandler,
+    etag: str,
+    *,
+    cache_control: str = "no-cache",
+    last_modified: str = "",
+) -> None:
+    handler.send_response(304)
+    handler.send_header("ETag", etag)
+    if last_modified:
+        handler.send_header("Last-Modified", last_modified)
+    handler.send_header("Vary", "Accept-Encoding")
+    handler.send_header("Content-Length", "0")
+    _apply_security_headers(handler, cache_control=cache_control)
+    _send_cors_headers(handler)
+    handler.end_headers()
+
+
+def _file_validators(stat: os.stat_result) -> tuple[str, str]:
+    etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+    return etag, formatdate(stat.st_mtime, usegmt=True)
+
+
+def _json_response(
+    handler: BaseHTTPRequestHandler,
+    status: int,
+    payload: object,
+    *,
+    etag: str = "",
+) -> None:
+    if etag and status == 200 and _etag_matches(handler, etag):
+        _not_modified_response(handler, etag)
+        return
+    if status == 204:
+        # No body may follow a 204; stray bytes would corrupt the next
+        # response on a persistent connection.
+        handler.send_response(status)
+        _apply_security_headers(handler)
+        _send_cors_headers(handler)
+        handler.end_headers()
+        return
+    content_type = "application/json; charset=utf-8"
+    body, encoding = _negotiate_body(
+        handler,
+        json.dumps(payload, separators=(",", ":")).encode("utf-8"),
+        content_type,
+    )
     handler.send_response(status)
-    handler.send_header("Content-Type", "application/json; charset=utf-8")
+    handler.send_header("Content-Type", content_type)
     handler.send_header("Content-Length", str(len(body)))
-    _apply_security_headers(handler)
+    handler.send_header("Vary", "Accept-Encoding")
+    if encoding:
+        handler.send_header("Content-Encoding", encoding)
+    if etag:
+        handler.send_header("ETag", _representation_etag(etag, encoding))
+    _apply_security_headers(handler, cache_control="no-cache" if etag else "no-store")
     _send_cors_headers(handler)
     handler.end_headers()
     _write_response_body(handler, body)
@@ -405,6 +692,7 @@ def _read_json_body(handler: BaseHTTPRequestHandler) -> dict[str, Any]:
     if length <= 0:
         return {}
     raw = handler.rfile.read(length).decode("utf-8")
+    handler.request_body_read = True
     payload = json.loads(raw)
     return payload if isinstance(payload, dict) else {}
 
@@ -892,6 +1180,26 @@ def _run_cli(
         check=False,
         **hidden_windows_subprocess_kwargs(),
     )
+    return _cli_completed_payload(command, completed)
+
+
+def _run_cli_in_process(
+    executor: CliExecutor,
+    root: Path,
+    command: str,
+    args: list[str],
+    timeout: int = 180,
+    extra_env: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    completed = executor.run(
+        [command, "--root", str(root), *args],
+        timeout=timeout,
+        extra_env=extra_env,
+    )
+    return _cli_completed_payload(command, completed)
+
+
+def _cli_completed_payload(command: str, completed: subprocess.CompletedProcess) -> dict[str, Any]:
     raw = (completed.stdout or completed.stderr or "").strip()
     try:
         payload = json.loads(raw) if raw else {}
@@ -3356,7 +3664,7 @@ def _codex_import_snapshot() -> dict[str, Any]:
     }
 
 
-def _save_codex_skill_file(payload: dict[str, Any]) -> dict[str, Any]:
+def _save_codex_skill_file(payload: dict[str, Any], control_dir: Path | None = None) -> dict[str, Any]:
     path_value = str(
         payload.get("path")
         or payload.get("sourcePath")
@@ -3387,6 +3695,7 @@ def _save_codex_skill_file(payload: dict[str, Any]) -> dict[str, Any]:
     backup = target.with_suffix(f".md.bak.{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}")
     backup.write_text(original, encoding="utf-8")
     target.write_text(content.rstrip() + "\n", encoding="utf-8")
+    invalidate_codex_home_skill_cache(target, control_dir)
     saved_at = datetime.now(timezone.utc).isoformat()
     return {
         "schema": "fluxio.codex_skill_save_receipt.v1",
@@ -3429,12 +3738,14 @@ class FluxioWebBackend:
             tuple[tuple[tuple[str, int, int], ...], float, dict[str, Any]],
         ] = {}
         self._full_summary_revalidation_keys: set[str] = set()
+        self._summary_version_logs: dict[str, SummaryVersionLog] = {}
         self._mission_detail_cache_lock = threading.Lock()
         self._mission_detail_cache: dict[str, tuple[tuple[tuple[str, int, int], ...], float, dict[str, Any]]] = {}
         self._mission_detail_prewarm_keys: set[str] = set()
         self._runtime_proof_status_cache_lock = threading.Lock()
         self._runtime_proof_status_cache: dict[str, tuple[float, dict[str, Any]]] = {}
         self._runtime_proof_status_revalidation_keys: set[str] = set()
+        self.cli_executor = CliExecutor()
 
     @property
     def username(self) -> str:
@@ -3752,7 +4063,31 @@ class FluxioWebBackend:
         env = self._provider_env()
         if fast_control_room:
             env["FLUXIO_CONTROL_ROOM_FAST"] = "1"
-        return _run_cli(root, command, args, timeout=timeout, extra_env=env)
+        in_process = (
+            command in IN_PROCESS_COMMANDS
+            and in_process_cli_enabled()
+            and runs_loaded_package(root)
+            and self.cli_executor.accepts(env)
+        )
+        mode = "in-process" if in_process else "subprocess"
+        started = time.perf_counter()
+        ok = False
+        try:
+            if in_process:
+                payload = _run_cli_in_process(
+                    self.cli_executor, root, command, args, timeout=timeout, extra_env=env
+                )
+            else:
+                payload = _run_cli(root, command, args, timeout=timeout, extra_env=env)
+            ok = True
+            return payload
+        finally:
+            self.cli_executor.record(
+                command,
+                mode=mode,
+                duration_ms=(time.perf_counter() - started) * 1000,
+                ok=ok,
+            )
 
     def _run_authenticated_live_agent_proof(self, payload: dict[str, Any]) -> dict[str, Any]:
         root = Path(payload.get("root") or self.root).resolve()
@@ -3862,6 +4197,7 @@ class FluxioWebBackend:
         rows: list[tuple[str, int, int]] = []
         watched_paths = [
             store.missions_path,
+            store.mission_shards.index_path,
             store.events_path,
             store.workspaces_path,
             store.workspace_actions_path,
@@ -3885,6 +4221,44 @@ class FluxioWebBackend:
                 rows.append((str(path), int(stat.st_mtime_ns), int(stat.st_size)))
         return tuple(rows)
 
+    def backend_read_etag(self, command: str, raw_payload: object) -> str:
+        """Strong validator for cacheable ``/api/backend`` reads, or ``""``."""
+        if command not in BACKEND_READ_ETAG_COMMANDS:
+            return ""
+        payload = _as_payload(raw_payload)
+        root = Path(payload.get("root") or self.root).resolve()
+        try:
+            signature = self._control_room_freshness_signature(root)
+        except OSError:
+            return ""
+        material = json.dumps(
+            [
+                command,
+                payload,
+                signature,
+                sorted(self.provider_secrets),
+                int(time.time() // BACKEND_READ_ETAG_WINDOW_SECONDS),
+            ],
+            sort_keys=True,
+            default=str,
+            separators=(",", ":"),
+        )
+        return f'"{hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]}"'
+
+    @staticmethod
+    def backend_read_is_current(result: object) -> bool:
+        """False when a cache served content older than the control files."""
+        if not isinstance(result, dict):
+            return True
+        markers = [result.get("summaryCache")]
+        performance = result.get("performance")
+        if isinstance(performance, dict):
+            markers.append(performance.get("missionDetailCache"))
+        return not any(
+            isinstance(marker, dict) and marker.get("freshness") == "control-files-changed"
+            for marker in markers
+        )
+
     @staticmethod
     def _mission_detail_cache_key(root: Path, mission_id: str, event_limit: int) -> str:
         return f"{root.resolve()}::{mission_id}::{event_limit}"
@@ -4450,6 +4824,14 @@ class FluxioWebBackend:
             ttl_seconds=FULL_SUMMARY_CACHE_TTL_SECONDS,
         )
 
+    def _summary_version_log(self, root: Path) -> SummaryVersionLog:
+        cache_key = str(root.resolve())
+        with self._summary_cache_lock:
+            log = self._summary_version_logs.get(cache_key)
+            if log is None:
+                log = self._summary_version_logs[cache_key] = SummaryVersionLog()
+            return log
+
     def _start_control_room_summary_revalidate(self, root: Path, cache_key: str) -> None:
         worker = threading.Thread(
             target=self._run_control_room_summary_revalidate,
@@ -8615,8 +8997,15 @@ class FluxioWebBackend:
                 "available": True,
                 "commandSurface": "http",
                 "root": str(root),
+                "cliLatency": self.cli_executor.latency_stats(),
             }
             return snapshot
+        if command == "get_cli_latency_command":
+            return {
+                "inProcessEnabled": in_process_cli_enabled(),
+                "workers": self.cli_executor.max_workers,
+                "commands": self.cli_executor.latency_stats(),
+            }
         if command == "get_control_room_summary_command":
             root = Path(payload.get("root") or self.root).resolve()
             bootstrap = bool(payload.get("bootstrap") or payload.get("summaryBootstrap"))
@@ -8656,6 +9045,8 @@ class FluxioWebBackend:
                 "root": str(root),
             }
             self._prewarm_control_room_mission_details(root, summary)
+            if "sinceVersion" in payload and not (bootstrap or summary_mode == "bootstrap"):
+                return self._summary_version_log(root).delta(summary, str(payload.get("sinceVersion") or ""))
             return summary
         if command == "get_control_room_mission_detail_command":
             root = Path(payload.get("root") or self.root).resolve()
@@ -8946,7 +9337,8 @@ class FluxioWebBackend:
         if command == "image_self_repair_loop_command":
             return self._image_self_repair_loop_artifact(payload)
         if command == "save_codex_skill_command":
-            return _save_codex_skill_file(payload)
+            root = Path(payload.get("root") or self.root).resolve()
+            return _save_codex_skill_file(payload, root / ".agent_control")
         if command == "apply_skill_repair_command":
             args = []
             for key, flag in (
@@ -9303,10 +9695,6 @@ class FluxioWebBackend:
             content_type = "application/json; charset=utf-8"
         elif target.suffix == ".png":
             content_type = "image/png"
-        body = target.read_bytes()
-        handler.send_response(200)
-        handler.send_header("Content-Type", content_type)
-        handler.send_header("Content-Length", str(len(body)))
         cache_control = "public, max-age=300"
         if target.name in {"index.html", "service-worker.js"} or target.suffix in {".html", ".js", ".css"}:
             cache_control = "no-store"
@@ -9315,6 +9703,25 @@ class FluxioWebBackend:
             embedded_target = (query.get("embedded") or [""])[0]
             if embedded_target in {"browser-proof", "fluxio-browser"}:
                 frame_options = "SAMEORIGIN"
+        stat = target.stat()
+        etag, last_modified = _file_validators(stat)
+        if _etag_matches(handler, etag) or _not_modified_since(handler, stat.st_mtime):
+            _not_modified_response(
+                handler,
+                etag,
+                cache_control=cache_control,
+                last_modified=last_modified,
+            )
+            return True
+        body, encoding = _negotiate_body(handler, target.read_bytes(), content_type)
+        handler.send_response(200)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            handler.send_header("Content-Encoding", encoding)
+        handler.send_header("ETag", _representation_etag(etag, encoding))
+        handler.send_header("Last-Modified", last_modified)
         _apply_security_headers(handler, cache_control=cache_control, frame_options=frame_options)
         handler.end_headers()
         _write_response_body(handler, body)
@@ -9347,10 +9754,25 @@ class FluxioWebBackend:
         if not content_type:
             _json_response(handler, 415, {"ok": False, "error": "Unsupported artifact type"})
             return True
-        body = target.read_bytes()
+        stat = target.stat()
+        etag, last_modified = _file_validators(stat)
+        if _etag_matches(handler, etag) or _not_modified_since(handler, stat.st_mtime):
+            _not_modified_response(
+                handler,
+                etag,
+                cache_control="private, max-age=60",
+                last_modified=last_modified,
+            )
+            return True
+        body, encoding = _negotiate_body(handler, target.read_bytes(), content_type)
         handler.send_response(200)
         handler.send_header("Content-Type", content_type)
         handler.send_header("Content-Length", str(len(body)))
+        handler.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            handler.send_header("Content-Encoding", encoding)
+        handler.send_header("ETag", _representation_etag(etag, encoding))
+        handler.send_header("Last-Modified", last_modified)
         handler.send_header("X-Syntelos-Artifact-Id", self._artifact_id(target))
         # SAMEORIGIN so the in-app Preview window can iframe the artifact.
         _apply_security_headers(
@@ -9361,6 +9783,54 @@ class FluxioWebBackend:
         _write_response_body(handler, body)
         return True
 
+    def serve_mission_stream(self, handler: BaseHTTPRequestHandler) -> bool:
+        if not self.is_authenticated(handler):
+            _json_response(
+                handler,
+                401,
+                {
+                    "ok": False,
+                    "error": f"{PRODUCT_NAME} login is required.",
+                    "loginRequired": True,
+                },
+            )
+            return True
+        query = parse_qs(urlparse(handler.path).query)
+        mission_id = str((query.get("missionId") or query.get("mission_id") or [""])[0]).strip()
+        if not mission_id:
+            _json_response(handler, 400, {"ok": False, "error": "missionId is required."})
+            return True
+        root = Path((query.get("root") or [""])[0] or self.root).resolve()
+        # EventSource cannot set headers on its first request, so the cursor
+        # may also arrive as ?lastEventId= from a client that kept it.
+        cursor = str(
+            handler.headers.get("Last-Event-ID")
+            or (query.get("lastEventId") or [""])[0]
+            or ""
+        )
+        begin_stream = getattr(getattr(handler, "server", None), "begin_stream", None)
+        if begin_stream is not None and not begin_stream():
+            # EventSource reconnects on its own once a stream slot frees up.
+            _json_response(handler, 503, {"ok": False, "error": "Too many open mission streams."})
+            return True
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        handler.send_header("X-Accel-Buffering", "no")
+        # Unframed event stream: the connection ends when the stream does.
+        _apply_security_headers(handler, keep_alive=False)
+        _send_cors_headers(handler)
+        handler.end_headers()
+
+        def write(chunk: bytes) -> None:
+            handler.wfile.write(chunk)
+            handler.wfile.flush()
+
+        try:
+            stream_mission_events(write, MissionEventTail(root, mission_id, cursor))
+        except (BrokenPipeError, ConnectionAbortedError, ConnectionResetError):
+            pass
+        return True
+
     def serve_delivery_receipts(self, handler: BaseHTTPRequestHandler) -> bool:
         parsed = urlparse(handler.path)
         if not self.is_authenticated(handler):
@@ -9385,9 +9855,7 @@ class FluxioWebBackend:
 
 
 def make_handler(backend: FluxioWebBackend) -> type[BaseHTTPRequestHandler]:
-    class Handler(BaseHTTPRequestHandler):
-        protocol_version = "HTTP/1.1"
-
+    class Handler(_KeepAliveRequestHandler):
         def do_OPTIONS(self) -> None:  # noqa: N802
             _json_response(self, 204, {})
 
@@ -9432,6 +9900,9 @@ def make_handler(backend: FluxioWebBackend) -> type[BaseHTTPRequestHandler]:
             if parsed.path == "/api/delivery-receipts":
                 backend.serve_delivery_receipts(self)
                 return
+            if parsed.path == "/api/mission-stream":
+                backend.serve_mission_stream(self)
+                return
             backend.serve_file(self)
 
         def do_POST(self) -> None:  # noqa: N802
@@ -9539,9 +10010,18 @@ def make_handler(backend: FluxioWebBackend) -> type[BaseHTTPRequestHandler]:
                 return
             try:
                 command = str(payload.get("command") or "").strip()
+                etag = backend.backend_read_etag(command, payload.get("payload"))
+                if etag and _etag_matches(self, etag):
+                    _not_modified_response(self, etag)
+                    return
                 result = backend.dispatch(command, payload.get("payload"))
+                if etag and (
+                    not backend.backend_read_is_current(result)
+                    or backend.backend_read_etag(command, payload.get("payload")) != etag
+                ):
+                    etag = ""
                 try:
-                    _json_response(self, 200, {"ok": True, "data": result})
+                    _json_response(self, 200, {"ok": True, "data": result}, etag=etag)
                 except (BrokenPipeError, ConnectionAbortedError, ConnectionResetError):
                     return
             except Exception as exc:  # pragma: no cover - exercised by browser/manual flows
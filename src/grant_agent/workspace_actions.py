@@ -21,6 +21,9 @@ from .app_capability_standard import (
     build_connected_apps_snapshot,
     record_connected_app_action_receipt,
 )
+from .command_probe import invalidate_command_probe_cache
+from .git_probe import invalidate_git_status
+from .mission_store import load_mission_payloads, save_mission_payloads
 from .models import (
     ActionApprovalGate,
     ActionExecutionRecord,
@@ -123,7 +126,12 @@ def execute_control_room_workspace_action(
                 "missingDependencies": verify_setup.get("missingDependencies", []),
             }
             record_dict.setdefault("result", {})["payload"] = payload
+    if workspace is not None and (surface or "").strip().lower() == "git":
+        # Push/fetch move remote refs without touching .git/index or HEAD.
+        invalidate_git_status(Path(workspace.root_path))
     if surface == "setup":
+        # Installs and updates can swap binaries inside WSL, where mtimes are not visible.
+        invalidate_command_probe_cache()
         invalidate_onboarding_status_cache(root)
         invalidate_runtime_status_cache(root)
         record_dict = _refresh_setup_result_payload(
@@ -1199,8 +1207,7 @@ def _discover_telegram_destination(root: Path) -> tuple[str, str]:
     openclaw_destination, openclaw_source = _discover_openclaw_telegram_destination()
     if openclaw_destination:
         return openclaw_destination, openclaw_source
-    missions_path = root / ".agent_control" / "missions.json"
-    missions_payload = _load_json_list(missions_path)
+    missions_payload = load_mission_payloads(root / ".agent_control")
     for mission in missions_payload:
         destination = _normalize_telegram_destination(
             mission.get("escalation_policy", {}).get("destination")
@@ -1334,8 +1341,7 @@ def _persist_telegram_destination(root: Path, *, destination: str, source: str)
 
 
 def _backfill_mission_telegram_destinations(root: Path, destination: str) -> int:
-    missions_path = root / ".agent_control" / "missions.json"
-    missions = _load_json_list(missions_path)
+    missions = load_mission_payloads(root / ".agent_control")
     if not missions:
         return 0
     updated_count = 0
@@ -1361,23 +1367,10 @@ def _backfill_mission_telegram_destinations(root: Path, destination: str) -> int
         updated_count += 1
         changed = True
     if changed:
-        missions_path.parent.mkdir(parents=True, exist_ok=True)
-        missions_path.write_text(json.dumps(missions, indent=2), encoding="utf-8")
+        save_mission_payloads(root / ".agent_control", missions)
     return updated_count
 
 
-def _load_json_list(path: Path) -> list[dict]:
-    if not path.exists():
-        return []
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return []
-    if not isinstance(payload, list):
-        return []
-    return [item for item in payload if isinstance(item, dict)]
-
-
 def _probe_health_url(url: str) -> dict:
     if not url:
         return {}
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import threading
+import uuid
+from pathlib import Path
+
+WORKTREE_POOL_SIZE_ENV = "FLUXIO_WORKTREE_POOL_SIZE"
+WORKTREE_POOL_MAX_MB_ENV = "FLUXIO_WORKTREE_POOL_MAX_MB"
+WORKTREE_POOL_DEFAULT_SIZE = 2
+WORKTREE_POOL_DEFAULT_MAX_MB = 4096
+WORKTREE_POOL_DIRNAME = ".idle"
+WORKTREE_POOL_LEDGER = "slots.json"
+LEASE_GIT_TIMEOUT_SECONDS = 30
+REFILL_GIT_TIMEOUT_SECONDS = 600
+# Slots a mission cleanup may add on top of the one it recycles.
+CLEANUP_REFILL_LIMIT = 1
+_WORKTREE_POOLS_LOCK = threading.Lock()
+_WORKTREE_POOLS: dict[str, "WorktreePool"] = {}
+
+
+def worktree_container(workspace_root: Path) -> Path:
+    return workspace_root.parent / f".fluxio-worktrees-{workspace_root.name}"
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.environ.get(name, "") or default))
+    except ValueError:
+        return default
+
+
+def _tree_bytes(path: Path) -> int:
+    total = 0
+    for current_root, _, file_names in os.walk(path):
+        for file_name in file_names:
+            try:
+                total += (Path(current_root) / file_name).lstat().st_size
+            except OSError:
+                continue
+    return total
+
+
+class WorktreePool:
+    """Idle, detached git worktrees kept next to one workspace.
+
+    Slots live under ``.fluxio-worktrees-<name>/.idle`` and are claimed with
+    ``git worktree move``, which is a rename plus a metadata update, so two
+    processes racing for the same slot cannot both win. A lease then checks
+    out a new ``fluxio/<mission_id>`` branch at the workspace's current HEAD.
+    Cleanup recycles the worktree back into the pool instead of deleting it,
+    which is how the pool warms up; nothing runs git in the background, so no
+    worktree is still being written once a caller has moved on. ``refill``
+    warms a pool synchronously; cleanup tops it up by a bounded number of
+    slots so launches beyond the recycled ones stay warm too. The pool
+    is bounded by ``FLUXIO_WORKTREE_POOL_SIZE`` slots (0 disables it) and
+    ``FLUXIO_WORKTREE_POOL_MAX_MB`` of checked-out files.
+    """
+
+    def __init__(self, workspace_root: Path, *, size: int | None = None, max_bytes: int | None = None) -> None:
+        self.workspace_root = workspace_root.resolve()
+        self.idle_dir = worktree_container(self.workspace_root) / WORKTREE_POOL_DIRNAME
+        self._size = size
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size if self._size is not None else _env_int(WORKTREE_POOL_SIZE_ENV, WORKTREE_POOL_DEFAULT_SIZE)
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return _env_int(WORKTREE_POOL_MAX_MB_ENV, WORKTREE_POOL_DEFAULT_MAX_MB) * 1024 * 1024
+
+    def _git(self, args: list[str], *, cwd: Path, timeout: int = LEASE_GIT_TIMEOUT_SECONDS) -> bool:
+        try:
+            completed = subprocess.run(  # noqa: S603
+                ["git", *args],
+                cwd=str(cwd),
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return completed.returncode == 0
+
+    def _head(self) -> str:
+        try:
+            completed = subprocess.run(  # noqa: S603
+                ["git", "rev-parse", "HEAD"],
+                cwd=str(self.workspace_root),
+                capture_output=True,
+                text=True,
+                timeout=LEASE_GIT_TIMEOUT_SECONDS,
+                check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return ""
+        return completed.stdout.strip() if completed.returncode == 0 else ""
+
+    def _ledger(self) -> dict[str, int]:
+        try:
+            payload = json.loads((self.idle_dir / WORKTREE_POOL_LEDGER).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return {str(key): int(value) for key, value in payload.items()} if isinstance(payload, dict) else {}
+
+    def _write_ledger(self, ledger: dict[str, int]) -> None:
+        self.idle_dir.mkdir(parents=True, exist_ok=True)
+        live = {name: size for name, size in ledger.items() if (self.idle_dir / name).is_dir()}
+        tmp_path = self.idle_dir / f"{WORKTREE_POOL_LEDGER}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        tmp_path.write_text(json.dumps(live, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.idle_dir / WORKTREE_POOL_LEDGER)
+
+    def idle_slots(self) -> list[Path]:
+        try:
+            return sorted(path for path in self.idle_dir.iterdir() if path.is_dir())
+        except OSError:
+            return []
+
+    def status(self) -> dict[str, int]:
+        ledger = self._ledger()
+        slots = self.idle_slots()
+        return {
+            "idle": len(slots),
+            "bytes": sum(ledger.get(slot.name, 0) for slot in slots),
+            "size": self.size,
+            "maxBytes": self.max_bytes,
+        }
+
+    def _discard(self, slot: Path) -> None:
+        if not self._git(["worktree", "remove", "--force", str(slot)], cwd=self.workspace_root):
+            shutil.rmtree(slot, ignore_errors=True)
+            self._git(["worktree", "prune"], cwd=self.workspace_root)
+
+    def lease(self, worktree_path: Path, branch_name: str) -> bool:
+        """Move an idle slot to ``worktree_path`` and check out a new ``branch_name`` at HEAD."""
+        if self.size <= 0:
+            return False
+        slots = self.idle_slots()
+        if not slots:
+            return False
+        head = self._head()
+        if not head:
+            return False
+        for slot in slots:
+            if not self._git(["worktree", "move", str(slot), str(worktree_path)], cwd=self.workspace_root):
+                if slot.exists():
+                    self._discard(slot)
+                continue
+            with self._lock:
+                ledger = self._ledger()
+                ledger.pop(slot.name, None)
+                self._write_ledger(ledger)
+            # Like the cold ``worktree add -b`` path, never move an existing
+            # mission branch: a resumed mission gets a detached HEAD instead.
+            if self._git(["checkout", "--force", "-b", branch_name, head], cwd=worktree_path):
+                return True
+            if self._git(["checkout", "--force", "--detach", head], cwd=worktree_path):
+                return True
+            self._discard(worktree_path)
+        return False
+
+    def recycle(self, worktree_path: Path, branch_name: str) -> bool:
+        """Reset a finished mission worktree and park it as an idle slot."""
+        size = self.size
+        if size <= 0 or not worktree_path.is_dir():
+            return False
+        with self._lock:
+            if len(self.idle_slots()) >= size:
+                return False
+            if not self._git(["checkout", "--force", "--detach"], cwd=worktree_path):
+                return False
+            # -ff also drops nested repositories; leftovers must not leak into the next mission.
+            if not self._git(["clean", "-ffdx"], cwd=worktree_path):
+                return False
+            slot_bytes = _tree_bytes(worktree_path)
+            ledger = self._ledger()
+            used = sum(ledger.get(slot.name, 0) for slot in self.idle_slots())
+            if used + slot_bytes > self.max_bytes:
+                return False
+            slot = self.idle_dir / f"slot_{uuid.uuid4().hex[:10]}"
+            self.idle_dir.mkdir(parents=True, exist_ok=True)
+            if not self._git(["worktree", "move", str(worktree_path), str(slot)], cwd=self.workspace_root):
+                return False
+            ledger[slot.name] = slot_bytes
+            self._write_ledger(ledger)
+        if branch_name.startswith("fluxio/"):
+            self._git(["branch", "-D", branch_name], cwd=self.workspace_root)
+        return True
+
+    def refill(self, limit: int | None = None) -> int:
+        """Create detached worktrees at HEAD until the pool is full; returns slots added.
+
+        ``limit`` caps how many ``git worktree add`` runs this call may spend.
+        """
+        added = 0
+        while limit is None or added < limit:
+            with self._lock:
+                slots = self.idle_slots()
+                if len(slots) >= self.size:
+                    return added
+                ledger = self._ledger()
+                used = sum(ledger.get(slot.name, 0) for slot in slots)
+                estimate = max(ledger.values(), default=0)
+                if used + estimate > self.max_bytes:
+                    return added
+            slot = self.idle_dir / f"slot_{uuid.uuid4().hex[:10]}"
+            self.idle_dir.mkdir(parents=True, exist_ok=True)
+            if not self._git(
+                ["worktree", "add", "--detach", str(slot), "HEAD"],
+                cwd=self.workspace_root,
+                timeout=REFILL_GIT_TIMEOUT_SECONDS,
+            ):
+                shutil.rmtree(slot, ignore_errors=True)
+                return added
+            slot_bytes = _tree_bytes(slot)
+            with self._lock:
+                ledger = self._ledger()
+                if used + slot_bytes > self.max_bytes:
+                    self._discard(slot)
+                    self._write_ledger(ledger)
+                    return added
+                ledger[slot.name] = slot_bytes
+                self._write_ledger(ledger)
+            added += 1
+        return added
+
+
+def worktree_pool_for(workspace_root: Path) -> WorktreePool:
+    key = str(workspace_root.resolve())
+    with _WORKTREE_POOLS_LOCK:
+        pool = _WORKTREE_POOLS.get(key)
+        if pool is None:
+            pool = WorktreePool(workspace_root)
+            _WORKTREE_POOLS[key] = pool
+        return pool
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 import pathlib
 import subprocess
 import sys
 import tempfile
+import threading
 import unittest
 from unittest import mock
 
@@ -18,6 +20,7 @@ from grant_agent.action_executor import (
     prepare_execution_scope,
 )
 from grant_agent.models import ActionProposal, PlannedStep
+from grant_agent.worktree_pool import WorktreePool, worktree_pool_for
 
 
 def _init_git_repo(root: pathlib.Path) -> None:
@@ -81,6 +84,114 @@ class ActionExecutorTests(unittest.TestCase):
             self.assertFalse(worktree_path.exists())
             self.assertEqual(scope.strategy, "git_worktree")
 
+    def test_worktree_pool_resets_leased_slot_to_head_and_recycles_it_clean(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir) / "repo"
+            root.mkdir()
+            (root / "README.md").write_text("# Demo\n", encoding="utf-8")
+            _init_git_repo(root)
+            pool = WorktreePool(root, size=1)
+
+            self.assertEqual(pool.refill(), 1)
+            (root / "NEW.md").write_text("after warmup\n", encoding="utf-8")
+            subprocess.run(["git", "add", "NEW.md"], cwd=root, check=True)
+            subprocess.run(["git", "commit", "-m", "second"], cwd=root, check=True, capture_output=True)
+            worktree_path = pathlib.Path(temp_dir) / "mission_pool"
+
+            self.assertTrue(pool.lease(worktree_path, "fluxio/mission_pool"))
+            self.assertEqual(pool.status()["idle"], 0)
+            self.assertTrue((worktree_path / "NEW.md").exists())
+            branch = subprocess.run(
+                ["git", "branch", "--show-current"], cwd=worktree_path, capture_output=True, text=True
+            ).stdout.strip()
+            self.assertEqual(branch, "fluxio/mission_pool")
+
+            (worktree_path / "README.md").write_text("mission edit\n", encoding="utf-8")
+            (worktree_path / "scratch.log").write_text("leftover\n", encoding="utf-8")
+            self.assertTrue(pool.recycle(worktree_path, "fluxio/mission_pool"))
+
+            self.assertFalse(worktree_path.exists())
+            slot = pool.idle_slots()[0]
+            self.assertFalse((slot / "scratch.log").exists())
+            self.assertEqual((slot / "README.md").read_text(encoding="utf-8"), "# Demo\n")
+            branches = subprocess.run(["git", "branch"], cwd=root, capture_output=True, text=True).stdout
+            self.assertNotIn("fluxio/mission_pool", branches)
+
+    def test_prepare_execution_scope_leases_from_worktree_pool(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir) / "repo"
+            root.mkdir()
+            (root / "README.md").write_text("# Demo\n", encoding="utf-8")
+            _init_git_repo(root)
+
+            with mock.patch.dict(os.environ, {"FLUXIO_WORKTREE_POOL_SIZE": "1"}):
+                pool = worktree_pool_for(root)
+                pool.refill()
+                scope = prepare_execution_scope(root, "mission_pooled", profile_name="builder")
+                # No background refill: the leased slot comes back only through cleanup.
+                self.assertEqual(pool.status()["idle"], 0)
+                self.assertNotIn("fluxio-worktree-refill", [thread.name for thread in threading.enumerate()])
+                cleanup = cleanup_execution_scope(scope)
+
+            self.assertTrue(scope.isolated)
+            self.assertIn("pre-warmed", scope.detail)
+            self.assertEqual(scope.branch_name, "fluxio/mission_pooled")
+            self.assertTrue(cleanup["cleaned"])
+            self.assertTrue(cleanup["recycled"])
+            self.assertEqual(len(pool.idle_slots()), 1)
+
+    def test_cleanup_tops_up_the_worktree_pool_for_later_launches(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir) / "repo"
+            root.mkdir()
+            (root / "README.md").write_text("# Demo\n", encoding="utf-8")
+            _init_git_repo(root)
+
+            with mock.patch.dict(os.environ, {"FLUXIO_WORKTREE_POOL_SIZE": "3"}):
+                pool = worktree_pool_for(root)
+                cold = prepare_execution_scope(root, "mission_cold", profile_name="builder")
+                cleanup = cleanup_execution_scope(cold)
+                self.assertTrue(cleanup["recycled"])
+                # One recycled slot plus one bounded refill, not a full pool.
+                self.assertEqual(pool.status()["idle"], 2)
+                warm = [
+                    prepare_execution_scope(root, f"mission_warm_{index}", profile_name="builder")
+                    for index in range(2)
+                ]
+
+            self.assertNotIn("pre-warmed", cold.detail)
+            self.assertTrue(all("pre-warmed" in scope.detail for scope in warm))
+            self.assertEqual(pool.refill(limit=0), 0)
+
+    def test_worktree_pool_lease_does_not_move_existing_mission_branch(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir) / "repo"
+            root.mkdir()
+            (root / "README.md").write_text("# Demo\n", encoding="utf-8")
+            _init_git_repo(root)
+            subprocess.run(["git", "branch", "fluxio/mission_resume"], cwd=root, check=True)
+            mission_tip = subprocess.run(
+                ["git", "rev-parse", "fluxio/mission_resume"], cwd=root, capture_output=True, text=True
+            ).stdout.strip()
+            (root / "NEW.md").write_text("later\n", encoding="utf-8")
+            subprocess.run(["git", "add", "NEW.md"], cwd=root, check=True)
+            subprocess.run(["git", "commit", "-m", "second"], cwd=root, check=True, capture_output=True)
+            pool = WorktreePool(root, size=1)
+            self.assertEqual(pool.refill(), 1)
+            worktree_path = pathlib.Path(temp_dir) / "mission_resume"
+
+            self.assertTrue(pool.lease(worktree_path, "fluxio/mission_resume"))
+
+            branch_tip = subprocess.run(
+                ["git", "rev-parse", "fluxio/mission_resume"], cwd=root, capture_output=True, text=True
+            ).stdout.strip()
+            self.assertEqual(branch_tip, mission_tip)
+            current = subprocess.run(
+                ["git", "branch", "--show-current"], cwd=worktree_path, capture_output=True, text=True
+            ).stdout.strip()
+            self.assertEqual(current, "")
+            self.assertTrue((worktree_path / "NEW.md").exists())
+
     def test_file_patch_executes_under_hands_free_policy(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = pathlib.Path(temp_dir)
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import json
+import os
 import pathlib
 import shutil
 import sys
+import tempfile
 import unittest
+from dataclasses import asdict
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
 from grant_agent.checkpoints import CheckpointStore
-from grant_agent.models import RunState
+from grant_agent.models import RunState, VerificationResult
+
+
+def _grow_state(state: RunState, iteration: int) -> None:
+    state.completed_steps.append(f"step {iteration}")
+    state.decisions.append(f"decision {iteration}: " + "x" * 200)
+    state.next_actions = [f"next after {iteration}"]
+    state.verification_results.append(
+        VerificationResult(command="python -m pytest", return_code=iteration % 2, stdout="ok " * 50, stderr="", duration_ms=iteration)
+    )
+    if iteration % 4 == 0:
+        state.risks = [f"risk {iteration}"]
 
 
 class CheckpointTests(unittest.TestCase):
@@ -39,6 +54,73 @@ class CheckpointTests(unittest.TestCase):
         self.assertEqual(loaded["session_id"], "session_x")
         self.assertEqual(loaded["state"]["objective"], "demo")
 
+    def test_delta_checkpoints_round_trip_every_iteration(self) -> None:
+        for compress in (False, True):
+            with self.subTest(compress=compress), tempfile.TemporaryDirectory() as temp_dir:
+                session = pathlib.Path(temp_dir) / "session_delta"
+                store = CheckpointStore(session, full_every=3, compress=compress)
+                state = RunState(objective="delta demo", plan_steps=["a", "b"], acceptance_checks=["tests"])
+                expected: dict[int, dict] = {}
+                paths: dict[int, pathlib.Path] = {}
+                for iteration in range(1, 9):
+                    _grow_state(state, iteration)
+                    paths[iteration] = store.save(
+                        session_id="session_delta",
+                        iteration=iteration,
+                        run_state=state,
+                        context={"used_tokens": iteration * 100, "status": "ok"},
+                        doc_sources=["README.md"],
+                    )
+                    expected[iteration] = asdict(state)
+
+                manifest = json.loads((session / "checkpoints" / "manifest.json").read_text(encoding="utf-8"))
+                self.assertEqual(
+                    [entry["kind"] for entry in manifest["checkpoints"]],
+                    ["full", "delta", "delta", "full", "delta", "delta", "full", "delta"],
+                )
+                self.assertEqual(CheckpointStore.latest(session), paths[8])
+                self.assertEqual(CheckpointStore.list(session), [paths[index] for index in range(8, 0, -1)])
+                for iteration in (8, 2, 6, 1):
+                    loaded = CheckpointStore.load(paths[iteration])
+                    self.assertEqual(loaded["iteration"], iteration)
+                    self.assertEqual(loaded["state"], expected[iteration])
+                    self.assertEqual(loaded["context"]["used_tokens"], iteration * 100)
+                self.assertEqual(CheckpointStore.load_iteration(session, 5)["state"], expected[5])
+                self.assertEqual(paths[8].suffix, ".zlib" if compress else ".json")
+
+                resumed = CheckpointStore(session, full_every=3, compress=compress)
+                _grow_state(state, 9)
+                resumed_path = resumed.save(
+                    session_id="session_delta",
+                    iteration=9,
+                    run_state=state,
+                    context={},
+                    doc_sources=[],
+                )
+                self.assertEqual(CheckpointStore.load(resumed_path)["state"], asdict(state))
+
+    def test_latest_uses_manifest_and_legacy_checkpoints_still_load(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            session = pathlib.Path(temp_dir) / "session_legacy"
+            checkpoint_dir = session / "checkpoints"
+            checkpoint_dir.mkdir(parents=True)
+            legacy = checkpoint_dir / "ckpt_001.json"
+            legacy.write_text(
+                json.dumps({"checkpoint_id": "ckpt_001", "iteration": 1, "created_at": "2026-01-01T00:00:00+00:00", "state": {}}, indent=2),
+                encoding="utf-8",
+            )
+            self.assertEqual(CheckpointStore.latest(session), legacy)
+            self.assertEqual(CheckpointStore.load(legacy)["checkpoint_id"], "ckpt_001")
+
+            store = CheckpointStore(session, full_every=5, compress=True)
+            state = RunState(objective="legacy", plan_steps=[], acceptance_checks=[])
+            newer = store.save(session_id="session_legacy", iteration=2, run_state=state, context={}, doc_sources=[])
+            os.utime(legacy, None)
+
+            self.assertEqual(CheckpointStore.latest(session), newer)
+            self.assertEqual(CheckpointStore.list(session), [newer, legacy])
+            self.assertEqual(CheckpointStore.load(newer)["state"]["objective"], "legacy")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from grant_agent.command_probe import gather_probes, invalidate_command_probe_cache, probe_command
+
+
+class CommandProbeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        invalidate_command_probe_cache()
+        self.addCleanup(invalidate_command_probe_cache)
+
+    def test_caches_by_binary_mtime_and_skips_unstatable_commands(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            binary = pathlib.Path(temp_dir) / "tool"
+            binary.write_text("#!/bin/sh\n", encoding="utf-8")
+            completed = subprocess.CompletedProcess([str(binary)], 0, stdout="tool 1.0\n", stderr="")
+            with mock.patch("grant_agent.command_probe.subprocess.run", return_value=completed) as run:
+                first = probe_command([str(binary), "--version"], timeout=8)
+                second = probe_command([str(binary), "--version"], timeout=8, cwd=temp_dir)
+                self.assertIs(first, second)
+                self.assertEqual(run.call_count, 1)
+
+                stat = binary.stat()
+                os.utime(binary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+                probe_command([str(binary), "--version"], timeout=8)
+                self.assertEqual(run.call_count, 2)
+
+                probe_command(["tool-on-path", "--version"], timeout=8)
+                probe_command(["tool-on-path", "--version"], timeout=8)
+                self.assertEqual(run.call_count, 4)
+
+                run.side_effect = subprocess.TimeoutExpired("tool", 8)
+                for _ in range(2):
+                    with self.assertRaises(subprocess.TimeoutExpired):
+                        probe_command([str(binary), "--help"], timeout=8)
+                self.assertEqual(run.call_count, 6)
+
+    def test_concurrent_identical_probes_share_one_subprocess(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        calls: list[list[str]] = []
+
+        def slow_run(args: list[str], **_kwargs: object) -> subprocess.CompletedProcess:
+            calls.append(args)
+            started.set()
+            release.wait(5)
+            return subprocess.CompletedProcess(args, 0, stdout="v1\n", stderr="")
+
+        results: list[object] = []
+        with mock.patch("grant_agent.command_probe.subprocess.run", side_effect=slow_run):
+            threads = [
+                threading.Thread(target=lambda: results.append(probe_command(["wsl-missing", "--status"])))
+                for _ in range(3)
+            ]
+            threads[0].start()
+            self.assertTrue(started.wait(5))
+            for thread in threads[1:]:
+                thread.start()
+            time.sleep(0.05)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_gather_probes_runs_calls_side_by_side(self) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+
+        def probe(name: str) -> str:
+            barrier.wait()
+            return name
+
+        results = gather_probes({name: (lambda name=name: probe(name)) for name in ("node", "uv", "hermes")})
+
+        self.assertEqual(results, {"node": "node", "uv": "uv", "hermes": "hermes"})
+
+
+if __name__ == "__main__":
+    unittest.main()
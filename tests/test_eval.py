@@ -4,14 +4,25 @@ import json
 import pathlib
 import shutil
 import sys
+import tempfile
 import unittest
+from unittest import mock
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
-from grant_agent.eval import summarize_runs
+from grant_agent import eval as eval_module
+from grant_agent.eval import RUN_METRICS_FILENAME, RUN_METRICS_INDEX_FILENAME, summarize_runs
+from grant_agent.session_store import SessionStore
 
 
 class EvalTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # Sessions written by the test are always "recent"; trust their mtimes anyway.
+        patcher = mock.patch.object(eval_module, "RUN_METRICS_RACY_NS", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(eval_module._RUN_METRICS_INDEX_CACHE.clear)
+
     def test_summarize_runs(self) -> None:
         root = pathlib.Path(__file__).resolve().parents[1]
         base = root / ".agent_runs_eval"
@@ -40,6 +51,77 @@ class EvalTests(unittest.TestCase):
         self.assertIn("blocked_commands", metrics)
         self.assertIn("runs_with_checkpoints", metrics)
 
+    def _write_sessions(self, base: pathlib.Path) -> None:
+        store = SessionStore(base)
+        for index in range(4):
+            session = base / f"session_{index:03d}"
+            session.mkdir(parents=True)
+            store.save_state(
+                session,
+                {
+                    "context": {"usage_ratio": 0.25 * index},
+                    "doc_evidence": ["README.md"] if index % 2 else [],
+                    "memory_item_ids": ["mem_1"] if index == 3 else [],
+                    "verification_results": [
+                        {"command": "ok", "return_code": 0},
+                        {"command": "blocked", "status": "blocked", "return_code": 126},
+                    ][: index % 3],
+                },
+            )
+        (base / "session_000" / "handoff_packet_001.json").write_text("{}", encoding="utf-8")
+        (base / "session_nostate").mkdir()
+
+    def test_summarize_runs_reuses_index_for_unchanged_sessions(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = pathlib.Path(temp_dir)
+            self._write_sessions(base)
+            self.assertTrue((base / "session_001" / RUN_METRICS_FILENAME).exists())
+
+            with mock.patch.object(eval_module, "run_metrics_from_state", wraps=eval_module.run_metrics_from_state) as parse:
+                first = summarize_runs(base)
+            parse.assert_not_called()
+            self.assertEqual(
+                first,
+                {
+                    "total_sessions": 5,
+                    "sessions_with_handoff": 1,
+                    "verification_failures": 1,
+                    "verification_commands": 3,
+                    "blocked_commands": 1,
+                    "runs_with_doc_evidence": 2,
+                    "runs_with_memory_writes": 1,
+                    "runs_with_checkpoints": 0,
+                    "average_context_usage_ratio": 0.375,
+                },
+            )
+            self.assertTrue((base / RUN_METRICS_INDEX_FILENAME).exists())
+
+            eval_module._RUN_METRICS_INDEX_CACHE.clear()
+            with mock.patch.object(eval_module, "_scan_session", wraps=eval_module._scan_session) as scan:
+                self.assertEqual(summarize_runs(base), first)
+            scan.assert_not_called()
+
+    def test_summarize_runs_rescans_changed_sessions(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = pathlib.Path(temp_dir)
+            self._write_sessions(base)
+            summarize_runs(base)
+
+            # Edited outside SessionStore, so the recorded metrics are stale and state.json is parsed.
+            (base / "session_002" / "state.json").write_text(
+                json.dumps({"context": {"usage_ratio": 1.0}, "verification_results": [{"command": "x", "return_code": 2}] * 3}),
+                encoding="utf-8",
+            )
+            shutil.rmtree(base / "session_003")
+            with mock.patch.object(eval_module, "_scan_session", wraps=eval_module._scan_session) as scan:
+                metrics = summarize_runs(base)
+            self.assertEqual([call.args[0].name for call in scan.call_args_list], ["session_002"])
+            self.assertEqual(metrics["total_sessions"], 4)
+            self.assertEqual(metrics["verification_commands"], 4)
+            self.assertEqual(metrics["verification_failures"], 3)
+            self.assertEqual(metrics["runs_with_memory_writes"], 0)
+            self.assertEqual(metrics["average_context_usage_ratio"], 0.417)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,7 @@ import pathlib
 import sys
 import tempfile
 import unittest
+from unittest import mock
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
@@ -17,7 +18,12 @@ from grant_agent.fluxio_harness import (
 )
 from grant_agent.models import DelegatedRuntimeSession, ModelRouteConfig, PlannedStep, PlanRevision
 from grant_agent.session_store import SessionStore
-from grant_agent.skill_library import SkillLibrary
+from grant_agent.skill_library import (
+    SkillLibrary,
+    invalidate_codex_home_skill_cache,
+    load_codex_home_skill_rows,
+    load_skill_ledger_rows,
+)
 from grant_agent.skills import SkillRegistry
 from grant_agent.verification import VerificationRunner
 
@@ -120,6 +126,137 @@ class FluxioHarnessTests(unittest.TestCase):
             self.assertTrue(runtime_contract["skills"][0]["output"]["artifactRequired"])
             self.assertIn("attach_proof_to_mission", runtime_contract["skills"][0]["guardrails"])
 
+    def test_skill_library_usage_and_feedback_aggregates_follow_new_records(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            config_dir = root / "config"
+            config_dir.mkdir(parents=True, exist_ok=True)
+            (config_dir / "skills.json").write_text("[]", encoding="utf-8")
+            library = SkillLibrary(root=root, registry=SkillRegistry(config_dir / "skills.json"))
+
+            self.assertEqual(library._usage_summary("repo_scan")["usageCount"], 0)
+            library.record_usage("repo_scan", "Repo Scan", "step_a", "mission_demo", True, "curated")
+            library.record_usage("repo_scan", "Repo Scan", "step_b", "mission_demo", False, "curated")
+            usage = library._usage_summary("repo_scan")
+            self.assertEqual(usage["usageCount"], 2)
+            self.assertEqual(usage["helpedCount"], 1)
+            self.assertEqual(usage["lastUsedAt"], library.usage_records[-1].created_at)
+
+            for failures in ([], ["pytest failed"]):
+                library.record_slice_feedback(
+                    mission_id="mission_demo",
+                    step_id="step_patch",
+                    selected_skills=[{"skillId": "repo_scan", "label": "Repo Scan", "sourceKind": "curated"}],
+                    execution_ok=True,
+                    verification_failures=failures,
+                    changed_files=["src/app.py"],
+                )
+            summary = library._feedback_summary({"skillId": "repo_scan"}, "repo_scan")
+            self.assertEqual(summary["sliceCount"], 2)
+            self.assertIsNotNone(library.feedback_records[-1]["previousSystemLoss"])
+
+            library.feedback_records = library.feedback_records[-1:]
+            self.assertEqual(library._feedback_summary({"skillId": "repo_scan"}, "repo_scan")["sliceCount"], 1)
+
+    def test_skill_usage_and_feedback_append_to_ledgers_and_compact(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            config_dir = root / "config"
+            config_dir.mkdir(parents=True, exist_ok=True)
+            (config_dir / "skills.json").write_text("[]", encoding="utf-8")
+            control_dir = root / ".agent_control"
+            control_dir.mkdir()
+            legacy = [
+                {
+                    "skill_id": "repo_scan",
+                    "label": "Repo Scan",
+                    "step_id": "step_old",
+                    "mission_id": "mission_old",
+                    "helped": True,
+                    "source_kind": "curated",
+                    "created_at": "2026-01-01T00:00:00+00:00",
+                }
+            ]
+            (control_dir / "skill_usage.json").write_text(json.dumps(legacy), encoding="utf-8")
+            registry = SkillRegistry(config_dir / "skills.json")
+            library = SkillLibrary(root=root, registry=registry)
+
+            library.record_usage("repo_scan", "Repo Scan", "step_a", "mission_demo", False, "curated")
+            library.record_usage("repo_scan", "Repo Scan", "step_b", "mission_demo", True, "curated")
+            library.record_slice_feedback(
+                mission_id="mission_demo",
+                step_id="step_patch",
+                selected_skills=[{"skillId": "repo_scan", "label": "Repo Scan", "sourceKind": "curated"}],
+                execution_ok=True,
+                verification_failures=[],
+                changed_files=["src/app.py"],
+            )
+            library.record_slice_feedback(
+                mission_id="mission_demo",
+                step_id="step_verify",
+                selected_skills=[{"skillId": "repo_scan", "label": "Repo Scan", "sourceKind": "curated"}],
+                execution_ok=True,
+                verification_failures=[],
+                changed_files=["src/app.py"],
+            )
+
+            summary = json.loads((control_dir / "skill_usage_summary.json").read_text(encoding="utf-8"))
+            self.assertEqual(summary["skills"]["repo_scan"]["usageCount"], 2)
+            usage_log = (control_dir / "skill_usage_summary.log.jsonl").read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(usage_log), 2)
+            self.assertEqual(len(json.loads((control_dir / "skill_feedback.json").read_text(encoding="utf-8"))), 1)
+            self.assertTrue((control_dir / "skill_feedback.log.jsonl").exists())
+
+            reopened = SkillLibrary(root=root, registry=registry)
+            usage = reopened._usage_summary("repo_scan")
+            self.assertEqual(usage["usageCount"], 3)
+            self.assertEqual(usage["helpedCount"], 2)
+            self.assertEqual(usage["lastUsedAt"], library.usage_records[-1].created_at)
+            self.assertEqual(len(reopened.feedback_records), 2)
+            self.assertEqual(
+                [row["stepId"] for row in load_skill_ledger_rows(control_dir / "skill_feedback.json")],
+                ["step_patch", "step_verify"],
+            )
+
+            with mock.patch("grant_agent.skill_library.SKILL_LEDGER_COMPACT_THRESHOLD", 2):
+                reopened.record_usage("repo_scan", "Repo Scan", "step_c", "mission_demo", False, "curated")
+            self.assertFalse((control_dir / "skill_usage_summary.log.jsonl").exists())
+            self.assertEqual(reopened.usage_records, [])
+            self.assertEqual(SkillLibrary(root=root, registry=registry)._usage_summary("repo_scan")["usageCount"], 4)
+
+    def test_codex_home_skill_rows_are_cached_by_file_signature(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir) / "repo"
+            control_dir = root / ".agent_control"
+            control_dir.mkdir(parents=True)
+            (control_dir / "workspaces.json").write_text("[]", encoding="utf-8")
+            home = pathlib.Path(temp_dir) / "home"
+            skill_path = home / ".codex" / "skills" / "alpha-skill" / "SKILL.md"
+            skill_path.parent.mkdir(parents=True)
+            skill_path.write_text("---\ndescription: First pass\n---\n# Alpha\n", encoding="utf-8")
+
+            with mock.patch.object(pathlib.Path, "home", return_value=home):
+                invalidate_codex_home_skill_cache()
+                rows = load_codex_home_skill_rows(control_dir)
+                self.assertEqual([row["description"] for row in rows], ["First pass"])
+                self.assertTrue((control_dir / "cache" / "codex_home_skills.json").exists())
+                rows[0]["tags"].append("mutated")
+
+                with mock.patch(
+                    "grant_agent.skill_library._codex_home_skill_row",
+                    side_effect=AssertionError("SKILL.md re-parsed"),
+                ):
+                    warm = load_codex_home_skill_rows(control_dir)
+                    invalidate_codex_home_skill_cache()
+                    cold = load_codex_home_skill_rows(control_dir)
+                self.assertNotIn("mutated", warm[0]["tags"])
+                self.assertEqual(cold[0]["description"], "First pass")
+
+                skill_path.write_text("---\ndescription: Edited from the Skills page\n---\n", encoding="utf-8")
+                invalidate_codex_home_skill_cache(skill_path)
+                edited = load_codex_home_skill_rows(control_dir)
+                self.assertEqual(edited[0]["description"], "Edited from the Skills page")
+
     def test_skill_retrieval_uses_slice_loss_to_route_away_from_repair_skills(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = pathlib.Path(temp_dir)
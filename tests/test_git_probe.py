@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import pathlib
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from grant_agent.git_probe import (
+    git_changed_files,
+    invalidate_git_status,
+    locate_git_dir,
+    parse_porcelain_v2,
+    read_git_remotes,
+    read_git_status,
+)
+
+
+def _git(repo: pathlib.Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True, text=True)
+
+
+class GitProbeParsingTests(unittest.TestCase):
+    def test_parse_porcelain_v2_counts_entries_and_branch_headers(self) -> None:
+        output = "\0".join(
+            [
+                "# branch.oid 0123456789abcdef0123456789abcdef01234567",
+                "# branch.head main",
+                "# branch.upstream origin/main",
+                "# branch.ab +2 -3",
+                "1 M. N... 100644 100644 100644 aaaa bbbb src/app.py",
+                "1 .M N... 100644 100644 100644 aaaa bbbb docs/with space.md",
+                "2 R. N... 100644 100644 100644 aaaa bbbb R100 new_name.py",
+                "old_name.py",
+                "u UU N... 100644 100644 100644 100644 aaaa bbbb cccc conflict.txt",
+                "? notes.txt",
+                "",
+            ]
+        )
+
+        status = parse_porcelain_v2(output)
+
+        self.assertEqual(status["branch"], "main")
+        self.assertEqual(status["trackingBranch"], "origin/main")
+        self.assertEqual((status["ahead"], status["behind"]), (2, 3))
+        self.assertEqual(
+            status["changedFiles"],
+            ["src/app.py", "docs/with space.md", "new_name.py", "conflict.txt", "notes.txt"],
+        )
+        self.assertEqual(
+            (status["stagedCount"], status["unstagedCount"], status["untrackedCount"]),
+            (3, 2, 1),
+        )
+
+    def test_parse_porcelain_v2_reports_detached_head(self) -> None:
+        status = parse_porcelain_v2("# branch.oid abc\0# branch.head (detached)\0")
+
+        self.assertEqual(status["branch"], "HEAD (no branch)")
+        self.assertEqual(status["trackingBranch"], "")
+
+    def test_read_git_remotes_prefers_pushurl_and_skips_other_sections(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            config = pathlib.Path(tmp) / "config"
+            config.write_text(
+                "[core]\n"
+                "\turl = not-a-remote\n"
+                '[remote "origin"]\n'
+                "\turl = https://github.com/example/demo.git\n"
+                "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+                '[remote "mirror"]\n'
+                "\turl = https://example.com/read.git\n"
+                "\tpushurl = ssh://example.com/write.git\n"
+                '[branch "main"]\n'
+                "\tremote = origin\n",
+                encoding="utf-8",
+            )
+
+            remotes = read_git_remotes(config)
+
+        self.assertEqual(
+            remotes,
+            [
+                {"name": "origin", "url": "https://github.com/example/demo.git"},
+                {"name": "mirror", "url": "ssh://example.com/write.git"},
+            ],
+        )
+
+
+@unittest.skipUnless(shutil.which("git"), "git is required for git probe tests")
+class GitProbeRepositoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        invalidate_git_status()
+        self.addCleanup(invalidate_git_status)
+
+    def test_status_uses_one_process_and_serves_unchanged_repo_from_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = pathlib.Path(tmp) / "repo"
+            repo.mkdir()
+            _git(repo, "init", "-q")
+            _git(repo, "remote", "add", "origin", "https://github.com/example/demo.git")
+            (repo / "app.py").write_text("print('hi')\n", encoding="utf-8")
+
+            first, first_state = read_git_status(repo)
+            second, second_state = read_git_status(repo)
+
+            self.assertTrue(first["repoDetected"])
+            self.assertEqual((first_state, first["processCount"]), ("miss", 1))
+            self.assertEqual((second_state, second["processCount"]), ("hit", 0))
+            self.assertEqual(first["changedFiles"], ["app.py"])
+            self.assertEqual(first["remotes"], [{"name": "origin", "url": "https://github.com/example/demo.git"}])
+
+            (repo / "second.py").write_text("x = 1\n", encoding="utf-8")
+            self.assertEqual(read_git_status(repo)[0]["changedFiles"], ["app.py"])
+            self.assertEqual(git_changed_files(repo), ["app.py", "second.py"])
+
+    def test_worktree_pointer_resolves_shared_config(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = pathlib.Path(tmp) / "repo"
+            repo.mkdir()
+            _git(repo, "init", "-q")
+            _git(repo, "-c", "user.email=dev@example.com", "-c", "user.name=Dev", "commit", "-q", "--allow-empty", "-m", "init")
+            _git(repo, "remote", "add", "origin", "https://example.com/demo.git")
+            worktree = pathlib.Path(tmp) / "feature"
+            _git(repo, "worktree", "add", "-q", "-b", "feature", str(worktree))
+
+            git_dir, common_dir = locate_git_dir(worktree)
+            status, _ = read_git_status(worktree)
+
+            self.assertNotEqual(git_dir, common_dir)
+            self.assertEqual(common_dir, (repo / ".git").resolve())
+            self.assertEqual(status["branch"], "feature")
+            self.assertEqual(status["remotes"], [{"name": "origin", "url": "https://example.com/demo.git"}])
+
+    def test_non_repository_is_uncached(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            status, state = read_git_status(pathlib.Path(tmp))
+
+        self.assertFalse(status["repoDetected"])
+        self.assertEqual(state, "uncached")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from grant_agent.json_cache import JsonFileCache
+
+
+class JsonFileCacheTests(unittest.TestCase):
+    def _write(self, path: pathlib.Path, payload: object) -> pathlib.Path:
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        return path
+
+    def test_evicts_least_recently_used_entry_by_count(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            cache = JsonFileCache(max_bytes=1_000_000, max_items=2)
+            first = self._write(root / "first.json", [1])
+            second = self._write(root / "second.json", [2])
+            third = self._write(root / "third.json", [3])
+
+            cache.load(first, [])
+            cache.load(second, [])
+            cache.load(first, [])
+            cache.load(third, [])
+            cache.load(first, [])
+            cache.load(second, [])
+
+            stats = cache.stats()
+            self.assertEqual(stats["entries"], 2)
+            self.assertEqual(stats["evictions"], 2)
+            self.assertEqual((stats["hits"], stats["misses"]), (2, 4))
+
+    def test_byte_budget_bounds_cache_and_skips_oversized_payloads(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            cache = JsonFileCache(max_bytes=400, max_items=10)
+            small = [self._write(root / f"small_{index}.json", ["x" * 100]) for index in range(4)]
+            large = self._write(root / "large.json", ["y" * 1000])
+
+            for path in small:
+                cache.load(path, [])
+            self.assertLessEqual(cache.stats()["bytes"], 400)
+            self.assertGreater(cache.stats()["evictions"], 0)
+
+            self.assertEqual(cache.load(large, []), ["y" * 1000])
+            self.assertNotIn(str(large.resolve()), cache._entries)
+
+    def test_returns_private_copies_and_revalidates_on_change(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write(pathlib.Path(temp_dir) / "state.json", {"items": [1, 2]})
+            cache = JsonFileCache(max_bytes=1_000_000, max_items=4)
+
+            payload = cache.load(path, {})
+            payload["items"].append(3)
+            self.assertEqual(cache.load(path, {}), {"items": [1, 2]})
+
+            self._write(path, {"items": [1, 2, 3, 4]})
+            self.assertEqual(cache.load(path, {}), {"items": [1, 2, 3, 4]})
+            cache.invalidate(path)
+            self.assertEqual(cache.stats()["entries"], 0)
+            self.assertEqual(cache.load(pathlib.Path(temp_dir) / "missing.json", []), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
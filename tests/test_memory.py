@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import json
 import pathlib
+import random
 import sys
+import tempfile
 import unittest
+from unittest import mock
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
-from grant_agent.memory import MemoryStore, ingest_state_into_memory
+from grant_agent import memory as memory_module
+from grant_agent.memory import MemoryStore, _tokens, ingest_state_into_memory
+
+
+def _linear_search(items: list, query: str, limit: int) -> list:
+    """The pre-index scan, kept as the parity reference."""
+    query_tokens = _tokens(query)
+
+    def overlap(item) -> int:
+        return len(query_tokens & _tokens(item.content + " " + " ".join(item.tags) + " " + item.objective))
+
+    ranked = sorted(items, key=lambda item: (overlap(item), len(item.tags)), reverse=True)
+    return [item for item in ranked if overlap(item) > 0][:limit]
 
 
 class MemoryTests(unittest.TestCase):
@@ -43,6 +59,102 @@ class MemoryTests(unittest.TestCase):
         inserted = ingest_state_into_memory(store, "session_y", state)
         self.assertGreaterEqual(len(inserted), 3)
 
+    def _populated_store(self, path: pathlib.Path, count: int = 300) -> MemoryStore:
+        rng = random.Random(7)
+        words = ["verify", "tests", "budget", "cache", "deploy", "risk", "replay", "index", "nas", "git"]
+        store = MemoryStore(path)
+        for index in range(count):
+            item = store.add(
+                source_session_id=f"session_{index % 5}",
+                objective=" ".join(rng.sample(words, 2)),
+                content=" ".join(rng.choices(words, k=rng.randint(1, 6))),
+                tags=rng.sample(["decision", "risk", "resume", "safety"], rng.randint(0, 3)),
+                kind="note",
+            )
+            item.created_at = f"2026-10-01T00:{index // 60:02d}:{index % 60:02d}+00:00"
+        return store
+
+    def test_search_matches_linear_scan_overlap_tiers(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = self._populated_store(pathlib.Path(temp_dir) / "memory.json")
+
+            for query in ["verify tests", "budget cache deploy", "nas", "git replay index risk", "unknown"]:
+                indexed = store.search(query, limit=len(store.items))
+                linear = _linear_search(store.items, query, len(store.items)) or store.recent(len(store.items))
+                query_tokens = _tokens(query)
+
+                def overlap(item) -> int:
+                    return len(query_tokens & _tokens(item.content + " " + " ".join(item.tags) + " " + item.objective))
+
+                self.assertEqual({item.id for item in indexed}, {item.id for item in linear}, query)
+                self.assertEqual([overlap(item) for item in indexed], [overlap(item) for item in linear], query)
+
+    def test_recent_matches_full_sort(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = self._populated_store(pathlib.Path(temp_dir) / "memory.json", count=120)
+            store.items[5].created_at = store.items[90].created_at
+
+            expected = sorted(store.items, key=lambda item: item.created_at, reverse=True)[:25]
+
+            self.assertEqual([item.id for item in store.recent(25)], [item.id for item in expected])
+            self.assertEqual(store.search("", limit=25), store.recent(25))
+
+    def test_inserts_append_to_log_and_compact_into_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = pathlib.Path(temp_dir) / "memory.json"
+            store = MemoryStore(path)
+            first = store.add("s", "Objective", "first note", ["decision"], "decision")
+            store.add("s", "Objective", "second note", ["risk"], "risk")
+
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8")), [])
+            self.assertEqual(len(store.log_path.read_text(encoding="utf-8").splitlines()), 3)
+            memory_module._MEMORY_CORPUS_CACHE.clear()
+            reloaded = MemoryStore(path)
+            self.assertEqual([item.id for item in reloaded.items], [first.id, store.items[1].id])
+
+            with mock.patch.object(memory_module, "MEMORY_LOG_COMPACT_THRESHOLD", 3):
+                reloaded.add("s", "Objective", "third note", ["resume"], "next_action")
+
+            self.assertFalse(reloaded.log_path.exists())
+            self.assertEqual(len(json.loads(path.read_text(encoding="utf-8"))), 3)
+            self.assertEqual(reloaded.search("third")[0].content, "third note")
+
+    def test_log_is_ignored_after_snapshot_is_deleted(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = pathlib.Path(temp_dir) / "memory.json"
+            MemoryStore(path).add("s", "Objective", "stale note", ["decision"], "decision")
+            path.unlink()
+
+            fresh = MemoryStore(path)
+            self.assertEqual(fresh.items, [])
+            fresh.add("s", "Objective", "fresh note", ["decision"], "decision")
+            memory_module._MEMORY_CORPUS_CACHE.clear()
+
+            self.assertEqual([item.content for item in MemoryStore(path).items], ["fresh note"])
+
+
+    def test_fresh_process_reuses_persisted_snapshot_index(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = pathlib.Path(temp_dir) / "memory.json"
+            store = self._populated_store(path, count=60)
+            store.save()
+            expected = [item.id for item in store.search("verify budget", limit=10)]
+            self.assertTrue(store.index_path.exists())
+
+            memory_module._MEMORY_CORPUS_CACHE.clear()
+            with mock.patch.object(memory_module._MemoryIndex, "add", side_effect=AssertionError("rebuilt")):
+                reopened = [item.id for item in MemoryStore(path).search("verify budget", limit=10)]
+            self.assertEqual(reopened, expected)
+
+            memory_module._MEMORY_CORPUS_CACHE.clear()
+            logged = MemoryStore(path)
+            logged.add("s", "Objective", "zeppelin note", ["decision"], "decision")
+            self.assertEqual(logged.search("zeppelin")[0].content, "zeppelin note")
+
+            snapshot = json.loads(path.read_text(encoding="utf-8"))
+            path.write_text(json.dumps([snapshot[0] | {"content": "replaced"}]), encoding="utf-8")
+            memory_module._MEMORY_CORPUS_CACHE.clear()
+            self.assertEqual(MemoryStore(path).search("replaced")[0].content, "replaced")
 
 if __name__ == "__main__":
     unittest.main()
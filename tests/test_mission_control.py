@@ -8,6 +8,7 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import time
 import unittest
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
@@ -17,6 +18,8 @@ sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
 from grant_agent.cli import cmd_mission_follow_up, cmd_workspace_delete
 from grant_agent import mission_control as mission_control_module
+from grant_agent.git_probe import invalidate_git_status
+from grant_agent.mission_store import ShardedMissionStore
 from grant_agent.mission_control import (
     ControlRoomStore,
     ROUTE_TRUST_SAMPLE_TEMPLATES,
@@ -158,11 +161,14 @@ class MissionControlTests(unittest.TestCase):
                 wraps=mission_control_module.json.loads,
             ) as loads:
                 first = store._load_json(path, [])
+                first[0]["value"] = "mutated by caller"
                 second = store._load_json(path, [])
 
-            self.assertEqual(first, [{"value": 1}])
-            self.assertIs(first, second)
+            self.assertEqual(second, [{"value": 1}])
+            self.assertIsNot(first, second)
             self.assertEqual(loads.call_count, 1)
+            stats = mission_control_module._CONTROL_ROOM_JSON_CACHE.stats()
+            self.assertEqual((stats["hits"] >= 1, stats["entries"]), (True, 1))
 
     def test_control_room_json_loader_invalidates_after_write(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -175,6 +181,219 @@ class MissionControlTests(unittest.TestCase):
 
             self.assertEqual(store._load_json(path, []), [{"value": 2}])
 
+    def test_load_missions_reuses_materialized_missions_across_stores(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            (root / "README.md").write_text("# Demo\n", encoding="utf-8")
+            store = ControlRoomStore(root)
+            workspace = store.load_workspaces()[0]
+            created = store.create_mission(
+                workspace_id=workspace.workspace_id,
+                runtime_id="openclaw",
+                objective="Tighten docs/guide.md wording",
+                success_checks=[],
+                mode="Autopilot",
+                verification_commands=[],
+                max_runtime_seconds=3600,
+            )
+            self.assertEqual(len(store.load_missions()), 1)
+
+            with mock.patch.object(
+                mission_control_module,
+                "infer_planned_file_scope",
+                side_effect=AssertionError("mission re-normalized"),
+            ):
+                first = ControlRoomStore(root).load_missions()[0]
+                first.state.status = "mutated by caller"
+                first.action_history.append({"kind": "local"})
+                second = ControlRoomStore(root).get_mission(created.mission_id)
+
+            self.assertIsNot(first, second)
+            self.assertNotEqual(second.state.status, "mutated by caller")
+            self.assertEqual(second.action_history, [])
+            self.assertEqual(second.planned_file_scope, created.planned_file_scope)
+
+            second.title = "Renamed"
+            store.update_mission(second)
+            self.assertEqual(ControlRoomStore(root).get_mission(created.mission_id).title, "Renamed")
+
+    def test_sharded_mission_store_migrates_legacy_missions_file(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            (root / "README.md").write_text("# Demo\n", encoding="utf-8")
+            store = ControlRoomStore(root)
+            workspace = store.load_workspaces()[0]
+            first = store.create_mission(
+                workspace_id=workspace.workspace_id,
+                runtime_id="openclaw",
+                objective="First mission owns the workspace",
+                success_checks=[],
+                mode="Autopilot",
+                verification_commands=[],
+                max_runtime_seconds=3600,
+            )
+            second = store.create_mission(
+                workspace_id=workspace.workspace_id,
+                runtime_id="hermes",
+                objective="Second mission should queue",
+                success_checks=[],
+                mode="Autopilot",
+                verification_commands=[],
+                max_runtime_seconds=3600,
+            )
+
+            migrated = ControlRoomStore(root).migrate_missions_to_shards()
+
+            sharded = ControlRoomStore(root)
+            self.assertEqual(migrated, 2)
+            self.assertFalse(sharded.missions_path.exists())
+            self.assertEqual(
+                [item.mission_id for item in sharded.load_missions()],
+                [first.mission_id, second.mission_id],
+            )
+            index_rows = sharded.mission_shards.load_index()
+            self.assertEqual(index_rows[1]["queue_position"], 1)
+            self.assertEqual(index_rows[1]["status"], "queued")
+            self.assertEqual(
+                [row["mission_id"] for row in mission_control_module.load_mission_payloads(sharded.control_dir)],
+                [first.mission_id, second.mission_id],
+            )
+
+    def test_sharded_mission_update_rewrites_only_one_shard(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            (root / "README.md").write_text("# Demo\n", encoding="utf-8")
+            with mock.patch.dict(os.environ, {"FLUXIO_MISSION_STORE": "sharded"}):
+                store = ControlRoomStore(root)
+                workspace = store.load_workspaces()[0]
+                missions = [
+                    store.create_mission(
+                        workspace_id=workspace.workspace_id,
+                        runtime_id="hermes",
+                        objective=f"Sharded mission {index}",
+                        success_checks=[],
+                        mode="Autopilot",
+                        verification_commands=[],
+                        max_runtime_seconds=3600,
+                    )
+                    for index in range(3)
+                ]
+            untouched = store.mission_shards.shard_path(missions[1].mission_id)
+            untouched_mtime = untouched.stat().st_mtime_ns
+
+            target = store.get_mission(missions[2].mission_id)
+            target.state.status = "paused"
+            with mock.patch.object(store, "load_missions", side_effect=AssertionError("full load")):
+                store.update_mission(target)
+                reloaded = store.get_mission(missions[2].mission_id)
+
+            self.assertFalse(store.missions_path.exists())
+            self.assertEqual(reloaded.state.status, "paused")
+            self.assertEqual(untouched.stat().st_mtime_ns, untouched_mtime)
+            self.assertEqual(store.mission_shards.load_index()[2]["status"], "paused")
+
+    def test_sharded_mission_store_removes_shards_for_deleted_missions(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            store = ControlRoomStore(root)
+            store.migrate_missions_to_shards()
+            workspace = store.load_workspaces()[0]
+            kept = store.create_mission(
+                workspace_id=workspace.workspace_id,
+                runtime_id="hermes",
+                objective="Keep this mission",
+                success_checks=[],
+                mode="Autopilot",
+                verification_commands=[],
+                max_runtime_seconds=3600,
+            )
+            dropped = store.create_mission(
+                workspace_id=workspace.workspace_id,
+                runtime_id="hermes",
+                objective="Drop this mission",
+                success_checks=[],
+                mode="Autopilot",
+                verification_commands=[],
+                max_runtime_seconds=3600,
+            )
+
+            store.save_missions([store.get_mission(kept.mission_id)])
+
+            self.assertFalse(store.mission_shards.shard_path(dropped.mission_id).exists())
+            self.assertEqual([item.mission_id for item in store.load_missions()], [kept.mission_id])
+
+    def test_sharded_mission_store_returns_private_copies_of_cached_shards(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            control_dir = pathlib.Path(temp_dir)
+            shards = ShardedMissionStore(control_dir)
+            shards.write_one({"mission_id": "m1", "escalation_policy": {"destination": "ops"}, "state": {}})
+
+            shards.load_one("m1")["escalation_policy"]["destination"] = "LEAKED"
+            shards.load_all()[0]["escalation_policy"]["destination"] = "LEAKED"
+
+            fresh = ShardedMissionStore(control_dir).load_one("m1")
+            self.assertEqual(fresh["escalation_policy"], {"destination": "ops"})
+
+    def test_mission_event_index_pages_quiet_mission_behind_busy_tail(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            store = ControlRoomStore(root)
+            store.append_event(MissionEvent(mission_id="mission_quiet", kind="mission.created", message="quiet"))
+            store.append_event(
+                MissionEvent(mission_id="mission_quiet", kind="mission.runtime_cycle", message="cycle")
+            )
+            for index in range(700):
+                store.append_event(
+                    MissionEvent(mission_id="mission_busy", kind="runtime.output", message=f"line {index}")
+                )
+
+            self.assertEqual(
+                [item["mission_id"] for item in store.recent_events(limit=600)].count("mission_quiet"),
+                0,
+            )
+            quiet_events = store.mission_events("mission_quiet", limit=10)
+            self.assertEqual([item["kind"] for item in quiet_events], ["mission.runtime_cycle", "mission.created"])
+            self.assertEqual(store._mission_event_count("mission_busy"), 700)
+            self.assertEqual(
+                store.event_index.latest_runtime_cycle("mission_quiet")["message"],
+                "cycle",
+            )
+            self.assertIn(
+                "mission_quiet",
+                mission_control_module._latest_runtime_cycles_by_mission(store.events_path),
+            )
+
+    def test_mission_event_index_catches_up_external_appends_and_rotation(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            store = ControlRoomStore(root)
+            for index in range(150):
+                store.append_event(
+                    MissionEvent(mission_id=f"mission_{index % 3}", kind="mission.note", message=str(index))
+                )
+            self.assertEqual(store._mission_event_count("mission_0"), 50)
+            with store.events_path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps({"mission_id": "mission_0", "kind": "mission.runtime_cycle"}) + "\n")
+
+            self.assertEqual(store._mission_event_count("mission_0"), 51)
+
+            with mock.patch.dict(
+                os.environ,
+                {
+                    "SYNTELOS_MISSION_EVENTS_MAX_BYTES": "1",
+                    "SYNTELOS_MISSION_EVENTS_KEEP_LINES": "100",
+                },
+            ):
+                with store.events_path.open("a", encoding="utf-8") as handle:
+                    handle.write(json.dumps({"kind": "padding", "message": "x" * (1024 * 1024)}) + "\n")
+                store.append_event(MissionEvent(mission_id="mission_1", kind="mission.note", message="after"))
+
+            kept = store.events_path.read_text(encoding="utf-8").splitlines()
+            expected = sum(1 for line in kept if '"mission_1"' in line)
+            self.assertLess(len(kept), 152)
+            self.assertEqual(store._mission_event_count("mission_1"), expected)
+            self.assertEqual(store.mission_events("mission_1", limit=1)[0]["message"], "after")
+
     def test_missing_mission_row_recovers_from_live_autonomous_workflow(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = pathlib.Path(temp_dir)
@@ -1763,6 +1982,85 @@ Run available tests/build/smoke checks and record proof artifacts.
                 "target-version\n",
             )
 
+    def test_sync_project_tree_manifest_skips_unchanged_pairs_and_prunes_quiet_dirs(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            source = root / "source"
+            target = root / "target"
+            manifest_dir = root / "manifests"
+            (source / "pkg" / "deep").mkdir(parents=True)
+            (source / "README.md").write_text("readme\n", encoding="utf-8")
+            (source / "pkg" / "module.py").write_text("x = 1\n", encoding="utf-8")
+            (source / "pkg" / "deep" / "data.txt").write_text("data\n", encoding="utf-8")
+
+            def age_tree(path: pathlib.Path) -> None:
+                for item in [path, *path.rglob("*")]:
+                    os.utime(item, (1_700_000_000, 1_700_000_000))
+
+            age_tree(source)
+            # Record the passes as if they finished a while ago so their own
+            # directory writes fall outside the racy-timestamp window.
+            later_ns = time.time_ns() + 10_000_000_000
+            with mock.patch("grant_agent.mission_control.time.time_ns", return_value=later_ns):
+                first = _sync_project_tree(
+                    source, target, conflict_policy="keep_newer_and_log", manifest_dir=manifest_dir
+                )
+                with mock.patch("grant_agent.mission_control.shutil.copy2") as copy2:
+                    second = _sync_project_tree(
+                        source, target, conflict_policy="keep_newer_and_log", manifest_dir=manifest_dir
+                    )
+
+            self.assertEqual(first["filesCopied"], 3)
+            self.assertTrue(first["syncManifest"]["fullScan"])
+            copy2.assert_not_called()
+            self.assertEqual((second["filesCopied"], second["filesSkipped"]), (0, 3))
+            self.assertFalse(second["syncManifest"]["fullScan"])
+            self.assertEqual(second["syncManifest"]["dirsPruned"], 3)
+            self.assertEqual(second["syncManifest"]["filesChecked"], 0)
+
+            (source / "pkg" / "deep" / "new.txt").write_text("new\n", encoding="utf-8")
+            third = _sync_project_tree(
+                source, target, conflict_policy="keep_newer_and_log", manifest_dir=manifest_dir
+            )
+
+            self.assertEqual(third["filesCopied"], 1)
+            self.assertEqual(third["syncManifest"]["dirsScanned"], 1)
+            self.assertEqual((target / "pkg" / "deep" / "new.txt").read_text(encoding="utf-8"), "new\n")
+
+            # In-place edits leave the directory mtime alone but are still copied.
+            (source / "pkg" / "module.py").write_text("x = 2\n", encoding="utf-8")
+            fourth = _sync_project_tree(
+                source, target, conflict_policy="keep_newer_and_log", manifest_dir=manifest_dir
+            )
+
+            self.assertEqual(fourth["filesCopied"], 1)
+            self.assertEqual((target / "pkg" / "module.py").read_text(encoding="utf-8"), "x = 2\n")
+
+    def test_sync_project_tree_manifest_keeps_reporting_unresolved_conflicts(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            source = root / "source"
+            target = root / "target"
+            source.mkdir()
+            target.mkdir()
+            (source / "shared.txt").write_text("source-version-longer\n", encoding="utf-8")
+            (target / "shared.txt").write_text("target-version\n", encoding="utf-8")
+            for item in (source, target, source / "shared.txt", target / "shared.txt"):
+                os.utime(item, (1_700_000_000, 1_700_000_000))
+
+            passes = [
+                _sync_project_tree(
+                    source, target, conflict_policy="manual_review", manifest_dir=root / "manifests"
+                )
+                for _ in range(2)
+            ]
+
+            for status in passes:
+                self.assertTrue(status["manualReviewRequired"])
+                self.assertEqual(status["conflictsDetected"], 1)
+            self.assertEqual(passes[1]["syncManifest"]["dirsPruned"], 0)
+            self.assertEqual((target / "shared.txt").read_text(encoding="utf-8"), "target-version\n")
+
     def test_resolve_workspace_sync_conflict_records_resolution_receipt(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = pathlib.Path(temp_dir)
@@ -2521,6 +2819,46 @@ Run available tests/build/smoke checks and record proof artifacts.
             self.assertEqual(progress["remainingSeconds"], 25)
             self.assertIn("Extend the runtime budget", progress["nextAction"])
 
+    def test_summary_snapshot_shares_one_memo_across_builders(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            (root / "README.md").write_text("# Demo\n", encoding="utf-8")
+            store = ControlRoomStore(root)
+            workspace = store.load_workspaces()[0]
+            mission = store.create_mission(
+                workspace_id=workspace.workspace_id,
+                runtime_id="openclaw",
+                objective="Tighten docs/guide.md wording",
+                success_checks=[],
+                mode="Autopilot",
+                verification_commands=[],
+                max_runtime_seconds=3600,
+            )
+            store.append_event(
+                MissionEvent(mission_id=mission.mission_id, kind="mission.note", message="Memo check")
+            )
+            real_auth_scan = mission_control_module._scan_provider_auth_presence
+            real_trends_scan = mission_control_module._scan_route_outcome_trends_for_trust
+            with mock.patch.object(
+                mission_control_module,
+                "_scan_provider_auth_presence",
+                wraps=real_auth_scan,
+            ) as auth_scan, mock.patch.object(
+                mission_control_module,
+                "_scan_route_outcome_trends_for_trust",
+                wraps=real_trends_scan,
+            ) as trends_scan:
+                snapshot = store.build_summary_snapshot()
+                store.build_summary_snapshot()
+
+            self.assertEqual(auth_scan.call_count, 2)
+            self.assertLessEqual(trends_scan.call_count, 2)
+            memo = snapshot["performance"]["snapshotMemo"]
+            self.assertGreater(memo["hits"], 0)
+            self.assertIn("recent_events", memo["hitsByKey"])
+            self.assertTrue(snapshot["performance"]["sectionDurations"])
+            self.assertIsNone(mission_control_module.active_snapshot_memo())
+
     def test_summary_snapshot_is_lightweight_and_notification_ready(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = pathlib.Path(temp_dir)
@@ -7010,6 +7348,46 @@ Run available tests/build/smoke checks and record proof artifacts.
                 "inspect_repo_state",
             )
 
+    @unittest.skipUnless(shutil.which("git"), "git is required for workspace git cache tests")
+    def test_workspace_git_snapshot_cache_tracks_index_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = pathlib.Path(tmp)
+            subprocess.run(["git", "init", "-q", str(repo)], check=True)
+            (repo / "app.py").write_text("print('hi')\n", encoding="utf-8")
+            invalidate_git_status()
+
+            first, first_state = mission_control_module._cached_workspace_git_snapshot(repo)
+            first["changedFiles"].append("mutated-by-caller.py")
+            second, second_state = mission_control_module._cached_workspace_git_snapshot(repo)
+            subprocess.run(["git", "-C", str(repo), "add", "app.py"], check=True)
+            third, third_state = mission_control_module._cached_workspace_git_snapshot(repo)
+
+            self.assertEqual([first_state, second_state, third_state], ["miss", "hit", "miss"])
+            self.assertEqual(second["changedFiles"], ["app.py"])
+            self.assertEqual((second["untrackedCount"], third["stagedCount"]), (1, 1))
+            invalidate_git_status()
+
+    def test_probe_workspaces_keeps_order_and_reports_timings(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            store = ControlRoomStore(root)
+            for name in ("alpha", "beta", "gamma"):
+                folder = root / name
+                folder.mkdir()
+                store.upsert_workspace(name=name, root_path=str(folder), default_runtime="openhands")
+            invalidate_git_status()
+
+            with mock.patch.dict(os.environ, {"FLUXIO_WORKSPACE_PROBE_WORKERS": "3"}):
+                snapshot = store.build_snapshot()
+
+            probe = snapshot["performance"]["workspaceProbe"]
+            self.assertEqual(probe["workers"], 3)
+            self.assertEqual(
+                [item["workspaceId"] for item in probe["workspaces"]],
+                [item["workspace_id"] for item in snapshot["workspaces"]],
+            )
+            self.assertTrue(all(item["gitCache"] == "uncached" for item in probe["workspaces"]))
+
     def test_build_git_actions_includes_pull_for_tracked_branch(self) -> None:
         actions = _build_git_actions(
             {
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from grant_agent.mission_stream import (
+    MissionEventTail,
+    format_sse,
+    parse_stream_cursor,
+    stream_mission_events,
+)
+
+
+def _write_mission(control_dir: pathlib.Path, status: str, sessions: list[dict]) -> None:
+    control_dir.mkdir(parents=True, exist_ok=True)
+    (control_dir / "missions.json").write_text(
+        json.dumps(
+            [
+                {
+                    "mission_id": "mission_a",
+                    "state": {"status": status, "delegated_runtime_sessions": sessions},
+                }
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+def _append(path: pathlib.Path, *events: dict) -> None:
+    with path.open("a", encoding="utf-8") as handle:
+        for event in events:
+            handle.write(json.dumps(event) + "\n")
+
+
+def _sse_frames(raw: bytes) -> list[dict]:
+    frames = []
+    for block in raw.decode("utf-8").split("\n\n"):
+        fields: dict[str, str] = {}
+        for line in block.splitlines():
+            key, _, value = line.partition(": ")
+            if key in {"id", "event", "data"}:
+                fields[key] = value
+        if "event" in fields:
+            frames.append(fields)
+    return frames
+
+
+class MissionStreamTests(unittest.TestCase):
+    def test_tail_starts_at_end_and_filters_other_missions(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            control_dir = root / ".agent_control"
+            _write_mission(control_dir, "running", [])
+            events_path = control_dir / "mission_events.jsonl"
+            _append(events_path, {"mission_id": "mission_a", "kind": "mission.created"})
+
+            tail = MissionEventTail(root, "mission_a")
+            tail.start()
+            self.assertEqual(tail.poll(), [])
+
+            _append(
+                events_path,
+                {"mission_id": "mission_b", "kind": "mission.created"},
+                {"mission_id": "mission_a", "kind": "mission.runtime_cycle"},
+            )
+            emitted = tail.poll()
+
+            self.assertEqual([payload["event"]["kind"] for _, payload in emitted], ["mission.runtime_cycle"])
+            self.assertEqual(parse_stream_cursor(emitted[-1][0])["mission"], events_path.stat().st_size)
+
+    def test_resume_cursor_replays_only_unseen_lines_and_new_sessions(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            control_dir = root / ".agent_control"
+            _write_mission(control_dir, "running", [])
+            events_path = control_dir / "mission_events.jsonl"
+            _append(events_path, {"mission_id": "mission_a", "kind": "seen"})
+            first = MissionEventTail(root, "mission_a")
+            first.start()
+            cursor = first.cursor()
+
+            session_events = control_dir / "delegate_1234.events.jsonl"
+            _append(session_events, {"kind": "session.queued"}, {"kind": "runtime.output"})
+            _write_mission(
+                control_dir,
+                "running",
+                [{"delegated_id": "delegate_1234", "events_path": str(session_events)}],
+            )
+            _append(events_path, {"mission_id": "mission_a", "kind": "unseen"})
+
+            resumed = MissionEventTail(root, "mission_a", cursor)
+            resumed.start()
+            emitted = [payload for _, payload in resumed.poll()]
+
+            self.assertEqual(
+                [(item["source"], item["event"]["kind"]) for item in emitted],
+                [
+                    ("mission", "unseen"),
+                    ("delegated_session", "session.queued"),
+                    ("delegated_session", "runtime.output"),
+                ],
+            )
+
+    def test_rotated_log_skips_retained_lines_and_accepts_camel_case_ids(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            control_dir = root / ".agent_control"
+            _write_mission(control_dir, "running", [])
+            events_path = control_dir / "mission_events.jsonl"
+            _append(
+                events_path,
+                *({"mission_id": "mission_a", "kind": f"old_{index}", "padding": "x" * 40} for index in range(4)),
+                {"mission_id": "mission_a", "kind": "retained"},
+            )
+            tail = MissionEventTail(root, "mission_a")
+            tail.start()
+
+            events_path.write_text(json.dumps({"mission_id": "mission_a", "kind": "retained"}) + "\n", encoding="utf-8")
+            self.assertEqual(tail.poll(), [])
+            self.assertEqual(parse_stream_cursor(tail.cursor())["mission"], events_path.stat().st_size)
+
+            _append(events_path, {"missionId": "mission_a", "kind": "after_rotation"})
+            self.assertEqual([payload["event"]["kind"] for _, payload in tail.poll()], ["after_rotation"])
+
+    def test_partial_lines_wait_for_the_newline(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            control_dir = root / ".agent_control"
+            _write_mission(control_dir, "running", [])
+            events_path = control_dir / "mission_events.jsonl"
+            events_path.write_text("", encoding="utf-8")
+            tail = MissionEventTail(root, "mission_a")
+            tail.start()
+
+            with events_path.open("a", encoding="utf-8") as handle:
+                handle.write('{"mission_id": "mission_a", "kind": "half"')
+            self.assertEqual(tail.poll(), [])
+            with events_path.open("a", encoding="utf-8") as handle:
+                handle.write("}\n")
+            self.assertEqual([payload["event"]["kind"] for _, payload in tail.poll()], ["half"])
+
+    def test_stream_ends_with_terminal_event_after_draining(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            control_dir = root / ".agent_control"
+            _write_mission(control_dir, "running", [])
+            events_path = control_dir / "mission_events.jsonl"
+            events_path.write_text("", encoding="utf-8")
+            chunks: list[bytes] = []
+
+            def sleep(_seconds: float) -> None:
+                _append(events_path, {"mission_id": "mission_a", "kind": "mission.completed"})
+                _write_mission(control_dir, "completed", [])
+
+            reason = stream_mission_events(
+                chunks.append,
+                MissionEventTail(root, "mission_a"),
+                poll_seconds=0.01,
+                max_seconds=60,
+                sleep=sleep,
+            )
+            frames = _sse_frames(b"".join(chunks))
+
+            self.assertEqual(reason, "terminal")
+            self.assertEqual([frame["event"] for frame in frames], ["ready", "mission_event", "end"])
+            self.assertEqual(json.loads(frames[1]["data"])["event"]["kind"], "mission.completed")
+            self.assertEqual(json.loads(frames[2]["data"])["status"], "completed")
+            self.assertTrue(frames[2]["id"])
+
+    def test_stream_reports_missing_mission(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            chunks: list[bytes] = []
+            reason = stream_mission_events(chunks.append, MissionEventTail(pathlib.Path(temp_dir), "nope"))
+
+            self.assertEqual(reason, "missing")
+            self.assertIn(b"event: end", b"".join(chunks))
+
+    def test_format_sse_keeps_payload_on_one_data_line(self) -> None:
+        frame = format_sse("mission_event", {"message": "line one\nline two"}, event_id="mission=10")
+
+        self.assertEqual(
+            frame,
+            b'id: mission=10\nevent: mission_event\ndata: {"message":"line one\\nline two"}\n\n',
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import os
 import pathlib
 import sys
+import tempfile
+import time
 import unittest
+from unittest import mock
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
-from grant_agent.research import search_workspace
+from grant_agent import research
+from grant_agent.research import SEARCH_INDEX_RELATIVE_PATH, invalidate_search_index_cache, search_workspace
+
+
+def _write_settled(path: pathlib.Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    settled = time.time() - 60
+    os.utime(path, (settled, settled))
 
 
 class ResearchTests(unittest.TestCase):
@@ -15,6 +27,78 @@ class ResearchTests(unittest.TestCase):
         matches = search_workspace(root=root, query="AutonomousEngine", include_glob="src/**/*.py", max_results=10)
         self.assertGreaterEqual(len(matches), 1)
 
+    def test_trigram_index_reads_only_candidate_files_and_tracks_edits(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            for index in range(20):
+                _write_settled(root / "src" / f"module_{index}.py", f"VALUE_{index} = {index}\n")
+            _write_settled(root / "src" / "engine.py", "class AutonomousEngine:\n    pass\n")
+            invalidate_search_index_cache()
+            self.addCleanup(invalidate_search_index_cache)
+
+            first = search_workspace(root, "autonomousengine", include_glob="src/**/*.py")
+            self.assertTrue((root / SEARCH_INDEX_RELATIVE_PATH).exists())
+
+            reads: list[str] = []
+            original_read = research._read_searchable_text
+
+            def counting_read(path: pathlib.Path) -> str | None:
+                reads.append(path.name)
+                return original_read(path)
+
+            with mock.patch.object(research, "_read_searchable_text", side_effect=counting_read):
+                invalidate_search_index_cache()
+                second = search_workspace(root, "class Autonomous\\w+", include_glob="src/**/*.py")
+                _write_settled(root / "src" / "module_3.py", "engine = AutonomousEngine()\n")
+                reads.clear()
+                third = search_workspace(root, "AutonomousEngine", include_glob="src/**/*.py")
+
+        self.assertEqual(first, [{"path": str(pathlib.Path("src/engine.py")), "line": 1, "snippet": "class AutonomousEngine:"}])
+        self.assertEqual(second, first)
+        self.assertEqual(sorted(reads), ["engine.py", "module_3.py", "module_3.py"])
+        self.assertEqual([item["path"] for item in third], [str(pathlib.Path("src/engine.py")), str(pathlib.Path("src/module_3.py"))])
+
+    def test_escape_operands_never_become_required_literals(self) -> None:
+        self.assertEqual(research._required_literals(r"\x41pple", 0), ["pple"])
+        self.assertEqual(research._required_literals(r"\101pple", 0), ["pple"])
+        self.assertEqual(research._required_literals(r"\u0041pple", 0), ["pple"])
+        self.assertEqual(research._required_literals(r"\U00000041pple", 0), ["pple"])
+        self.assertEqual(research._required_literals(r"\N{LATIN CAPITAL LETTER A}pple", 0), ["pple"])
+        self.assertEqual(research._required_literals(r"(pie)\1pie", 0), ["pie"])
+        self.assertEqual(research._required_literals(r"\1234567", 0), ["4567"])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            _write_settled(root / "menu.txt", "Apple pie\n")
+            _write_settled(root / "other.txt", "nothing here\n")
+            invalidate_search_index_cache()
+            self.addCleanup(invalidate_search_index_cache)
+            for query in (r"\x41pple", r"\101pple", r"\u0041pple", r"\U00000041pple", r"\N{LATIN CAPITAL LETTER A}pple"):
+                with self.subTest(query=query):
+                    matches = search_workspace(root, query)
+                    self.assertEqual([item["snippet"] for item in matches], ["Apple pie"])
+
+    def test_scan_skips_binaries_and_dependencies_and_stops_at_max_results(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            (root / "image.png").write_bytes(b"\x89PNG\0\0 needle")
+            _write_settled(root / "node_modules" / "dep" / "index.js", "needle\n")
+            for index in range(5):
+                _write_settled(root / f"notes_{index}.md", "needle\nneedle\n")
+
+            with mock.patch.dict(os.environ, {"FLUXIO_SEARCH_INDEX": "0"}):
+                limited = search_workspace(root, "need.e", max_results=3)
+                everything = search_workspace(root, "", max_results=100)
+
+            self.assertFalse((root / SEARCH_INDEX_RELATIVE_PATH).exists())
+
+        self.assertEqual(
+            [(item["path"], item["line"]) for item in limited],
+            [("notes_0.md", 1), ("notes_0.md", 2), ("notes_1.md", 1)],
+        )
+        self.assertEqual(len(everything), 10)
+        self.assertTrue(all(item["path"].startswith("notes_") for item in everything))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from grant_agent import runtime_worker
+from grant_agent.runtime_worker import (
+    _GitChangeTracker,
+    _InotifyChangeTracker,
+    _WalkChangeTracker,
+    _start_change_tracker,
+)
+
+
+def _git(repo: pathlib.Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=Fluxio", "-c", "user.email=fluxio@example.com", "-C", str(repo), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _committed_repo(root: pathlib.Path) -> pathlib.Path:
+    _git(root, "init", "-q")
+    (root / "src").mkdir()
+    (root / "src" / "app.py").write_text("print('a')\n", encoding="utf-8")
+    (root / "README.md").write_text("# Demo\n", encoding="utf-8")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "base")
+    return root
+
+
+class ChangeTrackerTests(unittest.TestCase):
+    def test_git_tracker_reports_run_changes_and_ignores_preexisting_dirt(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = _committed_repo(pathlib.Path(temp_dir))
+            (root / "README.md").write_text("# Dirty before launch\n", encoding="utf-8")
+            (root / "scratch.txt").write_text("untracked before launch\n", encoding="utf-8")
+
+            tracker = _start_change_tracker(root)
+            self.assertIsInstance(tracker, _GitChangeTracker)
+            self.assertEqual(tracker.changed_files(), [])
+
+            (root / "src" / "app.py").write_text("print('b')\n", encoding="utf-8")
+            (root / "src" / "new_module.py").write_text("VALUE = 1\n", encoding="utf-8")
+            (root / ".agent_control").mkdir()
+            (root / ".agent_control" / "state.json").write_text("{}", encoding="utf-8")
+            self.assertEqual(tracker.changed_files(), ["src/app.py", "src/new_module.py"])
+
+            _git(root, "add", "src")
+            _git(root, "commit", "-q", "-m", "runtime commit")
+            stat = (root / "README.md").stat()
+            os.utime(root / "README.md", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(
+                tracker.changed_files(),
+                ["README.md", "src/app.py", "src/new_module.py"],
+            )
+
+    def test_inotify_tracker_follows_new_directories_without_file_cap(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            (root / "docs").mkdir()
+            (root / "docs" / "guide.md").write_text("old\n", encoding="utf-8")
+            (root / "node_modules").mkdir()
+            tracker = _InotifyChangeTracker.start(root)
+            if tracker is None:
+                self.skipTest("inotify is not available on this host")
+            try:
+                with mock.patch.object(runtime_worker, "SNAPSHOT_MAX_FILES", 1):
+                    (root / "docs" / "guide.md").write_text("new\n", encoding="utf-8")
+                    (root / "pkg" / "nested").mkdir(parents=True)
+                    (root / "pkg" / "nested" / "module.py").write_text("x = 1\n", encoding="utf-8")
+                    (root / "tmp.swp").write_text("swap\n", encoding="utf-8")
+                    (root / "tmp.swp").unlink()
+                    (root / "node_modules" / "dep.js").write_text("", encoding="utf-8")
+                    expected = ["docs/guide.md", "pkg/nested/module.py"]
+                    deadline = time.monotonic() + 5
+                    while tracker.changed_files() != expected and time.monotonic() < deadline:
+                        time.sleep(0.05)
+                    self.assertEqual(tracker.changed_files(), expected)
+                    self.assertFalse(tracker.truncated)
+            finally:
+                tracker.close()
+
+    def test_walk_tracker_flags_truncation(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            for index in range(3):
+                (root / f"file_{index}.txt").write_text("x", encoding="utf-8")
+            with mock.patch.dict(os.environ, {"FLUXIO_DELEGATED_CHANGE_TRACKING": "walk"}), mock.patch.object(
+                runtime_worker, "SNAPSHOT_MAX_FILES", 2
+            ):
+                tracker = _start_change_tracker(root)
+                self.assertIsInstance(tracker, _WalkChangeTracker)
+                self.assertTrue(tracker.truncated)
+
+    def test_run_reports_changed_files_while_runtime_is_running(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = _committed_repo(pathlib.Path(temp_dir))
+            session_path = root / ".agent_runs" / "delegate.json"
+            session_path.parent.mkdir()
+            script = (
+                "import json, pathlib, time\n"
+                "pathlib.Path('src/app.py').write_text('print(2)\\n')\n"
+                "session = pathlib.Path(%r)\n"
+                "deadline = time.time() + 5\n"
+                "seen = []\n"
+                "while time.time() < deadline and not seen:\n"
+                "    time.sleep(0.05)\n"
+                "    seen = json.loads(session.read_text()).get('changed_files') or []\n"
+                "print('live changes: ' + ','.join(seen))\n"
+            ) % str(session_path)
+            (root / "probe_script.py").write_text(script, encoding="utf-8")
+            _git(root, "add", "probe_script.py")
+            _git(root, "commit", "-q", "-m", "probe")
+            command = f"{shlex.quote(sys.executable)} probe_script.py"
+
+            with mock.patch.object(runtime_worker, "HEARTBEAT_INTERVAL_SECONDS", 0.05):
+                return_code = runtime_worker.run(session_path, root, command)
+
+            state = json.loads(session_path.read_text(encoding="utf-8"))
+            self.assertEqual(return_code, 0)
+            self.assertEqual(state["change_tracking"], "git")
+            self.assertEqual(state["changed_files"], ["src/app.py"])
+            self.assertFalse(state["changed_files_truncated"])
+            log_text = session_path.with_suffix(".log").read_text(encoding="utf-8")
+            self.assertIn("live changes: src/app.py", log_text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,11 +3,12 @@ from __future__ import annotations
 import json
 import pathlib
 import sys
+import tempfile
 import unittest
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
-from grant_agent.runtime_worker import _parse_structured_event
+from grant_agent.runtime_worker import _SessionRecorder, _parse_structured_event
 
 
 class RuntimeWorkerMessageParsingTests(unittest.TestCase):
@@ -98,5 +99,55 @@ class RuntimeWorkerMessageParsingTests(unittest.TestCase):
         self.assertEqual(event["message"], "Lane booted")
 
 
+class RuntimeWorkerSessionRecorderTests(unittest.TestCase):
+    def test_chatty_output_batches_state_writes_and_tracks_cursor(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            session_path = pathlib.Path(temp_dir) / "delegate_chatty.json"
+            events_path = session_path.with_suffix(".events.jsonl")
+            session_path.write_text(
+                json.dumps({"delegated_id": "delegate_chatty", "status": "running", "events_path": str(events_path)}),
+                encoding="utf-8",
+            )
+            events_path.write_text(json.dumps({"kind": "session.launching"}) + "\n", encoding="utf-8")
+            recorder = _SessionRecorder(session_path, flush_interval=60)
+            try:
+                for index in range(2000):
+                    recorder.append_event(kind="runtime.output", message=f"line {index}", status="running")
+                with events_path.open("a", encoding="utf-8") as handle:
+                    handle.write(json.dumps({"kind": "approval.decision", "message": "external"}) + "\n")
+                recorder.append_event(kind="approval.resolved", message="approved", status="running")
+            finally:
+                recorder.close()
+
+            state = json.loads(session_path.read_text(encoding="utf-8"))
+            self.assertLessEqual(recorder.state_writes, 3)
+            self.assertEqual(state["event_cursor"], 2003)
+            self.assertEqual(
+                [item["message"] for item in state["latest_events"][-3:]],
+                ["line 1999", "external", "approved"],
+            )
+            self.assertEqual(len(state["latest_events"]), 5)
+
+    def test_status_transition_forces_state_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            session_path = pathlib.Path(temp_dir) / "delegate_status.json"
+            session_path.write_text(json.dumps({"status": "running"}), encoding="utf-8")
+            recorder = _SessionRecorder(session_path, flush_interval=60)
+            try:
+                recorder.append_event(kind="runtime.output", message="first", status="running")
+                recorder.append_event(kind="runtime.output", message="second", status="running")
+                self.assertEqual(
+                    json.loads(session_path.read_text(encoding="utf-8"))["last_event"],
+                    "first",
+                )
+                recorder.update_state({"status": "waiting_for_approval"})
+                state = json.loads(session_path.read_text(encoding="utf-8"))
+            finally:
+                recorder.close()
+
+            self.assertEqual(state["status"], "waiting_for_approval")
+            self.assertEqual(state["last_event"], "second")
+
+
 if __name__ == "__main__":
     unittest.main()
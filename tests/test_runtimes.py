@@ -44,7 +44,7 @@ class RuntimeAdapterTests(unittest.TestCase):
         self.openclaw_latest_patcher.stop()
         super().tearDown()
 
-    @mock.patch("grant_agent.runtimes.openclaw.subprocess.run")
+    @mock.patch("grant_agent.command_probe.subprocess.run")
     @mock.patch("grant_agent.runtimes.openclaw.shutil.which")
     def test_openclaw_adapter_detects_runtime(
         self, which_mock: mock.Mock, run_mock: mock.Mock
@@ -63,7 +63,7 @@ class RuntimeAdapterTests(unittest.TestCase):
         self.assertGreaterEqual(len(status.capabilities), 1)
         self.assertIn("opencode_go_provider", {item.key for item in status.capabilities})
 
-    @mock.patch("grant_agent.runtimes.openclaw.subprocess.run")
+    @mock.patch("grant_agent.command_probe.subprocess.run")
     @mock.patch("grant_agent.runtimes.openclaw.read_openclaw_package_version")
     @mock.patch("grant_agent.runtimes.openclaw.shutil.which")
     def test_openclaw_adapter_does_not_report_missing_when_package_version_is_read(
@@ -154,7 +154,7 @@ class RuntimeAdapterTests(unittest.TestCase):
 
             self.assertIn(shared_runtime_bin, candidates)
 
-    @mock.patch("grant_agent.runtimes.hermes.subprocess.run")
+    @mock.patch("grant_agent.command_probe.subprocess.run")
     @mock.patch("grant_agent.runtimes.hermes.shutil.which")
     @mock.patch("grant_agent.runtimes.hermes.os.name", "nt")
     def test_hermes_adapter_detects_runtime_inside_wsl(
@@ -183,7 +183,7 @@ class RuntimeAdapterTests(unittest.TestCase):
         self.assertTrue(status.update_available)
         self.assertIn("latest upstream release", status.doctor_summary)
 
-    @mock.patch("grant_agent.runtimes.hermes.subprocess.run")
+    @mock.patch("grant_agent.command_probe.subprocess.run")
     @mock.patch("grant_agent.runtimes.hermes.shutil.which")
     def test_hermes_adapter_prefers_release_version_over_stale_commit_warning(
         self,
@@ -309,7 +309,7 @@ class RuntimeAdapterTests(unittest.TestCase):
         )
         self.assertIn("--model openrouter/z-ai/glm-5.2", str(launch["launch_command"]))
 
-    @mock.patch("grant_agent.runtimes.opencode.subprocess.run")
+    @mock.patch("grant_agent.command_probe.subprocess.run")
     @mock.patch("grant_agent.runtimes.opencode.runtime_which")
     def test_opencode_adapter_detects_runtime(
         self, which_mock: mock.Mock, run_mock: mock.Mock
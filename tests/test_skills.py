@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import json
 import pathlib
 import sys
+import tempfile
 import unittest
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
-from grant_agent.skills import SkillRegistry
+from grant_agent.skills import SkillRegistry, _tokenize
 
 
 class SkillRegistryTests(unittest.TestCase):
@@ -34,6 +36,34 @@ class SkillRegistryTests(unittest.TestCase):
         self.assertIn("gpt_taste_frontend_motion", names)
         self.assertIn("frontend_image_direction", names)
 
+    def test_indexed_retrieval_matches_full_sort_ranking(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = pathlib.Path(temp_dir) / "skills.json"
+            words = ["repo", "scan", "verify", "build", "design", "browser", "tests"]
+            rows = [
+                {
+                    "name": f"skill_{words[index % 7]}_{'x' * (index % 4)}",
+                    "description": " ".join(words[(index * 3 + offset) % 7] for offset in range(index % 4)),
+                }
+                for index in range(40)
+            ]
+            path.write_text(json.dumps(rows), encoding="utf-8")
+            registry = SkillRegistry(path)
+
+            for query in ("repo tests", "design browser verify", "build", "nothing here"):
+                query_tokens = _tokenize(query)
+
+                def score(skill):
+                    return len(query_tokens & _tokenize(skill.name + " " + skill.description)), -len(skill.name)
+
+                expected = sorted(registry.skills, key=score, reverse=True)[:5]
+                if any(score(skill)[0] > 0 for skill in expected):
+                    expected = [skill for skill in expected if score(skill)[0] > 0]
+                self.assertEqual(
+                    [skill.name for skill in registry.retrieve(query, top_k=5)],
+                    [skill.name for skill in expected],
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
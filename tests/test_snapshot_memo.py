@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pathlib
+import sys
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from grant_agent.snapshot_memo import (
+    active_snapshot_memo,
+    clear_snapshot_memo,
+    snapshot_memo_scope,
+    snapshot_memoized,
+    with_snapshot_memo,
+)
+
+
+class SnapshotMemoTests(unittest.TestCase):
+    def test_computes_once_per_scope_and_not_outside_one(self) -> None:
+        calls: list[int] = []
+
+        def compute() -> dict:
+            calls.append(1)
+            return {"rows": [len(calls)]}
+
+        self.assertEqual(snapshot_memoized(("rows",), compute), {"rows": [1]})
+        self.assertEqual(snapshot_memoized(("rows",), compute), {"rows": [2]})
+        with snapshot_memo_scope() as memo:
+            first = snapshot_memoized(("rows",), compute)
+            with snapshot_memo_scope() as nested:
+                self.assertIs(nested, memo)
+                second = snapshot_memoized(("rows",), compute)
+            self.assertIs(first, second)
+            self.assertEqual(memo.stats()["hitsByKey"], {"rows": 1})
+        self.assertIsNone(active_snapshot_memo())
+        self.assertEqual(len(calls), 3)
+
+    def test_copy_on_read_returns_private_values_and_clear_recomputes(self) -> None:
+        calls: list[int] = []
+
+        def compute() -> dict:
+            calls.append(1)
+            return {"items": [1, 2], "path": pathlib.Path("state.json")}
+
+        @with_snapshot_memo
+        def build() -> dict:
+            first = snapshot_memoized(("state", "a"), compute, copy_on_read=True)
+            first["items"].append(3)
+            second = snapshot_memoized(("state", "a"), compute, copy_on_read=True)
+            clear_snapshot_memo()
+            snapshot_memoized(("state", "a"), compute, copy_on_read=True)
+            return {"second": second, "stats": active_snapshot_memo().stats()}
+
+        result = build()
+        self.assertEqual(result["second"]["items"], [1, 2])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual((result["stats"]["hits"], result["stats"]["misses"]), (1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
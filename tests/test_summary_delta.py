@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import copy
+import pathlib
+import sys
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from grant_agent.summary_delta import SUMMARY_DELTA_SCHEMA, SummaryVersionLog
+
+
+def _summary() -> dict:
+    return {
+        "schema": "fluxio.control_room.summary.v1",
+        "generatedAt": "2026-10-01T00:00:00+00:00",
+        "counts": {"missions": 2},
+        "missions": [
+            {"mission_id": "mission_a", "state": {"status": "running"}},
+            {"mission_id": "mission_b", "state": {"status": "queued"}},
+        ],
+        "workspaces": [{"workspace_id": "ws_1", "name": "One"}],
+        "missionWatchdog": {
+            "summary": "ok",
+            "issues": [{"issueId": "mission_a:stalled", "severity": "warning"}],
+        },
+        "performance": {"durationMs": 10},
+    }
+
+
+class SummaryDeltaTests(unittest.TestCase):
+    def test_unknown_cursor_returns_full_summary_with_version(self) -> None:
+        log = SummaryVersionLog()
+
+        result = log.delta(_summary(), "")
+
+        self.assertEqual(result["schema"], "fluxio.control_room.summary.v1")
+        self.assertTrue(result["summaryVersion"].startswith(f"{log.epoch}:"))
+        self.assertEqual(log.delta(_summary(), "other-process:1")["schema"], "fluxio.control_room.summary.v1")
+
+    def test_volatile_fields_do_not_bump_the_version(self) -> None:
+        log = SummaryVersionLog()
+        cursor = log.delta(_summary(), "")["summaryVersion"]
+        rebuilt = _summary()
+        rebuilt["generatedAt"] = "2026-10-01T00:00:05+00:00"
+        rebuilt["performance"] = {"durationMs": 99}
+
+        delta = log.delta(rebuilt, cursor)
+
+        self.assertEqual(delta["schema"], SUMMARY_DELTA_SCHEMA)
+        self.assertTrue(delta["unchanged"])
+        self.assertEqual(delta["summaryVersion"], cursor)
+        self.assertEqual(delta["generatedAt"], "2026-10-01T00:00:05+00:00")
+
+    def test_delta_lists_only_changed_rows_and_sections(self) -> None:
+        log = SummaryVersionLog()
+        cursor = log.delta(_summary(), "")["summaryVersion"]
+        changed = copy.deepcopy(_summary())
+        changed["missions"][1]["state"]["status"] = "running"
+        changed["missions"].append({"mission_id": "mission_c", "state": {"status": "queued"}})
+        changed["counts"] = {"missions": 3}
+        changed["missionWatchdog"]["issues"] = []
+
+        delta = log.delta(changed, cursor)
+        ops = {(op["op"], op.get("path") or f"{op['collection']}/{op['key']}") for op in delta["ops"]}
+
+        self.assertEqual(
+            ops,
+            {
+                ("replace", "/counts"),
+                ("upsert", "missions/mission_b"),
+                ("upsert", "missions/mission_c"),
+                ("remove", "missionWatchdog.issues/mission_a:stalled"),
+            },
+        )
+        self.assertNotEqual(delta["summaryVersion"], cursor)
+
+    def test_reordered_rows_emit_order_op(self) -> None:
+        log = SummaryVersionLog()
+        cursor = log.delta(_summary(), "")["summaryVersion"]
+        reordered = _summary()
+        reordered["missions"].reverse()
+
+        delta = log.delta(reordered, cursor)
+
+        self.assertEqual(
+            delta["ops"],
+            [{"op": "order", "collection": "missions", "keys": ["mission_b", "mission_a"]}],
+        )
+
+    def test_expired_cursor_falls_back_to_full_payload(self) -> None:
+        log = SummaryVersionLog(history=2)
+        first = log.delta(_summary(), "")["summaryVersion"]
+        for index in range(3):
+            summary = _summary()
+            summary["counts"] = {"missions": index + 10}
+            log.delta(summary, "")
+
+        result = log.delta(_summary(), first)
+
+        self.assertNotIn("ops", result)
+        self.assertIn("missions", result)
+
+
+if __name__ == "__main__":
+    unittest.main()
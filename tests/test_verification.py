@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import json
 import pathlib
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import unittest
 from unittest import mock
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
-from grant_agent.verification import VerificationRunner, detect_default_verification_commands
+from grant_agent.verification import (
+    VERIFICATION_CACHE_RELATIVE_PATH,
+    VerificationRunner,
+    _command_lane,
+    detect_default_verification_commands,
+)
 
 
 class VerificationTests(unittest.TestCase):
@@ -42,6 +51,129 @@ class VerificationTests(unittest.TestCase):
         self.assertEqual(results[0].return_code, 124)
         self.assertIn("timed out", results[0].stderr.lower())
 
+    def test_parallel_mode_streams_results_and_keeps_tool_lanes_ordered(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        started: list[str] = []
+
+        def fake_run(command: str, **_kwargs: object) -> subprocess.CompletedProcess:
+            started.append(command)
+            if command.startswith("python"):
+                barrier.wait()
+            if command == "python -m unittest discover -s tests":
+                time.sleep(0.1)
+            return subprocess.CompletedProcess(command, 0, stdout=f"{command} ok\n", stderr="")
+
+        commands = [
+            "python -m unittest discover -s tests",
+            "npm run build",
+            "python -m compileall -q src",
+            "npm test",
+        ]
+        streamed: list[str] = []
+        runner = VerificationRunner(mode="parallel", max_workers=4, use_cache=False)
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch(
+            "grant_agent.verification.subprocess.run", side_effect=fake_run
+        ):
+            results = runner.run(commands, pathlib.Path(temp_dir), on_result=lambda item: streamed.append(item.command))
+
+        self.assertEqual([item.command for item in results], commands)
+        self.assertEqual(streamed[-1], "python -m unittest discover -s tests")
+        self.assertLess(started.index("npm run build"), started.index("npm test"))
+        self.assertTrue(all(item.return_code == 0 and not item.cached for item in results))
+
+    def test_default_mode_keeps_explicit_commands_in_order_and_parallelizes_detected_ones(self) -> None:
+        running = 0
+        overlapped: list[str] = []
+        lock = threading.Lock()
+
+        def fake_run(command: str, **_kwargs: object) -> subprocess.CompletedProcess:
+            nonlocal running
+            with lock:
+                running += 1
+                if running > 1:
+                    overlapped.append(command)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch.dict(
+            "os.environ", {"FLUXIO_VERIFICATION_MODE": ""}
+        ), mock.patch("grant_agent.verification.subprocess.run", side_effect=fake_run):
+            root = pathlib.Path(temp_dir)
+            (root / "pyproject.toml").write_text("[project]\nname = 'demo'\n", encoding="utf-8")
+            (root / "src").mkdir()
+            (root / "tests").mkdir()
+            runner = VerificationRunner(max_workers=4, use_cache=False)
+            self.assertEqual(runner.mode, "auto")
+
+            runner.run(["pip install -e .", "python -m pytest -q"], root)
+            self.assertEqual(overlapped, [])
+            runner.run(detect_default_verification_commands(root), root)
+
+        self.assertEqual(len(overlapped), 1)
+
+    def test_command_lanes_group_node_tools_and_cd_prefixed_commands(self) -> None:
+        self.assertEqual(
+            {
+                _command_lane(command, index)
+                for index, command in enumerate(["npm ci", "npx tsc --noEmit", "cd web && npm run build", "yarn test"])
+            },
+            {"node"},
+        )
+
+    def test_cache_skips_passing_commands_until_tracked_inputs_change(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            (root / "src").mkdir()
+            module = root / "src" / "app.py"
+            module.write_text("VALUE = 1\n", encoding="utf-8")
+            passing = f"{sys.executable} -c \"print('checked')\""
+            failing = f"{sys.executable} -c \"raise SystemExit(3)\""
+            runner = VerificationRunner(use_cache=True)
+
+            first = runner.run([passing, failing], root)
+            second = runner.run([passing, failing], root)
+            module.write_text("VALUE = 2\n", encoding="utf-8")
+            third = runner.run([passing], root)
+
+            cache = json.loads((root / VERIFICATION_CACHE_RELATIVE_PATH).read_text(encoding="utf-8"))
+
+        self.assertEqual([(item.return_code, item.cached) for item in first], [(0, False), (3, False)])
+        self.assertEqual([(item.return_code, item.cached) for item in second], [(0, True), (3, False)])
+        self.assertEqual(second[0].stdout, "checked")
+        self.assertEqual(second[0].status, "executed")
+        self.assertFalse(third[0].cached)
+        self.assertEqual(list(cache["commands"]), [passing])
+        self.assertIn("src/app.py", cache["files"])
+
+    def test_cache_is_opt_in(self) -> None:
+        with mock.patch.dict("os.environ", {}, clear=False) as environ:
+            environ.pop("FLUXIO_VERIFICATION_CACHE", None)
+            self.assertFalse(VerificationRunner().use_cache)
+            environ["FLUXIO_VERIFICATION_CACHE"] = "1"
+            self.assertTrue(VerificationRunner().use_cache)
+
+    def test_cache_misses_after_environment_or_dependency_install_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            (root / "app.py").write_text("VALUE = 1\n", encoding="utf-8")
+            passing = f"{sys.executable} -c \"print('checked')\""
+            runner = VerificationRunner(use_cache=True)
+
+            runner.run([passing], root)
+            warm = runner.run([passing], root)
+            with mock.patch.dict("os.environ", {"PYTHONPATH": str(root / "vendor")}):
+                env_changed = runner.run([passing], root)
+            runner.run([passing], root)
+            (root / "node_modules").mkdir()
+            (root / "node_modules" / ".package-lock.json").write_text("{}", encoding="utf-8")
+            installed = runner.run([passing], root)
+
+        self.assertTrue(warm[0].cached)
+        self.assertFalse(env_changed[0].cached)
+        self.assertFalse(installed[0].cached)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,18 +2,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import hashlib
+import http.client
 import pathlib
 import io
 import json
 import sys
 import tempfile
 import threading
+import time
 import unittest
 from unittest import mock
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
 from grant_agent import web_backend
+from grant_agent.cli_executor import command_env
+from grant_agent.mission_store import ShardedMissionStore, mission_index_row
+from grant_agent.skill_library import invalidate_codex_home_skill_cache, load_codex_home_skill_rows
 from grant_agent.web_backend import (
     FluxioWebBackend,
     MISSION_ACTION_TIMEOUT_SECONDS,
@@ -37,6 +42,133 @@ class FluxioWebBackendTests(unittest.TestCase):
 
             self.assertEqual(handler.protocol_version, "HTTP/1.1")
 
+    def _serve(self, root: pathlib.Path, **kwargs: object) -> web_backend._HandshakeSafeThreadingHTTPServer:
+        server = web_backend._HandshakeSafeThreadingHTTPServer(
+            ("127.0.0.1", 0),
+            make_handler(FluxioWebBackend(root, root)),
+            **kwargs,
+        )
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_web_server_reuses_connections_up_to_request_cap(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch.object(
+            web_backend, "WEB_KEEPALIVE_MAX_REQUESTS", 3
+        ):
+            server = self._serve(pathlib.Path(temp_dir))
+            connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+            self.addCleanup(connection.close)
+            headers = []
+            local_ports = set()
+            for _ in range(3):
+                connection.request("GET", "/api/health")
+                local_ports.add(connection.sock.getsockname()[1])
+                response = connection.getresponse()
+                self.assertTrue(json.loads(response.read())["ok"])
+                headers.append((response.getheader("Connection"), response.getheader("Keep-Alive")))
+            self.assertIsNone(connection.sock)
+
+            connection.request("OPTIONS", "/api/backend")
+            preflight = connection.getresponse()
+
+            self.assertEqual(
+                headers,
+                [
+                    ("keep-alive", f"timeout={web_backend.WEB_KEEPALIVE_IDLE_SECONDS}, max=2"),
+                    ("keep-alive", f"timeout={web_backend.WEB_KEEPALIVE_IDLE_SECONDS}, max=1"),
+                    ("close", None),
+                ],
+            )
+            self.assertEqual(len(local_ports), 1)
+            self.assertEqual(preflight.status, 204)
+            self.assertEqual(preflight.read(), b"")
+            self.assertEqual(preflight.getheader("Connection"), "keep-alive")
+
+    def test_web_server_closes_when_request_body_is_unread_or_workers_are_busy(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            server = self._serve(pathlib.Path(temp_dir), max_workers=1)
+            first = http.client.HTTPConnection(*server.server_address, timeout=5)
+            self.addCleanup(first.close)
+            first.request("POST", "/api/unknown", body=b'{"ignored": true}')
+            unread = first.getresponse()
+            unread.read()
+            self.assertEqual(unread.status, 404)
+            self.assertEqual(unread.getheader("Connection"), "close")
+
+            first.request("GET", "/api/health")
+            idle = first.getresponse()
+            idle.read()
+            self.assertEqual(idle.getheader("Connection"), "keep-alive")
+
+            second = http.client.HTTPConnection(*server.server_address, timeout=5)
+            self.addCleanup(second.close)
+            second.connect()
+            deadline = time.monotonic() + 5
+            while server.keep_alive_available() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            first.request("GET", "/api/health")
+            released = first.getresponse()
+            released.read()
+            self.assertEqual(released.getheader("Connection"), "close")
+
+            second.request("GET", "/api/health")
+            queued = second.getresponse()
+            self.assertTrue(json.loads(queued.read())["ok"])
+
+    def test_web_server_serves_requests_while_streams_fill_the_worker_pool(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            backend = FluxioWebBackend(root, root)
+            backend.sessions["session-token"] = {"username": "admin", "role": "admin"}
+            cookie = {"Cookie": f"{web_backend.SESSION_COOKIE_NAME}=session-token"}
+            release = threading.Event()
+            self.addCleanup(release.set)
+
+            def hold_stream(write, tail) -> None:
+                write(b"event: ready\ndata: {}\n\n")
+                release.wait(timeout=10)
+
+            server = web_backend._HandshakeSafeThreadingHTTPServer(
+                ("127.0.0.1", 0), make_handler(backend), max_workers=1, max_streams=2
+            )
+            thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+            thread.start()
+            self.addCleanup(server.server_close)
+            self.addCleanup(server.shutdown)
+
+            def open_stream() -> http.client.HTTPResponse:
+                connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+                self.addCleanup(connection.close)
+                connection.request("GET", "/api/mission-stream?missionId=mission_a", headers=cookie)
+                return connection.getresponse()
+
+            with mock.patch.object(web_backend, "stream_mission_events", side_effect=hold_stream), mock.patch.object(
+                backend, "dispatch", return_value={"schema": "fluxio.control_room.summary.v1"}
+            ), mock.patch.object(backend, "backend_read_etag", return_value=""):
+                streams = [open_stream(), open_stream()]
+                for stream in streams:
+                    self.assertEqual(stream.status, 200)
+                    self.assertEqual(stream.readline(), b"event: ready\n")
+                refused = open_stream()
+                self.assertEqual(refused.status, 503)
+                refused.read()
+
+                summary = http.client.HTTPConnection(*server.server_address, timeout=5)
+                self.addCleanup(summary.close)
+                summary.request(
+                    "POST",
+                    "/api/backend",
+                    body=json.dumps({"command": "get_control_room_summary_command", "payload": {}}),
+                    headers={**cookie, "Content-Type": "application/json"},
+                )
+                response = summary.getresponse()
+                self.assertEqual(response.status, 200)
+                self.assertEqual(json.loads(response.read())["data"]["schema"], "fluxio.control_room.summary.v1")
+                release.set()
+
     def test_browser_click_probe_page_is_real_click_target(self) -> None:
         markup = _browser_click_probe_page()
 
@@ -4043,6 +4175,157 @@ class FluxioWebBackendTests(unittest.TestCase):
             self.assertIn("PYTHONPATH", called_env)
             self.assertTrue(str(root / "src") in called_env["PYTHONPATH"])
 
+    def test_run_cli_routes_read_only_commands_in_process(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            backend = FluxioWebBackend(root, root)
+            seen: list[tuple[list[str], str | None]] = []
+
+            def entrypoint(argv: list[str]) -> int:
+                seen.append(
+                    (
+                        argv,
+                        command_env("FLUXIO_CONTROL_ROOM_FAST"),
+                        web_backend.os.environ.get("FLUXIO_CONTROL_ROOM_FAST"),
+                    )
+                )
+                print(json.dumps({"schema": "fluxio.control_room.snapshot.v1"}))
+                return 0
+
+            backend.cli_executor = web_backend.CliExecutor(max_workers=2, entrypoint=entrypoint)
+            provider_env = {"PYTHONPATH": str(root / "src")}
+            with mock.patch.object(backend, "_provider_env", return_value=provider_env), mock.patch(
+                "grant_agent.web_backend.subprocess.run"
+            ) as run_mock:
+                result = backend._run_cli(root, "control-room", [], timeout=5, fast_control_room=True)
+
+            run_mock.assert_not_called()
+            self.assertEqual(result["schema"], "fluxio.control_room.snapshot.v1")
+            self.assertEqual(seen, [(["control-room", "--root", str(root)], "1", None)])
+            self.assertIsNone(command_env("FLUXIO_CONTROL_ROOM_FAST"))
+            stats = backend.dispatch("get_cli_latency_command", {})["commands"]["control-room"]
+            self.assertEqual(stats["count"], 1)
+            self.assertEqual(stats["inProcess"], 1)
+            self.assertEqual(stats["lastMode"], "in-process")
+
+    def test_run_cli_uses_in_process_pool_with_the_real_provider_env(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            backend = FluxioWebBackend(root, root)
+
+            def entrypoint(argv: list[str]) -> int:
+                print(json.dumps({"ok": True}))
+                return 0
+
+            backend.cli_executor = web_backend.CliExecutor(max_workers=1, entrypoint=entrypoint)
+            self.assertEqual(backend.cli_executor.env_conflicts(backend._provider_env()), [])
+            with mock.patch("grant_agent.web_backend.subprocess.run") as run_mock:
+                result = backend._run_cli(root, "control-room", [], timeout=5)
+
+            run_mock.assert_not_called()
+            self.assertTrue(result["ok"])
+            self.assertEqual(backend.cli_executor.latency_stats()["control-room"]["lastMode"], "in-process")
+            backend.cli_executor.shutdown()
+
+    def test_run_cli_keeps_subprocess_for_runtime_commands(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            backend = FluxioWebBackend(root, root)
+            backend.cli_executor = web_backend.CliExecutor(entrypoint=mock.Mock(side_effect=AssertionError))
+            completed = mock.Mock(returncode=0, stdout='{"ok": true}', stderr="")
+            with mock.patch("grant_agent.web_backend.subprocess.run", return_value=completed) as run_mock:
+                result = backend._run_cli(root, "workspace-action", ["--action-id", "a"], timeout=5)
+
+            self.assertTrue(result["ok"])
+            self.assertIn("workspace-action", run_mock.call_args.args[0])
+            stats = backend.cli_executor.latency_stats()["workspace-action"]
+            self.assertEqual(stats["subprocess"], 1)
+
+    def test_run_cli_keeps_subprocess_when_provider_env_differs(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            backend = FluxioWebBackend(root, root)
+            backend.cli_executor = web_backend.CliExecutor(entrypoint=mock.Mock(side_effect=AssertionError))
+            completed = mock.Mock(returncode=0, stdout='{"ok": true}', stderr="")
+            environ_before = dict(web_backend.os.environ)
+            provider_env = {"FLUXIO_TEST_PROVIDER_KEY": "secret"}
+            with mock.patch.object(backend, "_provider_env", return_value=provider_env), mock.patch(
+                "grant_agent.web_backend.subprocess.run", return_value=completed
+            ) as run_mock:
+                result = backend._run_cli(root, "control-room", [], timeout=5)
+
+            self.assertTrue(result["ok"])
+            self.assertEqual(run_mock.call_args.kwargs["env"]["FLUXIO_TEST_PROVIDER_KEY"], "secret")
+            self.assertEqual(dict(web_backend.os.environ), environ_before)
+            self.assertEqual(backend.cli_executor.latency_stats()["control-room"]["subprocess"], 1)
+
+    def test_run_cli_skips_in_process_pool_while_a_command_hangs(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            backend = FluxioWebBackend(root, root)
+            release = threading.Event()
+
+            def entrypoint(argv: list[str]) -> int:
+                release.wait(timeout=10)
+                print(json.dumps({"ok": True}))
+                return 0
+
+            backend.cli_executor = web_backend.CliExecutor(max_workers=1, entrypoint=entrypoint)
+            completed = mock.Mock(returncode=0, stdout='{"ok": true}', stderr="")
+            try:
+                with mock.patch.object(backend, "_provider_env", return_value={}):
+                    with self.assertRaises(web_backend.subprocess.TimeoutExpired):
+                        backend._run_cli(root, "control-room", [], timeout=0.05)
+                    self.assertFalse(backend.cli_executor.has_capacity())
+                    with mock.patch("grant_agent.web_backend.subprocess.run", return_value=completed) as run_mock:
+                        result = backend._run_cli(root, "control-room", [], timeout=5, fast_control_room=True)
+                    self.assertTrue(result["ok"])
+                    run_mock.assert_called_once()
+            finally:
+                release.set()
+            for _ in range(100):
+                if backend.cli_executor.has_capacity():
+                    break
+                time.sleep(0.02)
+            self.assertTrue(backend.cli_executor.has_capacity())
+            backend.cli_executor.shutdown()
+
+    def test_cli_executor_surfaces_failures_like_a_subprocess(self) -> None:
+        def entrypoint(argv: list[str]) -> int:
+            print(json.dumps({"error": "mission not found"}))
+            raise SystemExit(2)
+
+        executor = web_backend.CliExecutor(max_workers=1, entrypoint=entrypoint)
+        try:
+            with self.assertRaisesRegex(RuntimeError, "mission not found"):
+                web_backend._run_cli_in_process(executor, pathlib.Path("."), "mission-proof-digest", [])
+        finally:
+            executor.shutdown()
+
+    def test_cli_executor_isolates_concurrent_stdout(self) -> None:
+        barrier = threading.Barrier(2)
+
+        def entrypoint(argv: list[str]) -> int:
+            barrier.wait(timeout=5)
+            print(json.dumps({"command": argv[0]}))
+            return 0
+
+        executor = web_backend.CliExecutor(max_workers=2, entrypoint=entrypoint)
+        results: dict[str, str] = {}
+
+        def run(name: str) -> None:
+            results[name] = executor.run([name], timeout=5).stdout
+
+        threads = [threading.Thread(target=run, args=(name,)) for name in ("first", "second")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        executor.shutdown()
+
+        self.assertEqual(json.loads(results["first"]), {"command": "first"})
+        self.assertEqual(json.loads(results["second"]), {"command": "second"})
+
     def test_runtime_route_status_decodes_hermes_version_as_utf8(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = pathlib.Path(temp_dir)
@@ -4107,6 +4390,54 @@ class FluxioWebBackendTests(unittest.TestCase):
             self.assertEqual(cached_result["summaryCache"]["mode"], "full")
             self.assertEqual(build_summary.call_count, 1)
 
+    def test_control_room_summary_command_returns_delta_for_known_version(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            backend = FluxioWebBackend(root, root)
+            with (
+                mock.patch.object(
+                    backend,
+                    "_build_control_room_summary",
+                    side_effect=[
+                        {
+                            "schema": "fluxio.control_room.summary.v1",
+                            "missions": [{"mission_id": "mission_live", "status": "running"}],
+                        },
+                        {
+                            "schema": "fluxio.control_room.summary.v1",
+                            "missions": [{"mission_id": "mission_live", "status": "completed"}],
+                        },
+                    ],
+                ),
+                mock.patch.object(backend, "_start_mission_detail_prewarm_timer"),
+            ):
+                full = backend.dispatch(
+                    "get_control_room_summary_command",
+                    {"root": str(root), "sinceVersion": ""},
+                )
+                backend._full_summary_cache.clear()
+                (root / ".agent_control").mkdir(exist_ok=True)
+                (root / ".agent_control" / "mission_events.jsonl").write_text("{}\n", encoding="utf-8")
+                delta = backend.dispatch(
+                    "get_control_room_summary_command",
+                    {"root": str(root), "sinceVersion": full["summaryVersion"]},
+                )
+
+            self.assertEqual(full["schema"], "fluxio.control_room.summary.v1")
+            self.assertEqual(delta["mode"], "delta")
+            self.assertEqual(delta["baseVersion"], full["summaryVersion"])
+            self.assertEqual(
+                [op for op in delta["ops"] if "collection" in op],
+                [
+                    {
+                        "op": "upsert",
+                        "collection": "missions",
+                        "key": "mission_live",
+                        "value": {"mission_id": "mission_live", "status": "completed"},
+                    }
+                ],
+            )
+
     def test_skills_surface_full_summary_bypasses_stale_full_snapshot_cache(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = pathlib.Path(temp_dir)
@@ -5225,6 +5556,50 @@ class FluxioWebBackendTests(unittest.TestCase):
             self.assertTrue(backend.serve_artifact(stale))
             self.assertEqual(stale.status, 401)
 
+    def test_mission_stream_requires_login_and_streams_events(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            control_dir = root / ".agent_control"
+            control_dir.mkdir(parents=True)
+            (control_dir / "missions.json").write_text(
+                json.dumps([{"mission_id": "mission_a", "state": {"status": "completed"}}]),
+                encoding="utf-8",
+            )
+            backend = FluxioWebBackend(root, root)
+
+            class FakeHandler:
+                def __init__(self, path: str, headers: dict[str, str]) -> None:
+                    self.path = path
+                    self.headers = headers
+                    self.wfile = io.BytesIO()
+                    self.status: int | None = None
+                    self.response_headers: dict[str, str] = {}
+
+                def send_response(self, code: int) -> None:
+                    self.status = code
+
+                def send_header(self, key: str, value: str) -> None:
+                    self.response_headers[key] = value
+
+                def end_headers(self) -> None:
+                    pass
+
+            anonymous = FakeHandler("/api/mission-stream?missionId=mission_a", {})
+            self.assertTrue(backend.serve_mission_stream(anonymous))
+            self.assertEqual(anonymous.status, 401)
+
+            backend.sessions["session-token"] = {"username": "admin", "role": "admin"}
+            authed = FakeHandler(
+                "/api/mission-stream?missionId=mission_a",
+                {"Cookie": f"{web_backend.SESSION_COOKIE_NAME}=session-token"},
+            )
+            self.assertTrue(backend.serve_mission_stream(authed))
+            self.assertEqual(authed.status, 200)
+            self.assertEqual(authed.response_headers["Content-Type"], "text/event-stream; charset=utf-8")
+            body = authed.wfile.getvalue()
+            self.assertIn(b"event: ready", body)
+            self.assertIn(b"event: end", body)
+
     def test_quickstart_mission_command_forwards_turn_mode(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = pathlib.Path(temp_dir)
@@ -5496,6 +5871,164 @@ class FluxioWebBackendTests(unittest.TestCase):
             self.assertNotIn(b"<html", nested_asset_handler.wfile.getvalue().lower())
             self.assertIn(b"console.log('ok');", nested_asset_handler.wfile.getvalue())
 
+    def test_json_response_gzips_large_bodies_and_answers_matching_etag_with_304(self) -> None:
+        class DummyHandler:
+            def __init__(self, headers: dict[str, str]) -> None:
+                self.headers = headers
+                self.headers_out: dict[str, str] = {}
+                self.wfile = io.BytesIO()
+
+            def send_response(self, status: int) -> None:
+                self.headers_out["Status"] = str(status)
+
+            def send_header(self, key: str, value: str) -> None:
+                self.headers_out[key] = value
+
+            def end_headers(self) -> None:
+                return
+
+        payload = {"ok": True, "data": {"missions": [{"mission_id": f"m{index}"} for index in range(200)]}}
+        plain = DummyHandler({})
+        web_backend._json_response(plain, 200, payload, etag='"abc"')
+        self.assertNotIn("Content-Encoding", plain.headers_out)
+        self.assertEqual(plain.headers_out["ETag"], '"abc"')
+        self.assertEqual(json.loads(plain.wfile.getvalue()), payload)
+        self.assertNotIn(b"\n", plain.wfile.getvalue())
+
+        gzipped = DummyHandler({"Accept-Encoding": "br, gzip;q=0.8"})
+        web_backend._json_response(gzipped, 200, payload, etag='"abc"')
+        self.assertEqual(gzipped.headers_out["Content-Encoding"], "gzip")
+        self.assertEqual(gzipped.headers_out["ETag"], '"abc-gzip"')
+        self.assertEqual(json.loads(web_backend.zlib.decompress(gzipped.wfile.getvalue(), 31)), payload)
+
+        refused = DummyHandler({"Accept-Encoding": "gzip;q=0"})
+        web_backend._json_response(refused, 200, payload)
+        self.assertNotIn("Content-Encoding", refused.headers_out)
+
+        revalidated = DummyHandler({"If-None-Match": '"abc-gzip"'})
+        web_backend._json_response(revalidated, 200, payload, etag='"abc"')
+        self.assertEqual(revalidated.headers_out["Status"], "304")
+        self.assertEqual(revalidated.wfile.getvalue(), b"")
+
+    def test_static_files_carry_validators_and_revalidate_with_304(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            (root / "icon.svg").write_text("<svg>" + "<g/>" * 400 + "</svg>", encoding="utf-8")
+            backend = FluxioWebBackend(root, root)
+
+            class DummyHandler:
+                path = "/icon.svg"
+
+                def __init__(self, headers: dict[str, str]) -> None:
+                    self.headers = headers
+                    self.headers_out: dict[str, str] = {}
+                    self.wfile = io.BytesIO()
+
+                def send_response(self, status: int) -> None:
+                    self.headers_out["Status"] = str(status)
+
+                def send_header(self, key: str, value: str) -> None:
+                    self.headers_out[key] = value
+
+                def end_headers(self) -> None:
+                    return
+
+            first = DummyHandler({"Accept-Encoding": "gzip"})
+            self.assertTrue(backend.serve_file(first))
+            self.assertEqual(first.headers_out["Content-Encoding"], "gzip")
+            self.assertTrue(first.headers_out["ETag"].endswith('-gzip"'))
+            self.assertIn("Last-Modified", first.headers_out)
+
+            etag_check = DummyHandler({"If-None-Match": first.headers_out["ETag"]})
+            self.assertTrue(backend.serve_file(etag_check))
+            self.assertEqual(etag_check.headers_out["Status"], "304")
+            self.assertEqual(etag_check.wfile.getvalue(), b"")
+
+            date_check = DummyHandler({"If-Modified-Since": first.headers_out["Last-Modified"]})
+            self.assertTrue(backend.serve_file(date_check))
+            self.assertEqual(date_check.headers_out["Status"], "304")
+
+    def test_backend_read_etag_follows_control_files_and_skips_stale_cache_hits(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            backend = FluxioWebBackend(root, root)
+            payload = {"root": str(root), "missionId": "mission_a"}
+
+            self.assertEqual(backend.backend_read_etag("start_control_room_mission_command", payload), "")
+            etag = backend.backend_read_etag("get_control_room_mission_detail_command", payload)
+            self.assertTrue(etag.startswith('"'))
+            self.assertEqual(backend.backend_read_etag("get_control_room_mission_detail_command", payload), etag)
+
+            events_path = root / ".agent_control" / "mission_events.jsonl"
+            events_path.parent.mkdir(parents=True, exist_ok=True)
+            events_path.write_text('{"mission_id": "mission_a"}\n', encoding="utf-8")
+            self.assertNotEqual(backend.backend_read_etag("get_control_room_mission_detail_command", payload), etag)
+
+            self.assertTrue(backend.backend_read_is_current({"summaryCache": {"freshness": "control-files-matched"}}))
+            self.assertFalse(backend.backend_read_is_current({"summaryCache": {"freshness": "control-files-changed"}}))
+            self.assertFalse(
+                backend.backend_read_is_current(
+                    {"performance": {"missionDetailCache": {"freshness": "control-files-changed"}}}
+                )
+            )
+
+    def test_backend_read_etag_changes_when_a_shard_changes_without_its_index_row(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir)
+            backend = FluxioWebBackend(root, root)
+            shards = ShardedMissionStore(root / ".agent_control")
+            mission = {
+                "mission_id": "mission_a",
+                "workspace_id": "workspace_a",
+                "title": "Original title",
+                "state": {"status": "running", "queue_position": 0},
+                "updated_at": "2026-01-01T00:00:00+00:00",
+            }
+            shards.write_all([mission])
+            payload = {"root": str(root), "missionId": "mission_a"}
+            etag = backend.backend_read_etag("get_control_room_mission_detail_command", payload)
+
+            mission["title"] = "Renamed through write_one"
+            shards.write_one(mission)
+            renamed_etag = backend.backend_read_etag("get_control_room_mission_detail_command", payload)
+            self.assertNotEqual(renamed_etag, etag)
+
+            mission["state"]["delegated_session"] = {"session_id": "delegated_1"}
+            shards.write_all([mission])
+            self.assertNotEqual(
+                backend.backend_read_etag("get_control_room_mission_detail_command", payload),
+                renamed_etag,
+            )
+            self.assertEqual(shards.load_index(), [mission_index_row(mission)])
+
+    def test_save_codex_skill_drops_persisted_row_for_same_signature_edit(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = pathlib.Path(temp_dir) / "repo"
+            control_dir = root / ".agent_control"
+            control_dir.mkdir(parents=True)
+            (control_dir / "workspaces.json").write_text("[]", encoding="utf-8")
+            home = pathlib.Path(temp_dir) / "home"
+            skill_path = home / ".codex" / "skills" / "alpha-skill" / "SKILL.md"
+            skill_path.parent.mkdir(parents=True)
+            skill_path.write_text("---\ndescription: Before\n---\n", encoding="utf-8")
+            backend = FluxioWebBackend(root, root)
+
+            with mock.patch.object(pathlib.Path, "home", return_value=home):
+                invalidate_codex_home_skill_cache()
+                self.assertEqual(load_codex_home_skill_rows(control_dir)[0]["description"], "Before")
+                before = skill_path.stat()
+                backend.dispatch(
+                    "save_codex_skill_command",
+                    {"root": str(root), "path": str(skill_path), "content": "---\ndescription: Edited\n---"},
+                )
+                # Same size and mtime as before, as within a coarse mtime tick.
+                web_backend.os.utime(skill_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+                self.assertEqual(skill_path.stat().st_size, before.st_size)
+                invalidate_codex_home_skill_cache()
+                rows = load_codex_home_skill_rows(control_dir)
+
+            self.assertEqual(rows[0]["description"], "Edited")
+
     def test_main_refuses_duplicate_backend_port(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = pathlib.Path(temp_dir)
@@ -125,6 +125,7 @@ const LIVE_SYNC_OPTIONS = [
 ];
 const CONTROL_ROOM_SUMMARY_TIMEOUT_MS = 12000;
 const CONTROL_ROOM_MISSION_DETAIL_TIMEOUT_MS = 20000;
+const MISSION_STREAM_REFRESH_DEBOUNCE_MS = 750;
 const RUNTIME_PROOF_STATUS_TIMEOUT_MS = 15000;
 const RUNTIME_PROOF_REFRESH_INTERVAL_MS = 15000;
 const RUNTIME_PROOF_RUN_TIMEOUT_MS = 420000;
@@ -2612,6 +2613,20 @@ function hexToRgba(hex, alpha = 1) {
 }
 
 const BACKEND_CALL_SUBSCRIBERS = new Set();
+const BACKEND_READ_ETAG_COMMANDS = new Set([
+  "get_control_room_summary_command",
+  "get_control_room_mission_detail_command",
+]);
+const BACKEND_READ_ETAG_CACHE_LIMIT = 24;
+const BACKEND_READ_ETAG_CACHE = new Map();
+
+function rememberBackendRead(key, etag, data) {
+  BACKEND_READ_ETAG_CACHE.delete(key);
+  BACKEND_READ_ETAG_CACHE.set(key, { etag, data });
+  while (BACKEND_READ_ETAG_CACHE.size > BACKEND_READ_ETAG_CACHE_LIMIT) {
+    BACKEND_READ_ETAG_CACHE.delete(BACKEND_READ_ETAG_CACHE.keys().next().value);
+  }
+}
 
 function subscribeBackendCalls(handler) {
   BACKEND_CALL_SUBSCRIBERS.add(handler);
@@ -2629,18 +2644,32 @@ async function callBackend(command, payload = undefined, options = {}) {
     } else {
       const base = webBackendBaseUrl();
       const apiUrl = `${base}/api/backend`;
+      const body = JSON.stringify({ command, payload: payload ?? null });
+      const cachedRead = BACKEND_READ_ETAG_COMMANDS.has(command) ? BACKEND_READ_ETAG_CACHE.get(body) : null;
+      const headers = { "Content-Type": "application/json" };
+      if (cachedRead?.etag) {
+        headers["If-None-Match"] = cachedRead.etag;
+      }
       const httpResponse = await fetch(apiUrl, {
         method: "POST",
         credentials: "include",
-        headers: { "Content-Type": "application/json" },
+        headers,
         signal: options.signal,
-        body: JSON.stringify({ command, payload: payload ?? null }),
+        body,
       });
-      const result = await httpResponse.json().catch(() => ({}));
-      if (!httpResponse.ok || result?.ok === false) {
-        throw new Error(result?.error || `${command} failed with HTTP ${httpResponse.status}`);
+      if (httpResponse.status === 304 && cachedRead) {
+        response = cachedRead.data;
+      } else {
+        const result = await httpResponse.json().catch(() => ({}));
+        if (!httpResponse.ok || result?.ok === false) {
+          throw new Error(result?.error || `${command} failed with HTTP ${httpResponse.status}`);
+        }
+        response = result?.data;
+        const etag = httpResponse.headers.get("ETag");
+        if (etag && BACKEND_READ_ETAG_COMMANDS.has(command)) {
+          rememberBackendRead(body, etag, response);
+        }
       }
-      response = result?.data;
     }
     const event = {
       id: `invoke-${Date.now()}-${Math.random().toString(36).slice(2)}`,
@@ -2680,6 +2709,82 @@ async function callBackend(command, payload = undefined, options = {}) {
   }
 }
 
+const SUMMARY_DELTA_SCHEMA = "fluxio.control_room.summary_delta.v1";
+let FULL_SUMMARY_DELTA_STATE = { version: "", summary: null };
+
+function summaryPathParts(path) {
+  return String(path || "")
+    .split(/[/.]/)
+    .filter(Boolean);
+}
+
+function applySummaryDelta(base, delta) {
+  const next = { ...base };
+  const cloneParent = parts => {
+    let target = next;
+    for (const part of parts.slice(0, -1)) {
+      const child = target[part] && typeof target[part] === "object" ? { ...target[part] } : {};
+      target[part] = child;
+      target = child;
+    }
+    return target;
+  };
+  for (const op of Array.isArray(delta.ops) ? delta.ops : []) {
+    if (op.path) {
+      const parts = summaryPathParts(op.path);
+      const parent = cloneParent(parts);
+      if (op.op === "remove") {
+        delete parent[parts[parts.length - 1]];
+      } else {
+        parent[parts[parts.length - 1]] = op.value;
+      }
+      continue;
+    }
+    const parts = summaryPathParts(op.collection);
+    const parent = cloneParent(parts);
+    const leaf = parts[parts.length - 1];
+    const keyField = { missions: "mission_id", workspaces: "workspace_id", issues: "issueId" }[leaf];
+    const rows = Array.isArray(parent[leaf]) ? [...parent[leaf]] : [];
+    const index = rows.findIndex(row => String(row?.[keyField] || "") === String(op.key || ""));
+    if (op.op === "upsert") {
+      if (index >= 0) {
+        rows[index] = op.value;
+      } else {
+        rows.push(op.value);
+      }
+    } else if (op.op === "remove" && index >= 0) {
+      rows.splice(index, 1);
+    } else if (op.op === "order") {
+      const byKey = new Map(rows.map(row => [String(row?.[keyField] || ""), row]));
+      parent[leaf] = (op.keys || []).map(key => byKey.get(String(key))).filter(Boolean);
+      continue;
+    }
+    parent[leaf] = rows;
+  }
+  next.generatedAt = delta.generatedAt || next.generatedAt;
+  next.summaryCache = delta.summaryCache || next.summaryCache;
+  next.summaryVersion = delta.summaryVersion;
+  return next;
+}
+
+async function callFullSummaryWithDelta(timeoutMs) {
+  const since = FULL_SUMMARY_DELTA_STATE.summary ? FULL_SUMMARY_DELTA_STATE.version : "";
+  const response = await callBackendWithTimeout(
+    "get_control_room_summary_command",
+    { payload: { root: null, sinceVersion: since } },
+    timeoutMs,
+  );
+  if (!response || typeof response !== "object") {
+    return response;
+  }
+  const summary =
+    response.schema === SUMMARY_DELTA_SCHEMA && response.mode === "delta" && FULL_SUMMARY_DELTA_STATE.summary
+      ? applySummaryDelta(FULL_SUMMARY_DELTA_STATE.summary, response)
+      : response;
+  FULL_SUMMARY_DELTA_STATE = { version: String(summary.summaryVersion || ""), summary };
+  return summary;
+}
+
 function callBackendWithTimeout(command, payload = undefined, timeoutMs = 4500) {
   let timeoutId;
   const abortController =
@@ -5972,6 +6077,7 @@ export function FluxioShellApp({ reportUiAction = noopReportUiAction }) {
   );
   const [lastPushReason, setLastPushReason] = useState("");
   const [liveSyncSuspended, setLiveSyncSuspended] = useState(false);
+  const [missionStreamConnected, setMissionStreamConnected] = useState(false);
   const [isRefreshing, setIsRefreshing] = useState(false);
   const requestedDrawer = searchParams.get("drawer");
   const [activeDrawer, setActiveDrawer] = useState(requestedDrawer || storedUiState.activeDrawer || null);
@@ -6892,11 +6998,7 @@ export function FluxioShellApp({ reportUiAction = noopReportUiAction }) {
           openClawHasToken,
           providerSecretPresencePrimary,
         ] = await Promise.all([
-          callBackendWithTimeout(
-            "get_control_room_summary_command",
-            { payload: { root: null } },
-            CONTROL_ROOM_SUMMARY_TIMEOUT_MS,
-          ).catch(() => null),
+          callFullSummaryWithDelta(CONTROL_ROOM_SUMMARY_TIMEOUT_MS).catch(() => null),
           callBackendWithTimeout("list_pending_approvals").catch(() => []),
           callBackendWithTimeout("list_pending_questions").catch(() => []),
           callBackendWithTimeout("has_telegram_bot_token_command").catch(() => false),
@@ -7296,6 +7398,70 @@ export function FluxioShellApp({ reportUiAction = noopReportUiAction }) {
     };
   }, [previewMode, selectedMissionId]);
 
+  useEffect(() => {
+    if (
+      previewMode !== "live" ||
+      hasTauriBackend() ||
+      !canAttemptWebBackend() ||
+      !selectedMissionId ||
+      typeof EventSource === "undefined"
+    ) {
+      setMissionStreamConnected(false);
+      return undefined;
+    }
+    let refreshTimer = 0;
+    const source = new EventSource(
+      `${webBackendBaseUrl()}/api/mission-stream?missionId=${encodeURIComponent(selectedMissionId)}`,
+      { withCredentials: true },
+    );
+    const refreshMissionDetail = () => {
+      callBackendWithTimeout(
+        "get_control_room_mission_detail_command",
+        { payload: { root: null, missionId: selectedMissionId, eventLimit: 80 } },
+        CONTROL_ROOM_MISSION_DETAIL_TIMEOUT_MS,
+      ).then(detail => {
+        if (!detail || typeof detail !== "object") {
+          return;
+        }
+        const detailMissionId = String(detail.missionId || detail.mission_id || "").trim();
+        if (detailMissionId && detailMissionId !== selectedMissionId) {
+          return;
+        }
+        setData(current => {
+          const currentDetailMissionId = String(
+            current.missionDetail?.missionId || current.missionDetail?.mission_id || "",
+          ).trim();
+          if (currentDetailMissionId && currentDetailMissionId !== selectedMissionId) {
+            return current;
+          }
+          return { ...current, missionDetail: detail };
+        });
+      }).catch(() => undefined);
+    };
+    const scheduleRefresh = () => {
+      window.clearTimeout(refreshTimer);
+      refreshTimer = window.setTimeout(() => {
+        refreshMissionDetail();
+        void refreshAll("mission-stream");
+      }, MISSION_STREAM_REFRESH_DEBOUNCE_MS);
+    };
+    source.addEventListener("ready", () => setMissionStreamConnected(true));
+    source.addEventListener("mission_event", scheduleRefresh);
+    source.addEventListener("end", () => {
+      source.close();
+      setMissionStreamConnected(false);
+      scheduleRefresh();
+    });
+    // EventSource reconnects on its own and resends Last-Event-ID; fall back
+    // to interval polling until the next ready event arrives.
+    source.onerror = () => setMissionStreamConnected(false);
+    return () => {
+      window.clearTimeout(refreshTimer);
+      source.close();
+      setMissionStreamConnected(false);
+    };
+  }, [previewMode, refreshAll, selectedMissionId]);
+
   useEffect(() => {
     if (previewMode !== "live" || surface !== "skills" || !hasCommandBackend()) {
       return undefined;
@@ -7414,7 +7580,12 @@ export function FluxioShellApp({ reportUiAction = noopReportUiAction }) {
   }, [browserNotifications.enabled, browserNotifications.permission, liveSyncSeconds, previewMode, refreshAll]);
 
   useEffect(() => {
-    if (previewMode !== "live" || liveSyncSeconds === "off" || liveSyncSuspended) {
+    if (
+      previewMode !== "live" ||
+      liveSyncSeconds === "off" ||
+      liveSyncSuspended ||
+      missionStreamConnected
+    ) {
       return undefined;
     }
 
@@ -7425,7 +7596,7 @@ export function FluxioShellApp({ reportUiAction = noopReportUiAction }) {
     return () => {
       window.clearInterval(interval);
     };
-  }, [liveSyncSeconds, liveSyncSuspended, previewMode, refreshAll]);
+  }, [liveSyncSeconds, liveSyncSuspended, missionStreamConnected, previewMode, refreshAll]);
 
   useEffect(() => {
     if (previewMode !== "live" || !hasCommandBackend() || chatRequestsInFlight <= 0) {